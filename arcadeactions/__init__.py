@@ -6,7 +6,7 @@ Actions available:
 - Rotation: RotateUntil
 - Scaling: ScaleUntil
 - Visual: FadeTo, FadeUntil, BlinkUntil
-- Path: FollowPathUntil
+- Path: FollowPathUntil, FollowPathGroupUntil, SplinePath
 - Timing: DelayFrames, time_elapsed
 - Easing: Ease wrapper for smooth acceleration/deceleration effects
 - Interpolation: TweenUntil for direct property animation from start to end value
@@ -25,9 +25,18 @@ Actions available:
 # Helper functions
 import os
 
+from ._action_targets import register_target_name
+from ._callback_watchdog import CallbackWatchdog, SlowCallbackReport
+from ._clock_domains import ClockDomain
+from ._fixed_step import interpolated_position, interpolated_positions
+from ._frame_stats import FrameStats
+from ._spline import SplinePath
 from .axis_move import MoveXUntil, MoveYUntil
 from .base import Action
 
+# Collision queries
+from .collisions import CollisionBroker, collides_with, first_hit, register_collision_list, unregister_collision_list
+
 # Composition functions
 from .composite import parallel, repeat, sequence
 
@@ -40,6 +49,7 @@ from .conditional import (
     EmitParticlesUntil,
     FadeTo,
     FadeUntil,
+    FollowPathGroupUntil,
     FollowPathUntil,
     GlowUntil,
     MoveUntil,
@@ -50,12 +60,26 @@ from .conditional import (
 )
 from .config import (
     apply_environment_configuration,
+    clear_lod_policy,
     clear_observed_actions,
+    get_callback_watchdog,
+    get_clock_domain,
     get_debug_actions,
     get_debug_options,
+    get_frame_stats,
+    get_lod_policy,
+    get_transform_staging,
     observe_actions,
+    reset_clock_domains,
+    set_callback_watchdog,
+    set_clock_paused,
+    set_clock_scale,
     set_debug_actions,
     set_debug_options,
+    set_frame_stats,
+    set_lod_policy,
+    set_lod_viewport,
+    set_transform_staging,
 )
 
 # Display utilities
@@ -108,6 +132,9 @@ from .instant import MoveBy, MoveTo
 # Experimental pools module
 from .pools import SpritePool
 
+# Structured event tracing
+from .trace import clear_trace, disable_trace, enable_trace, flush_trace, get_trace_events, is_trace_enabled
+
 
 def _maybe_auto_attach_visualizer() -> None:
     """Automatically attach the visualizer when requested via environment variable."""
@@ -149,6 +176,35 @@ __all__ = [
     "get_debug_options",
     "observe_actions",
     "clear_observed_actions",
+    "set_transform_staging",
+    "get_transform_staging",
+    "set_frame_stats",
+    "get_frame_stats",
+    "FrameStats",
+    "set_callback_watchdog",
+    "get_callback_watchdog",
+    "CallbackWatchdog",
+    "SlowCallbackReport",
+    "set_lod_policy",
+    "set_lod_viewport",
+    "clear_lod_policy",
+    "get_lod_policy",
+    "get_clock_domain",
+    "set_clock_scale",
+    "set_clock_paused",
+    "reset_clock_domains",
+    "ClockDomain",
+    # Fixed-step interpolation
+    "interpolated_position",
+    "interpolated_positions",
+    "register_target_name",
+    # Tracing
+    "enable_trace",
+    "disable_trace",
+    "flush_trace",
+    "get_trace_events",
+    "clear_trace",
+    "is_trace_enabled",
     # Conditional actions
     "MoveUntil",
     "MoveXUntil",
@@ -161,6 +217,8 @@ __all__ = [
     "CallbackUntil",
     "DelayFrames",
     "FollowPathUntil",
+    "FollowPathGroupUntil",
+    "SplinePath",
     "TweenUntil",
     "CycleTexturesUntil",
     "GlowUntil",
@@ -210,6 +268,12 @@ __all__ = [
     # Condition helpers
     "time_elapsed",
     "sprite_count",
+    # Collision queries
+    "CollisionBroker",
+    "collides_with",
+    "first_hit",
+    "register_collision_list",
+    "unregister_collision_list",
     # Helper functions
     "move_by",
     "move_to",
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from time import perf_counter
 from typing import Any
 
+from ._callback_arity import callback_arity, describe_arity
+from ._callback_watchdog import callback_watchdog
+
 
 class ActionCallbacksMixin:
     """Callback helpers for Action."""
@@ -11,26 +15,63 @@ class ActionCallbacksMixin:
         """Safely call a callback function with exception handling."""
         if not self._callbacks_active:
             return
+        if callback_watchdog.enabled:
+            start = perf_counter()
+            type(self)._execute_callback_impl(fn, *args)
+            callback_watchdog.check(fn, self, perf_counter() - start)
+            return
         type(self)._execute_callback_impl(fn, *args)
 
     @staticmethod
     def _execute_callback_impl(fn: Callable, *args) -> None:
-        """Execute callback with exception handling - for internal use and testing."""
-        from ._action_core import Action
+        """Execute callback with exception handling - for internal use and testing.
+
+        The callback receives as many of *args* as its signature accepts (a single
+        ``None`` counts as no arguments), looked up once per function rather than
+        found by catching ``TypeError``. Callbacks whose arity can't be read up front
+        fall back to trying shorter argument lists.
+        """
+        has_meaningful_args = bool(args) and not (len(args) == 1 and args[0] is None)
+
+        arity = callback_arity(fn)
+        if arity is None:
+            ActionCallbacksMixin._execute_with_type_error_fallback(fn, args, has_meaningful_args)
+            return
 
-        def _warn_signature_mismatch(exc: TypeError) -> None:
-            if fn not in Action._warned_bad_callbacks and Action.debug_level >= 1:
-                import warnings
+        required, maximum = arity
+        if has_meaningful_args:
+            count = min(len(args), maximum)
+            mismatch = count < len(args)
+        elif required == 0:
+            count = 0
+            mismatch = False
+        else:
+            # Nothing meaningful to pass, but the callback insists on arguments
+            count = len(args)
+            mismatch = True
 
-                Action._warned_bad_callbacks.add(fn)
-                warnings.warn(
-                    f"Callback '{fn.__name__}' failed with TypeError - signature mismatch: {exc}",
-                    RuntimeWarning,
-                    stacklevel=4,
-                )
+        if count < required or count > maximum:
+            _warn_signature_mismatch(
+                fn, f"accepts {describe_arity(arity)} positional arguments, none of the offered {len(args)} fit"
+            )
+            return
+        if mismatch:
+            _warn_signature_mismatch(
+                fn, f"accepts {describe_arity(arity)} positional arguments but was offered {len(args)}"
+            )
+
+        try:
+            if count:
+                fn(*args[:count])
+            else:
+                fn()
+        except Exception as exc:
+            _report_callback_exception(fn, exc)
 
+    @staticmethod
+    def _execute_with_type_error_fallback(fn: Callable, args: tuple[Any, ...], has_meaningful_args: bool) -> None:
+        """Call *fn* by trial, retrying shorter argument lists on ``TypeError``."""
         try:
-            has_meaningful_args = args and not (len(args) == 1 and args[0] is None)
 
             def _call_with_args(call_args: tuple[Any, ...] | None) -> tuple[bool, TypeError | None]:
                 try:
@@ -71,11 +112,35 @@ class ActionCallbacksMixin:
                 fallback_error = error
 
             if fallback_called:
-                _warn_signature_mismatch(initial_error)
+                _warn_signature_mismatch(fn, str(initial_error), stacklevel=5)
                 return
 
             if fallback_error is not None:
-                _warn_signature_mismatch(fallback_error)
+                _warn_signature_mismatch(fn, str(fallback_error), stacklevel=5)
         except Exception as exc:
-            if Action.debug_level >= 2:
-                print(f"[AA] Callback '{fn.__name__}' raised {type(exc).__name__}: {exc}")
+            _report_callback_exception(fn, exc)
+
+
+def _callback_name(fn: Callable) -> str:
+    return getattr(fn, "__name__", type(fn).__name__)
+
+
+def _report_callback_exception(fn: Callable, exc: Exception) -> None:
+    from ._action_core import Action
+
+    if Action.debug_level >= 2:
+        print(f"[AA] Callback '{_callback_name(fn)}' raised {type(exc).__name__}: {exc}")
+
+
+def _warn_signature_mismatch(fn: Callable, detail: str, stacklevel: int = 4) -> None:
+    from ._action_core import Action
+
+    if fn not in Action._warned_bad_callbacks and Action.debug_level >= 1:
+        import warnings
+
+        Action._warned_bad_callbacks.add(fn)
+        warnings.warn(
+            f"Callback '{_callback_name(fn)}' signature mismatch (TypeError): {detail}",
+            RuntimeWarning,
+            stacklevel=stacklevel,
+        )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABC, ABCMeta, abstractmethod
 from collections.abc import Callable
+from time import perf_counter
 from typing import Any, Generic, TypeVar
 
 from ._action_callbacks import ActionCallbacksMixin
@@ -9,22 +10,69 @@ from ._action_conflicts import check_action_conflicts
 from ._action_debug import _debug_log_action, describe_target
 from ._action_instrumentation import ActionInstrumentationMixin
 from ._action_manager import ActionManagerMixin
-from ._action_targets import SpriteTarget, TargetAdapter, adapt_target, _get_sprite_list_name
+from ._action_registry import ActionRegistry
+from ._action_targets import SpriteTarget, TargetAdapter, _get_sprite_list_name, adapt_target, register_target_name
+from ._callback_watchdog import callback_watchdog, capture_apply_site
+from ._clock_domains import TICK_EPSILON as _TICK_EPSILON
+from ._clock_domains import ClockDomain, ClockDomains, clock_domains
+from ._fixed_step import FixedStepClock, fixed_step_clock
+from ._frame_stats import FrameStats, frame_stats
+from ._lod import LodPolicy, lod_policy
+from ._shared_logging import _debug_gate, _refresh_debug_gate
+from ._timer_wheel import TimerWheel
+from .frame_conditions import _can_reset_condition, _reset_condition
 
 _T = TypeVar("_T", bound="Action")
 
+_DEBUG_CONFIG_ATTRS = frozenset({"debug_level", "debug_all", "debug_include_classes"})
 
-class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixin, ABC, Generic[_T]):
+
+class _ActionMeta(ABCMeta):
+    """Refreshes the precomputed debug gate whenever Action's debug configuration is assigned."""
+
+    def __setattr__(cls, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _DEBUG_CONFIG_ATTRS and cls is Action:
+            _refresh_debug_gate(cls.debug_level, cls.debug_all, cls.debug_include_classes)
+
+
+class Action(
+    ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixin, ABC, Generic[_T], metaclass=_ActionMeta
+):
     """Base class for all actions."""
 
     _conflicts_with: tuple[str, ...] = ()
     _requires_sprite_target: bool = True
+    # True when reset() rewinds every piece of per-run state, so repeat(..., reuse=True)
+    # can restart the same instance instead of cloning it. Subclasses that add per-run
+    # state must extend reset() (or set this back to False).
+    _supports_reuse: bool = False
+    # Optional classmethod ``batch_update(actions, delta_time)``. update_all hands each type
+    # that defines it all of its registered instances whose _batchable() is True in one call
+    # instead of calling update() on each; the list may hold instances update() would skip
+    # and must not be mutated.
+    batch_update: Callable[[list[Any], float], None] | None = None
+    # True for types whose _idle_frames() can be nonzero; only these are asked after each
+    # update whether they can be parked on the timer wheel instead of being polled.
+    _parkable: bool = False
+    # file:line that apply()'d the action, captured only while the callback watchdog is on
+    _apply_site: str | None = None
+    # Clock domain bound by apply(clock=...), and the velocity scale last applied from it
+    _clock: ClockDomain | None = None
+    _clock_scale: float = 1.0
+    # Fraction of a domain tick accumulated toward the next frame-condition check
+    _tick_budget: float = 0.0
 
     num_active_actions = 0
     debug_level: int = 0
     debug_include_classes: set[str] | None = None
     debug_all: bool = False
-    _active_actions: list["Action"] = []
+    _active_actions: ActionRegistry = ActionRegistry()
+    _timer_wheel: TimerWheel = TimerWheel()
+    _frame_stats: FrameStats = frame_stats
+    _fixed_step: FixedStepClock = fixed_step_clock
+    _lod: LodPolicy = lod_policy
+    _clock_domains: ClockDomains = clock_domains
     _pending_actions: list["Action"] = []
     _is_updating: bool = False
     _previous_actions: set["Action"] | None = None
@@ -45,7 +93,7 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
         self._target_adapter: TargetAdapter | None = None
         self.condition = condition
         self.on_stop = on_stop
-        self.tag = tag
+        self._tag = tag
         self.done = False
         self._is_active = False
         self._callbacks_active = True
@@ -58,6 +106,19 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
         self.condition_data: Any = None
         self._instrumented = False
         self.wrapped_action: "Action" | None = None
+        # Set while parked on the timer wheel: the frame it wakes on, and the last frame it ran
+        self._wake_frame: int | None = None
+        self._parked_after = 0
+
+    @property
+    def tag(self) -> str | None:
+        return self._tag
+
+    @tag.setter
+    def tag(self, value: str | None) -> None:
+        self._tag = value
+        # Keep the tag index in step when an already-registered action is retagged
+        Action._active_actions.reindex(self)
 
     def __add__(self, other: "Action") -> "Action":
         from arcadeactions.composite import sequence
@@ -75,7 +136,18 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
     def __ror__(self, other: "Action") -> "Action":
         return other.__or__(self)
 
-    def apply(self, target: SpriteTarget | None, tag: str | None = None, replace: bool = False) -> "Action":
+    def apply(
+        self,
+        target: SpriteTarget | None,
+        tag: str | None = None,
+        replace: bool = False,
+        name: str | None = None,
+        clock: str | ClockDomain | None = None,
+    ) -> "Action":
+        # Bound before start() so velocity actions start at the domain's scale
+        domain = Action._clock_domains.resolve(clock)
+        self._clock = domain
+        self._on_clock_scale(domain.effective_scale if domain is not None else 1.0)
         if target is None:
             self.target = None
             self._target_adapter = None
@@ -85,9 +157,13 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
 
         if self._requires_sprite_target:
             self._target_adapter = adapt_target(target)
+        if callback_watchdog.enabled:
+            self._apply_site = capture_apply_site()
         self.target = target
         if tag is not None:
             self.tag = tag
+        if name is not None:
+            register_target_name(target, name)
         self._instrumented = True
 
         if replace and tag is not None:
@@ -107,27 +183,29 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
         return self
 
     def start(self) -> None:
-        _debug_log_action(self, 2, f"start() target={self.target} tag={self.tag}")
+        if _debug_gate.lifecycle:
+            _debug_log_action(self, 2, f"start() target={self.target} tag={self.tag}")
         self._is_active = True
 
-        if Action._active_actions:
-            other_actions = [a for a in Action._active_actions if a is not self]
-            if other_actions and all(a._paused for a in other_actions):
-                self._paused = True
-                self._on_start_paused()
+        if Action._active_actions.all_paused(exclude=self):
+            self._paused = True
+            Action._active_actions.set_paused(self, True)
+            self._on_start_paused()
+            if _debug_gate.lifecycle:
                 _debug_log_action(self, 2, "starting in paused state (matching global pause)")
 
-                if self._instrumentation_active():
-                    self._record_event("started")
-                    self._update_snapshot()
-                return
+            if self._instrumentation_active():
+                self._record_event("started")
+                self._update_snapshot()
+            return
 
         if self._instrumentation_active():
             self._record_event("started")
             self._update_snapshot()
 
         self.apply_effect()
-        _debug_log_action(self, 2, f"start() completed _is_active={self._is_active}")
+        if _debug_gate.lifecycle:
+            _debug_log_action(self, 2, f"start() completed _is_active={self._is_active}")
 
     def apply_effect(self) -> None:
         pass
@@ -137,9 +215,19 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
             return
 
         self.update_effect(delta_time)
+        self._evaluate_condition()
 
+    def _evaluate_condition(self) -> None:
+        """Check the stop condition after this frame's effect and finish the action if it is met."""
         if self.condition and not self._condition_met:
-            condition_result = self.condition()
+            if self._clock_scale != 1.0 and self._condition_counts_frames() and not self._take_condition_ticks():
+                return
+            if callback_watchdog.enabled:
+                start = perf_counter()
+                condition_result = self.condition()
+                callback_watchdog.check(self.condition, self, perf_counter() - start, "condition")
+            else:
+                condition_result = self.condition()
 
             if self._instrumentation_active():
                 self._record_condition_evaluation(condition_result)
@@ -159,27 +247,118 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
                     else:
                         self._safe_call(self.on_stop)
 
+    def _condition_counts_frames(self) -> bool:
+        """Return True when the stop condition counts its calls as frames (``after_frames``)."""
+        return getattr(self.condition, "_is_frame_condition", False)
+
+    def _take_condition_ticks(self) -> bool:
+        """Count this update in clock-domain ticks; return False when no whole tick is due.
+
+        On a slowed domain the effect still runs every frame, but a frame condition is
+        only checked once a whole tick has accumulated. On a sped-up domain, the ticks
+        beyond the first are counted without being checked; ``after_frames`` stays true
+        once reached, so it still stops on the right update.
+        """
+        budget = self._tick_budget + self._clock_scale
+        ticks = int(budget + _TICK_EPSILON)
+        self._tick_budget = budget - ticks
+        if ticks > 1:
+            advance = getattr(self.condition, "_advance", None)
+            if advance is not None:
+                advance(ticks - 1)
+            else:
+                for _ in range(ticks - 1):
+                    self.condition()
+        return ticks > 0
+
     def update_effect(self, delta_time: float) -> None:
         pass
 
     def remove_effect(self) -> None:
         pass
 
+    def reset(self) -> None:
+        """Rewind the action so ``start()`` runs it again from the beginning.
+
+        Clears completion state and rewinds frame conditions such as ``after_frames``.
+        Subclasses extend this to clear their own per-run state; configuration
+        (velocities, callbacks, targets) is kept.
+        """
+        self.done = False
+        self._condition_met = False
+        self.condition_data = None
+        self._elapsed = 0.0
+        self._callbacks_active = True
+        self._tick_budget = 0.0
+        if self._wake_frame is not None:
+            Action._unpark_action(self)
+        _reset_condition(self.condition)
+
+    def _can_reuse(self) -> bool:
+        """Return True when ``reset()`` can stand in for ``clone()`` on this instance."""
+        return self._supports_reuse and _can_reset_condition(self.condition)
+
+    def _batchable(self) -> bool:
+        """Return True when this instance should be handed to its type's ``batch_update``.
+
+        Only asked of types that define the hook, when the action is registered. Instances
+        that answer False are updated one by one, in apply order, with the other actions.
+        """
+        return True
+
+    def _idle_frames(self) -> int:
+        """Return how many upcoming ``update()`` calls are certain to do nothing but count frames.
+
+        A nonzero answer (only asked of ``_parkable`` types) lets ``update_all`` skip
+        the action until it has work again; see :meth:`_skip_frames`.
+        """
+        return 0
+
+    def _skip_frames(self, frames: int) -> None:
+        """Account for *frames* ``update()`` calls skipped while the action was parked.
+
+        By default this advances an ``after_frames`` condition by the skipped frames.
+        """
+        advance = getattr(self.condition, "_advance", None)
+        if advance is not None:
+            advance(frames)
+
+    def _offscreen_idle_frames(self) -> int:
+        """Return how many upcoming ``update()`` calls may be skipped while the target is off-screen.
+
+        Nonzero only when skipping them and then calling :meth:`_skip_frames` gives the
+        same result as running them; the LOD policy parks such actions when their
+        sprites are outside the viewport.
+        """
+        return 0
+
+    def _on_clock_scale(self, scale: float) -> None:
+        """Adopt the velocity scale of this action's clock domain (0 while it is paused).
+
+        Velocity-based actions override this to rescale the velocity Arcade integrates
+        each frame; everything else is slowed by the scaled delta and frame steps.
+        """
+        self._clock_scale = scale
+
     def stop(self) -> None:
-        _debug_log_action(self, 2, f"stop() called done={self.done} _is_active={self._is_active}")
+        if _debug_gate.lifecycle:
+            _debug_log_action(self, 2, f"stop() called done={self.done} _is_active={self._is_active}")
 
         self._callbacks_active = False
         self.done = True
         self._is_active = False
+        if self._wake_frame is not None:
+            Action._timer_wheel.cancel(self)
+            self._wake_frame = None
 
         if self._instrumentation_active():
             self._record_event("removed")
 
-        if self in Action._active_actions:
-            Action._active_actions.remove(self)
+        if Action._active_actions.discard(self) and _debug_gate.lifecycle:
             _debug_log_action(self, 2, "removed from _active_actions")
         self.remove_effect()
-        _debug_log_action(self, 2, f"stop() completed done={self.done} _is_active={self._is_active}")
+        if _debug_gate.lifecycle:
+            _debug_log_action(self, 2, f"stop() completed done={self.done} _is_active={self._is_active}")
 
     @classmethod
     def _describe_target(cls, target: SpriteTarget | None) -> str:
@@ -235,10 +414,14 @@ class Action(ActionManagerMixin, ActionInstrumentationMixin, ActionCallbacksMixi
         self._condition_met = value
 
     def pause(self) -> None:
+        if self._wake_frame is not None:
+            Action._unpark_action(self)
         self._paused = True
+        Action._active_actions.set_paused(self, True)
 
     def resume(self) -> None:
         self._paused = False
+        Action._active_actions.set_paused(self, False)
 
     def set_current_velocity(self, velocity: tuple[float, float]) -> None:
         pass
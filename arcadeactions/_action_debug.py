@@ -3,23 +3,17 @@ from __future__ import annotations
 from typing import Any
 
 from ._action_targets import adapt_target
+from ._shared_logging import _debug_gate
 
 
 def _debug_log_action(action: Any, level: int, message: str) -> None:
-    """Centralized debug logger with level and per-Action filtering."""
-    from ._action_core import Action
+    """Centralized debug logger with level and per-Action filtering.
 
+    Callers should check ``_debug_gate.lifecycle`` (level 2) before formatting *message*.
+    """
     action_name = type(action).__name__
-
-    if Action.debug_level < level:
-        return
-
-    if not Action.debug_all:
-        include = Action.debug_include_classes
-        if not include or action_name not in include:
-            return
-
-    print(f"[AA L{level} {action_name}] {message}")
+    if _debug_gate.allows(level, action_name):
+        print(f"[AA L{level} {action_name}] {message}")
 
 
 def describe_target(target: Any) -> str:
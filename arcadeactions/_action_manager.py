@@ -1,9 +1,28 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
+from time import perf_counter
 from typing import Any
 
 from ._action_debug import _debug_log_action
+from ._fixed_step import DEFAULT_MAX_STEPS, DEFAULT_STEP
+from ._frame_stats import PHASE_INDEX
+from ._shared_logging import _debug_gate
+from ._transform_staging import transform_stage
+
+# Parking costs a wheel insert and removal, so only waits at least this long are parked
+_MIN_PARK_FRAMES = 2
+
+_FRAME_COUNTER = PHASE_INDEX["frame_counter"]
+_DEBUG_SUMMARY = PHASE_INDEX["debug_summary"]
+_DEACTIVATE_CALLBACKS = PHASE_INDEX["deactivate_callbacks"]
+_WRAPPER_UPDATES = PHASE_INDEX["wrapper_updates"]
+_ACTION_UPDATES = PHASE_INDEX["action_updates"]
+_REBUILD = PHASE_INDEX["rebuild"]
+_APPEND_PENDING = PHASE_INDEX["append_pending"]
+_TRANSFORM_COMMIT = PHASE_INDEX["transform_commit"]
+_PHYSICS_SYNC = PHASE_INDEX["physics_sync"]
 
 
 class ActionManagerMixin:
@@ -11,9 +30,11 @@ class ActionManagerMixin:
 
     @classmethod
     def get_actions_for_target(cls, target, tag: str | None = None):
-        if tag:
-            return [action for action in cls._active_actions if action.target == target and action.tag == tag]
-        return [action for action in cls._active_actions if action.target == target]
+        return cls._active_actions.for_target(target, tag)
+
+    @classmethod
+    def get_actions_by_tag(cls, tag: str):
+        return cls._active_actions.for_tag(tag)
 
     @classmethod
     def pause_all(cls) -> None:
@@ -27,9 +48,7 @@ class ActionManagerMixin:
 
     @classmethod
     def is_paused(cls) -> bool:
-        if not cls._active_actions:
-            return False
-        return all(action._paused for action in cls._active_actions)
+        return cls._active_actions.all_paused()
 
     @classmethod
     def step_all(cls, delta_time: float, *, physics_engine=None) -> None:
@@ -46,34 +65,105 @@ class ActionManagerMixin:
         for action in cls.get_actions_for_target(target, tag):
             action.stop()
 
+    @classmethod
+    def stop_actions_by_tag(cls, tag: str) -> None:
+        for action in cls.get_actions_by_tag(tag):
+            action.stop()
+
     @classmethod
     def current_frame(cls) -> int:
         return cls._frame_counter
 
     @classmethod
     def update_all(cls, delta_time: float, *, physics_engine=None) -> None:
+        # Profiling costs one boolean check per phase while frame stats are disabled
+        stats = cls._frame_stats
+        profiling = stats.enabled
+        if profiling:
+            start = stats.begin_frame()
         cls._update_frame_counter()
+        if profiling:
+            stats.label_frame(cls._frame_counter)
+            start = stats.mark(_FRAME_COUNTER, start)
         set_current_engine = cls._configure_physics_engine(physics_engine)
+        if profiling:
+            start = stats.mark(_PHYSICS_SYNC, start)
 
         cls._is_updating = True
+        transform_stage.begin()
         try:
             cls._log_debug_summary()
             cls._log_debug_diff()
+            if profiling:
+                start = stats.mark(_DEBUG_SUMMARY, start)
             cls._deactivate_done_callbacks()
-            cls._update_actions(delta_time)
+            if profiling:
+                start = stats.mark(_DEACTIVATE_CALLBACKS, start)
+                start = cls._update_actions(delta_time, stats, start)
+            else:
+                cls._update_actions(delta_time)
             cls._rebuild_active_actions()
+            if profiling:
+                start = stats.mark(_REBUILD, start)
             cls._append_pending_actions()
+            if profiling:
+                start = stats.mark(_APPEND_PENDING, start)
+            # Physics sync reads sprite positions, so staged transforms must land first
+            transform_stage.commit()
+            if profiling:
+                start = stats.mark(_TRANSFORM_COMMIT, start)
             cls._sync_physics_engine(physics_engine, delta_time)
+            if profiling:
+                stats.mark(_PHYSICS_SYNC, start)
         finally:
             cls._is_updating = False
+            if transform_stage.active:
+                transform_stage.commit()
+            # Only still deferring if an update raised before the sweep
+            if cls._active_actions.deferring:
+                cls._active_actions.sweep_finished(cls._retire_action)
             cls._reset_physics_engine(set_current_engine)
 
+    @classmethod
+    def update_fixed(
+        cls,
+        delta_time: float,
+        *,
+        step: float = DEFAULT_STEP,
+        max_steps: int = DEFAULT_MAX_STEPS,
+        physics_engine=None,
+        on_step: Callable[[float], None] | None = None,
+    ) -> int:
+        """Advance actions in whole fixed steps covering *delta_time* and return the step count.
+
+        Real frame time accumulates across calls. Each step runs ``update_all(step)``
+        and then ``on_step(step)``, where the game advances anything else that moves
+        per step (typically ``sprite_list.update()`` for velocities set by MoveUntil).
+        At most *max_steps* steps run per call and the excess time is dropped. Draw
+        with :meth:`interpolation_alpha` or ``interpolated_positions()`` to smooth the
+        remainder.
+        """
+        clock = cls._fixed_step
+        steps = clock.accumulate(delta_time, step, max_steps)
+        for index in range(steps):
+            if index == steps - 1:
+                clock.capture(cls._active_actions)
+            cls.update_all(step, physics_engine=physics_engine)
+            if on_step is not None:
+                on_step(step)
+        return steps
+
+    @classmethod
+    def interpolation_alpha(cls) -> float:
+        """Fraction of a fixed step accumulated but not yet simulated by :meth:`update_fixed`."""
+        return cls._fixed_step.alpha
+
     @classmethod
     def _update_frame_counter(cls) -> None:
-        all_paused = cls._active_actions and all(action._paused for action in cls._active_actions)
-        if all_paused:
+        if cls._active_actions.all_paused():
             return
         cls._frame_counter += 1
+        cls._timer_wheel.advance(cls._frame_counter, cls._wake_parked_action)
         if cls._enable_visualizer and cls._debug_store:
             cls._record_debug_frame(cls._frame_counter, time.time())
 
@@ -116,52 +206,164 @@ class ActionManagerMixin:
         new_actions = current_actions - cls._previous_actions
         removed_actions = cls._previous_actions - current_actions
         for action in new_actions:
-            _debug_log_action(action, 2, f"created target={cls._describe_target(action.target)} tag='{action.tag}'")
+            if _debug_gate.lifecycle:
+                _debug_log_action(action, 2, f"created target={cls._describe_target(action.target)} tag='{action.tag}'")
         for action in removed_actions:
-            _debug_log_action(action, 2, f"removed target={cls._describe_target(action.target)} tag='{action.tag}'")
+            if _debug_gate.lifecycle:
+                _debug_log_action(action, 2, f"removed target={cls._describe_target(action.target)} tag='{action.tag}'")
         cls._previous_actions = current_actions
 
     @classmethod
     def _deactivate_done_callbacks(cls) -> None:
-        for action in cls._active_actions[:]:
+        for action in cls._active_actions:
             if action.done:
                 action._callbacks_active = False
 
     @classmethod
-    def _update_actions(cls, delta_time: float) -> None:
-        current = cls._active_actions[:]
-        wrappers = [action for action in current if action.wrapped_action is not None]
-        non_wrappers = [action for action in current if action.wrapped_action is None]
-        for action in wrappers:
-            action.update(delta_time)
-        for action in non_wrappers:
-            action.update(delta_time)
+    def _update_actions(cls, delta_time: float, stats=None, start: float = 0.0) -> float:
+        # Walk the registry's persistent phase lists (wrappers first) instead of copying
+        # them; removals are deferred until _rebuild_active_actions so indices stay put,
+        # and actions registered mid-frame are appended past the captured counts.
+        # Types with a batch_update hook get all of their batchable instances in one call.
+        # With frame stats on, the same walk times each phase and each update call.
+        registry = cls._active_actions
+        registry.defer_removals()
+        wrappers, others = registry.phases
+        for index in range(len(wrappers)):
+            action = wrappers[index]
+            if stats is None:
+                action.update(delta_time)
+            else:
+                before = perf_counter()
+                action.update(delta_time)
+                stats.add_action(action, perf_counter() - before)
+        if stats is not None:
+            start = stats.mark(_WRAPPER_UPDATES, start)
+        for action_type, group in registry.batch_groups.items():
+            if not group:
+                continue
+            if stats is None:
+                action_type.batch_update(group, delta_time)
+            else:
+                before = perf_counter()
+                action_type.batch_update(group, delta_time)
+                stats.add_batch(action_type, group, perf_counter() - before)
+        for index in range(len(others)):
+            action = others[index]
+            if stats is None:
+                action.update(delta_time)
+            else:
+                before = perf_counter()
+                action.update(delta_time)
+                stats.add_action(action, perf_counter() - before)
+            if action._parkable:
+                cls._park_if_idle(action)
+        if registry.clock_groups:
+            cls._update_clock_domains(delta_time, stats)
+        if cls._lod.enabled:
+            cls._park_offscreen_actions()
+        if stats is not None:
+            start = stats.mark(_ACTION_UPDATES, start)
+        return start
+
+    @classmethod
+    def _update_clock_domains(cls, delta_time: float, stats=None) -> None:
+        """Update actions bound to running clock domains with each domain's scaled delta.
+
+        Actions in a domain are never parked: the timer wheel counts frames, not ticks.
+        """
+        for domain, phases in cls._active_actions.clock_groups.items():
+            if domain._rescaled:
+                domain._rescaled = False
+                scale = domain.effective_scale
+                for phase in phases:
+                    for index in range(len(phase)):
+                        phase[index]._on_clock_scale(scale)
+            if not domain.effective_scale:
+                continue
+            scaled_delta = domain.advance(delta_time)
+            for phase in phases:
+                for index in range(len(phase)):
+                    action = phase[index]
+                    if stats is None:
+                        action.update(scaled_delta)
+                    else:
+                        before = perf_counter()
+                        action.update(scaled_delta)
+                        stats.add_action(action, perf_counter() - before)
+
+    @classmethod
+    def _park_if_idle(cls, action) -> None:
+        """Take an action that will only count frames for a while off the update path."""
+        idle = action._idle_frames()
+        if idle < _MIN_PARK_FRAMES:
+            return
+        cls._park(action, idle)
+
+    @classmethod
+    def _park_offscreen_actions(cls) -> None:
+        """Park opted-in actions whose sprites are all outside the LOD viewport."""
+        lod = cls._lod
+        longest = lod.interval - 1
+        if longest < 1:
+            return
+        registry = cls._active_actions
+        for phase in (registry.phases[1], *registry.batch_groups.values()):
+            for index in range(len(phase)):
+                action = phase[index]
+                if action._wake_frame is not None or action.done or not lod.applies_to(action):
+                    continue
+                idle = action._offscreen_idle_frames()
+                if idle and lod.is_offscreen(action):
+                    cls._park(action, min(longest, idle))
+
+    @classmethod
+    def _park(cls, action, idle: int) -> None:
+        """Skip the action's next *idle* updates; it wakes on the frame after them."""
+        frame = cls._frame_counter
+        action._parked_after = frame
+        action._wake_frame = frame + idle + 1
+        cls._timer_wheel.schedule(action, action._wake_frame)
+        cls._active_actions.park(action)
+
+    @classmethod
+    def _wake_parked_action(cls, action) -> None:
+        # Due on the current frame: every frame since it parked was skipped
+        cls._resume_parked_action(action, cls._frame_counter - 1)
+
+    @classmethod
+    def _unpark_action(cls, action) -> None:
+        """Wake a parked action early (pause/reset), crediting the frames it has missed so far."""
+        cls._timer_wheel.cancel(action)
+        # Mid-update, the current frame's update is treated as not having reached it yet
+        last_skipped = cls._frame_counter - 1 if cls._is_updating else cls._frame_counter
+        cls._resume_parked_action(action, last_skipped)
+
+    @classmethod
+    def _resume_parked_action(cls, action, last_skipped_frame: int) -> None:
+        action._wake_frame = None
+        skipped = last_skipped_frame - action._parked_after
+        if skipped > 0:
+            action._skip_frames(skipped)
+        cls._active_actions.unpark(action)
 
     @classmethod
     def _rebuild_active_actions(cls) -> None:
-        remaining_actions: list[Any] = []
-        if cls._enable_visualizer:
-            for action in cls._active_actions:
-                if action.done:
-                    action._record_event("removed")
-                    action._is_active = False
-                else:
-                    remaining_actions.append(action)
-        else:
-            for action in cls._active_actions:
-                if not action.done:
-                    remaining_actions.append(action)
-                else:
-                    action._is_active = False
-        cls._active_actions[:] = remaining_actions
+        cls._active_actions.sweep_finished(cls._retire_action)
         cls.num_active_actions = len(cls._active_actions)
 
+    @classmethod
+    def _retire_action(cls, action: Any) -> None:
+        if cls._enable_visualizer:
+            action._record_event("removed")
+        action._is_active = False
+
     @classmethod
     def _append_pending_actions(cls) -> None:
         if not cls._pending_actions:
             return
         for action in cls._pending_actions:
-            cls._active_actions.append(action)
+            cls._active_actions.add(action)
             action.start()
         cls._pending_actions.clear()
 
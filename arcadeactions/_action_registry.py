@@ -0,0 +1,361 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+
+def _action_tag(action: Any) -> str | None:
+    try:
+        return action.tag
+    except AttributeError:
+        return None
+
+
+def _action_target(action: Any) -> Any:
+    try:
+        return action.target
+    except AttributeError:
+        return None
+
+
+def _action_done(action: Any) -> bool:
+    try:
+        return bool(action.done)
+    except AttributeError:
+        return False
+
+
+def _action_is_wrapper(action: Any) -> bool:
+    try:
+        return action.wrapped_action is not None
+    except AttributeError:
+        return False
+
+
+def _action_batchable(action: Any) -> bool:
+    if getattr(type(action), "batch_update", None) is None:
+        return False
+    try:
+        return bool(action._batchable())
+    except AttributeError:
+        return True
+
+
+def _action_paused(action: Any) -> bool:
+    try:
+        return bool(action._paused)
+    except AttributeError:
+        return False
+
+
+class ActionRegistry:
+    """Ordered set of active actions indexed by target identity and tag.
+
+    Supports the list operations the rest of the library (and its tests) rely on
+    for ``Action._active_actions`` - ``append``, ``remove``, ``clear``, ``len``,
+    membership, iteration and slice reads/assignment - while making membership,
+    removal and lookups by target or tag O(1) in the number of active actions.
+
+    The index keys are captured when an action is added, so removing an action
+    whose ``target`` or ``tag`` was reassigned afterwards still cleans up the
+    right buckets; ``Action.tag`` calls :meth:`reindex` when it changes.
+
+    The registry also keeps a running set of paused members, updated through
+    :meth:`set_paused` by ``Action.pause()``/``resume()``, so "are all active
+    actions paused?" is answered without scanning. Iteration is live; callers
+    that stop actions while iterating must iterate over a copy
+    (``list(registry)``).
+
+    For the per-frame update the registry keeps persistent phase lists so
+    ``update_all`` walks them without copying: :attr:`phases` holds wrapper actions
+    (``wrapped_action`` set, e.g. ``Ease``) and plain actions, and :attr:`batch_groups`
+    holds one list per action type with a ``batch_update`` hook, for the instances whose
+    ``_batchable()`` is True. Entries are
+    swap-removed, so phase order is not insertion order once actions finish. Between
+    :meth:`defer_removals` and :meth:`sweep_finished`, removals leave the phase
+    lists untouched so indices stay stable while they are being iterated.
+    :meth:`park` takes a registered action out of the phase lists while it waits on
+    the manager's timer wheel, and :meth:`unpark` puts it back. Actions bound to a
+    clock domain (``Action._clock``) go to :attr:`clock_groups` instead, one
+    (wrappers, others) pair per domain, so a paused or slowed domain is skipped as a whole.
+    """
+
+    __slots__ = (
+        "_actions",
+        "_by_target",
+        "_by_tag",
+        "_paused",
+        "_phase_slots",
+        "phases",
+        "batch_groups",
+        "clock_groups",
+        "_deferring",
+        "_parking",
+    )
+
+    def __init__(self, actions: Iterable[Any] = ()):
+        # action -> (id(target) or None, tag) captured at insertion time
+        self._actions: dict[Any, tuple[int | None, str | None]] = {}
+        self._by_target: dict[int, dict[Any, None]] = {}
+        self._by_tag: dict[str, dict[Any, None]] = {}
+        self._paused: set[Any] = set()
+        # (wrappers, others); each action maps to its (phase list, index) slot
+        self.phases: tuple[list[Any], list[Any]] = ([], [])
+        self.batch_groups: dict[type, list[Any]] = {}
+        self.clock_groups: dict[Any, tuple[list[Any], list[Any]]] = {}
+        self._phase_slots: dict[Any, tuple[list[Any], int]] = {}
+        self._deferring = False
+        # Actions parked mid-update, taken out of their phase lists by the next sweep
+        self._parking: list[Any] = []
+        for action in actions:
+            self.add(action)
+
+    # ------------------------------------------------------------------ mutation
+    def add(self, action: Any) -> None:
+        """Add an action, indexing it by its current target and tag."""
+        if action in self._actions:
+            return
+        target = _action_target(action)
+        target_key = id(target) if target is not None else None
+        tag = _action_tag(action)
+        self._actions[action] = (target_key, tag)
+        if target_key is not None:
+            self._by_target.setdefault(target_key, {})[action] = None
+        if tag is not None:
+            self._by_tag.setdefault(tag, {})[action] = None
+        if _action_paused(action):
+            self._paused.add(action)
+        self._insert_into_phase(action)
+
+    append = add
+
+    def _insert_into_phase(self, action: Any) -> None:
+        # A deferred removal may have left the action in its phase list already
+        if action not in self._phase_slots:
+            clock = getattr(action, "_clock", None)
+            if clock is not None:
+                group = self.clock_groups.get(clock)
+                if group is None:
+                    group = self.clock_groups[clock] = ([], [])
+                phase = group[0] if _action_is_wrapper(action) else group[1]
+            elif _action_is_wrapper(action):
+                phase = self.phases[0]
+            elif _action_batchable(action):
+                phase = self.batch_groups.setdefault(type(action), [])
+            else:
+                phase = self.phases[1]
+            self._phase_slots[action] = (phase, len(phase))
+            phase.append(action)
+
+    def _remove_from_phase(self, action: Any) -> None:
+        slot = self._phase_slots.pop(action, None)
+        if slot is None:
+            return
+        phase, index = slot
+        last = phase.pop()
+        if last is not action:
+            phase[index] = last
+            self._phase_slots[last] = (phase, index)
+
+    def discard(self, action: Any) -> bool:
+        """Remove an action if present. Returns True when something was removed."""
+        keys = self._actions.pop(action, None)
+        if keys is None:
+            return False
+        target_key, tag = keys
+        self._paused.discard(action)
+        if not self._deferring:
+            self._remove_from_phase(action)
+        self._unindex(action, target_key, tag)
+        return True
+
+    def _unindex(self, action: Any, target_key: int | None, tag: str | None) -> None:
+        if target_key is not None:
+            bucket = self._by_target.get(target_key)
+            if bucket is not None:
+                bucket.pop(action, None)
+                if not bucket:
+                    del self._by_target[target_key]
+        if tag is not None:
+            bucket = self._by_tag.get(tag)
+            if bucket is not None:
+                bucket.pop(action, None)
+                if not bucket:
+                    del self._by_tag[tag]
+
+    def remove(self, action: Any) -> None:
+        """Remove an action, raising ValueError if it is not registered (list semantics)."""
+        if not self.discard(action):
+            raise ValueError("action is not registered")
+
+    def clear(self) -> None:
+        self._actions.clear()
+        self._by_target.clear()
+        self._by_tag.clear()
+        self._paused.clear()
+        for phase in self.phases:
+            phase.clear()
+        self.batch_groups.clear()
+        self.clock_groups.clear()
+        self._phase_slots.clear()
+        self._parking.clear()
+
+    def park(self, action: Any) -> None:
+        """Keep a registered action registered but out of the phase lists until :meth:`unpark`."""
+        if action not in self._actions:
+            return
+        if self._deferring:
+            self._parking.append(action)
+        else:
+            self._remove_from_phase(action)
+
+    def unpark(self, action: Any) -> None:
+        """Return a parked action to its phase list (no-op if it is not registered)."""
+        if action not in self._actions:
+            return
+        if self._parking and action in self._parking:
+            self._parking.remove(action)
+        self._insert_into_phase(action)
+
+    def defer_removals(self) -> None:
+        """Keep removed actions in the phase lists until :meth:`sweep_finished`."""
+        self._deferring = True
+
+    def sweep_finished(self, on_finished: Callable[[Any], None]) -> None:
+        """End deferral and compact the phase lists in place.
+
+        Registered actions that are done are passed to *on_finished* and removed;
+        entries whose removal was deferred are dropped. Each removal swap-removes, so
+        a frame in which nothing finishes allocates nothing.
+        """
+        self._deferring = False
+        if self._parking:
+            for action in self._parking:
+                self._remove_from_phase(action)
+            self._parking.clear()
+        for phase in self.phases:
+            self._sweep_phase(phase, on_finished)
+        for phase in self.batch_groups.values():
+            self._sweep_phase(phase, on_finished)
+        if self.clock_groups:
+            empty = []
+            for clock, group in self.clock_groups.items():
+                for phase in group:
+                    self._sweep_phase(phase, on_finished)
+                if not group[0] and not group[1]:
+                    empty.append(clock)
+            for clock in empty:
+                del self.clock_groups[clock]
+
+    def _sweep_phase(self, phase: list[Any], on_finished: Callable[[Any], None]) -> None:
+        actions = self._actions
+        index = 0
+        while index < len(phase):
+            action = phase[index]
+            if action not in actions:
+                self._remove_from_phase(action)
+            elif _action_done(action):
+                on_finished(action)
+                # Either call swap-removes the entry; the slot now holds the former last action
+                self.discard(action)
+            else:
+                index += 1
+
+    def set_paused(self, action: Any, paused: bool) -> None:
+        """Record a registered action's pause state; unregistered actions are ignored."""
+        if action not in self._actions:
+            return
+        if paused:
+            self._paused.add(action)
+        else:
+            self._paused.discard(action)
+
+    def reindex(self, action: Any) -> None:
+        """Refresh the index keys for an action whose target or tag changed.
+
+        Only the target and tag buckets move; the action keeps its phase slot, so a
+        parked action stays parked.
+        """
+        keys = self._actions.get(action)
+        if keys is None:
+            return
+        target = _action_target(action)
+        target_key = id(target) if target is not None else None
+        tag = _action_tag(action)
+        if keys == (target_key, tag):
+            return
+        self._unindex(action, *keys)
+        self._actions[action] = (target_key, tag)
+        if target_key is not None:
+            self._by_target.setdefault(target_key, {})[action] = None
+        if tag is not None:
+            self._by_tag.setdefault(tag, {})[action] = None
+
+    # ------------------------------------------------------------------ queries
+    @property
+    def deferring(self) -> bool:
+        """True between :meth:`defer_removals` and :meth:`sweep_finished`."""
+        return self._deferring
+
+    @property
+    def paused_count(self) -> int:
+        return len(self._paused)
+
+    def all_paused(self, exclude: Any = None) -> bool:
+        """Return True when every registered action (other than *exclude*) is paused.
+
+        An empty registry, or one holding only *exclude*, is never "all paused".
+        """
+        total = len(self._actions)
+        paused = len(self._paused)
+        if exclude is not None and exclude in self._actions:
+            total -= 1
+            if exclude in self._paused:
+                paused -= 1
+        return total > 0 and paused == total
+
+    def for_target(self, target: Any, tag: str | None = None) -> list[Any]:
+        """Return actions applied to *target* (optionally filtered by tag) in insertion order."""
+        bucket = self._by_target.get(id(target))
+        if not bucket:
+            return []
+        if tag:
+            return [action for action in bucket if _action_tag(action) == tag]
+        return list(bucket)
+
+    def for_tag(self, tag: str) -> list[Any]:
+        """Return actions registered under *tag* in insertion order."""
+        bucket = self._by_tag.get(tag)
+        if not bucket:
+            return []
+        return list(bucket)
+
+    # ------------------------------------------------------------------ list protocol
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._actions)
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __bool__(self) -> bool:
+        return bool(self._actions)
+
+    def __contains__(self, action: object) -> bool:
+        try:
+            return action in self._actions
+        except TypeError:
+            return False
+
+    def __getitem__(self, index):
+        return list(self._actions)[index]
+
+    def __setitem__(self, index, actions: Iterable[Any]) -> None:
+        if not isinstance(index, slice) or index != slice(None, None, None):
+            raise TypeError("ActionRegistry only supports full-slice assignment")
+        replacement = list(actions)
+        self.clear()
+        for action in replacement:
+            self.add(action)
+
+    def __repr__(self) -> str:
+        return f"ActionRegistry({list(self._actions)!r})"
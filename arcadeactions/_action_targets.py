@@ -3,6 +3,8 @@ from __future__ import annotations
 from collections.abc import Iterable
 from typing import Any, Protocol, TYPE_CHECKING
 
+from ._sprite_state import SpriteStateMap
+
 if TYPE_CHECKING:
     import arcade
 
@@ -37,7 +39,7 @@ class SpriteTargetAdapter:
         return self._sprite_lists
 
     def describe_target(self) -> str:
-        return type(self.target).__name__
+        return _target_names.get(id(self.target)) or type(self.target).__name__
 
 
 class SpriteListTargetAdapter:
@@ -69,7 +71,7 @@ class IterableTargetAdapter:
         return ()
 
     def describe_target(self) -> str:
-        return type(self.target).__name__
+        return _target_names.get(id(self.target)) or type(self.target).__name__
 
 
 _ADAPTERS: dict[type[Any], type[TargetAdapter]] = {}
@@ -112,17 +114,31 @@ def adapt_target(target: Any) -> TargetAdapter:
     return adapter_type(target)
 
 
-def _get_sprite_list_name(sprite_list: Any) -> str:
-    """Attempt to find an attribute name that refers to this SpriteList."""
-    import gc
-
-    for obj in gc.get_objects():
-        try:
-            obj_dict = obj.__dict__
-            for attr_name, attr_value in obj_dict.items():
-                if attr_value is sprite_list:
-                    return f"{type(obj).__name__}.{attr_name}"
-        except AttributeError:
-            continue
+# Debug labels for targets, dropped when the target is garbage-collected
+_target_names = SpriteStateMap()
+
+
+def register_target_name(target: Any, name: str | None) -> None:
+    """Give *target* a readable name for debug logs and the visualizer.
+
+    ``Action.apply(..., name=...)`` calls this for you. Passing ``None`` forgets the
+    name. Plain lists and tuples can't be weakly referenced, so naming one keeps it
+    alive until its name is removed again.
+    """
+    if name is None:
+        _target_names.pop(id(target), None)
+    else:
+        _target_names.set_for(target, name)
 
+
+def get_target_name(target: Any) -> str | None:
+    """Return the name registered for *target*, if any."""
+    return _target_names.get(id(target))
+
+
+def _get_sprite_list_name(sprite_list: Any) -> str:
+    """Return the registered name of a SpriteList, or a label built from its length."""
+    name = _target_names.get(id(sprite_list))
+    if name is not None:
+        return name
     return f"SpriteList(len={len(sprite_list)})"
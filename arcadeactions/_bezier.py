@@ -0,0 +1,147 @@
+"""Precomputed Bezier curves shared by the path-following actions.
+
+A :class:`BezierCurve` is built once per distinct control-point tuple and cached, so
+the many actions that follow the same preset path share one set of coefficients and
+one arc-length table instead of re-sampling the curve every time they start.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from math import comb, hypot
+from typing import Any
+
+# Above this degree the monomial (power-basis) form loses too much precision to
+# cancellation, so evaluation falls back to Bernstein form with precomputed binomials.
+_MAX_POWER_BASIS_DEGREE = 7
+
+_CURVE_CACHE_SIZE = 256
+
+
+class BezierCurve:
+    """Immutable Bezier curve with an arc-length → parameter lookup table.
+
+    Args:
+        control_points: Tuple of (x, y) control points (at least 2).
+        samples: Number of chords used to approximate arc length. Defaults to a value
+            that scales with the curve degree.
+    """
+
+    __slots__ = ("control_points", "degree", "length", "_coeffs_x", "_coeffs_y", "_binomials", "_lengths", "_params")
+
+    def __init__(self, control_points: tuple[tuple[float, float], ...], samples: int | None = None):
+        if len(control_points) < 2:
+            raise ValueError("Must specify at least 2 control points")
+        self.control_points = control_points
+        self.degree = n = len(control_points) - 1
+
+        if n <= _MAX_POWER_BASIS_DEGREE:
+            # B(t) = sum_j c_j t^j with c_j = C(n, j) * sum_i (-1)^(j-i) C(j, i) P_i
+            coeffs_x = []
+            coeffs_y = []
+            for j in range(n + 1):
+                cx = cy = 0.0
+                for i in range(j + 1):
+                    weight = (-1) ** (j - i) * comb(j, i)
+                    cx += weight * control_points[i][0]
+                    cy += weight * control_points[i][1]
+                scale = comb(n, j)
+                coeffs_x.append(cx * scale)
+                coeffs_y.append(cy * scale)
+            # Stored highest power first for Horner evaluation
+            self._coeffs_x: tuple[float, ...] | None = tuple(reversed(coeffs_x))
+            self._coeffs_y: tuple[float, ...] | None = tuple(reversed(coeffs_y))
+            self._binomials: tuple[int, ...] = ()
+        else:
+            self._coeffs_x = self._coeffs_y = None
+            self._binomials = tuple(comb(n, i) for i in range(n + 1))
+
+        if samples is None:
+            samples = min(1024, max(128, 32 * n))
+        lengths = [0.0]
+        params = [0.0]
+        prev_x, prev_y = self.point(0.0)
+        total = 0.0
+        for i in range(1, samples + 1):
+            t = i / samples
+            x, y = self.point(t)
+            total += hypot(x - prev_x, y - prev_y)
+            lengths.append(total)
+            params.append(t)
+            prev_x, prev_y = x, y
+        self.length = total
+        self._lengths = lengths
+        self._params = params
+
+    def point(self, t: float) -> tuple[float, float]:
+        """Return the point on the curve at parameter *t* (0-1)."""
+        coeffs_x = self._coeffs_x
+        if coeffs_x is not None:
+            coeffs_y = self._coeffs_y
+            x = y = 0.0
+            for cx, cy in zip(coeffs_x, coeffs_y, strict=True):
+                x = x * t + cx
+                y = y * t + cy
+            return (x, y)
+
+        # Bernstein form: t^i grows forwards, (1-t)^(n-i) is accumulated backwards
+        n = self.degree
+        u = 1.0 - t
+        t_powers = [1.0] * (n + 1)
+        for i in range(1, n + 1):
+            t_powers[i] = t_powers[i - 1] * t
+        x = y = 0.0
+        u_power = 1.0
+        for i in range(n, -1, -1):
+            coef = self._binomials[i] * t_powers[i] * u_power
+            px, py = self.control_points[i]
+            x += px * coef
+            y += py * coef
+            u_power *= u
+        return (x, y)
+
+    def param_at_distance(self, distance: float) -> float:
+        """Return the curve parameter *t* reached after travelling *distance* pixels."""
+        if distance <= 0.0:
+            return 0.0
+        if distance >= self.length:
+            return 1.0
+        lengths = self._lengths
+        index = bisect_left(lengths, distance)
+        start = lengths[index - 1]
+        span = lengths[index] - start
+        t0 = self._params[index - 1]
+        if span <= 0.0:
+            return t0
+        return t0 + (self._params[index] - t0) * (distance - start) / span
+
+    def point_at_distance(self, distance: float) -> tuple[float, float]:
+        """Return the point reached after travelling *distance* pixels along the curve."""
+        return self.point(self.param_at_distance(distance))
+
+    def points_at_distances(self, np: Any, distances: Any) -> tuple[Any, Any]:
+        """Vectorized :meth:`point_at_distance` for a NumPy array of distances.
+
+        *np* is the NumPy module, passed in so this module never imports it itself.
+        Returns ``(xs, ys)`` arrays.
+        """
+        params = np.interp(distances, self._lengths, self._params)
+        # point() is pure arithmetic, so it evaluates element-wise on arrays
+        return self.point(params)
+
+
+@lru_cache(maxsize=_CURVE_CACHE_SIZE)
+def _cached_curve(control_points: tuple[tuple[float, float], ...]) -> BezierCurve:
+    return BezierCurve(control_points)
+
+
+def get_bezier_curve(control_points: Iterable[Sequence[float]]) -> BezierCurve:
+    """Return the shared :class:`BezierCurve` for *control_points*.
+
+    Curves are cached (LRU) by their control-point values, so equal paths built
+    independently – e.g. by the dive presets – reuse the same precomputed tables.
+    """
+    key = tuple((float(point[0]), float(point[1])) for point in control_points)
+    return _cached_curve(key)
@@ -0,0 +1,97 @@
+"""Cached callback arities, so actions call callbacks with the right arguments directly.
+
+Callbacks may accept the arguments an action offers (the target, a condition result,
+``(sprite, axis, side)`` for boundary callbacks) or a prefix of them. Finding out by
+calling and catching ``TypeError`` costs an exception per call and also swallows
+TypeErrors raised inside the callback, so the accepted positional range is read from the
+signature once per function and cached.
+"""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import types
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+# Upper bound reported for callbacks taking *args
+VARIADIC = sys.maxsize
+
+_CACHE_SIZE = 1024
+
+_POSITIONAL_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+# Keyed weakly so caching a callback never keeps it (or a closure's captured state) alive
+_arity_cache: weakref.WeakKeyDictionary[Any, tuple[int, int] | None] = weakref.WeakKeyDictionary()
+
+
+def callback_arity(fn: Callable) -> tuple[int, int] | None:
+    """Return ``(required, maximum)`` positional arguments accepted by *fn*.
+
+    ``maximum`` is :data:`VARIADIC` for callbacks with ``*args`` after named parameters.
+    Returns None when the arity can't be known up front: the signature is not
+    inspectable, the callback takes nothing but ``*args`` (so it gives no hint which
+    arguments it wants), or it has required keyword-only parameters. Callers fall back
+    to trying the call in that case.
+    """
+    offset = 0
+    key = fn
+    if isinstance(fn, types.MethodType):
+        # Bound methods are created on every attribute access; cache the function
+        key = fn.__func__
+        offset = 1
+
+    try:
+        arity = _arity_cache[key]
+    except KeyError:
+        arity = _resolve_arity(key)
+        if len(_arity_cache) >= _CACHE_SIZE:
+            _arity_cache.clear()
+        _arity_cache[key] = arity
+    except TypeError:
+        # Not weakly referenceable (or unhashable): resolve without caching
+        arity = _resolve_arity(key)
+
+    if arity is None or not offset:
+        return arity
+    required, maximum = arity
+    if maximum == 0:
+        return None
+    return (max(required - offset, 0), maximum if maximum == VARIADIC else maximum - offset)
+
+
+def _resolve_arity(fn: Callable) -> tuple[int, int] | None:
+    try:
+        signature = inspect.signature(fn)
+    except (TypeError, ValueError):
+        return None
+
+    required = maximum = 0
+    variadic = False
+    for parameter in signature.parameters.values():
+        if parameter.kind in _POSITIONAL_KINDS:
+            maximum += 1
+            if parameter.default is inspect.Parameter.empty:
+                required += 1
+        elif parameter.kind is inspect.Parameter.VAR_POSITIONAL:
+            variadic = True
+        elif parameter.kind is inspect.Parameter.KEYWORD_ONLY and parameter.default is inspect.Parameter.empty:
+            return None
+
+    if variadic:
+        if maximum == 0:
+            return None
+        maximum = VARIADIC
+    return (required, maximum)
+
+
+def describe_arity(arity: tuple[int, int]) -> str:
+    """Human-readable form of an arity for signature-mismatch warnings."""
+    required, maximum = arity
+    if maximum == VARIADIC:
+        return f"at least {required}"
+    if required == maximum:
+        return str(required)
+    return f"{required} to {maximum}"
@@ -0,0 +1,175 @@
+"""Opt-in detection of slow user callbacks run inside ``Action.update_all``.
+
+Callbacks (``on_stop``, boundary callbacks, ``CallbackUntil`` callbacks such as
+``every_frames`` tickers) and condition functions (``sprite_count``, custom lambdas)
+run inline in the frame. With the watchdog enabled, each invocation is timed. Any
+call at or over the threshold is recorded with the callback's qualified name, the
+owning action and its tag, and the ``file:line`` that ``apply()``'d the action.
+Actions started by a composite report the composite's apply site. That location
+is captured once in ``apply()``, and only while the watchdog is enabled.
+
+Reports go to a bounded buffer, to a per-offender summary and, when a debug store
+is injected (the visualizer), to its event log as ``slow_callback`` events.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+DEFAULT_THRESHOLD_MS = 2.0
+DEFAULT_CAPACITY = 256
+
+_PACKAGE_PREFIX = os.path.dirname(os.path.abspath(__file__)) + os.sep
+
+
+@dataclass(frozen=True)
+class SlowCallbackReport:
+    """One callback invocation that took at least the watchdog threshold."""
+
+    callback: str
+    kind: str
+    duration_ms: float
+    action_type: str
+    action_id: int
+    tag: str | None
+    apply_site: str | None
+    frame: int
+
+
+def callback_qualname(fn: Callable) -> str:
+    """Return ``module.qualname`` for *fn*, falling back to its type name."""
+    qualname = getattr(fn, "__qualname__", None)
+    if qualname is None:
+        return type(fn).__name__
+    module = getattr(fn, "__module__", None)
+    return f"{module}.{qualname}" if module else qualname
+
+
+def capture_apply_site() -> str | None:
+    """Return ``file:line`` of the innermost caller outside the arcadeactions package."""
+    frame = sys._getframe(1)
+    while frame is not None and frame.f_code.co_filename.startswith(_PACKAGE_PREFIX):
+        frame = frame.f_back
+    if frame is None:
+        return None
+    return f"{frame.f_code.co_filename}:{frame.f_lineno}"
+
+
+class CallbackWatchdog:
+    """Threshold check for timed callback invocations, plus the reports it produced."""
+
+    __slots__ = ("enabled", "threshold", "dropped", "_reports", "_summary")
+
+    def __init__(self, threshold_ms: float = DEFAULT_THRESHOLD_MS, capacity: int = DEFAULT_CAPACITY):
+        self.enabled = False
+        self.threshold = threshold_ms / 1000
+        self.dropped = 0
+        self._reports: deque[SlowCallbackReport] = deque(maxlen=capacity)
+        # (callback, kind, action type, tag, apply site) -> [count, total seconds, max seconds]
+        self._summary: dict[tuple[str, str, str, str | None, str | None], list[float]] = {}
+
+    @property
+    def threshold_ms(self) -> float:
+        return self.threshold * 1000
+
+    @property
+    def capacity(self) -> int:
+        return self._reports.maxlen or 0
+
+    def configure(self, *, threshold_ms: float, capacity: int) -> None:
+        """Set the threshold and resize the report buffer (keeping the newest reports)."""
+        if threshold_ms < 0:
+            raise ValueError("threshold_ms must not be negative")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.threshold = threshold_ms / 1000
+        if capacity != self.capacity:
+            self._reports = deque(self._reports, maxlen=capacity)
+
+    def check(self, fn: Callable, action: Any, seconds: float, kind: str = "callback") -> None:
+        """Record the invocation of *fn* owned by *action* if it took at least the threshold."""
+        if seconds >= self.threshold:
+            self._record(fn, action, seconds, kind)
+
+    def _record(self, fn: Callable, action: Any, seconds: float, kind: str) -> None:
+        from ._action_core import Action
+
+        report = SlowCallbackReport(
+            callback=callback_qualname(fn),
+            kind=kind,
+            duration_ms=seconds * 1000,
+            action_type=type(action).__name__,
+            action_id=id(action),
+            tag=action.tag,
+            apply_site=action._apply_site,
+            frame=Action._frame_counter,
+        )
+        if len(self._reports) == self._reports.maxlen:
+            self.dropped += 1
+        self._reports.append(report)
+
+        key = (report.callback, kind, report.action_type, report.tag, report.apply_site)
+        totals = self._summary.get(key)
+        if totals is None:
+            self._summary[key] = [1, seconds, seconds]
+        else:
+            totals[0] += 1
+            totals[1] += seconds
+            totals[2] = max(totals[2], seconds)
+
+        store = Action._debug_store
+        if store is not None:
+            target = action.target
+            store.record_event(
+                event_type="slow_callback",
+                action_id=report.action_id,
+                action_type=report.action_type,
+                target_id=id(target) if target is not None else 0,
+                target_type=type(target).__name__ if target is not None else "None",
+                tag=report.tag,
+                callback=report.callback,
+                kind=kind,
+                duration_ms=report.duration_ms,
+                apply_site=report.apply_site,
+            )
+
+    def reports(self) -> list[SlowCallbackReport]:
+        """Return buffered reports, oldest first."""
+        return list(self._reports)
+
+    def summary(self) -> list[dict[str, Any]]:
+        """Return one entry per offender (callback, kind, action type, tag, apply site), worst total first.
+
+        Each entry holds those fields plus ``count``, ``total_ms`` and ``max_ms``. The
+        summary covers every slow call since the last :meth:`clear`, including reports
+        that have since dropped out of the buffer.
+        """
+        entries = [
+            {
+                "callback": callback,
+                "kind": kind,
+                "action_type": action_type,
+                "tag": tag,
+                "apply_site": apply_site,
+                "count": int(count),
+                "total_ms": total * 1000,
+                "max_ms": longest * 1000,
+            }
+            for (callback, kind, action_type, tag, apply_site), (count, total, longest) in self._summary.items()
+        ]
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return entries
+
+    def clear(self) -> None:
+        """Discard reports and the summary."""
+        self._reports.clear()
+        self._summary.clear()
+        self.dropped = 0
+
+
+callback_watchdog = CallbackWatchdog()
@@ -0,0 +1,121 @@
+"""Named clock domains that scale or pause groups of actions in O(1).
+
+An action applied with ``apply(target, clock="enemies")`` runs on that domain's
+clock instead of the frame clock. While the domain runs, ``update_all`` updates its
+actions once per frame with ``delta_time * scale``, so motion stays smooth at any
+scale. A paused domain, or one at scale 0, is skipped as a whole.
+
+Actions adopt the domain's scale as ``Action._clock_scale``. Time-based effects
+(paths, duration timers, interval callbacks) advance by the scaled delta. Frame-stepped
+effects (tweens, parametric motion, ``Ease``, blinking) advance ``_clock_scale`` frames
+per update. Frame-counted stop conditions (``after_frames``, ``DelayFrames``) count
+whole domain ticks: each action accumulates its scale and checks the condition once
+per whole tick, so at 0.5 ``after_frames(60)`` ends after 120 frames.
+
+``MoveUntil`` and ``RotateUntil`` set velocities that Arcade integrates every
+rendered frame, so they scale those velocities by the domain's scale (0 while
+paused). A scale change only flags the domain. Its velocity actions re-apply their
+velocity once in the next ``update_all``, instead of each going through
+``set_factor``/``apply_effect`` at the call site.
+"""
+
+from __future__ import annotations
+
+# Absorbs float error so e.g. ten frames at scale 0.1 add up to one whole tick
+TICK_EPSILON = 1e-9
+
+
+class ClockDomain:
+    """Time scale and pause state shared by the actions bound to it."""
+
+    __slots__ = ("name", "scale", "paused", "ticks", "time", "_budget", "_rescaled")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.scale = 1.0
+        self.paused = False
+        # Whole ticks and scaled seconds elapsed since the domain was created or reset
+        self.ticks = 0
+        self.time = 0.0
+        self._budget = 0.0
+        # Set when scale or pause changed; update_all re-applies velocities once
+        self._rescaled = False
+
+    @property
+    def effective_scale(self) -> float:
+        """The scale velocities are multiplied by: 0 while paused."""
+        return 0.0 if self.paused else self.scale
+
+    def set_scale(self, scale: float) -> None:
+        """Run this domain at *scale* times the frame rate (0 freezes it, 1 is normal speed)."""
+        if scale < 0:
+            raise ValueError("scale must not be negative")
+        if scale != self.scale:
+            self.scale = float(scale)
+            self._rescaled = True
+
+    def pause(self) -> None:
+        if not self.paused:
+            self.paused = True
+            self._rescaled = True
+
+    def resume(self) -> None:
+        if self.paused:
+            self.paused = False
+            self._rescaled = True
+
+    def advance(self, delta_time: float) -> float:
+        """Advance the domain by one frame and return the scaled delta for its actions."""
+        scaled = delta_time * self.scale
+        self._budget += self.scale
+        ticks = int(self._budget + TICK_EPSILON)
+        self._budget = max(0.0, self._budget - ticks)
+        self.ticks += ticks
+        self.time += scaled
+        return scaled
+
+    def reset(self) -> None:
+        """Return to scale 1, unpaused, with no elapsed ticks."""
+        if self.scale != 1.0 or self.paused:
+            self._rescaled = True
+        self.scale = 1.0
+        self.paused = False
+        self.ticks = 0
+        self.time = 0.0
+        self._budget = 0.0
+
+    def __repr__(self) -> str:
+        state = ", paused" if self.paused else ""
+        return f"ClockDomain({self.name!r}, scale={self.scale}{state})"
+
+
+class ClockDomains:
+    """Name -> :class:`ClockDomain` lookup; domains are created on first use."""
+
+    __slots__ = ("_domains",)
+
+    def __init__(self):
+        self._domains: dict[str, ClockDomain] = {}
+
+    def get(self, name: str) -> ClockDomain:
+        domain = self._domains.get(name)
+        if domain is None:
+            domain = self._domains[name] = ClockDomain(name)
+        return domain
+
+    def resolve(self, clock: str | ClockDomain | None) -> ClockDomain | None:
+        """Return the domain for a name or domain passed to ``apply(clock=...)``."""
+        if clock is None or isinstance(clock, ClockDomain):
+            return clock
+        return self.get(clock)
+
+    def names(self) -> list[str]:
+        return list(self._domains)
+
+    def reset(self) -> None:
+        """Reset every domain to scale 1, unpaused."""
+        for domain in self._domains.values():
+            domain.reset()
+
+
+clock_domains = ClockDomains()
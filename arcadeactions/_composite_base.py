@@ -16,6 +16,23 @@ class CompositeAction(Action):
             self._on_complete_called = True
             self.done = True
 
+    def _start_child(self, action: Action) -> None:
+        """Start a sub-action on this composite's target, attributing it to this composite's apply site."""
+        action.target = self.target
+        if self._apply_site is not None:
+            action._apply_site = self._apply_site
+        if action._clock_scale != self._clock_scale:
+            action._on_clock_scale(self._clock_scale)
+        action.start()
+
+    def _on_clock_scale(self, scale: float) -> None:
+        super()._on_clock_scale(scale)
+        current = getattr(self, "current_action", None)
+        if current is not None and current not in self.actions:
+            current._on_clock_scale(scale)
+        for action in self.actions:
+            action._on_clock_scale(scale)
+
     def reverse_movement(self, axis: str) -> None:
         pass
 
@@ -23,9 +40,14 @@ class CompositeAction(Action):
         return self.actions
 
     def reset(self) -> None:
-        self.done = False
+        super().reset()
         self._on_complete_called = False
 
+    def _can_reuse(self) -> bool:
+        if not self._supports_reuse:
+            return False
+        return all(action._can_reuse() for action in self.actions)
+
     def clone(self) -> "CompositeAction":
         raise NotImplementedError("Subclasses must implement clone()")
 
@@ -0,0 +1,136 @@
+"""Fixed-timestep driving of ``Action.update_all`` with render interpolation.
+
+``Action.update_fixed(delta_time)`` adds the real frame time to an accumulator and
+runs as many whole ``update_all(step)`` calls as it covers. Duration tracking,
+tweens and parametric motion then always see the same delta, and frame-counting
+conditions advance once per simulated step rather than once per rendered frame. When
+the game falls behind, at most ``max_steps`` steps run per call and the excess time
+is dropped, so a slow frame can't snowball into ever longer catch-up frames.
+
+Before the last step of each call, the driver records the position of every sprite
+targeted by an active action. After the steps, the leftover accumulator gives the
+interpolation alpha. Drawing at ``previous + (current - previous) * alpha`` keeps
+motion smooth when the render rate and the simulation rate differ.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from ._sprite_state import SpriteStateMap
+
+DEFAULT_STEP = 1 / 60
+DEFAULT_MAX_STEPS = 5
+
+# Absorbs float error so e.g. three 1/180 s frames add up to one 1/60 s step
+_EPSILON = 1e-9
+
+
+class FixedStepClock:
+    """Accumulator, interpolation alpha and previous sprite positions for ``update_fixed``."""
+
+    __slots__ = ("step", "accumulator", "alpha", "dropped_steps", "_generation", "_previous")
+
+    def __init__(self):
+        self.step = DEFAULT_STEP
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        # Whole steps discarded by the max_steps cap since the last reset()
+        self.dropped_steps = 0
+        self._generation = 0
+        # id(sprite) -> [x, y, generation] captured before the last step
+        self._previous = SpriteStateMap()
+
+    def accumulate(self, delta_time: float, step: float, max_steps: int) -> int:
+        """Add *delta_time* and return how many steps of *step* seconds to run now."""
+        if step <= 0:
+            raise ValueError("step must be positive")
+        if max_steps < 1:
+            raise ValueError("max_steps must be at least 1")
+        self.step = step
+        self.accumulator += max(0.0, delta_time)
+        steps = int((self.accumulator + _EPSILON) / step)
+        self.accumulator = max(0.0, self.accumulator - steps * step)
+        if steps > max_steps:
+            self.dropped_steps += steps - max_steps
+            steps = max_steps
+        self.alpha = min(1.0, self.accumulator / step)
+        return steps
+
+    def capture(self, actions: Iterable[Any]) -> None:
+        """Record the current position of every sprite targeted by *actions*."""
+        self._generation += 1
+        generation = self._generation
+        previous = self._previous
+        seen: set[int] = set()
+        for action in actions:
+            adapter = action._target_adapter
+            if adapter is None or id(adapter.target) in seen:
+                continue
+            seen.add(id(adapter.target))
+            for sprite in adapter.iter_sprites():
+                entry = previous.get(id(sprite))
+                if entry is None:
+                    previous.set_for(sprite, [sprite.center_x, sprite.center_y, generation])
+                else:
+                    entry[0] = sprite.center_x
+                    entry[1] = sprite.center_y
+                    entry[2] = generation
+
+    def previous_position(self, sprite: Any) -> tuple[float, float] | None:
+        """Return *sprite*'s position before the last step, or None if it wasn't captured."""
+        entry = self._previous.get(id(sprite))
+        if entry is None or entry[2] != self._generation:
+            return None
+        return (entry[0], entry[1])
+
+    def interpolated_position(self, sprite: Any) -> tuple[float, float]:
+        """Return where to draw *sprite*: between its previous and current position by alpha."""
+        x = sprite.center_x
+        y = sprite.center_y
+        entry = self._previous.get(id(sprite))
+        if entry is None or entry[2] != self._generation:
+            return (x, y)
+        alpha = self.alpha
+        return (entry[0] + (x - entry[0]) * alpha, entry[1] + (y - entry[1]) * alpha)
+
+    def reset(self) -> None:
+        """Drop accumulated time and captured positions."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.dropped_steps = 0
+        self._generation += 1
+        self._previous.clear()
+
+
+fixed_step_clock = FixedStepClock()
+
+
+def interpolated_position(sprite: Any) -> tuple[float, float]:
+    """Return the position to draw *sprite* at after ``Action.update_fixed``."""
+    return fixed_step_clock.interpolated_position(sprite)
+
+
+@contextmanager
+def interpolated_positions(sprites: Iterable[Any]) -> Iterator[None]:
+    """Move *sprites* to their interpolated positions for drawing, then restore them.
+
+    Example:
+        with interpolated_positions(enemies):
+            enemies.draw()
+    """
+    clock = fixed_step_clock
+    moved: list[tuple[Any, float, float]] = []
+    try:
+        for sprite in sprites:
+            x, y = sprite.center_x, sprite.center_y
+            position = clock.interpolated_position(sprite)
+            if position != (x, y):
+                moved.append((sprite, x, y))
+                sprite.position = position
+        yield
+    finally:
+        for sprite, x, y in moved:
+            sprite.position = (x, y)
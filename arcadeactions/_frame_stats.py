@@ -0,0 +1,184 @@
+"""Opt-in per-phase and per-action frame profiling for ``Action.update_all``.
+
+With stats disabled, ``update_all`` pays one boolean check per phase. With stats
+enabled, it records the wall time of each phase into preallocated per-phase ring
+buffers (one slot per frame, ``capacity`` frames deep). It also times every
+``update()`` call and adds it to cumulative totals per Action subclass and per tag.
+Batched types (``batch_update``) are timed per call; the time is credited to the
+class once per action and split evenly across the actions' tags.
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+from typing import Any
+
+# Phases of update_all in the order they run
+PHASES: tuple[str, ...] = (
+    "frame_counter",
+    "debug_summary",
+    "deactivate_callbacks",
+    "wrapper_updates",
+    "action_updates",
+    "rebuild",
+    "append_pending",
+    "transform_commit",
+    "physics_sync",
+)
+PHASE_INDEX = {name: index for index, name in enumerate(PHASES)}
+
+DEFAULT_CAPACITY = 240
+
+
+class FrameStats:
+    """Ring buffers of per-phase frame times plus cumulative per-class and per-tag totals."""
+
+    __slots__ = (
+        "enabled",
+        "frames_recorded",
+        "_capacity",
+        "_index",
+        "_frame_numbers",
+        "_phase_times",
+        "_by_class",
+        "_by_tag",
+    )
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.enabled = False
+        self.frames_recorded = 0
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._capacity = capacity
+        self._index = -1
+        self._frame_numbers = [0] * capacity
+        # One ring per phase, indexed by frame slot, in seconds
+        self._phase_times = [[0.0] * capacity for _ in PHASES]
+        # key -> [seconds, calls]
+        self._by_class: dict[type, list[float]] = {}
+        self._by_tag: dict[str | None, list[float]] = {}
+        self.frames_recorded = 0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def configure(self, *, capacity: int) -> None:
+        """Resize the ring buffers, discarding everything recorded so far."""
+        self._allocate(capacity)
+
+    def reset(self) -> None:
+        """Discard recorded frames and cumulative totals."""
+        self._allocate(self._capacity)
+
+    # ------------------------------------------------------------------ recording
+    def begin_frame(self) -> float:
+        """Claim the next ring slot and return the start time of the first phase."""
+        index = self._index + 1
+        if index == self._capacity:
+            index = 0
+        self._index = index
+        self._frame_numbers[index] = 0
+        for times in self._phase_times:
+            times[index] = 0.0
+        self.frames_recorded += 1
+        return perf_counter()
+
+    def label_frame(self, frame_number: int) -> None:
+        """Record the action manager's frame counter for the current slot."""
+        self._frame_numbers[self._index] = frame_number
+
+    def mark(self, phase: int, start: float) -> float:
+        """Add the time since *start* to *phase* for the current frame; return the new start."""
+        now = perf_counter()
+        self._phase_times[phase][self._index] += now - start
+        return now
+
+    def add_action(self, action: Any, seconds: float) -> None:
+        """Credit one ``update()`` call taking *seconds* to the action's class and tag."""
+        totals = self._by_class.get(type(action))
+        if totals is None:
+            totals = self._by_class[type(action)] = [0.0, 0]
+        totals[0] += seconds
+        totals[1] += 1
+        tag = action.tag
+        totals = self._by_tag.get(tag)
+        if totals is None:
+            totals = self._by_tag[tag] = [0.0, 0]
+        totals[0] += seconds
+        totals[1] += 1
+
+    def add_batch(self, action_type: type, actions: list[Any], seconds: float) -> None:
+        """Credit one ``batch_update`` call over *actions* taking *seconds*."""
+        totals = self._by_class.get(action_type)
+        if totals is None:
+            totals = self._by_class[action_type] = [0.0, 0]
+        totals[0] += seconds
+        totals[1] += len(actions)
+        share = seconds / len(actions)
+        by_tag = self._by_tag
+        for action in actions:
+            tag = action.tag
+            totals = by_tag.get(tag)
+            if totals is None:
+                totals = by_tag[tag] = [0.0, 0]
+            totals[0] += share
+            totals[1] += 1
+
+    # ------------------------------------------------------------------ queries
+    def _slots(self, frames: int | None) -> list[int]:
+        """Ring indices of the last *frames* recorded frames, oldest first."""
+        count = min(self.frames_recorded, self._capacity)
+        if frames is not None:
+            count = min(count, max(0, frames))
+        return [(self._index - offset) % self._capacity for offset in range(count - 1, -1, -1)]
+
+    def last_frame(self) -> dict[str, float]:
+        """Return the most recent frame's time per phase in microseconds (empty before any frame)."""
+        if self.frames_recorded == 0:
+            return {}
+        index = self._index
+        return {name: self._phase_times[phase][index] * 1e6 for phase, name in enumerate(PHASES)}
+
+    def phase_history(self, phase: str, frames: int | None = None) -> list[float]:
+        """Return *phase*'s time in microseconds for the last *frames* frames, oldest first."""
+        times = self._phase_times[PHASE_INDEX[phase]]
+        return [times[index] * 1e6 for index in self._slots(frames)]
+
+    def frame_numbers(self, frames: int | None = None) -> list[int]:
+        """Return the frame counter value of each buffered frame, oldest first."""
+        return [self._frame_numbers[index] for index in self._slots(frames)]
+
+    def phase_averages(self, frames: int | None = None) -> dict[str, float]:
+        """Return the mean time per phase in microseconds over the last *frames* buffered frames."""
+        slots = self._slots(frames)
+        if not slots:
+            return {}
+        return {
+            name: sum(self._phase_times[phase][index] for index in slots) * 1e6 / len(slots)
+            for phase, name in enumerate(PHASES)
+        }
+
+    def frame_totals(self, frames: int | None = None) -> list[float]:
+        """Return the summed phase time in microseconds of each buffered frame, oldest first."""
+        return [sum(times[index] for times in self._phase_times) * 1e6 for index in self._slots(frames)]
+
+    def by_class(self) -> dict[str, tuple[float, int]]:
+        """Return cumulative ``(microseconds, update calls)`` per Action subclass name, slowest first."""
+        totals: dict[str, tuple[float, int]] = {}
+        for action_type, (seconds, calls) in self._by_class.items():
+            name = action_type.__name__
+            previous_us, previous_calls = totals.get(name, (0.0, 0))
+            totals[name] = (previous_us + seconds * 1e6, previous_calls + int(calls))
+        return dict(sorted(totals.items(), key=lambda item: item[1][0], reverse=True))
+
+    def by_tag(self) -> dict[str | None, tuple[float, int]]:
+        """Return cumulative ``(microseconds, update calls)`` per tag (None for untagged), slowest first."""
+        totals = {tag: (seconds * 1e6, int(calls)) for tag, (seconds, calls) in self._by_tag.items()}
+        return dict(sorted(totals.items(), key=lambda item: item[1][0], reverse=True))
+
+
+frame_stats = FrameStats()
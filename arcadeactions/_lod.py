@@ -0,0 +1,89 @@
+"""Level-of-detail update rates for actions whose sprites are off-screen.
+
+In a scrolling game most sprites are outside the camera at any moment, yet their
+actions are updated every frame. With a LOD policy, an opted-in action (selected by
+tag or class name) whose target lies entirely outside the viewport, grown by a
+margin, is taken off the update path for up to ``interval - 1`` frames. It is parked
+on the manager's timer wheel, like a waiting ``DelayFrames``, and the skipped frames
+are credited to it when it wakes.
+
+Only actions that can catch up exactly take part. They report how many upcoming
+updates they can skip through ``Action._offscreen_idle_frames()``. A ``MoveUntil``
+without bounds or a velocity provider qualifies: Arcade's velocity integration keeps
+moving its sprites, and an ``after_frames`` condition is advanced by the skipped frame
+count, so it still stops on its exact frame. Every other action stays at full rate
+even when opted in.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+DEFAULT_MARGIN = 64.0
+DEFAULT_INTERVAL = 4
+
+
+class LodPolicy:
+    """Viewport, margin, update interval and opt-in filters for off-screen actions."""
+
+    __slots__ = ("enabled", "viewport", "margin", "interval", "tags", "classes", "_bounds")
+
+    def __init__(self):
+        self.enabled = False
+        self.viewport: tuple[float, float, float, float] | None = None
+        self.margin = DEFAULT_MARGIN
+        self.interval = DEFAULT_INTERVAL
+        self.tags: frozenset[str] = frozenset()
+        self.classes: frozenset[str] = frozenset()
+        # Viewport grown by the margin
+        self._bounds = (0.0, 0.0, 0.0, 0.0)
+
+    def configure(
+        self,
+        viewport: tuple[float, float, float, float],
+        *,
+        margin: float,
+        interval: int,
+        tags: frozenset[str],
+        classes: frozenset[str],
+    ) -> None:
+        if interval < 1:
+            raise ValueError("interval must be at least 1")
+        if margin < 0:
+            raise ValueError("margin must not be negative")
+        self.margin = float(margin)
+        self.interval = int(interval)
+        self.tags = tags
+        self.classes = classes
+        self.set_viewport(viewport)
+        self.enabled = True
+
+    def set_viewport(self, viewport: tuple[float, float, float, float]) -> None:
+        """Move the viewport ``(left, bottom, right, top)``, e.g. after the camera scrolled."""
+        left, bottom, right, top = viewport
+        self.viewport = (left, bottom, right, top)
+        margin = self.margin
+        self._bounds = (left - margin, bottom - margin, right + margin, top + margin)
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def applies_to(self, action: Any) -> bool:
+        """Return True when *action* opted in by tag or class name."""
+        return action.tag in self.tags or type(action).__name__ in self.classes
+
+    def is_offscreen(self, action: Any) -> bool:
+        """Return True when every sprite of *action*'s target lies outside the grown viewport."""
+        adapter = action._target_adapter
+        if adapter is None:
+            return False
+        left, bottom, right, top = self._bounds
+        seen_any = False
+        for sprite in adapter.iter_sprites():
+            seen_any = True
+            if sprite.right >= left and sprite.left <= right and sprite.top >= bottom and sprite.bottom <= top:
+                return False
+        return seen_any
+
+
+lod_policy = LodPolicy()
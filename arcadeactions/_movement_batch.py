@@ -0,0 +1,169 @@
+"""Vectorized per-frame pass for batched MoveUntil actions.
+
+``MoveUntil(..., batched=True)`` routes its per-frame velocity and boundary work
+through :class:`MoveUntilBatchEngine`. The engine gathers the target sprites'
+centers, velocities and sizes into NumPy arrays once per frame and then:
+
+1. Assigns ``current_velocity`` with array comparisons, writing only the
+   sprites whose velocity actually differs from what the action wants.
+2. Runs a conservative broad phase over the bounds to find the few sprites
+   that could touch a boundary this frame (or still carry boundary state).
+3. Hands only those sprites to the regular per-sprite boundary code, so
+   bounce/wrap/limit behaviour and ``on_boundary_enter``/``on_boundary_exit``
+   callbacks are exactly the same as the unbatched path.
+
+Actions passed to :meth:`MoveUntilBatchEngine.step` together must share the
+same ``bounds``/``boundary_behavior`` configuration.
+
+NumPy is an optional dependency (``pip install arcadeactions[batch]``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+# Extra distance (px) added to the broad phase so float rounding can never hide a boundary hit
+_BROAD_PHASE_SLACK = 1.0
+# Tolerances used by MoveUntil's per-sprite velocity logic
+_MANUAL_VELOCITY_TOLERANCE = 0.001
+_LIMIT_EDGE_TOLERANCE = 0.1
+
+_engine: MoveUntilBatchEngine | None = None
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - exercised only without numpy installed
+        raise ImportError(
+            "MoveUntil(batched=True) requires NumPy. Install it with 'pip install arcadeactions[batch]'."
+        ) from exc
+    return numpy
+
+
+def get_batch_engine() -> MoveUntilBatchEngine:
+    """Return the shared batch engine, creating it (and importing NumPy) on first use."""
+    global _engine
+    if _engine is None:
+        _engine = MoveUntilBatchEngine()
+    return _engine
+
+
+class MoveUntilBatchEngine:
+    """Vectorized velocity assignment and boundary broad phase for MoveUntil."""
+
+    def __init__(self):
+        self._np = _load_numpy()
+
+    def step(self, actions: Sequence[Any]) -> None:
+        """Run one frame of velocity and boundary handling for *actions*."""
+        np = self._np
+
+        sprites: list[Any] = []
+        counts: list[int] = []
+        for action in actions:
+            members = action._batch_sprites()
+            sprites.extend(members)
+            counts.append(len(members))
+        count = len(sprites)
+        if count == 0:
+            return
+
+        owners = np.repeat(np.arange(len(actions)), counts)
+        velocities = np.array([sprite.velocity for sprite in sprites], dtype=np.float64).reshape(count, 2)
+        wanted = np.array([action.current_velocity for action in actions], dtype=np.float64).reshape(-1, 2)
+
+        first = actions[0]
+        bounds = first.bounds
+        behavior = first.boundary_behavior
+        check_bounds = bool(bounds and behavior)
+
+        positions = reach = None
+        if check_bounds:
+            positions = np.array([sprite.position for sprite in sprites], dtype=np.float64).reshape(count, 2)
+            sizes = np.array([(sprite.width, sprite.height) for sprite in sprites], dtype=np.float64).reshape(count, 2)
+            # Half-diagonal bounds the hit box extent from the center for any rotation
+            reach = 0.5 * np.hypot(sizes[:, 0], sizes[:, 1])
+
+        velocities = self._assign_velocities(actions, sprites, owners, velocities, wanted, positions, reach)
+
+        if not check_bounds:
+            return
+
+        for action in actions:
+            action._frame_callback_tracker.clear()
+
+        candidates = self._boundary_candidates(actions, sprites, owners, velocities, positions, reach)
+        for index in np.flatnonzero(candidates).tolist():
+            sprite = sprites[index]
+            action = actions[owners[index]]
+            action._apply_sprite_limits(sprite)
+            state = action._boundary_state.get(id(sprite))
+            if state is not None and (state["x"] is not None or state["y"] is not None):
+                action._batch_stateful.set_for(sprite, True)
+            else:
+                action._batch_stateful.pop(id(sprite), None)
+
+    def _assign_velocities(self, actions, sprites, owners, velocities, wanted, positions, reach):
+        """Apply each action's current_velocity; return the sprite velocities afterwards."""
+        np = self._np
+        behavior = actions[0].boundary_behavior
+        target = wanted[owners]
+        scalar = np.zeros(len(sprites), dtype=bool)
+
+        if behavior in ("wrap", "bounce"):
+            # Zero-velocity wrap/bounce actions only police boundaries: keep manually set axes
+            zero_action = np.all(np.abs(wanted) < _MANUAL_VELOCITY_TOLERANCE, axis=1)[owners]
+            manual = np.abs(velocities - target) > _MANUAL_VELOCITY_TOLERANCE
+            target = np.where(zero_action[:, None] & manual, velocities, target)
+        elif behavior == "limit" and actions[0].bounds:
+            # Sprites resting on a limit edge may keep a manually set velocity; let MoveUntil decide
+            left, bottom, right, top = actions[0].bounds
+            margin = reach + _LIMIT_EDGE_TOLERANCE + _BROAD_PHASE_SLACK
+            x = positions[:, 0]
+            y = positions[:, 1]
+            scalar = (
+                (np.abs(x - left) <= margin)
+                | (np.abs(x - right) <= margin)
+                | (np.abs(y - bottom) <= margin)
+                | (np.abs(y - top) <= margin)
+            )
+
+        changed = np.any(velocities != target, axis=1) & ~scalar
+        for index in np.flatnonzero(changed).tolist():
+            wanted_x, wanted_y = actions[owners[index]].current_velocity
+            manual_x, manual_y = velocities[index]
+            sprite = sprites[index]
+            sprite.velocity = (
+                manual_x if target[index, 0] == manual_x else wanted_x,
+                manual_y if target[index, 1] == manual_y else wanted_y,
+            )
+
+        result = target.copy()
+        for index in np.flatnonzero(scalar).tolist():
+            sprite = sprites[index]
+            actions[owners[index]]._apply_current_velocity(sprite)
+            result[index] = sprite.velocity
+        return result
+
+    def _boundary_candidates(self, actions, sprites, owners, velocities, positions, reach):
+        """Return a mask of sprites that could interact with a bound this frame."""
+        np = self._np
+        left, bottom, right, top = actions[0].bounds
+        slack = _BROAD_PHASE_SLACK
+        low_x = positions[:, 0] - reach + np.minimum(velocities[:, 0], 0.0)
+        high_x = positions[:, 0] + reach + np.maximum(velocities[:, 0], 0.0)
+        low_y = positions[:, 1] - reach + np.minimum(velocities[:, 1], 0.0)
+        high_y = positions[:, 1] + reach + np.maximum(velocities[:, 1], 0.0)
+        candidates = (
+            (low_x <= left + slack) | (high_x >= right - slack) | (low_y <= bottom + slack) | (high_y >= top - slack)
+        )
+
+        stateful_ids = set()
+        for action in actions:
+            stateful_ids.update(action._batch_stateful)
+        if stateful_ids:
+            ids = np.fromiter(map(id, sprites), dtype=np.int64, count=len(sprites))
+            candidates |= np.isin(ids, np.fromiter(stateful_ids, dtype=np.int64, count=len(stateful_ids)))
+        return candidates
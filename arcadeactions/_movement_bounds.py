@@ -1,194 +1,194 @@
 from __future__ import annotations
 
-from ._shared_logging import _debug_log
+from ._shared_logging import _debug_gate, _debug_log
 
 
 class _MoveUntilBoundsMixin:
     def _apply_boundary_limits(self) -> None:
         """Apply boundary behavior and trigger events based on intended movement."""
 
-        _debug_log(
-            f"_apply_boundary_limits: id={id(self)}, target={self.target}, boundary_behavior={self.boundary_behavior}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"_apply_boundary_limits: id={id(self)}, target={self.target}, "
+                f"boundary_behavior={self.boundary_behavior}",
+                action="MoveUntil",
+            )
 
         # Track callbacks triggered in this frame to prevent duplicates
         self._frame_callback_tracker.clear()
 
-        def apply_limits(sprite):
-            if not self.bounds:
-                return
-
-            left, bottom, right, top = self.bounds
-            sprite_id = id(sprite)
-
-            # Initialize boundary state if needed
-            if sprite_id not in self._boundary_state:
-                self._boundary_state[sprite_id] = {"x": None, "y": None}
-
-            current_state = self._boundary_state[sprite_id]
-
-            # For limit behavior, check if sprite would cross boundaries and clamp using edge-based coordinates
-            if self.boundary_behavior == "limit":
-                # First, clamp sprites that are already outside bounds
-                if sprite.left <= left:
-                    # At or past left boundary - clamp and clear velocity
-                    # But don't clear if sprite is moving away (manually set velocity)
-                    sprite.left = left
-                    # Only clear velocity if sprite is moving toward boundary or stationary
-                    # (not if it's moving away with manually set velocity)
-                    if sprite.change_x <= 0:
-                        sprite.change_x = 0
-                    # Only trigger callback if not already at this boundary and not already triggered this frame
-                    callback_key = (sprite_id, "x", "left")
-                    if current_state["x"] != "left" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "x", "left")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["x"] = "left"
-                elif sprite.right >= right:
-                    # At or past right boundary - clamp and clear velocity
-                    # But don't clear if sprite is moving away (manually set velocity)
-                    sprite.right = right
-                    # Only clear velocity if sprite is moving toward boundary or stationary
-                    # (not if it's moving away with manually set velocity)
-                    if sprite.change_x >= 0:
-                        sprite.change_x = 0
-                    # Only trigger callback if not already at this boundary and not already triggered this frame
-                    callback_key = (sprite_id, "x", "right")
-                    if current_state["x"] != "right" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "x", "right")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["x"] = "right"
-
-                if sprite.bottom <= bottom:
-                    # At or past bottom boundary - clamp and clear velocity
-                    # But don't clear if sprite is moving away (manually set velocity)
-                    sprite.bottom = bottom
-                    # Only clear velocity if sprite is moving toward boundary or stationary
-                    # (not if it's moving away with manually set velocity)
-                    if sprite.change_y <= 0:
-                        sprite.change_y = 0
-                    # Only trigger callback if not already at this boundary and not already triggered this frame
-                    callback_key = (sprite_id, "y", "bottom")
-                    if current_state["y"] != "bottom" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "y", "bottom")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["y"] = "bottom"
-                elif sprite.top >= top:
-                    # At or past top boundary - clamp and clear velocity
-                    # But don't clear if sprite is moving away (manually set velocity)
-                    sprite.top = top
-                    # Only clear velocity if sprite is moving toward boundary or stationary
-                    # (not if it's moving away with manually set velocity)
-                    if sprite.change_y >= 0:
-                        sprite.change_y = 0
-                    # Only trigger callback if not already at this boundary and not already triggered this frame
-                    callback_key = (sprite_id, "y", "top")
-                    if current_state["y"] != "top" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "y", "top")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["y"] = "top"
-
-                # Check horizontal movement using edge positions
-                # Check if sprite would cross boundary (only if not already handled above)
-                # Skip if sprite is already at or past boundary (handled by checks above)
-                # Also skip if sprite is exactly at boundary (handled by checks above)
-                if sprite.right < right and sprite.change_x > 0 and sprite.right + sprite.change_x > right:
-                    # Would cross right boundary
-                    callback_key = (sprite_id, "x", "right")
-                    if current_state["x"] != "right" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "x", "right")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["x"] = "right"
-                    sprite.right = right
+        self.for_each_sprite(self._apply_sprite_limits)
+
+    def _apply_sprite_limits(self, sprite) -> None:
+        """Apply the configured boundary behavior to a single sprite."""
+        if not self.bounds:
+            return
+
+        left, bottom, right, top = self.bounds
+        sprite_id = id(sprite)
+
+        # Initialize boundary state if needed
+        current_state = self._boundary_state.setdefault_for(sprite, {"x": None, "y": None})
+
+        # For limit behavior, check if sprite would cross boundaries and clamp using edge-based coordinates
+        if self.boundary_behavior == "limit":
+            # First, clamp sprites that are already outside bounds
+            if sprite.left <= left:
+                # At or past left boundary - clamp and clear velocity
+                # But don't clear if sprite is moving away (manually set velocity)
+                sprite.left = left
+                # Only clear velocity if sprite is moving toward boundary or stationary
+                # (not if it's moving away with manually set velocity)
+                if sprite.change_x <= 0:
                     sprite.change_x = 0
-                elif sprite.left > left and sprite.change_x < 0 and sprite.left + sprite.change_x < left:
-                    # Would cross left boundary
-                    callback_key = (sprite_id, "x", "left")
-                    if current_state["x"] != "left" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "x", "left")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["x"] = "left"
-                    sprite.left = left
+                # Only trigger callback if not already at this boundary and not already triggered this frame
+                callback_key = (sprite_id, "x", "left")
+                if current_state["x"] != "left" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "x", "left")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["x"] = "left"
+            elif sprite.right >= right:
+                # At or past right boundary - clamp and clear velocity
+                # But don't clear if sprite is moving away (manually set velocity)
+                sprite.right = right
+                # Only clear velocity if sprite is moving toward boundary or stationary
+                # (not if it's moving away with manually set velocity)
+                if sprite.change_x >= 0:
                     sprite.change_x = 0
-                elif current_state["x"] is not None:
-                    # Was at boundary, now moving away
-                    # Only reset state if sprite is actually moving away from boundary
-                    # (not just at boundary with zero velocity)
-                    is_moving_away = False
-                    if (
-                        current_state["x"] == "right"
-                        and sprite.change_x < 0
-                        or current_state["x"] == "left"
-                        and sprite.change_x > 0
-                    ):
-                        is_moving_away = True
-
-                    if is_moving_away:
-                        old_side = current_state["x"]
-                        if self.on_boundary_exit:
-                            self._safe_call(self.on_boundary_exit, sprite, "x", old_side)
-                        current_state["x"] = None
-
-                # Check vertical movement using edge positions
-                # Check if sprite would cross boundary OR is at boundary and moving toward it
-                # But skip if sprite is already outside bounds (handled by first check above)
-                if sprite.top < top and sprite.change_y > 0 and sprite.top + sprite.change_y > top:
-                    # Would cross top boundary
-                    callback_key = (sprite_id, "y", "top")
-                    if current_state["y"] != "top" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "y", "top")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["y"] = "top"
-                    sprite.top = top
+                # Only trigger callback if not already at this boundary and not already triggered this frame
+                callback_key = (sprite_id, "x", "right")
+                if current_state["x"] != "right" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "x", "right")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["x"] = "right"
+
+            if sprite.bottom <= bottom:
+                # At or past bottom boundary - clamp and clear velocity
+                # But don't clear if sprite is moving away (manually set velocity)
+                sprite.bottom = bottom
+                # Only clear velocity if sprite is moving toward boundary or stationary
+                # (not if it's moving away with manually set velocity)
+                if sprite.change_y <= 0:
                     sprite.change_y = 0
-                elif sprite.bottom > bottom and sprite.change_y < 0 and sprite.bottom + sprite.change_y < bottom:
-                    # Would cross bottom boundary
-                    callback_key = (sprite_id, "y", "bottom")
-                    if current_state["y"] != "bottom" and callback_key not in self._frame_callback_tracker:
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "y", "bottom")
-                            self._frame_callback_tracker.add(callback_key)
-                        current_state["y"] = "bottom"
-                    sprite.bottom = bottom
+                # Only trigger callback if not already at this boundary and not already triggered this frame
+                callback_key = (sprite_id, "y", "bottom")
+                if current_state["y"] != "bottom" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "y", "bottom")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["y"] = "bottom"
+            elif sprite.top >= top:
+                # At or past top boundary - clamp and clear velocity
+                # But don't clear if sprite is moving away (manually set velocity)
+                sprite.top = top
+                # Only clear velocity if sprite is moving toward boundary or stationary
+                # (not if it's moving away with manually set velocity)
+                if sprite.change_y >= 0:
                     sprite.change_y = 0
-                elif sprite.bottom == bottom and sprite.change_y < 0:
-                    # Already at bottom boundary and moving into it - clear velocity
-                    if current_state["y"] != "bottom":
-                        if self.on_boundary_enter:
-                            self._safe_call(self.on_boundary_enter, sprite, "y", "bottom")
-                        current_state["y"] = "bottom"
-                    sprite.change_y = 0
-                elif current_state["y"] is not None:
-                    # Was at boundary, now moving away
-                    # Only reset state if sprite is actually moving away from boundary
-                    # (not just at boundary with zero velocity)
-                    is_moving_away = False
-                    if (
-                        current_state["y"] == "top"
-                        and sprite.change_y < 0
-                        or current_state["y"] == "bottom"
-                        and sprite.change_y > 0
-                    ):
-                        is_moving_away = True
-
-                    if is_moving_away:
-                        old_side = current_state["y"]
-                        if self.on_boundary_exit:
-                            self._safe_call(self.on_boundary_exit, sprite, "y", old_side)
-                        current_state["y"] = None
-            else:
-                # For other boundary behaviors, use the existing method
-                self._check_boundaries(sprite)
-
-        self.for_each_sprite(apply_limits)
+                # Only trigger callback if not already at this boundary and not already triggered this frame
+                callback_key = (sprite_id, "y", "top")
+                if current_state["y"] != "top" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "y", "top")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["y"] = "top"
+
+            # Check horizontal movement using edge positions
+            # Check if sprite would cross boundary (only if not already handled above)
+            # Skip if sprite is already at or past boundary (handled by checks above)
+            # Also skip if sprite is exactly at boundary (handled by checks above)
+            if sprite.right < right and sprite.change_x > 0 and sprite.right + sprite.change_x > right:
+                # Would cross right boundary
+                callback_key = (sprite_id, "x", "right")
+                if current_state["x"] != "right" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "x", "right")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["x"] = "right"
+                sprite.right = right
+                sprite.change_x = 0
+            elif sprite.left > left and sprite.change_x < 0 and sprite.left + sprite.change_x < left:
+                # Would cross left boundary
+                callback_key = (sprite_id, "x", "left")
+                if current_state["x"] != "left" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "x", "left")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["x"] = "left"
+                sprite.left = left
+                sprite.change_x = 0
+            elif current_state["x"] is not None:
+                # Was at boundary, now moving away
+                # Only reset state if sprite is actually moving away from boundary
+                # (not just at boundary with zero velocity)
+                is_moving_away = False
+                if (
+                    current_state["x"] == "right"
+                    and sprite.change_x < 0
+                    or current_state["x"] == "left"
+                    and sprite.change_x > 0
+                ):
+                    is_moving_away = True
+
+                if is_moving_away:
+                    old_side = current_state["x"]
+                    if self.on_boundary_exit:
+                        self._safe_call(self.on_boundary_exit, sprite, "x", old_side)
+                    current_state["x"] = None
+
+            # Check vertical movement using edge positions
+            # Check if sprite would cross boundary OR is at boundary and moving toward it
+            # But skip if sprite is already outside bounds (handled by first check above)
+            if sprite.top < top and sprite.change_y > 0 and sprite.top + sprite.change_y > top:
+                # Would cross top boundary
+                callback_key = (sprite_id, "y", "top")
+                if current_state["y"] != "top" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "y", "top")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["y"] = "top"
+                sprite.top = top
+                sprite.change_y = 0
+            elif sprite.bottom > bottom and sprite.change_y < 0 and sprite.bottom + sprite.change_y < bottom:
+                # Would cross bottom boundary
+                callback_key = (sprite_id, "y", "bottom")
+                if current_state["y"] != "bottom" and callback_key not in self._frame_callback_tracker:
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "y", "bottom")
+                        self._frame_callback_tracker.add(callback_key)
+                    current_state["y"] = "bottom"
+                sprite.bottom = bottom
+                sprite.change_y = 0
+            elif sprite.bottom == bottom and sprite.change_y < 0:
+                # Already at bottom boundary and moving into it - clear velocity
+                if current_state["y"] != "bottom":
+                    if self.on_boundary_enter:
+                        self._safe_call(self.on_boundary_enter, sprite, "y", "bottom")
+                    current_state["y"] = "bottom"
+                sprite.change_y = 0
+            elif current_state["y"] is not None:
+                # Was at boundary, now moving away
+                # Only reset state if sprite is actually moving away from boundary
+                # (not just at boundary with zero velocity)
+                is_moving_away = False
+                if (
+                    current_state["y"] == "top"
+                    and sprite.change_y < 0
+                    or current_state["y"] == "bottom"
+                    and sprite.change_y > 0
+                ):
+                    is_moving_away = True
+
+                if is_moving_away:
+                    old_side = current_state["y"]
+                    if self.on_boundary_exit:
+                        self._safe_call(self.on_boundary_exit, sprite, "y", old_side)
+                    current_state["y"] = None
+        else:
+            # For other boundary behaviors, use the existing method
+            self._check_boundaries(sprite)
 
     def _validate_bounds_for_sprite_dimensions(self) -> None:
         """Validate that edge-based bounds are large enough for sprite dimensions.
@@ -238,13 +238,9 @@ class _MoveUntilBoundsMixin:
             return
 
         left, bottom, right, top = self.bounds
-        sprite_id = id(sprite)
 
         # Initialize boundary state for this sprite if needed
-        if sprite_id not in self._boundary_state:
-            self._boundary_state[sprite_id] = {"x": None, "y": None}
-
-        current_state = self._boundary_state.setdefault(sprite_id, {"x": None, "y": None})
+        current_state = self._boundary_state.setdefault_for(sprite, {"x": None, "y": None})
 
         # Check each axis independently for enter/exit events using edge positions
         self._process_axis_boundary_events(sprite, sprite.left, sprite.right, left, right, "x", current_state)
@@ -3,7 +3,8 @@ from __future__ import annotations
 from typing import Any
 
 from . import physics_adapter as _pa
-from ._shared_logging import _debug_log
+from ._action_targets import adapt_target
+from ._shared_logging import _debug_gate, _debug_log
 
 
 class _MoveUntilRuntimeMixin:
@@ -52,13 +53,22 @@ class _MoveUntilRuntimeMixin:
             kwargs["metadata"] = metadata
         self._update_snapshot(**kwargs)
 
+    def _provided_velocity(self) -> tuple[float, float]:
+        """Call the velocity provider and scale its result by the action's clock domain."""
+        dx, dy = self.velocity_provider()
+        scale = self._clock_scale
+        if scale != 1.0:
+            return (dx * scale, dy * scale)
+        return (dx, dy)
+
     def apply_effect(self) -> None:
         """Apply velocity to all sprites."""
 
-        _debug_log(
-            f"apply_effect: id={id(self)}, target={self.target}, velocity_provider={bool(self.velocity_provider)}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"apply_effect: id={id(self)}, target={self.target}, velocity_provider={bool(self.velocity_provider)}",
+                action="MoveUntil",
+            )
 
         # Validate edge-based bounds against sprite dimensions
         if self.bounds and self.boundary_behavior in ("bounce", "wrap", "limit"):
@@ -71,33 +81,35 @@ class _MoveUntilRuntimeMixin:
         # Get velocity from provider or use current velocity
         if self.velocity_provider:
             try:
-                dx, dy = self.velocity_provider()
-                _debug_log(
-                    f"apply_effect: id={id(self)}, velocity_provider returned {(dx, dy)}",
-                    action="MoveUntil",
-                )
+                dx, dy = self._provided_velocity()
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"apply_effect: id={id(self)}, velocity_provider returned {(dx, dy)}",
+                        action="MoveUntil",
+                    )
                 self.current_velocity = (dx, dy)
             except Exception as error:
-                _debug_log(
-                    f"apply_effect: id={id(self)}, velocity_provider exception={error!r} - using current_velocity",
-                    action="MoveUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"apply_effect: id={id(self)}, velocity_provider exception={error!r} - using current_velocity",
+                        action="MoveUntil",
+                    )
                 dx, dy = self.current_velocity  # Fallback on provider error
         else:
             dx, dy = self.current_velocity
 
-        _debug_log(
-            f"apply_effect: id={id(self)}, applying velocity {(dx, dy)}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"apply_effect: id={id(self)}, applying velocity {(dx, dy)}",
+                action="MoveUntil",
+            )
 
         def set_velocity(sprite):
             # For limit boundary behavior, check if velocity would cross boundary
             if self.boundary_behavior == "limit" and self.bounds:
                 left, bottom, right, top = self.bounds
-                sprite_id = id(sprite)
                 # Initialize boundary state if needed (robust against concurrent clears)
-                state = self._boundary_state.setdefault(sprite_id, {"x": None, "y": None})
+                state = self._boundary_state.setdefault_for(sprite, {"x": None, "y": None})
 
                 # Check if applying velocity would cross horizontal boundary
                 if dx > 0 and sprite.center_x + dx > right:
@@ -153,11 +165,12 @@ class _MoveUntilRuntimeMixin:
 
     def update_effect(self, delta_time: float) -> None:
         """Update movement and handle boundary checking if enabled."""
-        _debug_log(
-            f"update_effect: id={id(self)}, delta_time={delta_time:.4f}, done={self.done}, "
-            f"velocity_provider={bool(self.velocity_provider)}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"update_effect: id={id(self)}, delta_time={delta_time:.4f}, done={self.done}, "
+                f"velocity_provider={bool(self.velocity_provider)}",
+                action="MoveUntil",
+            )
         # Handle duration-based conditions using simulation time
         if self._duration is not None:
             self._elapsed += delta_time
@@ -165,10 +178,11 @@ class _MoveUntilRuntimeMixin:
             # Check if duration has elapsed
             if self._elapsed >= self._duration:
                 # End immediately and clear velocities to avoid carryover into next actions
-                _debug_log(
-                    f"update_effect: id={id(self)}, duration elapsed ({self._duration:.4f}s) - stopping",
-                    action="MoveUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"update_effect: id={id(self)}, duration elapsed ({self._duration:.4f}s) - stopping",
+                        action="MoveUntil",
+                    )
                 self._condition_met = True
                 self.remove_effect()
                 self.done = True
@@ -176,6 +190,11 @@ class _MoveUntilRuntimeMixin:
                     self.on_stop()
                 return
 
+        if self._batch_engine is not None and not self.velocity_provider:
+            self._batch_engine.step((self,))
+            self._update_motion_snapshot(velocity=self.current_velocity)
+            return
+
         # Default to using current_velocity for dx/dy so update_effect works even when
         # no velocity_provider is present (prevents referencing undefined locals).
         dx, dy = self.current_velocity
@@ -183,21 +202,21 @@ class _MoveUntilRuntimeMixin:
         # Re-apply velocity from provider if available
         if self.velocity_provider:
             try:
-                dx, dy = self.velocity_provider()
-                _debug_log(
-                    f"update_effect: id={id(self)}, velocity_provider returned {(dx, dy)}",
-                    action="MoveUntil",
-                )
+                dx, dy = self._provided_velocity()
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"update_effect: id={id(self)}, velocity_provider returned {(dx, dy)}",
+                        action="MoveUntil",
+                    )
                 self.current_velocity = (dx, dy)
 
                 # Apply velocity to all sprites (with boundary limits if needed)
                 def set_velocity(sprite):
                     if self.boundary_behavior == "limit" and self.bounds:
                         left, bottom, right, top = self.bounds
-                        sprite_id = id(sprite)
 
                         # Initialize boundary state and get reference
-                        state = self._boundary_state.setdefault(sprite_id, {"x": None, "y": None})
+                        state = self._boundary_state.setdefault_for(sprite, {"x": None, "y": None})
 
                         # Horizontal velocity with boundary limits and events
                         if dx > 0 and sprite.center_x + dx > right:
@@ -256,93 +275,18 @@ class _MoveUntilRuntimeMixin:
 
                 self.for_each_sprite(set_velocity)
             except Exception as error:
-                _debug_log(
-                    f"update_effect: id={id(self)}, velocity_provider exception={error!r} - keeping current velocity",
-                    action="MoveUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"update_effect: id={id(self)}, velocity_provider exception={error!r} "
+                        "- keeping current velocity",
+                        action="MoveUntil",
+                    )
                 pass
 
         # Re-apply velocity if not using velocity_provider (to handle resume after pause)
         # This ensures velocity is set on sprites during step_all() cycles
         if not self.velocity_provider:
-            # Apply current velocity to all sprites
-            # But preserve manually set velocity if sprite is at boundary and moving away
-            # (only if velocity is different from action's velocity, indicating it was manually set)
-            def set_velocity(sprite):
-                sprite_id = id(sprite)
-                # For wrap/bounce behaviors with zero velocity, preserve manually set velocity
-                # (common pattern: action handles boundaries, external code sets velocity)
-                if self.boundary_behavior in ("wrap", "bounce"):
-                    action_has_zero_velocity = (
-                        abs(self.current_velocity[0]) < 0.001 and abs(self.current_velocity[1]) < 0.001
-                    )
-                    if action_has_zero_velocity:
-                        # Check if velocity was manually set (different from action's velocity)
-                        manually_set_x = abs(sprite.change_x - self.current_velocity[0]) > 0.001
-                        manually_set_y = abs(sprite.change_y - self.current_velocity[1]) > 0.001
-                        # Preserve manually set velocity - action is only for boundary handling
-                        if not manually_set_x:
-                            sprite.change_x = self.current_velocity[0]
-                        if not manually_set_y:
-                            sprite.change_y = self.current_velocity[1]
-                        # If both velocities are manually set, don't override anything
-                        if manually_set_x and manually_set_y:
-                            return
-                        # If only one is manually set, apply the other from action
-                        if manually_set_x:
-                            sprite.change_y = self.current_velocity[1]
-                        elif manually_set_y:
-                            sprite.change_x = self.current_velocity[0]
-                        return
-
-                if self.boundary_behavior == "limit" and self.bounds:
-                    state = self._boundary_state.get(sprite_id, {"x": None, "y": None})
-                    left, bottom, right, top = self.bounds
-
-                    # Check if sprite is at boundary (by position) and moving away
-                    # Only preserve if velocity is different from action's velocity (manually set)
-                    at_right_boundary = abs(sprite.right - right) < 0.1  # Allow small floating point differences
-                    at_left_boundary = abs(sprite.left - left) < 0.1
-                    at_top_boundary = abs(sprite.top - top) < 0.1
-                    at_bottom_boundary = abs(sprite.bottom - bottom) < 0.1
-
-                    # Check if velocity was manually set (different from action's velocity)
-                    manually_set_x = abs(sprite.change_x - self.current_velocity[0]) > 0.001
-                    manually_set_y = abs(sprite.change_y - self.current_velocity[1]) > 0.001
-
-                    moving_away_x = False
-                    if at_right_boundary and sprite.change_x < 0 and manually_set_x:
-                        # At right boundary, moving left (away), and velocity was manually set
-                        moving_away_x = True
-                    elif at_left_boundary and sprite.change_x > 0 and manually_set_x:
-                        # At left boundary, moving right (away), and velocity was manually set
-                        moving_away_x = True
-
-                    moving_away_y = False
-                    if at_top_boundary and sprite.change_y < 0 and manually_set_y:
-                        # At top boundary, moving down (away), and velocity was manually set
-                        moving_away_y = True
-                    elif at_bottom_boundary and sprite.change_y > 0 and manually_set_y:
-                        # At bottom boundary, moving up (away), and velocity was manually set
-                        moving_away_y = True
-
-                    # Preserve manually set velocity if moving away from boundary
-                    if moving_away_x:
-                        # Keep current change_x (manually set)
-                        sprite.change_y = self.current_velocity[1]
-                    elif moving_away_y:
-                        # Keep current change_y (manually set)
-                        sprite.change_x = self.current_velocity[0]
-                    else:
-                        # Normal case: apply action's velocity
-                        sprite.change_x = self.current_velocity[0]
-                        sprite.change_y = self.current_velocity[1]
-                else:
-                    # Normal case: apply action's velocity
-                    sprite.change_x = self.current_velocity[0]
-                    sprite.change_y = self.current_velocity[1]
-
-            self.for_each_sprite(set_velocity)
+            self.for_each_sprite(self._apply_current_velocity)
 
         # Check boundaries if configured
         # For "limit" behavior with velocity_provider, boundaries are already handled above.
@@ -351,23 +295,109 @@ class _MoveUntilRuntimeMixin:
             # Skip boundary checking only if we have velocity_provider AND limit behavior
             # (since limit behavior is handled in the velocity_provider path above)
             if not (self.velocity_provider and self.boundary_behavior == "limit"):
-                _debug_log(
-                    f"update_effect: id={id(self)}, applying boundary limits behavior={self.boundary_behavior}",
-                    action="MoveUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"update_effect: id={id(self)}, applying boundary limits behavior={self.boundary_behavior}",
+                        action="MoveUntil",
+                    )
                 self._apply_boundary_limits()
 
         self._update_motion_snapshot(velocity=self.current_velocity)
 
+    def _batch_sprites(self) -> list[Any]:
+        """Return the target's sprites as a list for the batch engine."""
+        if self.target is None:
+            return []
+        if self._target_adapter is None:
+            self._target_adapter = adapt_target(self.target)
+        return list(self._target_adapter.iter_sprites())
+
+    def _apply_current_velocity(self, sprite) -> None:
+        """Apply current_velocity to one sprite, preserving manually set velocities where supported."""
+        sprite_id = id(sprite)
+        # For wrap/bounce behaviors with zero velocity, preserve manually set velocity
+        # (common pattern: action handles boundaries, external code sets velocity)
+        if self.boundary_behavior in ("wrap", "bounce"):
+            action_has_zero_velocity = abs(self.current_velocity[0]) < 0.001 and abs(self.current_velocity[1]) < 0.001
+            if action_has_zero_velocity:
+                # Check if velocity was manually set (different from action's velocity)
+                manually_set_x = abs(sprite.change_x - self.current_velocity[0]) > 0.001
+                manually_set_y = abs(sprite.change_y - self.current_velocity[1]) > 0.001
+                # Preserve manually set velocity - action is only for boundary handling
+                if not manually_set_x:
+                    sprite.change_x = self.current_velocity[0]
+                if not manually_set_y:
+                    sprite.change_y = self.current_velocity[1]
+                # If both velocities are manually set, don't override anything
+                if manually_set_x and manually_set_y:
+                    return
+                # If only one is manually set, apply the other from action
+                if manually_set_x:
+                    sprite.change_y = self.current_velocity[1]
+                elif manually_set_y:
+                    sprite.change_x = self.current_velocity[0]
+                return
+
+        if self.boundary_behavior == "limit" and self.bounds:
+            state = self._boundary_state.get(sprite_id, {"x": None, "y": None})
+            left, bottom, right, top = self.bounds
+
+            # Check if sprite is at boundary (by position) and moving away
+            # Only preserve if velocity is different from action's velocity (manually set)
+            at_right_boundary = abs(sprite.right - right) < 0.1  # Allow small floating point differences
+            at_left_boundary = abs(sprite.left - left) < 0.1
+            at_top_boundary = abs(sprite.top - top) < 0.1
+            at_bottom_boundary = abs(sprite.bottom - bottom) < 0.1
+
+            # Check if velocity was manually set (different from action's velocity)
+            manually_set_x = abs(sprite.change_x - self.current_velocity[0]) > 0.001
+            manually_set_y = abs(sprite.change_y - self.current_velocity[1]) > 0.001
+
+            moving_away_x = False
+            if at_right_boundary and sprite.change_x < 0 and manually_set_x:
+                # At right boundary, moving left (away), and velocity was manually set
+                moving_away_x = True
+            elif at_left_boundary and sprite.change_x > 0 and manually_set_x:
+                # At left boundary, moving right (away), and velocity was manually set
+                moving_away_x = True
+
+            moving_away_y = False
+            if at_top_boundary and sprite.change_y < 0 and manually_set_y:
+                # At top boundary, moving down (away), and velocity was manually set
+                moving_away_y = True
+            elif at_bottom_boundary and sprite.change_y > 0 and manually_set_y:
+                # At bottom boundary, moving up (away), and velocity was manually set
+                moving_away_y = True
+
+            # Preserve manually set velocity if moving away from boundary
+            if moving_away_x:
+                # Keep current change_x (manually set)
+                sprite.change_y = self.current_velocity[1]
+            elif moving_away_y:
+                # Keep current change_y (manually set)
+                sprite.change_x = self.current_velocity[0]
+            else:
+                # Normal case: apply action's velocity
+                sprite.change_x = self.current_velocity[0]
+                sprite.change_y = self.current_velocity[1]
+        else:
+            # Normal case: apply action's velocity
+            sprite.change_x = self.current_velocity[0]
+            sprite.change_y = self.current_velocity[1]
+
     def remove_effect(self) -> None:
         """Clear velocities and deactivate callbacks when the action finishes."""
 
-        _debug_log(f"remove_effect: id={id(self)}", action="MoveUntil")
+        if _debug_gate.verbose:
+            _debug_log(f"remove_effect: id={id(self)}", action="MoveUntil")
 
         # Deactivate boundary callbacks to prevent late execution
+        if self.on_boundary_enter is not None or self.on_boundary_exit is not None:
+            self._detached_boundary_callbacks = (self.on_boundary_enter, self.on_boundary_exit)
         self.on_boundary_enter = None
         self.on_boundary_exit = None
         self._boundary_state.clear()
+        self._batch_stateful.clear()
 
         def clear_velocity(sprite):
             sprite.change_x = 0
@@ -388,7 +418,8 @@ class _MoveUntilRuntimeMixin:
         self.current_velocity = velocity
         if not self.done:
             self.apply_effect()  # Immediately apply velocity to sprites
-        _debug_log(
-            f"set_current_velocity: id={id(self)}, velocity={velocity}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"set_current_velocity: id={id(self)}, velocity={velocity}",
+                action="MoveUntil",
+            )
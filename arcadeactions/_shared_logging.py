@@ -1,29 +1,48 @@
-import json
-import time
-
-
-def _agent_debug_log(*, hypothesis_id: str, location: str, message: str, data: dict | None = None) -> None:
-    payload = {
-        "sessionId": "debug-session",
-        "runId": "pre-fix",
-        "hypothesisId": hypothesis_id,
-        "location": location,
-        "message": message,
-        "data": data or {},
-        "timestamp": time.time(),
-    }
-    try:
-        with open("/home/bcorfman/dev/arcadeactions/.cursor/debug.log", "a", encoding="utf-8") as log_file:
-            log_file.write(json.dumps(payload) + "\n")
-    except Exception:
-        pass
+from collections.abc import Iterable
+
+
+class _DebugGate:
+    """Debug switches precomputed from the Action debug configuration.
+
+    Hot paths test ``_debug_gate.verbose`` (or ``lifecycle``) before building a log
+    message, so with debugging off a call site costs one attribute check and no
+    string formatting. :func:`_refresh_debug_gate` recomputes the switches whenever
+    ``Action.debug_level``, ``debug_all`` or ``debug_include_classes`` is assigned.
+    """
+
+    __slots__ = ("level", "include_all", "include", "lifecycle", "verbose")
+
+    def __init__(self) -> None:
+        self.level = 0
+        self.include_all = False
+        self.include: frozenset[str] = frozenset()
+        self.lifecycle = False
+        self.verbose = False
+
+    def allows(self, level: int, action: str) -> bool:
+        """Return True when a message at *level* for *action* should be printed."""
+        return self.level >= level and (self.include_all or action in self.include)
+
+
+_debug_gate = _DebugGate()
+
+
+def _refresh_debug_gate(level: int, include_all: bool, include: Iterable[str] | None) -> None:
+    """Recompute the debug switches; called when the debug configuration changes."""
+    gate = _debug_gate
+    gate.level = level
+    gate.include_all = include_all
+    gate.include = frozenset(include) if include else frozenset()
+    observed = include_all or bool(gate.include)
+    gate.lifecycle = observed and level >= 2
+    gate.verbose = observed and level >= 3
 
 
 def _debug_log(message: str, *, action: str = "CallbackUntil", level: int = 3) -> None:
-    """Log debug message using centralized config with level and filters."""
-    from arcadeactions.base import Action as _ActionBase
+    """Log debug message using centralized config with level and filters.
 
-    if _ActionBase.debug_level >= level and (
-        _ActionBase.debug_all or (_ActionBase.debug_include_classes and action in _ActionBase.debug_include_classes)
-    ):
+    Callers on per-frame paths should check ``_debug_gate.verbose`` first so the
+    message is only formatted when it can be printed.
+    """
+    if _debug_gate.allows(level, action):
         print(f"[AA L{level} {action}] {message}")
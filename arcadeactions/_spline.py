@@ -0,0 +1,254 @@
+"""Piecewise cubic spline paths for the path-following actions.
+
+A single :class:`~arcadeactions._bezier.BezierCurve` through *n* points has degree
+``n - 1``: every evaluation touches every point and the curve drifts away from the
+interior points. A :class:`SplinePath` chains cubic segments instead, so evaluation
+costs the same for 4 waypoints or 400, and the path passes through its waypoints
+(Catmull-Rom) or follows hand-placed Bezier handles exactly (chained Bezier).
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Sequence
+from math import atan2, degrees, hypot
+from typing import Any
+
+# Arc-length samples per segment: one every _SAMPLE_SPACING pixels of control polygon, within these bounds
+_SAMPLES_PER_SEGMENT = 16
+_MAX_SAMPLES_PER_SEGMENT = 512
+_SAMPLE_SPACING = 2.0
+
+# Spacing in pixels of the distance -> parameter table, and a cap on its size
+_DISTANCE_RESOLUTION = 0.5
+_MAX_DISTANCE_STEPS = 1 << 16
+
+_KINDS = ("catmull_rom", "bezier")
+
+# Floor for knot spacing so repeated waypoints don't divide by zero
+_MIN_KNOT = 1e-6
+
+
+def _catmull_rom_handles(points: list[tuple[float, float]], closed: bool) -> list[tuple[float, float]]:
+    """Convert centripetal Catmull-Rom waypoints to chained cubic Bezier control points."""
+    if closed:
+        extended = [points[-1], *points, points[0], points[1 % len(points)]]
+    else:
+        (x0, y0), (x1, y1) = points[0], points[1]
+        (xa, ya), (xb, yb) = points[-2], points[-1]
+        # Reflected phantom end points give the end segments a natural tangent
+        extended = [(2 * x0 - x1, 2 * y0 - y1), *points, (2 * xb - xa, 2 * yb - ya)]
+
+    # Centripetal knot spacing (square root of chord length) keeps unevenly spaced
+    # waypoints from producing cusps or loops inside a segment
+    knots = [
+        max(hypot(bx - ax, by - ay) ** 0.5, _MIN_KNOT)
+        for (ax, ay), (bx, by) in zip(extended, extended[1:], strict=False)
+    ]
+    handles = [extended[1]]
+    for i in range(1, len(extended) - 2):
+        (px, py), (ax, ay), (bx, by), (nx, ny) = extended[i - 1 : i + 3]
+        d0, d1, d2 = knots[i - 1], knots[i], knots[i + 1]
+        # Tangents at both ends of the segment, scaled to the segment's knot span
+        m1x = d1 * ((ax - px) / d0 - (bx - px) / (d0 + d1)) + (bx - ax)
+        m1y = d1 * ((ay - py) / d0 - (by - py) / (d0 + d1)) + (by - ay)
+        m2x = (bx - ax) + d1 * ((nx - bx) / d2 - (nx - ax) / (d1 + d2))
+        m2y = (by - ay) + d1 * ((ny - by) / d2 - (ny - ay) / (d1 + d2))
+        handles.append((ax + m1x / 3.0, ay + m1y / 3.0))
+        handles.append((bx - m2x / 3.0, by - m2y / 3.0))
+        handles.append((bx, by))
+    return handles
+
+
+class SplinePath:
+    """Immutable piecewise cubic path accepted by FollowPathUntil and FollowPathGroupUntil.
+
+    Args:
+        points: Waypoints the path passes through (``kind="catmull_rom"``, at least 2;
+            centripetal parameterization, so uneven spacing doesn't cause loops),
+            or chained cubic Bezier control points ``P0, H1, H2, P1, H1, H2, P2, ...``
+            (``kind="bezier"``, ``3k + 1`` points).
+        kind: ``"catmull_rom"`` or ``"bezier"``.
+        closed: Join the last Catmull-Rom waypoint back to the first, producing a loop
+            with a smooth seam.
+
+    Finding the segment for a parameter or distance is a table lookup, so the cost of
+    a position or tangent query does not grow with the number of waypoints. Iterating
+    or indexing a path yields its input points, so it can be drawn like a point list.
+
+    Example:
+        from arcadeactions import FollowPathUntil, SplinePath
+        from arcadeactions.presets.entry_paths import circle_arc_waypoints
+
+        patrol = SplinePath(waypoints, closed=True)
+        FollowPathUntil(patrol, velocity=120, condition=infinite, rotate_with_path=True).apply(guard)
+
+        # circle_arc_waypoints() is already a chain of four cubic arcs
+        loop = SplinePath(circle_arc_waypoints(400, 300, 100), kind="bezier")
+    """
+
+    __slots__ = (
+        "points",
+        "kind",
+        "closed",
+        "segment_count",
+        "length",
+        "_coeffs",
+        "_np_tables",
+        "_distance_step",
+        "_params",
+    )
+
+    def __init__(self, points: Iterable[Sequence[float]], *, kind: str = "catmull_rom", closed: bool = False):
+        if kind not in _KINDS:
+            raise ValueError(f"kind must be one of {_KINDS}, got {kind!r}")
+        pts = [(float(point[0]), float(point[1])) for point in points]
+        if len(pts) < 2:
+            raise ValueError("Must specify at least 2 control points")
+        if kind == "bezier":
+            if closed:
+                raise ValueError("closed is only supported for Catmull-Rom paths")
+            if (len(pts) - 1) % 3:
+                raise ValueError("A chained cubic Bezier needs 3k + 1 control points")
+            handles = pts
+        else:
+            if closed and len(pts) > 2 and pts[-1] == pts[0]:
+                pts.pop()
+            handles = _catmull_rom_handles(pts, closed)
+
+        self.points = tuple(pts)
+        self.kind = kind
+        self.closed = closed
+        self.segment_count = n = (len(handles) - 1) // 3
+
+        # Per segment: power-basis coefficients (a, b, c, d) for x then y, p(u) = ((a u + b) u + c) u + d
+        coeffs = []
+        for i in range(n):
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = handles[3 * i : 3 * i + 4]
+            coeffs.append(
+                (
+                    -x0 + 3 * x1 - 3 * x2 + x3,
+                    3 * x0 - 6 * x1 + 3 * x2,
+                    3 * (x1 - x0),
+                    x0,
+                    -y0 + 3 * y1 - 3 * y2 + y3,
+                    3 * y0 - 6 * y1 + 3 * y2,
+                    3 * (y1 - y0),
+                    y0,
+                )
+            )
+        self._coeffs = tuple(coeffs)
+        self._np_tables: Any = None
+        self._build_distance_table(handles)
+
+    def _build_distance_table(self, handles: list[tuple[float, float]]) -> None:
+        n = self.segment_count
+        lengths = [0.0]
+        params = [0.0]
+        prev_x, prev_y = self.point(0.0)
+        total = 0.0
+        for i in range(n):
+            # Sample long segments more densely; the control polygon bounds the arc length
+            (x0, y0), (x1, y1), (x2, y2), (x3, y3) = handles[3 * i : 3 * i + 4]
+            hull = hypot(x1 - x0, y1 - y0) + hypot(x2 - x1, y2 - y1) + hypot(x3 - x2, y3 - y2)
+            samples = min(_MAX_SAMPLES_PER_SEGMENT, max(_SAMPLES_PER_SEGMENT, int(hull / _SAMPLE_SPACING)))
+            for j in range(1, samples + 1):
+                t = (i + j / samples) / n
+                x, y = self.point(t)
+                total += hypot(x - prev_x, y - prev_y)
+                lengths.append(total)
+                params.append(t)
+                prev_x, prev_y = x, y
+        self.length = total
+        samples = len(lengths) - 1
+
+        # Resample to evenly spaced distances so param_at_distance() is a direct index
+        steps = min(_MAX_DISTANCE_STEPS, max(samples, int(total / _DISTANCE_RESOLUTION)))
+        step = total / steps if total > 0.0 else 0.0
+        uniform = [0.0]
+        for k in range(1, steps):
+            distance = k * step
+            index = bisect_left(lengths, distance)
+            start = lengths[index - 1]
+            span = lengths[index] - start
+            t0 = params[index - 1]
+            uniform.append(t0 if span <= 0.0 else t0 + (params[index] - t0) * (distance - start) / span)
+        uniform.append(1.0)
+        self._distance_step = step
+        self._params = uniform
+
+    def _segment(self, t: float) -> tuple[tuple[float, ...], float]:
+        n = self.segment_count
+        f = t * n
+        i = int(f)
+        if i >= n:
+            i = n - 1
+        elif i < 0:
+            i = 0
+        return self._coeffs[i], f - i
+
+    def point(self, t: float) -> tuple[float, float]:
+        """Return the point on the path at parameter *t* (0-1)."""
+        (ax, bx, cx, dx, ay, by, cy, dy), u = self._segment(t)
+        return (((ax * u + bx) * u + cx) * u + dx, ((ay * u + by) * u + cy) * u + dy)
+
+    def tangent(self, t: float) -> tuple[float, float]:
+        """Return the (unnormalized) direction of travel at parameter *t*."""
+        (ax, bx, cx, _, ay, by, cy, _), u = self._segment(t)
+        return ((3 * ax * u + 2 * bx) * u + cx, (3 * ay * u + 2 * by) * u + cy)
+
+    def param_at_distance(self, distance: float) -> float:
+        """Return the path parameter *t* reached after travelling *distance* pixels."""
+        if distance <= 0.0:
+            return 0.0
+        if distance >= self.length:
+            return 1.0
+        f = distance / self._distance_step
+        k = int(f)
+        params = self._params
+        if k >= len(params) - 1:
+            return 1.0
+        t0 = params[k]
+        return t0 + (params[k + 1] - t0) * (f - k)
+
+    def point_at_distance(self, distance: float) -> tuple[float, float]:
+        """Return the point reached after travelling *distance* pixels along the path."""
+        return self.point(self.param_at_distance(distance))
+
+    def angle_at_distance(self, distance: float) -> float | None:
+        """Return the heading in degrees after travelling *distance* pixels, or None where the path stalls."""
+        tx, ty = self.tangent(self.param_at_distance(distance))
+        if tx == 0.0 and ty == 0.0:
+            return None
+        return degrees(atan2(ty, tx))
+
+    def points_at_distances(self, np: Any, distances: Any) -> tuple[Any, Any]:
+        """Vectorized :meth:`point_at_distance` for a NumPy array of distances.
+
+        *np* is the NumPy module, passed in so this module never imports it itself.
+        Returns ``(xs, ys)`` arrays.
+        """
+        tables = self._np_tables
+        if tables is None:
+            grid = np.arange(len(self._params), dtype=float) * self._distance_step
+            tables = self._np_tables = (np.array(self._coeffs, dtype=float).T, grid, np.array(self._params))
+        coeffs, grid, uniform = tables
+        params = np.interp(distances, grid, uniform) if self._distance_step > 0.0 else np.zeros(len(distances))
+        f = params * self.segment_count
+        index = np.clip(f.astype(int), 0, self.segment_count - 1)
+        u = f - index
+        ax, bx, cx, dx, ay, by, cy, dy = coeffs[:, index]
+        return (((ax * u + bx) * u + cx) * u + dx, ((ay * u + by) * u + cy) * u + dy)
+
+    # Sequence protocol over the input points, for code that draws or measures paths
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        return iter(self.points)
+
+    def __getitem__(self, index: int) -> tuple[float, float]:
+        return self.points[index]
+
+    def __repr__(self) -> str:
+        return f"SplinePath({len(self.points)} points, kind={self.kind!r}, closed={self.closed})"
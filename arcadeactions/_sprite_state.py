@@ -0,0 +1,81 @@
+"""Per-sprite action state that forgets sprites when they are garbage-collected.
+
+Actions keep per-sprite state (boundary sides, captured origins, emitters, ...) keyed
+by ``id(sprite)``. A plain dict keeps those entries after the sprite is destroyed, so
+long-running actions on churning sprite lists grow without bound, and a new sprite
+allocated at the same address inherits the old sprite's state. :class:`SpriteStateMap`
+holds a weak reference per entry and drops the entry as soon as its sprite dies.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+
+class SpriteStateMap(dict):
+    """Dict of per-sprite state keyed by ``id(sprite)``, cleaned up when sprites die.
+
+    Reads use the plain dict API with ``id(sprite)`` keys, so lookups stay a single
+    hash probe. Entries must be written through :meth:`set_for` or
+    :meth:`setdefault_for`, which register the sprite for cleanup. Sprites that can't
+    be weakly referenced are kept alive until their entry is removed instead, so their
+    id can't be reused while the entry exists.
+    """
+
+    __slots__ = ("_refs", "_forget", "__weakref__")
+
+    def __init__(self):
+        super().__init__()
+        # id(sprite) -> weak reference with a cleanup callback (or the sprite itself)
+        refs: dict[int, Any] = {}
+        self._refs = refs
+        entries = weakref.ref(self)
+
+        def forget(ref: weakref.KeyedRef) -> None:
+            key = ref.key
+            if refs.get(key) is ref:
+                del refs[key]
+                owner = entries()
+                if owner is not None:
+                    dict.pop(owner, key, None)
+
+        self._forget = forget
+
+    def _track(self, sprite: Any) -> int:
+        key = id(sprite)
+        if key not in self._refs:
+            try:
+                self._refs[key] = weakref.KeyedRef(sprite, self._forget, key)
+            except TypeError:
+                self._refs[key] = sprite
+        return key
+
+    def set_for(self, sprite: Any, value: Any) -> None:
+        """Store *value* for *sprite*."""
+        self[self._track(sprite)] = value
+
+    def setdefault_for(self, sprite: Any, default: Any) -> Any:
+        """Return the state stored for *sprite*, storing *default* first if there is none."""
+        key = id(sprite)
+        try:
+            return self[key]
+        except KeyError:
+            self[self._track(sprite)] = default
+            return default
+
+    def get_for(self, sprite: Any, default: Any = None) -> Any:
+        """Return the state stored for *sprite*, or *default*."""
+        return self.get(id(sprite), default)
+
+    def pop(self, key: int, *default: Any) -> Any:
+        self._refs.pop(key, None)
+        return super().pop(key, *default)
+
+    def __delitem__(self, key: int) -> None:
+        super().__delitem__(key)
+        self._refs.pop(key, None)
+
+    def clear(self) -> None:
+        super().clear()
+        self._refs.clear()
@@ -0,0 +1,126 @@
+"""Hierarchical timer wheel keyed on the action manager's frame counter.
+
+Actions that know they will do nothing but count frames for a while (a waiting
+``DelayFrames``, or a composite whose current step is one) are parked here until the
+frame they have work to do, instead of being polled every frame.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+_SLOT_BITS = 6
+_SLOTS = 1 << _SLOT_BITS
+_SLOT_MASK = _SLOTS - 1
+_LEVELS = 4
+# Deadlines at least this many frames ahead wait in the overflow bucket
+_WHEEL_SPAN = 1 << (_SLOT_BITS * _LEVELS)
+
+
+class TimerWheel:
+    """Timer wheel mapping items to the integer frame at which they are due.
+
+    Level 0 has one slot per frame for the next 64 frames; each higher level has 64
+    slots that each span 64 slots of the level below and are cascaded down when the
+    current frame reaches them. Scheduling, cancelling and advancing one frame are
+    O(1) (amortized over cascades), so the cost does not grow with the number of
+    waiting items or with how far away they are due.
+    """
+
+    __slots__ = ("now", "_levels", "_overflow", "_where")
+
+    def __init__(self, now: int = 0):
+        self.now = now
+        self._levels: list[list[dict[Any, int]]] = [[{} for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        self._overflow: dict[Any, int] = {}
+        # item -> the bucket currently holding it
+        self._where: dict[Any, dict[Any, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._where
+
+    def schedule(self, item: Any, frame: int) -> None:
+        """Make *item* due at *frame* (at least one frame after :attr:`now`), replacing any earlier schedule."""
+        self.cancel(item)
+        self._file(item, max(frame, self.now + 1))
+
+    def cancel(self, item: Any) -> bool:
+        """Forget *item*. Returns True when it was scheduled."""
+        bucket = self._where.pop(item, None)
+        if bucket is None:
+            return False
+        del bucket[item]
+        return True
+
+    def advance(self, frame: int, on_due: Callable[[Any], None]) -> None:
+        """Move the wheel to *frame*, calling *on_due* for every item due on the way.
+
+        Items due on the same frame are reported in scheduling order. Moving backwards
+        (the frame counter was reset) reports every scheduled item immediately.
+        """
+        if not self._where:
+            self.now = frame
+            return
+        if frame < self.now:
+            due = list(self._where)
+            self._clear()
+            self.now = frame
+            for item in due:
+                on_due(item)
+            return
+        while self.now < frame and self._where:
+            self._tick(on_due)
+        if self.now < frame:
+            self.now = frame
+
+    def _clear(self) -> None:
+        for level in self._levels:
+            for bucket in level:
+                bucket.clear()
+        self._overflow.clear()
+        self._where.clear()
+
+    def _file(self, item: Any, frame: int) -> None:
+        delta = frame - self.now
+        if delta >= _WHEEL_SPAN:
+            bucket = self._overflow
+        else:
+            level = 0
+            while delta >= 1 << (_SLOT_BITS * (level + 1)):
+                level += 1
+            bucket = self._levels[level][(frame >> (_SLOT_BITS * level)) & _SLOT_MASK]
+        bucket[item] = frame
+        self._where[item] = bucket
+
+    def _refile(self, bucket: dict[Any, int]) -> None:
+        if not bucket:
+            return
+        items = list(bucket.items())
+        bucket.clear()
+        for item, frame in items:
+            self._file(item, frame)
+
+    def _tick(self, on_due: Callable[[Any], None]) -> None:
+        self.now = now = self.now + 1
+        # Cascade from the top so items dropping several levels land in level 0 in time
+        if now & (_WHEEL_SPAN - 1) == 0:
+            self._refile(self._overflow)
+        for level in range(_LEVELS - 1, 0, -1):
+            if now & ((1 << (_SLOT_BITS * level)) - 1) == 0:
+                self._refile(self._levels[level][(now >> (_SLOT_BITS * level)) & _SLOT_MASK])
+
+        bucket = self._levels[0][now & _SLOT_MASK]
+        if not bucket:
+            return
+        items = list(bucket.items())
+        bucket.clear()
+        for item, frame in items:
+            if frame == now:
+                del self._where[item]
+                on_due(item)
+            else:
+                self._file(item, frame)
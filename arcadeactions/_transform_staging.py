@@ -0,0 +1,129 @@
+"""Opt-in staging of sprite transforms written by actions during ``Action.update_all``.
+
+Each Arcade transform setter (``center_x``, ``center_y``, ``angle``, ``scale``)
+refreshes the sprite's hit box and pushes it to every SpriteList holding it. When
+several actions drive one sprite – a parametric offset, a tween and a path rider, say
+– each frame pays for every write separately. With staging on, the actions below
+write into a per-sprite pending transform instead, and the manager commits it once at
+the end of ``update_all`` with a single ``position``, ``angle`` and ``scale`` write.
+
+Writes made outside ``update_all`` (``apply()`` from game code) are never staged. A
+staged field wins over a direct write to the same field made by an action that does
+not stage, within the same frame.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Slot in a pending entry ([x, y, angle, scale]) for each stageable property
+_SLOTS = {"center_x": 0, "center_y": 1, "angle": 2, "scale": 3}
+
+
+class TransformStage:
+    """Pending per-sprite transforms for the current frame."""
+
+    __slots__ = ("enabled", "active", "_pending")
+
+    def __init__(self):
+        self.enabled = False
+        # True between begin() and commit() when staging is enabled
+        self.active = False
+        # sprite -> [x, y, angle, scale]; None marks an untouched field
+        self._pending: dict[Any, list[Any]] = {}
+
+    def begin(self) -> None:
+        self.active = self.enabled
+
+    def commit(self) -> None:
+        """Write every pending transform to its sprite and stop staging until the next begin()."""
+        self.active = False
+        if not self._pending:
+            return
+        pending = list(self._pending.items())
+        self._pending.clear()
+        for sprite, (x, y, angle, scale) in pending:
+            if x is not None:
+                if y is not None:
+                    sprite.position = (x, y)
+                else:
+                    sprite.center_x = x
+            elif y is not None:
+                sprite.center_y = y
+            if angle is not None:
+                sprite.angle = angle
+            if scale is not None:
+                sprite.scale = scale
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+transform_stage = TransformStage()
+_pending = transform_stage._pending
+
+
+def set_position(sprite: Any, x: float, y: float) -> None:
+    """Move *sprite* to ``(x, y)``, staged when staging is active."""
+    if transform_stage.active:
+        entry = _pending.get(sprite)
+        if entry is None:
+            _pending[sprite] = [x, y, None, None]
+        else:
+            entry[0] = x
+            entry[1] = y
+    else:
+        sprite.position = (x, y)
+
+
+def set_angle(sprite: Any, angle: float) -> None:
+    """Set *sprite*'s angle, staged when staging is active."""
+    if transform_stage.active:
+        entry = _pending.get(sprite)
+        if entry is None:
+            _pending[sprite] = [None, None, angle, None]
+        else:
+            entry[2] = angle
+    else:
+        sprite.angle = angle
+
+
+def set_scale(sprite: Any, scale: Any) -> None:
+    """Set *sprite*'s scale, staged when staging is active."""
+    if transform_stage.active:
+        entry = _pending.get(sprite)
+        if entry is None:
+            _pending[sprite] = [None, None, None, scale]
+        else:
+            entry[3] = scale
+    else:
+        sprite.scale = scale
+
+
+def set_property(sprite: Any, name: str, value: Any) -> None:
+    """``setattr`` that stages the transform properties and writes anything else directly."""
+    slot = _SLOTS.get(name) if transform_stage.active else None
+    if slot is None:
+        setattr(sprite, name, value)
+        return
+    entry = _pending.get(sprite)
+    if entry is None:
+        entry = _pending[sprite] = [None, None, None, None]
+    entry[slot] = value
+
+
+def get_position(sprite: Any) -> tuple[float, float]:
+    """Return *sprite*'s position including any staged, not yet committed move."""
+    entry = _pending.get(sprite) if transform_stage.active else None
+    if entry is None:
+        return (sprite.center_x, sprite.center_y)
+    x, y = entry[0], entry[1]
+    return (sprite.center_x if x is None else x, sprite.center_y if y is None else y)
+
+
+def get_scale(sprite: Any) -> Any:
+    """Return *sprite*'s scale including any staged, not yet committed change."""
+    entry = _pending.get(sprite) if transform_stage.active else None
+    if entry is None or entry[3] is None:
+        return sprite.scale
+    return entry[3]
@@ -9,7 +9,7 @@ orthogonal movement patterns.
 from collections.abc import Callable
 from typing import Any
 
-from arcadeactions._shared_logging import _debug_log
+from arcadeactions._shared_logging import _debug_gate, _debug_log
 from arcadeactions.conditional import MoveUntil
 
 
@@ -55,11 +55,12 @@ class MoveXUntil(MoveUntil):
             on_boundary_exit,
         )
 
-        _debug_log(
-            f"MoveXUntil.__init__: id={id(self)}, velocity={velocity}, bounds={bounds}, "
-            f"boundary_behavior={boundary_behavior}",
-            action="MoveXUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"MoveXUntil.__init__: id={id(self)}, velocity={velocity}, bounds={bounds}, "
+                f"boundary_behavior={boundary_behavior}",
+                action="MoveXUntil",
+            )
 
     def apply_effect(self) -> None:
         """Apply X-axis only movement to sprites."""
@@ -82,7 +83,7 @@ class MoveXUntil(MoveUntil):
         def apply_to_sprite(sprite):
             # Get current velocity (from provider or current)
             if self.velocity_provider:
-                current_velocity = self.velocity_provider()
+                current_velocity = self._provided_velocity()
                 self.current_velocity = (current_velocity[0], self.current_velocity[1])
             else:
                 current_velocity = self.current_velocity
@@ -91,30 +92,33 @@ class MoveXUntil(MoveUntil):
             sprite.change_x = current_velocity[0]
             # change_y is intentionally not modified
 
-            _debug_log(
-                f"MoveXUntil.apply_effect: sprite={id(sprite)}, change_x={sprite.change_x}, "
-                f"change_y={sprite.change_y} (preserved)",
-                action="MoveXUntil",
-            )
+            if _debug_gate.verbose:
+                _debug_log(
+                    f"MoveXUntil.apply_effect: sprite={id(sprite)}, change_x={sprite.change_x}, "
+                    f"change_y={sprite.change_y} (preserved)",
+                    action="MoveXUntil",
+                )
 
         self.for_each_sprite(apply_to_sprite)
         self._update_motion_snapshot(velocity=self.current_velocity)
 
     def update_effect(self, delta_time: float) -> None:
         """Update X-axis movement and handle X-axis boundary behavior only."""
-        _debug_log(
-            f"MoveXUntil.update_effect: id={id(self)}, delta_time={delta_time:.4f}, done={self.done}",
-            action="MoveXUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"MoveXUntil.update_effect: id={id(self)}, delta_time={delta_time:.4f}, done={self.done}",
+                action="MoveXUntil",
+            )
 
         # Handle duration-based conditions using simulation time
         if self._duration is not None:
             self._elapsed += delta_time
             if self._elapsed >= self._duration:
-                _debug_log(
-                    f"MoveXUntil.update_effect: duration elapsed ({self._duration:.4f}s) - stopping",
-                    action="MoveXUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"MoveXUntil.update_effect: duration elapsed ({self._duration:.4f}s) - stopping",
+                        action="MoveXUntil",
+                    )
                 self._condition_met = True
                 self.remove_effect()
                 self.done = True
@@ -125,11 +129,12 @@ class MoveXUntil(MoveUntil):
         # Re-apply velocity from provider if available (X-axis only)
         if self.velocity_provider:
             try:
-                dx, dy = self.velocity_provider()
-                _debug_log(
-                    f"MoveXUntil.update_effect: velocity_provider returned dx={dx}",
-                    action="MoveXUntil",
-                )
+                dx, dy = self._provided_velocity()
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"MoveXUntil.update_effect: velocity_provider returned dx={dx}",
+                        action="MoveXUntil",
+                    )
                 self.current_velocity = (dx, self.current_velocity[1])
 
                 def set_velocity(sprite):
@@ -137,10 +142,11 @@ class MoveXUntil(MoveUntil):
 
                 self.for_each_sprite(set_velocity)
             except Exception as error:
-                _debug_log(
-                    f"MoveXUntil.update_effect: velocity_provider exception={error!r} - keeping current velocity",
-                    action="MoveXUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"MoveXUntil.update_effect: velocity_provider exception={error!r} - keeping current velocity",
+                        action="MoveXUntil",
+                    )
 
         # Handle X-axis boundaries only
         if self.bounds and self.boundary_behavior:
@@ -189,9 +195,13 @@ class MoveXUntil(MoveUntil):
 
         self.for_each_sprite(handle_sprite_boundaries)
 
+    def _write_clock_velocity(self, sprite) -> None:
+        sprite.change_x = self.current_velocity[0]
+
     def clone(self) -> "MoveXUntil":
         """Create a copy of this MoveXUntil action."""
-        _debug_log(f"MoveXUntil.clone: id={id(self)}", action="MoveXUntil")
+        if _debug_gate.verbose:
+            _debug_log(f"MoveXUntil.clone: id={id(self)}", action="MoveXUntil")
         return MoveXUntil(
             self.target_velocity,
             self.condition,  # Use condition directly, not _clone_condition
@@ -246,11 +256,12 @@ class MoveYUntil(MoveUntil):
             on_boundary_exit,
         )
 
-        _debug_log(
-            f"MoveYUntil.__init__: id={id(self)}, velocity={velocity}, bounds={bounds}, "
-            f"boundary_behavior={boundary_behavior}",
-            action="MoveYUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"MoveYUntil.__init__: id={id(self)}, velocity={velocity}, bounds={bounds}, "
+                f"boundary_behavior={boundary_behavior}",
+                action="MoveYUntil",
+            )
 
     def apply_effect(self) -> None:
         """Apply Y-axis only movement to sprites."""
@@ -273,7 +284,7 @@ class MoveYUntil(MoveUntil):
         def apply_to_sprite(sprite):
             # Get current velocity (from provider or current)
             if self.velocity_provider:
-                current_velocity = self.velocity_provider()
+                current_velocity = self._provided_velocity()
                 self.current_velocity = (self.current_velocity[0], current_velocity[1])
             else:
                 current_velocity = self.current_velocity
@@ -282,30 +293,33 @@ class MoveYUntil(MoveUntil):
             sprite.change_y = current_velocity[1]
             # change_x is intentionally not modified
 
-            _debug_log(
-                f"MoveYUntil.apply_effect: sprite={id(sprite)}, change_x={sprite.change_x} (preserved), "
-                f"change_y={sprite.change_y}",
-                action="MoveYUntil",
-            )
+            if _debug_gate.verbose:
+                _debug_log(
+                    f"MoveYUntil.apply_effect: sprite={id(sprite)}, change_x={sprite.change_x} (preserved), "
+                    f"change_y={sprite.change_y}",
+                    action="MoveYUntil",
+                )
 
         self.for_each_sprite(apply_to_sprite)
         self._update_motion_snapshot(velocity=self.current_velocity)
 
     def update_effect(self, delta_time: float) -> None:
         """Update Y-axis movement and handle Y-axis boundary behavior only."""
-        _debug_log(
-            f"MoveYUntil.update_effect: id={id(self)}, delta_time={delta_time:.4f}, done={self.done}",
-            action="MoveYUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"MoveYUntil.update_effect: id={id(self)}, delta_time={delta_time:.4f}, done={self.done}",
+                action="MoveYUntil",
+            )
 
         # Handle duration-based conditions using simulation time
         if self._duration is not None:
             self._elapsed += delta_time
             if self._elapsed >= self._duration:
-                _debug_log(
-                    f"MoveYUntil.update_effect: duration elapsed ({self._duration:.4f}s) - stopping",
-                    action="MoveYUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"MoveYUntil.update_effect: duration elapsed ({self._duration:.4f}s) - stopping",
+                        action="MoveYUntil",
+                    )
                 self._condition_met = True
                 self.remove_effect()
                 self.done = True
@@ -316,11 +330,12 @@ class MoveYUntil(MoveUntil):
         # Re-apply velocity from provider if available (Y-axis only)
         if self.velocity_provider:
             try:
-                dx, dy = self.velocity_provider()
-                _debug_log(
-                    f"MoveYUntil.update_effect: velocity_provider returned dy={dy}",
-                    action="MoveYUntil",
-                )
+                dx, dy = self._provided_velocity()
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"MoveYUntil.update_effect: velocity_provider returned dy={dy}",
+                        action="MoveYUntil",
+                    )
                 self.current_velocity = (self.current_velocity[0], dy)
 
                 def set_velocity(sprite):
@@ -328,10 +343,11 @@ class MoveYUntil(MoveUntil):
 
                 self.for_each_sprite(set_velocity)
             except Exception as error:
-                _debug_log(
-                    f"MoveYUntil.update_effect: velocity_provider exception={error!r} - keeping current velocity",
-                    action="MoveYUntil",
-                )
+                if _debug_gate.verbose:
+                    _debug_log(
+                        f"MoveYUntil.update_effect: velocity_provider exception={error!r} - keeping current velocity",
+                        action="MoveYUntil",
+                    )
 
         # Handle Y-axis boundaries only
         if self.bounds and self.boundary_behavior:
@@ -380,9 +396,13 @@ class MoveYUntil(MoveUntil):
 
         self.for_each_sprite(handle_sprite_boundaries)
 
+    def _write_clock_velocity(self, sprite) -> None:
+        sprite.change_y = self.current_velocity[1]
+
     def clone(self) -> "MoveYUntil":
         """Create a copy of this MoveYUntil action."""
-        _debug_log(f"MoveYUntil.clone: id={id(self)}", action="MoveYUntil")
+        if _debug_gate.verbose:
+            _debug_log(f"MoveYUntil.clone: id={id(self)}", action="MoveYUntil")
         return MoveYUntil(
             self.target_velocity,
             self.condition,  # Use condition directly, not _clone_condition
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from time import perf_counter
 from typing import Any
 
-from arcadeactions._shared_logging import _debug_log
+from arcadeactions._action_callbacks import _report_callback_exception
+from arcadeactions._callback_arity import callback_arity
+from arcadeactions._callback_watchdog import callback_watchdog
+from arcadeactions._shared_logging import _debug_gate, _debug_log
 from arcadeactions.base import Action as _Action
-from arcadeactions.frame_conditions import _clone_condition, infinite
+from arcadeactions.frame_conditions import _can_reset_condition, _clone_condition, _reset_condition, infinite
 
 
 class DelayFrames(_Action):
@@ -21,6 +25,9 @@ class DelayFrames(_Action):
         on_stop: Optional callback called when condition is satisfied
     """
 
+    _supports_reuse = True
+    _parkable = True
+
     def __init__(
         self,
         frames: int | None = None,
@@ -56,8 +63,32 @@ class DelayFrames(_Action):
 
     def reset(self) -> None:
         """Reset the action to its initial state."""
+        super().reset()
+        _reset_condition(self._user_condition)
         self._frames_elapsed = 0
 
+    def _can_reuse(self) -> bool:
+        return super()._can_reuse() and _can_reset_condition(self._user_condition)
+
+    def _condition_counts_frames(self) -> bool:
+        return self.frames is not None
+
+    def _idle_frames(self) -> int:
+        # Only a pure frame wait can be skipped; a user condition must be polled every frame
+        if (
+            self.frames is None
+            or self._user_condition is not infinite
+            or not self._is_active
+            or self.done
+            or self._paused
+            or self._instrumentation_active()
+        ):
+            return 0
+        return max(0, self.frames - self._frames_elapsed - 1)
+
+    def _skip_frames(self, frames: int) -> None:
+        self._frames_elapsed += frames
+
     def clone(self) -> DelayFrames:
         """Create a copy of this action."""
         return DelayFrames(self.frames, _clone_condition(self._user_condition), self.on_stop)
@@ -77,6 +108,8 @@ class CallbackUntil(_Action):
         seconds_between_calls: Optional seconds between calls; None → every frame
     """
 
+    _supports_reuse = True
+
     def __init__(
         self,
         callback: Callable[..., None],
@@ -95,8 +128,12 @@ class CallbackUntil(_Action):
         self._duration: float | None = None
         self._elapsed = 0.0
         self._next_fire_time: float | None = None
+        # Arity of the callback it was resolved for, so update_effect calls it directly
+        self._arity_callback: Callable[..., Any] | None = None
+        self._callback_arity: tuple[int, int] | None = None
 
-        _debug_log(f"__init__: id={id(self)}, callback={callback}, seconds_between_calls={seconds_between_calls}")
+        if _debug_gate.verbose:
+            _debug_log(f"__init__: id={id(self)}, callback={callback}, seconds_between_calls={seconds_between_calls}")
 
     def set_factor(self, factor: float) -> None:
         """Scale the callback interval by the given factor.
@@ -125,12 +162,15 @@ class CallbackUntil(_Action):
 
     def update_effect(self, delta_time: float) -> None:
         """Call the callback function respecting optional interval scheduling."""
-        _debug_log(
-            f"update_effect: id={id(self)}, delta_time={delta_time:.4f}, elapsed={self._elapsed:.4f}, done={self.done}"
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"update_effect: id={id(self)}, delta_time={delta_time:.4f}, elapsed={self._elapsed:.4f}, "
+                f"done={self.done}"
+            )
 
         if not self.callback:
-            _debug_log(f"update_effect: id={id(self)}, no callback - returning")
+            if _debug_gate.verbose:
+                _debug_log(f"update_effect: id={id(self)}, no callback - returning")
             return
 
         # Always advance simulation time first for duration conditions
@@ -138,7 +178,8 @@ class CallbackUntil(_Action):
 
         # Per-frame mode
         if self.current_seconds_between_calls is None:
-            _debug_log(f"update_effect: id={id(self)}, per-frame mode - calling callback")
+            if _debug_gate.verbose:
+                _debug_log(f"update_effect: id={id(self)}, per-frame mode - calling callback")
             # Call callback once per frame, trying both signatures
             self._call_callback_with_fallback()
             return
@@ -147,18 +188,24 @@ class CallbackUntil(_Action):
         # Bootstrap schedule on first update
         if self._next_fire_time is None:
             self._next_fire_time = self.current_seconds_between_calls or 0.0
-            _debug_log(f"update_effect: id={id(self)}, interval mode - bootstrap next_fire_time={self._next_fire_time}")
+            if _debug_gate.verbose:
+                _debug_log(
+                    f"update_effect: id={id(self)}, interval mode - bootstrap next_fire_time={self._next_fire_time}"
+                )
 
         # Fire when elapsed meets or exceeds schedule (but not if paused)
         should_fire = (
             self.current_seconds_between_calls != float("inf") and self._elapsed >= self._next_fire_time - 1e-9
         )
-        _debug_log(
-            f"update_effect: id={id(self)}, interval mode - elapsed={self._elapsed:.4f}, next_fire={self._next_fire_time:.4f}, should_fire={should_fire}"
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"update_effect: id={id(self)}, interval mode - elapsed={self._elapsed:.4f}, "
+                f"next_fire={self._next_fire_time:.4f}, should_fire={should_fire}"
+            )
 
         if should_fire:
-            _debug_log(f"update_effect: id={id(self)}, interval mode - calling callback")
+            if _debug_gate.verbose:
+                _debug_log(f"update_effect: id={id(self)}, interval mode - calling callback")
             # Call callback once, trying both signatures
             self._call_callback_with_fallback()
 
@@ -180,7 +227,8 @@ class CallbackUntil(_Action):
 
     def apply_effect(self) -> None:
         """Initialize duration tracking based on frame metadata, if available."""
-        _debug_log(f"apply_effect: id={id(self)}, target={self.target}")
+        if _debug_gate.verbose:
+            _debug_log(f"apply_effect: id={id(self)}, target={self.target}")
         self._elapsed = 0.0
         self._elapsed_since_call = 0.0
         self.current_seconds_between_calls = self.target_seconds_between_calls
@@ -188,27 +236,71 @@ class CallbackUntil(_Action):
         self._duration = None
 
     def _call_callback_with_fallback(self) -> None:
-        """Call the callback, trying both with and without target parameter."""
-        _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback={self.callback}, target={self.target}")
+        """Call the callback with the target if its signature takes one, otherwise without arguments."""
+        if callback_watchdog.enabled:
+            callback = self.callback
+            start = perf_counter()
+            self._invoke_callback()
+            callback_watchdog.check(callback, self, perf_counter() - start)
+            return
+        self._invoke_callback()
+
+    def _invoke_callback(self) -> None:
+        if _debug_gate.verbose:
+            _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback={self.callback}, target={self.target}")
+        callback = self.callback
+        if self._arity_callback is not callback:
+            self._arity_callback = callback
+            self._callback_arity = callback_arity(callback)
+        arity = self._callback_arity
+        if arity is None:
+            self._call_callback_by_trial()
+            return
+
+        required, maximum = arity
+        if required <= 1 <= maximum:
+            if _debug_gate.verbose:
+                _debug_log(f"_call_callback_with_fallback: id={id(self)}, calling callback(target)")
+            callback(self.target)
+        elif required == 0:
+            if _debug_gate.verbose:
+                _debug_log(f"_call_callback_with_fallback: id={id(self)}, calling callback()")
+            try:
+                callback()
+            except Exception as exc:
+                _report_callback_exception(callback, exc)
+        else:
+            # Needs more than the target: reported once as a signature mismatch
+            type(self)._execute_callback_impl(callback, self.target)
+
+    def _call_callback_by_trial(self) -> None:
+        """Call a callback whose arity is unknown, trying with and without the target."""
         try:
             # Try with target parameter first
-            _debug_log(f"_call_callback_with_fallback: id={id(self)}, trying callback(target)")
+            if _debug_gate.verbose:
+                _debug_log(f"_call_callback_with_fallback: id={id(self)}, trying callback(target)")
             self.callback(self.target)
-            _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback(target) succeeded")
+            if _debug_gate.verbose:
+                _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback(target) succeeded")
         except TypeError:
             try:
                 # Fall back to no parameters
-                _debug_log(f"_call_callback_with_fallback: id={id(self)}, trying callback()")
+                if _debug_gate.verbose:
+                    _debug_log(f"_call_callback_with_fallback: id={id(self)}, trying callback()")
                 self.callback()
-                _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback() succeeded")
+                if _debug_gate.verbose:
+                    _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback() succeeded")
             except Exception as e:
                 # Use safe call for any other exceptions (includes TypeError)
-                _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback() failed: {e}, using safe_call")
+                if _debug_gate.verbose:
+                    _debug_log(f"_call_callback_with_fallback: id={id(self)}, callback() failed: {e}, using safe_call")
                 self._safe_call(self.callback)
 
     def reset(self) -> None:
         """Reset interval timing to initial state."""
-        _debug_log(f"reset: id={id(self)}")
+        if _debug_gate.verbose:
+            _debug_log(f"reset: id={id(self)}")
+        super().reset()
         self._elapsed_since_call = 0.0
         self.current_seconds_between_calls = self.target_seconds_between_calls
         self._elapsed = 0.0
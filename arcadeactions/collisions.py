@@ -0,0 +1,245 @@
+"""Per-frame collision queries shared by action conditions.
+
+Bullet-style conditions usually call ``arcade.check_for_collision_with_list`` every
+frame, so N bullets against a list of M targets cost N x M checks per frame. The
+:class:`CollisionBroker` instead keeps one spatial hash per registered SpriteList,
+brings it up to date once per frame (keyed on :meth:`Action.current_frame`), and
+memoizes each ``(sprite, list)`` answer for the rest of that frame::
+
+    from arcadeactions import collides_with, register_collision_list
+
+    register_collision_list("enemies", self.enemy_list)
+
+
+    def bullet_hit():
+        hits = collides_with(bullet, "enemies")
+        return {"hits": hits} if hits else None
+
+Answers describe sprite positions as of the first query for a list in a frame.
+Sprites removed from a list during the frame are left out of later answers; sprites
+added during the frame show up from the next frame (or after :meth:`invalidate`).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from math import floor
+from typing import Any
+
+import arcade
+
+from arcadeactions.base import Action
+
+# Same broad-phase radius factor arcade uses: half the diagonal of the larger side
+_RADIUS_FACTOR = 0.71
+
+
+def _cell_span(sprite: Any, cell_size: float) -> tuple[int, int, int, int]:
+    x, y = sprite.position
+    width = sprite.width
+    height = sprite.height
+    reach = (width if width > height else height) * _RADIUS_FACTOR
+    return (
+        floor((x - reach) / cell_size),
+        floor((y - reach) / cell_size),
+        floor((x + reach) / cell_size),
+        floor((y + reach) / cell_size),
+    )
+
+
+class _SpatialHash:
+    """Uniform-grid hash over one SpriteList, updated incrementally by :meth:`sync`."""
+
+    __slots__ = ("sprite_list", "cell_size", "_cells", "_placed")
+
+    def __init__(self, sprite_list: Any, cell_size: float | None):
+        self.sprite_list = sprite_list
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[int, Any]] = {}
+        # id(sprite) -> (sprite, cell span it is filed under)
+        self._placed: dict[int, tuple[Any, tuple[int, int, int, int]]] = {}
+
+    def sync(self) -> None:
+        """Re-file sprites whose cells changed and drop sprites that left the list."""
+        sprite_list = self.sprite_list
+        if self.cell_size is None:
+            if not len(sprite_list):
+                return
+            largest = max(max(sprite.width, sprite.height) for sprite in sprite_list)
+            self.cell_size = max(1.0, largest * 2 * _RADIUS_FACTOR)
+        cell_size = self.cell_size
+        placed = self._placed
+
+        for sprite in sprite_list:
+            key = id(sprite)
+            span = _cell_span(sprite, cell_size)
+            entry = placed.get(key)
+            if entry is not None:
+                if entry[0] is sprite and entry[1] == span:
+                    continue
+                # Moved to other cells (or a dead sprite's id was reused)
+                self._unfile(key, entry[1])
+            self._file(key, sprite, span)
+            placed[key] = (sprite, span)
+
+        if len(placed) != len(sprite_list):
+            in_list = {id(sprite) for sprite in sprite_list}
+            for key in [key for key in placed if key not in in_list]:
+                self._unfile(key, placed.pop(key)[1])
+
+    def _file(self, key: int, sprite: Any, span: tuple[int, int, int, int]) -> None:
+        cells = self._cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = {key: sprite}
+                else:
+                    bucket[key] = sprite
+
+    def _unfile(self, key: int, span: tuple[int, int, int, int]) -> None:
+        cells = self._cells
+        x0, y0, x1, y1 = span
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(key, None)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def hits(self, sprite: Any) -> list[Any]:
+        """Return sprites in the list that collide with *sprite*."""
+        if self.cell_size is None or not self._cells:
+            return []
+        cells = self._cells
+        x0, y0, x1, y1 = _cell_span(sprite, self.cell_size)
+        if x0 == x1 and y0 == y1:
+            bucket = cells.get((x0, y0))
+            candidates = bucket.values() if bucket else ()
+        else:
+            nearby: dict[int, Any] = {}
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        nearby.update(bucket)
+            candidates = nearby.values()
+
+        sprite_list = self.sprite_list
+        return [
+            other
+            for other in candidates
+            if other is not sprite and sprite_list in other.sprite_lists and arcade.check_for_collision(sprite, other)
+        ]
+
+
+class CollisionBroker:
+    """Answers collision queries against named SpriteLists, at most once per sprite per frame.
+
+    Args:
+        frame_source: Returns the current frame number. Defaults to
+            :meth:`Action.current_frame`; hashes are refreshed and memoized answers
+            dropped whenever it changes.
+    """
+
+    def __init__(self, frame_source: Callable[[], int] | None = None):
+        self._frame_source = frame_source if frame_source is not None else Action.current_frame
+        self._hashes: dict[str, _SpatialHash] = {}
+        self._synced: set[str] = set()
+        self._memo: dict[tuple[int, str], tuple[Any, list[Any]]] = {}
+        self._frame: int | None = None
+
+    def register(self, name: str, sprite_list: Any, *, cell_size: float | None = None) -> None:
+        """Make *sprite_list* queryable as *name*, replacing any list registered under it.
+
+        *cell_size* defaults to the broad-phase diameter of the largest sprite in the
+        list when it is first queried.
+        """
+        if cell_size is not None and cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self._hashes[name] = _SpatialHash(sprite_list, cell_size)
+        self.invalidate()
+
+    def unregister(self, name: str) -> None:
+        """Forget the list registered as *name* (no-op when there is none)."""
+        if self._hashes.pop(name, None) is not None:
+            self.invalidate()
+
+    def clear(self) -> None:
+        """Forget every registered list."""
+        self._hashes.clear()
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop memoized answers and re-sync hashes on the next query, e.g. after teleporting sprites."""
+        self._synced.clear()
+        self._memo.clear()
+
+    def collides_with(self, sprite: Any, name: str) -> list[Any]:
+        """Return the sprites in list *name* that collide with *sprite* (empty when none).
+
+        Raises:
+            KeyError: If no list is registered as *name*.
+        """
+        frame = self._frame_source()
+        if frame != self._frame:
+            self._frame = frame
+            self.invalidate()
+
+        memo_key = (id(sprite), name)
+        entry = self._memo.get(memo_key)
+        if entry is not None and entry[0] is sprite:
+            hits = entry[1]
+            sprite_list = self._hashes[name].sprite_list
+            for other in hits:
+                if sprite_list not in other.sprite_lists:
+                    # Removed from the list since this answer was memoized
+                    hits = [other for other in hits if sprite_list in other.sprite_lists]
+                    self._memo[memo_key] = (sprite, hits)
+                    break
+            return hits
+
+        spatial_hash = self._hashes.get(name)
+        if spatial_hash is None:
+            raise KeyError(f"No collision list registered as {name!r}")
+        if name not in self._synced:
+            spatial_hash.sync()
+            self._synced.add(name)
+        hits = spatial_hash.hits(sprite)
+        self._memo[memo_key] = (sprite, hits)
+        return hits
+
+    def first_hit(self, sprite: Any, name: str) -> Any | None:
+        """Return one sprite in list *name* that collides with *sprite*, or None."""
+        hits = self.collides_with(sprite, name)
+        return hits[0] if hits else None
+
+
+_default_broker = CollisionBroker()
+
+
+def get_collision_broker() -> CollisionBroker:
+    """Return the broker used by the module-level helpers."""
+    return _default_broker
+
+
+def register_collision_list(name: str, sprite_list: Any, *, cell_size: float | None = None) -> None:
+    """Register *sprite_list* as *name* with the shared broker."""
+    _default_broker.register(name, sprite_list, cell_size=cell_size)
+
+
+def unregister_collision_list(name: str) -> None:
+    """Remove the list registered as *name* from the shared broker."""
+    _default_broker.unregister(name)
+
+
+def collides_with(sprite: Any, name: str) -> list[Any]:
+    """Return sprites in the shared broker's list *name* that collide with *sprite*."""
+    return _default_broker.collides_with(sprite, name)
+
+
+def first_hit(sprite: Any, name: str) -> Any | None:
+    """Return one sprite in the shared broker's list *name* that collides with *sprite*, or None."""
+    return _default_broker.first_hit(sprite, name)
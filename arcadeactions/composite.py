@@ -2,31 +2,8 @@
 Composite actions that combine other actions.
 """
 
-import json
-import time
-
 from .base import Action, CompositeAction
-
-
-# region agent log helper
-def _agent_debug_log(*, hypothesis_id: str, location: str, message: str, data: dict | None = None) -> None:
-    payload = {
-        "sessionId": "debug-session",
-        "runId": "pre-fix",
-        "hypothesisId": hypothesis_id,
-        "location": location,
-        "message": message,
-        "data": data or {},
-        "timestamp": time.time(),
-    }
-    try:
-        with open("/home/bcorfman/dev/arcade_actions/.cursor/debug.log", "a", encoding="utf-8") as log_file:
-            log_file.write(json.dumps(payload) + "\n")
-    except Exception:
-        pass
-
-
-# endregion agent log helper
+from .trace import _tracer
 
 
 class _Sequence(CompositeAction):
@@ -36,6 +13,9 @@ class _Sequence(CompositeAction):
     before starting the next one.
     """
 
+    _supports_reuse = True
+    _parkable = True
+
     def __init__(self, *actions: Action):
         # Allow empty sequences - they complete immediately
         if not actions:
@@ -57,8 +37,7 @@ class _Sequence(CompositeAction):
         if self.actions:
             self.current_index = 0
             self.current_action = self.actions[0]
-            self.current_action.target = self.target
-            self.current_action.start()
+            self._start_child(self.current_action)
         else:
             # Empty sequence completes immediately
             self.done = True
@@ -82,8 +61,7 @@ class _Sequence(CompositeAction):
         # Start current action if needed
         if self.current_action is None and self.current_index < len(self.actions):
             self.current_action = self.actions[self.current_index]
-            self.current_action.target = self.target
-            self.current_action.start()
+            self._start_child(self.current_action)
 
         # Update current action if it exists and isn't done
         if self.current_action and not self.current_action.done:
@@ -97,8 +75,7 @@ class _Sequence(CompositeAction):
             # Start next action if available
             if self.current_index < len(self.actions):
                 self.current_action = self.actions[self.current_index]
-                self.current_action.target = self.target
-                self.current_action.start()
+                self._start_child(self.current_action)
             else:
                 # All actions complete
                 self.current_action = None
@@ -143,6 +120,15 @@ class _Sequence(CompositeAction):
         for action in self.actions:
             action.resume()
 
+    def _idle_frames(self) -> int:
+        if self.current_action is None or not self._is_active or self.done or self._paused:
+            return 0
+        return self.current_action._idle_frames()
+
+    def _skip_frames(self, frames: int) -> None:
+        if self.current_action is not None:
+            self.current_action._skip_frames(frames)
+
     def set_current_velocity(self, velocity: tuple[float, float]) -> None:
         """Forward velocity setting to the currently running action."""
         if self.current_action is not None:
@@ -160,6 +146,9 @@ class _Parallel(CompositeAction):
     all sub-actions have completed.
     """
 
+    _supports_reuse = True
+    _parkable = True
+
     def __init__(self, *actions: Action):
         # Allow empty parallel - they complete immediately
         if not actions:
@@ -176,8 +165,7 @@ class _Parallel(CompositeAction):
         super().start()
         if self.actions:
             for action in self.actions:
-                action.target = self.target
-                action.start()
+                self._start_child(action)
         else:
             # Empty parallel completes immediately
             self.done = True
@@ -240,6 +228,24 @@ class _Parallel(CompositeAction):
         for action in self.actions:
             action.resume()
 
+    def _idle_frames(self) -> int:
+        if not self.actions or not self._is_active or self.done or self._paused:
+            return 0
+        idle = 0
+        for action in self.actions:
+            if action.done:
+                continue
+            frames = action._idle_frames()
+            if frames == 0:
+                return 0
+            idle = frames if idle == 0 else min(idle, frames)
+        return idle
+
+    def _skip_frames(self, frames: int) -> None:
+        for action in self.actions:
+            if not action.done:
+                action._skip_frames(frames)
+
     def set_current_velocity(self, velocity: tuple[float, float]) -> None:
         """Forward velocity setting to all child actions that support it."""
         for action in self.actions:
@@ -256,42 +262,45 @@ class _Repeat(CompositeAction):
     This action clones the given action and runs it repeatedly. When one
     iteration completes, it automatically starts a new iteration with a fresh
     clone of the action.
+
+    With ``reuse=True`` the action is cloned once and then rewound in place with
+    ``reset()`` between iterations, as long as every action in it supports reuse
+    (see ``Action._supports_reuse``); otherwise it falls back to cloning.
     """
 
-    def __init__(self, action: Action | None):
-        # Allow None action - it completes immediately
-        if action is None:
-            CompositeAction.__init__(self)
-            self.action = None
-            self.current_action = None
-            return
+    _parkable = True
 
+    def __init__(self, action: Action | None, *, reuse: bool = False):
         CompositeAction.__init__(self)
-
+        # Allow None action - it completes immediately
         self.action = action
         self.current_action = None
+        self.reuse = reuse
+        self._reuse_current = False
 
     def start(self) -> None:
         """Start the repeat by starting the first iteration."""
         super().start()
         if self.action:
-            # Clone the action for the first iteration
-            self.current_action = self.action.clone()
-            self.current_action.target = self.target
-            self.current_action.start()
-            # region agent log
-            _agent_debug_log(
-                hypothesis_id="H7",
-                location="composite._Repeat.start",
-                message="repeat_clone_start",
-                data={"repeat_id": id(self), "clone_id": id(self.current_action)},
-            )
-            # endregion agent log
+            self._start_next_iteration()
         else:
             # No action to repeat - complete immediately
             self.done = True
             self._check_complete()
 
+    def _start_next_iteration(self) -> None:
+        """Start a fresh iteration: rewind the current action when allowed, otherwise clone."""
+        if self.current_action is not None and self._reuse_current:
+            self.current_action.reset()
+            if _tracer.enabled:
+                _tracer.record("repeat_reuse_start", repeat_id=id(self), action_id=id(self.current_action))
+        else:
+            self.current_action = self.action.clone()
+            self._reuse_current = self.reuse and self.current_action._can_reuse()
+            if _tracer.enabled:
+                _tracer.record("repeat_clone_start", repeat_id=id(self), clone_id=id(self.current_action))
+        self._start_child(self.current_action)
+
     def update(self, delta_time: float) -> None:
         """Update the current action and restart when done."""
 
@@ -316,39 +325,13 @@ class _Repeat(CompositeAction):
         # Check if current action completed after update
         if self.current_action and self.current_action.done:
             # Action finished. Immediately start the next iteration.
-            # region agent log
-            _agent_debug_log(
-                hypothesis_id="H7",
-                location="composite._Repeat.update",
-                message="repeat_clone_done",
-                data={"repeat_id": id(self), "completed_clone_id": id(self.current_action)},
-            )
-            # endregion agent log
-            self.current_action = self.action.clone()
-            self.current_action.target = self.target
-            self.current_action.start()
-            # region agent log
-            _agent_debug_log(
-                hypothesis_id="H7",
-                location="composite._Repeat.update",
-                message="repeat_clone_start",
-                data={"repeat_id": id(self), "clone_id": id(self.current_action)},
-            )
-            # endregion agent log
+            if _tracer.enabled:
+                _tracer.record("repeat_clone_done", repeat_id=id(self), completed_clone_id=id(self.current_action))
+            self._start_next_iteration()
 
         # Start current action if needed
         if self.current_action is None:
-            self.current_action = self.action.clone()
-            self.current_action.target = self.target
-            self.current_action.start()
-            # region agent log
-            _agent_debug_log(
-                hypothesis_id="H7",
-                location="composite._Repeat.update",
-                message="repeat_clone_start",
-                data={"repeat_id": id(self), "clone_id": id(self.current_action)},
-            )
-            # endregion agent log
+            self._start_next_iteration()
 
     def stop(self) -> None:
         """Stop the repeat action and the current iteration."""
@@ -363,12 +346,13 @@ class _Repeat(CompositeAction):
         if self.current_action:
             self.current_action.reset()
         self.current_action = None
+        self._reuse_current = False
         self._on_complete_called = False
         super().reset()
 
     def clone(self) -> "_Repeat":
         """Create a copy of this _Repeat action."""
-        return _Repeat(self.action.clone() if self.action else None)
+        return _Repeat(self.action.clone() if self.action else None, reuse=self.reuse)
 
     def pause(self) -> None:
         """Pause the repeat action and propagate to the current nested action."""
@@ -382,6 +366,15 @@ class _Repeat(CompositeAction):
         if self.current_action is not None:
             self.current_action.resume()
 
+    def _idle_frames(self) -> int:
+        if self.current_action is None or not self._is_active or self.done or self._paused:
+            return 0
+        return self.current_action._idle_frames()
+
+    def _skip_frames(self, frames: int) -> None:
+        if self.current_action is not None:
+            self.current_action._skip_frames(frames)
+
     def set_current_velocity(self, velocity: tuple[float, float]) -> None:
         """Forward velocity setting to the currently running action."""
         if self.current_action is not None:
@@ -431,11 +424,14 @@ def parallel(*actions: Action) -> _Parallel:
     return _Parallel(*actions)
 
 
-def repeat(action: Action) -> _Repeat:
+def repeat(action: Action, *, reuse: bool = False) -> _Repeat:
     """Create a repeat composition that runs an action indefinitely.
 
     Args:
         action: Action to repeat indefinitely
+        reuse: Rewind the running copy with ``reset()`` between iterations instead of
+            cloning the whole action tree each time. Falls back to cloning when an
+            action in the tree does not support reuse.
 
     Returns:
         Repeat action that runs the action repeatedly
@@ -455,5 +451,9 @@ def repeat(action: Action) -> _Repeat:
         rep.apply(sprite, tag="complex_cycle")
 
         # The action will repeat indefinitely until stopped
+
+        # Allocation-free repetition for long-running patterns
+        rep = repeat(create_wave_pattern(amplitude=30, length=400, velocity=80), reuse=True)
+        rep.apply(enemies, tag="wave")
     """
-    return _Repeat(action)
+    return _Repeat(action, reuse=reuse)
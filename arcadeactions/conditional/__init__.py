@@ -6,7 +6,7 @@ from arcadeactions.effects import BlinkUntil, CycleTexturesUntil, EmitParticlesU
 from arcadeactions.frame_conditions import _clone_condition, _extract_duration_seconds, infinite
 from arcadeactions.movement import MoveUntil, RotateUntil
 from arcadeactions.parametric import ParametricMotionUntil
-from arcadeactions.paths import FollowPathUntil
+from arcadeactions.paths import FollowPathGroupUntil, FollowPathUntil
 from arcadeactions.transforms import FadeTo, FadeUntil, ScaleUntil, TweenUntil
 
 __all__ = [
@@ -19,6 +19,7 @@ __all__ = [
     "CallbackUntil",
     "DelayFrames",
     "FollowPathUntil",
+    "FollowPathGroupUntil",
     "TweenUntil",
     "CycleTexturesUntil",
     "GlowUntil",
@@ -13,6 +13,15 @@ import os
 from collections.abc import Iterable
 from typing import Final
 
+from ._callback_watchdog import DEFAULT_CAPACITY as _WATCHDOG_CAPACITY
+from ._callback_watchdog import DEFAULT_THRESHOLD_MS as _WATCHDOG_THRESHOLD_MS
+from ._callback_watchdog import CallbackWatchdog, callback_watchdog
+from ._clock_domains import ClockDomain, clock_domains
+from ._frame_stats import FrameStats, frame_stats
+from ._lod import DEFAULT_INTERVAL as _LOD_INTERVAL
+from ._lod import DEFAULT_MARGIN as _LOD_MARGIN
+from ._lod import LodPolicy, lod_policy
+from ._transform_staging import transform_stage
 from .base import Action
 
 __all__ = [
@@ -23,6 +32,20 @@ __all__ = [
     "get_debug_options",
     "observe_actions",
     "clear_observed_actions",
+    "set_transform_staging",
+    "get_transform_staging",
+    "set_frame_stats",
+    "get_frame_stats",
+    "set_callback_watchdog",
+    "get_callback_watchdog",
+    "set_lod_policy",
+    "set_lod_viewport",
+    "clear_lod_policy",
+    "get_lod_policy",
+    "get_clock_domain",
+    "set_clock_scale",
+    "set_clock_paused",
+    "reset_clock_domains",
 ]
 
 
@@ -92,9 +115,8 @@ def observe_actions(*classes_or_names: object) -> None:
     """
     names = _normalize_names(classes_or_names)
     if names:
-        if Action.debug_include_classes is None:
-            Action.debug_include_classes = set()
-        Action.debug_include_classes.update(names)
+        # Assign a new set (rather than updating in place) so the precomputed debug gate refreshes
+        Action.debug_include_classes = (Action.debug_include_classes or set()) | names
 
 
 def clear_observed_actions() -> None:
@@ -102,6 +124,147 @@ def clear_observed_actions() -> None:
     Action.debug_include_classes = None
 
 
+def set_transform_staging(enabled: bool) -> None:
+    """Stage sprite transforms written by actions and commit them once per ``Action.update_all``.
+
+    When enabled, path, parametric, tween, ScaleUntil, MoveTo and MoveBy actions write
+    position, angle and scale into a per-sprite pending transform; the manager applies
+    it with one ``position`` write and one ``angle``/``scale`` write per sprite, just
+    before the physics engine sync. Sprite properties read inside callbacks and
+    conditions reflect the previous frame's commit until then.
+    """
+    transform_stage.enabled = bool(enabled)
+
+
+def get_transform_staging() -> bool:
+    """Return True if transform staging is enabled."""
+    return transform_stage.enabled
+
+
+def set_frame_stats(enabled: bool, *, capacity: int | None = None) -> None:
+    """Record per-phase, per-class and per-tag timings inside ``Action.update_all``.
+
+    Args:
+        enabled: Turn the collector on or off. Recorded data is kept when disabling.
+        capacity: Number of frames kept in the per-phase ring buffers. Changing it
+            discards everything recorded so far.
+    """
+    if capacity is not None and capacity != frame_stats.capacity:
+        frame_stats.configure(capacity=capacity)
+    frame_stats.enabled = bool(enabled)
+
+
+def get_frame_stats() -> FrameStats:
+    """Return the frame stats collector used by ``Action.update_all`` for querying."""
+    return frame_stats
+
+
+def set_callback_watchdog(
+    enabled: bool, *, threshold_ms: float = _WATCHDOG_THRESHOLD_MS, capacity: int = _WATCHDOG_CAPACITY
+) -> None:
+    """Time user callbacks and conditions run by actions and report the slow ones.
+
+    While enabled, every callback passed to an action (``on_stop``, boundary callbacks,
+    ``CallbackUntil`` callbacks) and every condition function is timed. Calls taking at
+    least *threshold_ms* are reported with the callback's name, the owning action and
+    tag, and the ``file:line`` of the ``apply()`` call. Only actions applied while the
+    watchdog is on know their apply site.
+
+    Args:
+        enabled: Turn the watchdog on or off. Reports are kept when disabling.
+        threshold_ms: Minimum duration of a reported call, in milliseconds.
+        capacity: Number of individual reports kept; the summary covers all of them.
+    """
+    callback_watchdog.configure(threshold_ms=threshold_ms, capacity=capacity)
+    callback_watchdog.enabled = bool(enabled)
+
+
+def get_callback_watchdog() -> CallbackWatchdog:
+    """Return the callback watchdog, for ``reports()``, ``summary()`` and ``clear()``."""
+    return callback_watchdog
+
+
+def set_lod_policy(
+    viewport: tuple[float, float, float, float],
+    *,
+    margin: float = _LOD_MARGIN,
+    interval: int = _LOD_INTERVAL,
+    tags: Iterable[str] | None = None,
+    classes: Iterable[object] | None = None,
+) -> None:
+    """Update opted-in actions less often while their sprites are off-screen.
+
+    An action opts in when its tag is in *tags* or its class (or class name) is in
+    *classes*. While every sprite of its target lies outside *viewport* grown by
+    *margin*, it is updated only every *interval* frames, and the skipped frames are
+    credited to it when it runs again. Only actions that can catch up exactly are
+    slowed down: currently ``MoveUntil`` without bounds or a velocity provider, whose
+    ``infinite`` or ``after_frames`` condition still ends it on its exact frame. Other
+    opted-in actions keep updating every frame.
+
+    Args:
+        viewport: Visible area as (left, bottom, right, top) in world coordinates.
+        margin: Extra distance around the viewport that still counts as on-screen.
+        interval: Update every Nth frame while off-screen (1 disables throttling).
+        tags: Action tags that opt in.
+        classes: Action classes or class names that opt in.
+    """
+    lod_policy.configure(
+        viewport,
+        margin=margin,
+        interval=interval,
+        tags=frozenset(tags or ()),
+        classes=frozenset(_normalize_names(classes) or ()),
+    )
+
+
+def set_lod_viewport(viewport: tuple[float, float, float, float]) -> None:
+    """Move the LOD viewport (left, bottom, right, top), e.g. each frame after the camera scrolls."""
+    lod_policy.set_viewport(viewport)
+
+
+def clear_lod_policy() -> None:
+    """Update every action every frame again. Parked actions wake on their scheduled frame."""
+    lod_policy.disable()
+
+
+def get_lod_policy() -> LodPolicy:
+    """Return the LOD policy used by ``Action.update_all``."""
+    return lod_policy
+
+
+def get_clock_domain(name: str) -> ClockDomain:
+    """Return the clock domain called *name*, creating it (at scale 1) on first use.
+
+    Actions join a domain with ``action.apply(target, clock=name)``.
+    """
+    return clock_domains.get(name)
+
+
+def set_clock_scale(name: str, scale: float) -> None:
+    """Run every action on clock domain *name* at *scale* times normal speed.
+
+    O(1): the domain's actions keep updating every frame with a scaled delta,
+    ``after_frames`` conditions count domain ticks, and ``MoveUntil``/``RotateUntil``
+    pick up the new velocity scale in the next ``Action.update_all``.
+    """
+    clock_domains.get(name).set_scale(scale)
+
+
+def set_clock_paused(name: str, paused: bool) -> None:
+    """Freeze (or unfreeze) every action on clock domain *name* without pausing each one."""
+    domain = clock_domains.get(name)
+    if paused:
+        domain.pause()
+    else:
+        domain.resume()
+
+
+def reset_clock_domains() -> None:
+    """Return every clock domain to scale 1, unpaused."""
+    clock_domains.reset()
+
+
 def apply_environment_configuration() -> None:
     """Apply configuration from environment variables.
 
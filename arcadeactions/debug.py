@@ -1,5 +1,3 @@
-from __future__ import annotations
-
 """Runtime debugging helpers for ArcadeActions.
 
 Currently contains a MotionDebugger action that watches sprites for
@@ -7,6 +5,8 @@ single-frame world-space jumps that exceed a configurable threshold and
 prints a console message when such an event occurs.
 """
 
+from __future__ import annotations
+
 import math
 import time
 from typing import TYPE_CHECKING
@@ -14,6 +14,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     import arcade
 
+from arcadeactions._sprite_state import SpriteStateMap
 from arcadeactions.base import Action
 from arcadeactions.conditional import infinite
 
@@ -30,14 +31,14 @@ class MotionDebugger(Action):
     def __init__(self, threshold: float = 20.0):
         super().__init__(condition=infinite)
         self.threshold = threshold
-        self._prev_positions: dict[int, tuple[float, float]] = {}
+        self._prev_positions = SpriteStateMap()  # sprite_id -> (x, y) last frame
 
     # ---------------- Action hooks ----------------
     def apply_effect(self) -> None:  # noqa: D401 – imperative style
         """Capture initial positions for all bound sprites."""
 
         def _capture(sprite: arcade.Sprite):
-            self._prev_positions[id(sprite)] = (sprite.center_x, sprite.center_y)
+            self._prev_positions.set_for(sprite, (sprite.center_x, sprite.center_y))
 
         self.for_each_sprite(_capture)
 
@@ -57,7 +58,7 @@ class MotionDebugger(Action):
                     f"[MotionDebugger] t={ts} sprite_id={sid} Δ={jump:.2f}px "
                     f"(threshold={self.threshold}) pos_prev={prev} pos_now={(sprite.center_x, sprite.center_y)}"
                 )
-            self._prev_positions[sid] = (sprite.center_x, sprite.center_y)
+            self._prev_positions.set_for(sprite, (sprite.center_x, sprite.center_y))
 
         self.for_each_sprite(_check)
 
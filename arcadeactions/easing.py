@@ -10,6 +10,7 @@ from __future__ import annotations
 from collections.abc import Callable
 
 from arcadeactions import Action
+from arcadeactions._clock_domains import TICK_EPSILON
 
 
 class Ease(Action):
@@ -91,13 +92,13 @@ class Ease(Action):
         self._frames_elapsed = 0
         self._easing_complete = False
 
-    def apply(self, target, tag: str = "default") -> Action:
-        """Apply both this easing wrapper and the wrapped action to the target."""
+    def apply(self, target, tag: str = "default", replace: bool = False, name: str | None = None, clock=None) -> Action:
+        """Apply both this easing wrapper and the wrapped action to the target (on the same clock)."""
         # Apply the wrapped action first
-        self.wrapped_action.apply(target, tag=f"{tag}_wrapped")
+        self.wrapped_action.apply(target, tag=f"{tag}_wrapped", replace=replace, name=name, clock=clock)
 
         # Then apply this easing wrapper
-        return super().apply(target, tag)
+        return super().apply(target, tag, replace=replace, clock=clock)
 
     def apply_effect(self) -> None:
         """Initialize easing - start with factor 0."""
@@ -108,7 +109,10 @@ class Ease(Action):
         if self._easing_complete:
             return
 
-        self._frames_elapsed += 1
+        self._frames_elapsed += self._clock_scale
+        # Fractional clock-domain steps can land a hair short of the last frame
+        if 0 < self.easing_frames - self._frames_elapsed < TICK_EPSILON:
+            self._frames_elapsed = self.easing_frames
 
         # Calculate easing progress (0 to 1)
         t = min(self._frames_elapsed / self.easing_frames, 1.0)
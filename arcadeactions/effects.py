@@ -3,7 +3,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
-from arcadeactions._shared_logging import _debug_log
+from arcadeactions._shared_logging import _debug_gate, _debug_log
+from arcadeactions._sprite_state import SpriteStateMap
 from arcadeactions.base import Action as _Action
 from arcadeactions.frame_conditions import _clone_condition, infinite
 
@@ -34,8 +35,8 @@ class BlinkUntil(_Action):
         self.target_frames_until_change = frames_until_change  # Immutable target rate
         self.current_frames_until_change = frames_until_change  # Current rate (can be scaled)
         self._frames_elapsed = 0
-        self._original_visibility = {}
-        self._last_visible: dict[int, bool] = {}
+        self._original_visibility = SpriteStateMap()
+        self._last_visible = SpriteStateMap()
 
         self.on_blink_enter = on_blink_enter
         self.on_blink_exit = on_blink_exit
@@ -60,10 +61,9 @@ class BlinkUntil(_Action):
         """Store original visibility for all sprites."""
 
         def store_visibility(sprite):
-            vid = id(sprite)
             visible = sprite.visible
-            self._original_visibility[vid] = visible
-            self._last_visible[vid] = visible
+            self._original_visibility.set_for(sprite, visible)
+            self._last_visible.set_for(sprite, visible)
 
         self.for_each_sprite(store_visibility)
 
@@ -81,7 +81,7 @@ class BlinkUntil(_Action):
 
     def update_effect(self, delta_time: float) -> None:
         """Apply blinking effect based on the configured interval."""
-        self._frames_elapsed += 1
+        self._frames_elapsed += self._clock_scale
         # Determine how many intervals have passed to know whether we should show or hide.
         cycles = int(self._frames_elapsed / self.current_frames_until_change)
 
@@ -111,7 +111,7 @@ class BlinkUntil(_Action):
                     any_exited = True
 
             sprite.visible = new_visible
-            self._last_visible[vid] = new_visible
+            self._last_visible.set_for(sprite, new_visible)
 
         self.for_each_sprite(apply_blink)
 
@@ -194,9 +194,10 @@ class CycleTexturesUntil(_Action):
         # We check BEFORE incrementing so that:
         # - frames_per_texture=3 means: frame 0,1,2 show texture 0, then frame 3,4,5 show texture 1
         if self._frames_on_current_texture >= self._frames_per_texture:
-            # Advance to next texture
-            self._current_texture_index = (self._current_texture_index + self._direction) % self._count
-            self._frames_on_current_texture = 0
+            # Advance to next texture; a fast clock domain can pass more than one per update
+            steps = int(self._frames_on_current_texture // self._frames_per_texture)
+            self._current_texture_index = (self._current_texture_index + self._direction * steps) % self._count
+            self._frames_on_current_texture -= steps * self._frames_per_texture
 
             # Apply new texture
             current_texture = self._textures[self._current_texture_index]
@@ -207,7 +208,7 @@ class CycleTexturesUntil(_Action):
             self.for_each_sprite(set_texture)
 
         # Increment frame counter AFTER checking/switching
-        self._frames_on_current_texture += 1
+        self._frames_on_current_texture += self._clock_scale
 
     def set_factor(self, factor: float) -> None:
         """Scale both texture cycling speed and duration timing by the given factor.
@@ -281,7 +282,8 @@ class GlowUntil(_Action):
         try:
             self._shader = self._factory((0, 0))
         except Exception as e:
-            _debug_log(f"GlowUntil factory failed: {e!r}", action="GlowUntil")
+            if _debug_gate.verbose:
+                _debug_log(f"GlowUntil factory failed: {e!r}", action="GlowUntil")
             self._shader = None
 
         self._duration = None
@@ -310,7 +312,8 @@ class GlowUntil(_Action):
             try:
                 uniforms = self._uniforms_provider(self._shader, self.target)
             except Exception as e:
-                _debug_log(f"GlowUntil uniforms_provider failed: {e!r}", action="GlowUntil")
+                if _debug_gate.verbose:
+                    _debug_log(f"GlowUntil uniforms_provider failed: {e!r}", action="GlowUntil")
                 uniforms = None
             if isinstance(uniforms, dict):
                 # Camera correction for common uniform key names
@@ -330,7 +333,8 @@ class GlowUntil(_Action):
         try:
             self._shader.render()
         except Exception as e:
-            _debug_log(f"GlowUntil render failed: {e!r}", action="GlowUntil")
+            if _debug_gate.verbose:
+                _debug_log(f"GlowUntil render failed: {e!r}", action="GlowUntil")
 
     # Optional hook from window to propagate resize
     def on_resize(self, width: int, height: int) -> None:
@@ -338,7 +342,8 @@ class GlowUntil(_Action):
             try:
                 self._shader.resize((width, height))
             except Exception as e:
-                _debug_log(f"GlowUntil resize failed: {e!r}", action="GlowUntil")
+                if _debug_gate.verbose:
+                    _debug_log(f"GlowUntil resize failed: {e!r}", action="GlowUntil")
 
     def clone(self) -> GlowUntil:
         return GlowUntil(
@@ -382,7 +387,7 @@ class EmitParticlesUntil(_Action):
         self._start_paused = start_paused
         self._destroy_on_stop = destroy_on_stop
 
-        self._emitters: dict[int, object] = {}
+        self._emitters = SpriteStateMap()  # sprite_id -> emitter
         self._emitters_snapshot: dict[int, object] = {}
         self._elapsed = 0.0
         self._duration: float | None = None
@@ -392,7 +397,7 @@ class EmitParticlesUntil(_Action):
 
         def create_for_sprite(sprite):
             emitter = self._factory(sprite)
-            self._emitters[id(sprite)] = emitter
+            self._emitters.set_for(sprite, emitter)
 
         self.for_each_sprite(create_for_sprite)
 
@@ -437,7 +442,8 @@ class EmitParticlesUntil(_Action):
                 if hasattr(emitter, "update"):
                     emitter.update()
             except Exception as e:
-                _debug_log(f"EmitParticlesUntil update failed: {e!r}", action="EmitParticlesUntil")
+                if _debug_gate.verbose:
+                    _debug_log(f"EmitParticlesUntil update failed: {e!r}", action="EmitParticlesUntil")
 
         self.for_each_sprite(update_for_sprite)
 
@@ -451,7 +457,8 @@ class EmitParticlesUntil(_Action):
                     if hasattr(emitter, "destroy"):
                         emitter.destroy()
                 except Exception as e:
-                    _debug_log(f"EmitParticlesUntil destroy failed: {e!r}", action="EmitParticlesUntil")
+                    if _debug_gate.verbose:
+                        _debug_log(f"EmitParticlesUntil destroy failed: {e!r}", action="EmitParticlesUntil")
         self._emitters.clear()
 
     def clone(self) -> EmitParticlesUntil:
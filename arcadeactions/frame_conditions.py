@@ -18,6 +18,24 @@ def _clone_condition(condition):
         return condition
 
 
+def _can_reset_condition(condition) -> bool:
+    """Return True when *condition* can be rewound in place by :func:`_reset_condition`.
+
+    Frame conditions carry a counter and must expose ``_reset``; any other condition is
+    shared between clones anyway, so reusing it is equivalent to cloning it.
+    """
+    if getattr(condition, "_is_frame_condition", False):
+        return callable(getattr(condition, "_reset", None))
+    return True
+
+
+def _reset_condition(condition) -> None:
+    """Rewind a frame condition's counter (no-op for other conditions)."""
+    reset = getattr(condition, "_reset", None)
+    if reset is not None:
+        reset()
+
+
 # Common condition functions
 
 
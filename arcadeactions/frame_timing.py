@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from collections.abc import Callable
 
+from arcadeactions._callback_arity import callback_arity
+
 
 def after_frames(frame_count: int) -> Callable[[], bool]:
     """Create a condition that returns True after a specified number of frames.
@@ -58,9 +60,25 @@ def after_frames(frame_count: int) -> Callable[[], bool]:
         frames_elapsed += 1
         return frames_elapsed >= frame_count
 
+    def reset() -> None:
+        nonlocal frames_elapsed
+        frames_elapsed = 0
+
+    def advance(frames: int) -> None:
+        nonlocal frames_elapsed
+        frames_elapsed += frames
+
+    def remaining() -> int:
+        return max(0, frame_count - frames_elapsed)
+
     # Mark this as a frame-based condition for introspection
     condition._is_frame_condition = True  # type: ignore
     condition._frame_count = frame_count  # type: ignore
+    # Lets Action.reset() rewind the counter instead of cloning the condition
+    condition._reset = reset  # type: ignore
+    # Let an action that skipped updates count those frames without calling the condition
+    condition._advance = advance  # type: ignore
+    condition._remaining = remaining  # type: ignore
 
     return condition
 
@@ -111,13 +129,19 @@ def every_frames(interval: int, callback: Callable[..., None]) -> Callable[[], N
 
         if frames_since_last_call >= interval:
             frames_since_last_call = 0
-            # Try calling with args first, fall back to no args
+            arity = callback_arity(callback)
+            if arity is not None:
+                callback(*args[: arity[1]], **kwargs)
+                return
+            # Arity unknown: try calling with args first, fall back to no args
             try:
                 callback(*args, **kwargs)
             except TypeError:
                 # Callback doesn't accept parameters
                 callback()
 
+    # Expose the callback's signature so callers pass it the arguments it takes
+    ticker.__wrapped__ = callback
     return ticker
 
 
@@ -158,9 +182,14 @@ def within_frames(start_frame: int, end_frame: int) -> Callable[[], bool]:
         current_frame += 1
         return result
 
+    def reset() -> None:
+        nonlocal current_frame
+        current_frame = 0
+
     # Mark this as a frame-based condition
     condition._is_frame_condition = True  # type: ignore
     condition._frame_window = (start_frame, end_frame)  # type: ignore
+    condition._reset = reset  # type: ignore
 
     return condition
 
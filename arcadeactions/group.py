@@ -5,6 +5,8 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
+from arcadeactions._sprite_state import SpriteStateMap
+
 if TYPE_CHECKING:
     import arcade
 
@@ -82,7 +84,7 @@ class AttackGroup:
         self.sprites = sprites
         self.group_id = group_id
         self.formation_type: str | None = None
-        self._home_slots: dict[int, tuple[float, float]] = {}  # sprite_id -> (x, y)
+        self._home_slots = SpriteStateMap()  # sprite_id -> (x, y)
         self._breakaway_manager: BreakawayManager | None = None
 
     def place(
@@ -113,7 +115,7 @@ class AttackGroup:
         # Record home slots for each sprite
         self._home_slots.clear()
         for sprite in self.sprites:
-            self._home_slots[id(sprite)] = (sprite.center_x, sprite.center_y)
+            self._home_slots.set_for(sprite, (sprite.center_x, sprite.center_y))
 
     def script(self, action: Action, tag: str | None = None) -> None:
         """Apply a synchronized action script to all sprites in the group.
@@ -191,9 +193,10 @@ class AttackGroup:
         The first sprite (leader) follows the path immediately. Each follower
         sprite waits a delay (spacing_frames * follower_index) before starting
         the same path. At path completion, each sprite tweens to its home slot.
+        All sprites share a single FollowPathGroupUntil action.
 
         Args:
-            leader_path: List of waypoints for FollowPathUntil
+            leader_path: List of waypoints for the shared path
             velocity: Speed along the path (pixels per second)
             spacing_frames: Frames between each follower starting the path
             tag: Optional tag for the entry actions
@@ -203,75 +206,51 @@ class AttackGroup:
             path = loop_the_loop(start_x=400, start_y=-100, end_x=400, end_y=500)
             group.entry_path(path, velocity=150, spacing_frames=5)
         """
-        from arcadeactions.composite import parallel, sequence
-        from arcadeactions.conditional import FollowPathUntil, TweenUntil, infinite
+        from arcadeactions.composite import parallel
+        from arcadeactions.conditional import FollowPathGroupUntil, TweenUntil, infinite
         from arcadeactions.frame_timing import after_frames, seconds_to_frames
 
         if not self.sprites:
             return
 
-        # Leader sprite: FollowPathUntil then TweenUntil to home slot
-        leader = self.sprites[0]
-        leader_home = self.get_home_slot(leader)
-        if leader_home:
-            # Use infinite condition - FollowPathUntil will complete automatically
-            # when it reaches the end of the path (_curve_progress >= 1.0)
-            leader_path_action = FollowPathUntil(
-                leader_path.copy(),
-                velocity,
-                infinite,
-            )
-            # Use lambda to capture sprite position when tween starts (after path completes)
-            leader_return_x = TweenUntil(
-                lambda sprite: sprite.center_x,
-                leader_home[0],
-                "center_x",
-                after_frames(seconds_to_frames(0.5)),
-            )
-            leader_return_y = TweenUntil(
-                lambda sprite: sprite.center_y,
-                leader_home[1],
-                "center_y",
-                after_frames(seconds_to_frames(0.5)),
-            )
-            leader_sequence = sequence(leader_path_action, parallel(leader_return_x, leader_return_y))
-            leader_sequence.apply(leader, tag=tag or "entry_leader")
-
-        # Follower sprites: DelayFrames + FollowPathUntil + TweenUntil
-        for i, follower in enumerate(self.sprites[1:], start=1):
-            follower_home = self.get_home_slot(follower)
-            if not follower_home:
-                continue
-
-            delay_frames = i * spacing_frames
-
-            # Use infinite condition - FollowPathUntil will complete automatically
-            follower_path_action = FollowPathUntil(
-                leader_path.copy(),
-                velocity,
-                infinite,
-            )
+        # One shared path action drives the leader and every follower; sprite i
+        # waits spacing_frames * i frames before starting (sprites without a home
+        # slot are skipped but keep their place in the spacing).
+        riders = []
+        delays = []
+        for index, sprite in enumerate(self.sprites):
+            if self.get_home_slot(sprite):
+                riders.append(sprite)
+                delays.append(index * spacing_frames)
+        if not riders:
+            return
 
-            # Use lambda to capture sprite position when tween starts (after path completes)
-            follower_return_x = TweenUntil(
-                lambda sprite: sprite.center_x,
-                follower_home[0],
+        def return_home(sprite) -> None:
+            home = self.get_home_slot(sprite)
+            if home is None:
+                return
+            # Use lambdas to capture sprite position when tween starts (after path completes)
+            return_x = TweenUntil(
+                lambda s: s.center_x,
+                home[0],
                 "center_x",
                 after_frames(seconds_to_frames(0.5)),
             )
-            follower_return_y = TweenUntil(
-                lambda sprite: sprite.center_y,
-                follower_home[1],
+            return_y = TweenUntil(
+                lambda s: s.center_y,
+                home[1],
                 "center_y",
                 after_frames(seconds_to_frames(0.5)),
             )
-
-            # Create sequence: delay -> path -> return
-            from arcadeactions.conditional import DelayFrames
-
-            follower_sequence = sequence(
-                DelayFrames(delay_frames),
-                follower_path_action,
-                parallel(follower_return_x, follower_return_y),
-            )
-            follower_sequence.apply(follower, tag=tag or f"entry_follower_{i}")
+            parallel(return_x, return_y).apply(sprite, tag=tag or "entry_return")
+
+        # Use infinite condition - the path action completes once every sprite has
+        # reached the end of the path
+        path_action = FollowPathGroupUntil(
+            leader_path.copy(),
+            velocity,
+            infinite,
+            delays=delays,
+            on_sprite_complete=return_home,
+        )
+        path_action.apply(riders, tag=tag or "entry_path")
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from ._transform_staging import get_position, set_position
 from .base import Action as _Action
 
 
@@ -38,8 +39,7 @@ class MoveTo(_Action):
         tx, ty = self.target_position
 
         def _set_pos(sprite):
-            sprite.center_x = tx
-            sprite.center_y = ty
+            set_position(sprite, tx, ty)
 
         self.for_each_sprite(_set_pos)
 
@@ -96,8 +96,8 @@ class MoveBy(_Action):
         dx, dy = self.offset
 
         def _add_pos(sprite):
-            sprite.center_x += dx
-            sprite.center_y += dy
+            x, y = get_position(sprite)
+            set_position(sprite, x + dx, y + dy)
 
         self.for_each_sprite(_add_pos)
 
@@ -3,14 +3,19 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from arcadeactions._movement_batch import get_batch_engine
 from arcadeactions._movement_bounds import _MoveUntilBoundsMixin
 from arcadeactions._movement_runtime import _MoveUntilRuntimeMixin
-from arcadeactions._shared_logging import _debug_log
+from arcadeactions._shared_logging import _debug_gate, _debug_log
+from arcadeactions._sprite_state import SpriteStateMap
 from arcadeactions.base import Action as _Action
-from arcadeactions.frame_conditions import _clone_condition
+from arcadeactions.frame_conditions import _clone_condition, infinite
 
 from . import physics_adapter as _pa
 
+# Idle frames reported by an action that never stops on its own; the LOD interval caps it
+_UNBOUNDED_IDLE_FRAMES = 1 << 30
+
 
 class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
     """Move sprites using Arcade's velocity system until a condition is satisfied.
@@ -30,9 +35,15 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         velocity_provider: Optional function returning (dx, dy) to dynamically provide velocity each frame
         on_boundary_enter: Optional callback(sprite, axis, side) called when sprite enters a boundary
         on_boundary_exit: Optional callback(sprite, axis, side) called when sprite exits a boundary
+        batched: When True, per-frame velocity assignment and boundary checks run as vectorized
+            NumPy passes over all target sprites; only sprites that can touch a bound go through
+            the per-sprite boundary logic, so callbacks fire exactly as in the default mode.
+            Requires NumPy (``pip install arcadeactions[batch]``) and ``arcade.Sprite`` targets.
+            Ignored while a velocity_provider is set.
     """
 
     _conflicts_with = ("position", "velocity")
+    _supports_reuse = True
 
     def __init__(
         self,
@@ -44,6 +55,7 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         velocity_provider: Callable[[], tuple[float, float]] | None = None,
         on_boundary_enter: Callable[[Any, str, str], None] | None = None,
         on_boundary_exit: Callable[[Any, str, str], None] | None = None,
+        batched: bool = False,
     ):
         try:
             velocity_x, velocity_y = velocity
@@ -53,6 +65,8 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         super().__init__(condition, on_stop)
         self.target_velocity = (velocity_x, velocity_y)  # Immutable target velocity
         self.current_velocity = (velocity_x, velocity_y)  # Current velocity (can be scaled by factor)
+        # Unscaled velocity held while the clock domain is paused or at scale 0
+        self._clock_stash = (velocity_x, velocity_y)
         # Boundary checking
         self.bounds = bounds  # (left, bottom, right, top)
         self.boundary_behavior = boundary_behavior
@@ -61,24 +75,34 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         self.velocity_provider = velocity_provider
         self.on_boundary_enter = on_boundary_enter
         self.on_boundary_exit = on_boundary_exit
+        # Callbacks detached by remove_effect(), restored by reset() for reuse
+        self._detached_boundary_callbacks: tuple[Any, Any] | None = None
+        # target_velocity when the current run started; bounce/limit rewrite target_velocity while running
+        self._run_target_velocity: tuple[float, float] | None = None
 
         # Track boundary state for enter/exit detection
-        self._boundary_state = {}  # {sprite_id: {"x": side_or_None, "y": side_or_None}}
+        self._boundary_state = SpriteStateMap()  # {sprite_id: {"x": side_or_None, "y": side_or_None}}
         self._frame_callback_tracker: set[tuple[int, str, str]] = set()
         self._paused_velocity: tuple[float, float] | None = None
 
         # Track if we just completed a step and need to preserve velocities for one frame
         self._step_velocity_pending = False
 
+        # Optional vectorized engine; sprite ids that still carry boundary state are always rechecked
+        self.batched = batched
+        self._batch_engine = get_batch_engine() if batched else None
+        self._batch_stateful = SpriteStateMap()  # {sprite_id: True}
+
         # Duration tracking for simulation time compatibility
         self._elapsed = 0.0
         self._duration = None
 
-        _debug_log(
-            f"__init__: id={id(self)}, velocity={velocity}, bounds={bounds}, boundary_behavior={boundary_behavior}, "
-            f"velocity_provider={bool(self.velocity_provider)}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"__init__: id={id(self)}, velocity={velocity}, bounds={bounds}, "
+                f"boundary_behavior={boundary_behavior}, velocity_provider={bool(self.velocity_provider)}",
+                action="MoveUntil",
+            )
 
     def set_factor(self, factor: float) -> None:
         """Scale the velocity by the given factor.
@@ -86,15 +110,16 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         Args:
             factor: Scaling factor for velocity (0.0 = stopped, 1.0 = full speed)
         """
-        self.current_velocity = (self.target_velocity[0] * factor, self.target_velocity[1] * factor)
+        self._set_unscaled_velocity((self.target_velocity[0] * factor, self.target_velocity[1] * factor))
         # Immediately apply the new velocity if action is active
         if not self.done and self.target is not None:
             self.apply_effect()
-        _debug_log(
-            f"set_factor: id={id(self)}, factor={factor}, target_velocity={self.target_velocity}, "
-            f"current_velocity={self.current_velocity}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"set_factor: id={id(self)}, factor={factor}, target_velocity={self.target_velocity}, "
+                f"current_velocity={self.current_velocity}",
+                action="MoveUntil",
+            )
 
     def set_bounds(self, bounds: tuple[float, float, float, float]) -> None:
         """Update the boundary bounds for this action.
@@ -107,10 +132,11 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         except Exception as exc:
             raise ValueError("bounds must be a tuple or list of length 4") from exc
         self.bounds = (left, bottom, right, top)
-        _debug_log(
-            f"set_bounds: id={id(self)}, bounds={bounds}",
-            action="MoveUntil",
-        )
+        if _debug_gate.verbose:
+            _debug_log(
+                f"set_bounds: id={id(self)}, bounds={bounds}",
+                action="MoveUntil",
+            )
 
     def reverse_movement(self, axis: str) -> None:
         """Reverse movement on the specified axis.
@@ -129,18 +155,41 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         self.apply_effect()
         self._update_motion_snapshot(velocity=self.current_velocity)
 
+    def start(self) -> None:
+        self._run_target_velocity = self.target_velocity
+        super().start()
+
     def reset(self) -> None:
-        """Reset velocity to original target velocity."""
-        self.current_velocity = self.target_velocity
-        self.apply_effect()
-        _debug_log(
-            f"reset: id={id(self)}, target_velocity={self.target_velocity}",
-            action="MoveUntil",
-        )
+        """Reset velocity to original target velocity and clear boundary tracking.
+
+        A running action re-applies the restored velocity immediately.
+        """
+        running = self._is_active and not self.done
+        super().reset()
+        if self._run_target_velocity is not None:
+            self.target_velocity = self._run_target_velocity
+        self._set_unscaled_velocity(self.target_velocity)
+        if self._detached_boundary_callbacks is not None:
+            self.on_boundary_enter, self.on_boundary_exit = self._detached_boundary_callbacks
+            self._detached_boundary_callbacks = None
+        self._boundary_state.clear()
+        self._frame_callback_tracker.clear()
+        self._batch_stateful.clear()
+        self._paused_velocity = None
+        self._step_velocity_pending = False
+        self._duration = None
+        if running:
+            self.apply_effect()
+        if _debug_gate.verbose:
+            _debug_log(
+                f"reset: id={id(self)}, target_velocity={self.target_velocity}",
+                action="MoveUntil",
+            )
 
     def clone(self) -> MoveUntil:
         """Create a copy of this MoveUntil action."""
-        _debug_log(f"clone: id={id(self)}", action="MoveUntil")
+        if _debug_gate.verbose:
+            _debug_log(f"clone: id={id(self)}", action="MoveUntil")
         return MoveUntil(
             self.target_velocity,  # Use target_velocity for cloning
             _clone_condition(self.condition),
@@ -150,6 +199,7 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
             self.velocity_provider,
             self.on_boundary_enter,
             self.on_boundary_exit,
+            batched=self.batched,
         )
 
     def pause(self) -> None:
@@ -199,6 +249,97 @@ class MoveUntil(_MoveUntilRuntimeMixin, _MoveUntilBoundsMixin, _Action):
         # Call parent update which handles update_effect() and condition checking
         super().update(delta_time)
 
+    @classmethod
+    def batch_update(cls, actions: list[MoveUntil], delta_time: float) -> None:
+        """Update every registered instance of this type in one call.
+
+        Running ``batched=True`` actions without a velocity provider or duration share a
+        single :class:`MoveUntilBatchEngine` step per bounds configuration, followed by
+        their condition checks; every other instance takes its own ``update()``.
+        """
+        groups: dict[tuple[Any, str | None], list[MoveUntil]] | None = None
+        for action in actions:
+            if (
+                action._batch_engine is None
+                or action.velocity_provider
+                or action._duration is not None
+                or not action._is_active
+                or action.done
+                or action._paused
+                or _debug_gate.verbose
+            ):
+                action.update(delta_time)
+                continue
+            if groups is None:
+                groups = {}
+            bounds = tuple(action.bounds) if action.bounds else None
+            groups.setdefault((bounds, action.boundary_behavior), []).append(action)
+
+        if groups is None:
+            return
+        for group in groups.values():
+            group[0]._batch_engine.step(group)
+            for action in group:
+                action._update_motion_snapshot(velocity=action.current_velocity)
+                action._evaluate_condition()
+
+    def _batchable(self) -> bool:
+        # Unbatched instances would only be update()d one by one inside batch_update, out
+        # of apply order with the actions around them
+        return self._batch_engine is not None
+
+    def _offscreen_idle_frames(self) -> int:
+        # Without bounds or a provider, update() only reasserts a constant velocity that
+        # Arcade integrates anyway, so skipped frames just need counting by the condition
+        if (
+            self.bounds is not None
+            or self.boundary_behavior is not None
+            or self.velocity_provider is not None
+            or self._duration is not None
+            or self._step_velocity_pending
+            or not self._is_active
+            or self.done
+            or self._paused
+            or self._instrumentation_active()
+        ):
+            return 0
+        condition = self.condition
+        if not condition or condition is infinite:
+            return _UNBOUNDED_IDLE_FRAMES
+        remaining = getattr(condition, "_remaining", None)
+        if remaining is None:
+            return 0
+        return max(0, remaining() - 1)
+
+    def _set_unscaled_velocity(self, velocity: tuple[float, float]) -> None:
+        """Set current_velocity to *velocity* times the clock domain's scale."""
+        scale = self._clock_scale
+        if not scale:
+            self._clock_stash = velocity
+        self.current_velocity = (velocity[0] * scale, velocity[1] * scale)
+
+    def _on_clock_scale(self, scale: float) -> None:
+        previous = self._clock_scale
+        if scale == previous:
+            return
+        paused = self._paused and self._paused_velocity is not None
+        velocity = self._paused_velocity if paused else self.current_velocity
+        unscaled = (velocity[0] / previous, velocity[1] / previous) if previous else self._clock_stash
+        super()._on_clock_scale(scale)
+        if paused:
+            self._paused_velocity = (unscaled[0] * scale, unscaled[1] * scale)
+            if not scale:
+                self._clock_stash = unscaled
+            return
+        self._set_unscaled_velocity(unscaled)
+        # The same per-sprite write update_effect() makes each frame, without apply_effect()
+        if self._is_active and not self.done:
+            self.for_each_sprite(self._write_clock_velocity)
+
+    def _write_clock_velocity(self, sprite) -> None:
+        """Write the rescaled velocity to *sprite* after a clock domain changed speed."""
+        self._apply_current_velocity(sprite)
+
     def resume(self) -> None:
         if not self._paused:
             return
@@ -233,13 +374,32 @@ class RotateUntil(_Action):
         super().__init__(condition, on_stop)
         self.target_angular_velocity = angular_velocity  # Immutable target velocity
         self.current_angular_velocity = angular_velocity  # Current velocity (can be scaled)
+        # Unscaled velocity held while the clock domain is paused or at scale 0
+        self._clock_stash = angular_velocity
 
     def set_factor(self, factor: float) -> None:
         """Scale the angular velocity by the given factor."""
-        self.current_angular_velocity = self.target_angular_velocity * factor
+        self._set_unscaled_angular_velocity(self.target_angular_velocity * factor)
         if not self.done and self.target is not None:
             self.apply_effect()
 
+    def _set_unscaled_angular_velocity(self, velocity: float) -> None:
+        """Set current_angular_velocity to *velocity* times the clock domain's scale."""
+        scale = self._clock_scale
+        if not scale:
+            self._clock_stash = velocity
+        self.current_angular_velocity = velocity * scale
+
+    def _on_clock_scale(self, scale: float) -> None:
+        previous = self._clock_scale
+        if scale == previous:
+            return
+        unscaled = self.current_angular_velocity / previous if previous else self._clock_stash
+        super()._on_clock_scale(scale)
+        self._set_unscaled_angular_velocity(unscaled)
+        if self._is_active and not self.done and not self._paused:
+            self.apply_effect()
+
     def apply_effect(self) -> None:
         """Apply angular velocity to all sprites."""
 
@@ -260,7 +420,7 @@ class RotateUntil(_Action):
         return RotateUntil(self.target_angular_velocity, _clone_condition(self.condition), self.on_stop)
 
     def reset(self) -> None:
-        self.current_angular_velocity = self.target_angular_velocity
+        self._set_unscaled_angular_velocity(self.target_angular_velocity)
 
     def set_duration(self, duration: float) -> None:
         raise NotImplementedError
@@ -3,15 +3,17 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
-from arcadeactions._shared_logging import _agent_debug_log
+from arcadeactions._clock_domains import TICK_EPSILON
+from arcadeactions._sprite_state import SpriteStateMap
+from arcadeactions._transform_staging import get_position, set_angle, set_position
 from arcadeactions.base import Action as _Action
 from arcadeactions.frame_conditions import _clone_condition
+from arcadeactions.trace import _tracer
 
 
 def _apply_offset(sprite, dx: float, dy: float, origins: dict[int, tuple[float, float]]):
     ox, oy = origins[id(sprite)]
-    sprite.center_x = ox + dx
-    sprite.center_y = oy + dy
+    set_position(sprite, ox + dx, oy + dy)
 
 
 class ParametricMotionUntil(_Action):
@@ -25,6 +27,8 @@ class ParametricMotionUntil(_Action):
     If you have a duration in seconds, convert it first using ``seconds_to_frames()``.
     """
 
+    _supports_reuse = True
+
     def __init__(
         self,
         offset_fn: Callable[[float], tuple[float, float]],
@@ -39,12 +43,13 @@ class ParametricMotionUntil(_Action):
     ):
         super().__init__(condition=condition, on_stop=on_stop)
         self._offset_fn = offset_fn
-        self._origins: dict[int, tuple[float, float]] = {}
+        self._origins = SpriteStateMap()  # sprite_id -> (x, y) at apply time
         self._elapsed_frames = 0.0
         self._frame_duration: float | None = None  # extracted from after_frames() condition
         self.rotate_with_path = rotate_with_path
         self.rotation_offset = rotation_offset
         self._prev_offset = None  # Track previous offset for rotation calculation
+        self._traced_first_update = False
 
         # Debug helpers
         self._debug = debug
@@ -55,20 +60,12 @@ class ParametricMotionUntil(_Action):
         """Memorise origins and determine duration."""
 
         def capture_origin(sprite):
-            self._origins[id(sprite)] = (sprite.center_x, sprite.center_y)
+            self._origins.set_for(sprite, get_position(sprite))
 
         self.for_each_sprite(capture_origin)
 
-        if not getattr(self, "_agent_logged_apply", False):
-            # region agent log
-            _agent_debug_log(
-                hypothesis_id="H3",
-                location="conditional.ParametricMotionUntil.apply_effect",
-                message="param_motion_apply",
-                data={"action_id": id(self), "sprite_count": len(self._origins)},
-            )
-            # endregion agent log
-            self._agent_logged_apply = True
+        if _tracer.enabled:
+            _tracer.record("param_motion_apply", action_id=id(self), sprite_count=len(self._origins))
 
         # Reset timing state
         self._elapsed_frames = 0.0
@@ -92,9 +89,12 @@ class ParametricMotionUntil(_Action):
     def update_effect(self, delta_time: float) -> None:  # noqa: D401
         from math import atan2, degrees, hypot
 
-        # Frame-based timing: advance by one frame per update, scaled by factor
-        self._elapsed_frames += self._factor
+        # Frame-based timing: advance by one frame per update, scaled by factor and clock domain
+        self._elapsed_frames += self._factor * self._clock_scale
         total = self._frame_duration or 0.0
+        # Fractional clock-domain steps can land a hair short of the last frame
+        if 0 < total - self._elapsed_frames < TICK_EPSILON:
+            self._elapsed_frames = total
         progress = min(1.0, self._elapsed_frames / total) if total > 0 else 1.0
 
         # Clamp progress to 1.0 for offset calculation to ensure exact endpoint positioning
@@ -129,36 +129,29 @@ class ParametricMotionUntil(_Action):
         def apply_transform(sprite):
             _apply_offset(sprite, dx, dy, self._origins)
             if sprite_angle is not None:
-                sprite.angle = sprite_angle
+                set_angle(sprite, sprite_angle)
 
         self.for_each_sprite(apply_transform)
 
         # Store current offset for next frame's rotation calculation
         self._prev_offset = current_offset
 
-        if not getattr(self, "_agent_logged_update", False):
+        if _tracer.enabled and not self._traced_first_update:
+            self._traced_first_update = True
             sample_pos = None
             try:
-                iterator = iter(self.target)
-                sample_sprite = next(iterator)
+                sample_sprite = next(iter(self.target))
                 sample_pos = (sample_sprite.center_x, sample_sprite.center_y)
             except Exception:
                 sample_pos = None
-            # region agent log
-            _agent_debug_log(
-                hypothesis_id="H4",
-                location="conditional.ParametricMotionUntil.update_effect",
-                message="param_motion_update",
-                data={
-                    "action_id": id(self),
-                    "progress": clamped_progress,
-                    "dx": dx,
-                    "dy": dy,
-                    "sample_pos": sample_pos,
-                },
+            _tracer.record(
+                "param_motion_update",
+                action_id=id(self),
+                progress=clamped_progress,
+                dx=dx,
+                dy=dy,
+                sample_pos=sample_pos,
             )
-            # endregion agent log
-            self._agent_logged_update = True
 
         if progress >= 1.0:
             if not hasattr(self.condition, "_frame_count"):
@@ -178,12 +171,8 @@ class ParametricMotionUntil(_Action):
         multiple actions overlap, this causes visible position jumps.
         """
         # Disabled to prevent jumps - let patterns complete naturally
-        _agent_debug_log(
-            hypothesis_id="H7",
-            location="conditional.ParametricMotionUntil.remove_effect",
-            message="param_motion_removed",
-            data={"action_id": id(self)},
-        )
+        if _tracer.enabled:
+            _tracer.record("param_motion_removed", action_id=id(self))
 
     def clone(self) -> ParametricMotionUntil:  # type: ignore[name-defined]
         return ParametricMotionUntil(
@@ -201,8 +190,8 @@ class ParametricMotionUntil(_Action):
         self._elapsed_frames = 0.0
         self._origins.clear()
         self._prev_offset = None
-        self._condition_met = False
-        self.done = False
+        self._traced_first_update = False
+        super().reset()
         # Keep duration configuration (seconds or frames) so a reused action
         # instance behaves consistently after reset.
 
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from typing import Any
 
+from arcadeactions._bezier import BezierCurve, get_bezier_curve
+from arcadeactions._clock_domains import TICK_EPSILON
+from arcadeactions._spline import SplinePath
+from arcadeactions._transform_staging import set_angle, set_position
 from arcadeactions.base import Action as _Action
 from arcadeactions.frame_conditions import _clone_condition
 
 from . import physics_adapter as _pa
 
 
+def _path_curve(control_points: Sequence[tuple[float, float]] | SplinePath) -> BezierCurve | SplinePath:
+    """Return the curve object to evaluate for *control_points*."""
+    if isinstance(control_points, SplinePath):
+        return control_points
+    return get_bezier_curve(control_points)
+
+
 class FollowPathUntil(_Action):
     """Follow a Bezier curve path at constant velocity until a condition is satisfied.
 
     Unlike duration-based Bezier actions, this maintains constant speed along the curve
     and can be interrupted by any condition (collision, position, time, etc.).
+    Progress is measured in arc length, using a lookup table that is computed once per
+    distinct set of control points and shared by every action following that path.
 
     The action supports automatic sprite rotation to face the movement direction, with
     calibration offset for sprites that aren't naturally drawn pointing to the right.
@@ -23,7 +36,8 @@ class FollowPathUntil(_Action):
     interaction with other physics forces and collisions.
 
     Args:
-        control_points: List of (x, y) points defining the Bezier curve (minimum 2 points)
+        control_points: List of (x, y) points defining the Bezier curve (minimum 2 points),
+            or a :class:`SplinePath` for long waypoint lists
         velocity: Speed in pixels per second along the curve
         condition: Function that returns truthy value when path following should stop
         on_stop: Optional callback called when condition is satisfied
@@ -66,6 +80,10 @@ class FollowPathUntil(_Action):
             rotate_with_path=True
         )
 
+        # Long waypoint list as a Catmull-Rom spline: per-frame cost doesn't grow with the point count
+        patrol = SplinePath(patrol_waypoints, closed=True)
+        action = FollowPathUntil(patrol, velocity=120, condition=infinite, rotate_with_path=True)
+
         # Physics-based path following with steering
         action = FollowPathUntil(
             [(100, 100), (300, 200), (500, 100)], velocity=150, condition=infinite,
@@ -73,9 +91,11 @@ class FollowPathUntil(_Action):
         )
     """
 
+    _supports_reuse = True
+
     def __init__(
         self,
-        control_points: list[tuple[float, float]],
+        control_points: list[tuple[float, float]] | SplinePath,
         velocity: float,
         condition: Callable[[], Any],
         on_stop: Callable[[Any], None] | Callable[[], None] | None = None,
@@ -104,6 +124,11 @@ class FollowPathUntil(_Action):
         # Path traversal state
         self._curve_progress = 0.0  # Progress along curve: 0.0 (start) to 1.0 (end)
         self._curve_length = 0.0  # Total length of the curve in pixels
+        self._distance_travelled = 0.0  # Arc length covered so far in pixels
+        self._curve: BezierCurve | SplinePath | None = None
+        self._curve_source: list[tuple[float, float]] | SplinePath | None = (
+            None  # control_points the curve was built from
+        )
         self._last_position = None  # Previous position for calculating movement delta
         self._update_path_snapshot()
 
@@ -116,50 +141,31 @@ class FollowPathUntil(_Action):
         self.current_velocity = self.target_velocity * factor
         # No immediate apply needed - velocity is used in update_effect
 
+    def _get_curve(self) -> BezierCurve | SplinePath:
+        """Return the shared precomputed curve for the current control points."""
+        if self._curve is None or self._curve_source is not self.control_points:
+            self._curve = _path_curve(self.control_points)
+            self._curve_source = self.control_points
+        return self._curve
+
     def _bezier_point(self, t: float) -> tuple[float, float]:
         """Calculate point on Bezier curve at parameter t (0-1)."""
-        from math import comb
-
-        n = len(self.control_points) - 1
-        x = y = 0
-        for i, point in enumerate(self.control_points):
-            # Binomial coefficient * (1-t)^(n-i) * t^i
-            coef = comb(n, i) * (1 - t) ** (n - i) * t**i
-            x += point[0] * coef
-            y += point[1] * coef
-        return (x, y)
-
-    def _calculate_curve_length(self, samples: int = 100) -> float:
-        """Approximate curve length by sampling points."""
-        from math import sqrt
-
-        length = 0.0
-        prev_point = self._bezier_point(0.0)
-
-        for i in range(1, samples + 1):
-            t = i / samples
-            current_point = self._bezier_point(t)
-            dx = current_point[0] - prev_point[0]
-            dy = current_point[1] - prev_point[1]
-            length += sqrt(dx * dx + dy * dy)
-            prev_point = current_point
-
-        return length
+        return self._get_curve().point(t)
 
     def apply_effect(self) -> None:
         """Initialize path following and rotation state."""
-        # Calculate curve length for constant velocity movement
-        self._curve_length = self._calculate_curve_length()
+        curve = self._get_curve()
+        self._curve_length = curve.length
         self._curve_progress = 0.0
+        self._distance_travelled = 0.0
 
         # Set initial position on the curve
-        start_point = self._bezier_point(0.0)
+        start_point = curve.point(0.0)
         self._last_position = start_point
 
         # Snap target(s) to the exact start point to guarantee continuity across repeats
         def snap_to_start(sprite):
-            sprite.center_x = start_point[0]
-            sprite.center_y = start_point[1]
+            set_position(sprite, start_point[0], start_point[1])
 
         self.for_each_sprite(snap_to_start)
         self._update_path_snapshot()
@@ -172,13 +178,15 @@ class FollowPathUntil(_Action):
             self._update_path_snapshot()
             return
 
-        # Calculate how far to move along curve based on velocity
-        distance_per_frame = self.current_velocity * delta_time
-        progress_delta = distance_per_frame / self._curve_length
-        self._curve_progress = min(1.0, self._curve_progress + progress_delta)
+        # Advance by arc length so speed stays constant regardless of control point spacing
+        self._distance_travelled = min(
+            self._curve_length, self._distance_travelled + self.current_velocity * delta_time
+        )
+        self._curve_progress = self._distance_travelled / self._curve_length
 
         # Calculate new position on curve
-        current_point = self._bezier_point(self._curve_progress)
+        curve = self._get_curve()
+        current_point = curve.point_at_distance(self._distance_travelled)
 
         # Check if physics engine is available for steering mode
         engine = None
@@ -198,7 +206,12 @@ class FollowPathUntil(_Action):
 
             # Calculate movement angle for rotation (skip if no movement)
             if self.rotate_with_path and (dx != 0 or dy != 0):
-                movement_angle = degrees(atan2(dy, dx))
+                # Splines have an analytic tangent; Bezier paths use the chord just travelled
+                movement_angle = None
+                if isinstance(curve, SplinePath):
+                    movement_angle = curve.angle_at_distance(self._distance_travelled)
+                if movement_angle is None:
+                    movement_angle = degrees(atan2(dy, dx))
                 self._prev_movement_angle = movement_angle
             else:
                 # If no movement, reuse the last angle to avoid jitter
@@ -232,12 +245,11 @@ class FollowPathUntil(_Action):
             else:
                 # Kinematic mode (direct position updates)
                 def apply_movement(sprite):
-                    sprite.center_x = current_point[0]
-                    sprite.center_y = current_point[1]
+                    set_position(sprite, current_point[0], current_point[1])
 
                     # Apply rotation if enabled
                     if self.rotate_with_path and movement_angle is not None:
-                        sprite.angle = movement_angle + self.rotation_offset
+                        set_angle(sprite, movement_angle + self.rotation_offset)
 
                 self.for_each_sprite(apply_movement)
 
@@ -275,10 +287,261 @@ class FollowPathUntil(_Action):
         )
 
     def reset(self) -> None:
+        """Rewind traversal to the start of the path."""
+        super().reset()
         self._curve_progress = 0.0
+        self._distance_travelled = 0.0
         self._last_position = None
         self._prev_movement_angle = None
         self._update_path_snapshot()
 
     def set_duration(self, duration: float) -> None:
         raise NotImplementedError
+
+
+class _PathRider:
+    """Per-sprite traversal state for FollowPathGroupUntil."""
+
+    __slots__ = ("distance", "wait_frames", "last_point", "angle", "finished")
+
+    def __init__(self, distance: float, wait_frames: int):
+        self.distance = distance
+        self.wait_frames = wait_frames
+        self.last_point: tuple[float, float] | None = None
+        self.angle: float | None = None
+        self.finished = False
+
+
+class FollowPathGroupUntil(_Action):
+    """Move every sprite in a group along one shared Bezier path.
+
+    A single action drives the whole group, so a convoy of N sprites costs one curve
+    lookup and one pass per frame instead of N independent FollowPathUntil actions.
+    Sprites can be staggered in time (``spacing_frames`` / ``delays``) or along the
+    curve (``spacing``), and each one finishes independently when it reaches the end
+    of the path. The action itself completes once every sprite has finished, or
+    earlier if *condition* is met.
+
+    A sprite is left where it is until its turn comes; it then snaps to the start of
+    the path (like FollowPathUntil does on apply) and travels at constant speed.
+
+    Args:
+        control_points: List of (x, y) points defining the Bezier curve (minimum 2 points),
+            or a :class:`SplinePath` for long waypoint lists
+        velocity: Speed in pixels per second along the curve
+        condition: Function that returns truthy value when path following should stop
+        on_stop: Optional callback called when condition is satisfied
+        spacing_frames: Frames between successive sprites starting the path
+            (sprite *i* waits ``i * spacing_frames`` frames).
+        spacing: Arc-length gap in pixels between successive sprites
+            (sprite *i* starts ``i * spacing`` pixels behind the start).
+        delays: Optional explicit start delay in frames for each sprite, in target order.
+            Overrides ``spacing_frames``.
+        rotate_with_path: When True, rotates each sprite to face its movement direction.
+        rotation_offset: Rotation offset in degrees for sprite artwork orientation.
+        on_sprite_complete: Optional callback called with each sprite as it reaches the end.
+        batched: When True, positions for all moving sprites are evaluated as NumPy
+            arrays each frame. Requires NumPy (``pip install arcadeactions[batch]``).
+
+    Examples:
+        from arcadeactions.presets.entry_paths import loop_the_loop
+
+        # Leader/follower entry: each enemy starts 8 frames after the previous one
+        action = FollowPathGroupUntil(
+            loop_the_loop(), velocity=180, condition=infinite, spacing_frames=8, rotate_with_path=True
+        )
+        action.apply(enemies)
+    """
+
+    _supports_reuse = True
+
+    def __init__(
+        self,
+        control_points: list[tuple[float, float]] | SplinePath,
+        velocity: float,
+        condition: Callable[[], Any],
+        on_stop: Callable[[Any], None] | Callable[[], None] | None = None,
+        *,
+        spacing_frames: int = 0,
+        spacing: float = 0.0,
+        delays: Sequence[int] | None = None,
+        rotate_with_path: bool = False,
+        rotation_offset: float = 0.0,
+        on_sprite_complete: Callable[[Any], None] | None = None,
+        batched: bool = False,
+    ):
+        super().__init__(condition, on_stop)
+        if len(control_points) < 2:
+            raise ValueError("Must specify at least 2 control points")
+        if spacing_frames < 0 or spacing < 0:
+            raise ValueError("spacing_frames and spacing must be non-negative")
+
+        self.control_points = control_points
+        self.target_velocity = velocity
+        self.current_velocity = velocity
+        self.spacing_frames = spacing_frames
+        self.spacing = spacing
+        self.delays = list(delays) if delays is not None else None
+        self.rotate_with_path = rotate_with_path
+        self.rotation_offset = rotation_offset
+        self.on_sprite_complete = on_sprite_complete
+        self.batched = batched
+        self._np = _load_numpy() if batched else None
+
+        self._curve: BezierCurve | SplinePath | None = None
+        self._riders: dict[Any, _PathRider] = {}
+        self._update_path_snapshot()
+
+    def set_factor(self, factor: float) -> None:
+        """Scale the path velocity by the given factor.
+
+        Args:
+            factor: Scaling factor for path velocity (0.0 = stopped, 1.0 = full speed)
+        """
+        self.current_velocity = self.target_velocity * factor
+
+    def apply_effect(self) -> None:
+        """Create per-sprite traversal state and place sprites that start immediately."""
+        self._curve = _path_curve(self.control_points)
+        self._riders = {}
+
+        def add_rider(sprite):
+            index = len(self._riders)
+            if self.delays is not None:
+                wait_frames = self.delays[index] if index < len(self.delays) else 0
+            else:
+                wait_frames = index * self.spacing_frames
+            self._riders[sprite] = _PathRider(-index * self.spacing, wait_frames)
+
+        self.for_each_sprite(add_rider)
+
+        start_point = self._curve.point(0.0)
+        for sprite, rider in self._riders.items():
+            if rider.wait_frames == 0 and rider.distance >= 0.0:
+                set_position(sprite, start_point[0], start_point[1])
+                rider.last_point = start_point
+        self._update_path_snapshot()
+
+    def update_effect(self, delta_time: float) -> None:
+        """Advance every started sprite along the path and finish the ones that arrive."""
+        curve = self._curve
+        if curve is None:
+            return
+
+        advance = self.current_velocity * delta_time
+        length = curve.length
+        moving: list[tuple[Any, _PathRider]] = []
+        unfinished = 0
+
+        def advance_rider(sprite):
+            nonlocal unfinished
+            rider = self._riders.get(sprite)
+            if rider is None or rider.finished:
+                return
+            unfinished += 1
+            if rider.wait_frames > TICK_EPSILON:
+                rider.wait_frames -= self._clock_scale
+                return
+            rider.distance = min(length, rider.distance + advance)
+            if rider.distance >= 0.0:
+                moving.append((sprite, rider))
+
+        self.for_each_sprite(advance_rider)
+
+        if moving:
+            if self._np is not None:
+                np = self._np
+                xs, ys = curve.points_at_distances(np, np.fromiter((rider.distance for _, rider in moving), float))
+                points = zip(xs.tolist(), ys.tolist(), strict=True)
+            else:
+                points = (curve.point_at_distance(rider.distance) for _, rider in moving)
+            unfinished -= self._place_riders(moving, points, length)
+
+        self._update_path_snapshot()
+
+        if unfinished == 0 and not self.done:
+            self._condition_met = True
+            self.done = True
+            self.remove_effect()
+            if self.on_stop:
+                self._safe_call(self.on_stop, None)
+
+    def _place_riders(self, moving: list[tuple[Any, _PathRider]], points: Any, length: float) -> int:
+        """Write positions (and rotations) for moving sprites; return how many finished."""
+        from math import atan2, degrees
+
+        rotate = self.rotate_with_path
+        spline = self._curve if isinstance(self._curve, SplinePath) else None
+        arrived = 0
+        for (sprite, rider), point in zip(moving, points, strict=True):
+            last_point = rider.last_point
+            if last_point is None:
+                # First frame of this sprite's run: it starts from the beginning of the path
+                last_point = self._curve.point(0.0)
+            if rotate:
+                dx = point[0] - last_point[0]
+                dy = point[1] - last_point[1]
+                if dx != 0 or dy != 0:
+                    angle = spline.angle_at_distance(rider.distance) if spline is not None else None
+                    rider.angle = angle if angle is not None else degrees(atan2(dy, dx))
+                if rider.angle is not None:
+                    set_angle(sprite, rider.angle + self.rotation_offset)
+            set_position(sprite, point[0], point[1])
+            rider.last_point = point
+
+            if rider.distance >= length:
+                rider.finished = True
+                arrived += 1
+                if self.on_sprite_complete:
+                    self._safe_call(self.on_sprite_complete, sprite)
+        return arrived
+
+    def _update_path_snapshot(self) -> None:
+        riders = self._riders
+        progress = 0.0
+        if riders and self._curve is not None and self._curve.length > 0:
+            progress = min(max(0.0, rider.distance) for rider in riders.values()) / self._curve.length
+        self._update_snapshot(
+            control_points=self.control_points,
+            velocity=self.current_velocity,
+            progress=progress,
+            metadata={"path_points": self.control_points, "sprite_count": len(riders)},
+        )
+
+    def clone(self) -> FollowPathGroupUntil:
+        return FollowPathGroupUntil(
+            self.control_points,
+            self.target_velocity,
+            _clone_condition(self.condition),
+            self.on_stop,
+            spacing_frames=self.spacing_frames,
+            spacing=self.spacing,
+            delays=self.delays,
+            rotate_with_path=self.rotate_with_path,
+            rotation_offset=self.rotation_offset,
+            on_sprite_complete=self.on_sprite_complete,
+            batched=self.batched,
+        )
+
+    def reset(self) -> None:
+        """Rewind every sprite to the start of its run."""
+        running = self._is_active and not self.done
+        super().reset()
+        self._riders = {}
+        if running:
+            self.apply_effect()
+        else:
+            self._update_path_snapshot()
+
+    def set_duration(self, duration: float) -> None:
+        raise NotImplementedError
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - exercised only without numpy installed
+        raise ImportError(
+            "FollowPathGroupUntil(batched=True) requires NumPy. Install it with 'pip install arcadeactions[batch]'."
+        ) from exc
+    return numpy
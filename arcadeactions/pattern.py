@@ -14,6 +14,7 @@ from collections.abc import Callable
 import arcade
 
 from arcadeactions import DelayFrames, FollowPathUntil, MoveUntil, sequence
+from arcadeactions._sprite_state import SpriteStateMap
 from arcadeactions.conditional import ParametricMotionUntil
 from arcadeactions.frame_timing import after_frames
 
@@ -370,7 +371,7 @@ def create_orbit_pattern(center: tuple[float, float], radius: float, velocity: f
             self.angular_velocity = angular_velocity
             self.clockwise = clockwise
             # Per-sprite state: angle, start_angle, accumulated, prev_pos, prev_sprite_angle
-            self._states: dict[int, dict[str, float | tuple[float, float] | None]] = {}
+            self._states = SpriteStateMap()
 
         def apply_effect(self):
             # Initialize per-sprite state from current positions for seamless start
@@ -385,14 +386,16 @@ def create_orbit_pattern(center: tuple[float, float], radius: float, velocity: f
                 else:
                     start_angle = math.atan2(dy0, dx0)
 
-                sid = id(sprite)
-                self._states[sid] = {
-                    "angle": float(start_angle),
-                    "start_angle": float(start_angle),
-                    "accumulated": 0.0,
-                    "prev_pos": (sprite.center_x, sprite.center_y),
-                    "prev_sprite_angle": None,
-                }
+                self._states.set_for(
+                    sprite,
+                    {
+                        "angle": float(start_angle),
+                        "start_angle": float(start_angle),
+                        "accumulated": 0.0,
+                        "prev_pos": (sprite.center_x, sprite.center_y),
+                        "prev_sprite_angle": None,
+                    },
+                )
 
             self.for_each_sprite(init_state)
 
@@ -688,7 +691,11 @@ def _validate_entry_kwargs(kwargs: dict) -> dict:
         "window_bounds": kwargs["window_bounds"],
         "velocity": kwargs.get("velocity", 5.0),
         "stagger_delay_frames": kwargs.get("stagger_delay_frames", 30),  # Default 30 frames (~0.5s at 60fps)
+        "seed": kwargs.get("seed", 0),
+        "assignment": kwargs.get("assignment", "greedy"),
     }
+    if validated["assignment"] not in ("greedy", "optimal"):
+        raise ValueError(f"assignment must be 'greedy' or 'optimal', got {validated['assignment']!r}")
     return validated
 
 
@@ -745,6 +752,12 @@ def create_formation_entry_from_sprites(
             - velocity: Movement speed in pixels per frame
             - stagger_delay_frames: Delay between waves in frames
             - min_spacing: Minimum spacing between sprites during movement
+            - seed: Seed for the assignment search (default 0, so the same formation always
+              produces the same entry); pass None for a different result each call
+            - assignment: "greedy" (default) starts the conflict repair from a nearest-spawn
+              assignment; "optimal" starts it from the minimum-total-distance assignment,
+              which crosses far fewer paths on large formations. "optimal" requires NumPy
+              (``pip install arcadeactions[batch]``).
 
     Returns:
         List of (sprite, action, target_formation_index) tuples
@@ -772,6 +785,7 @@ def create_formation_entry_from_sprites(
     window_bounds = params["window_bounds"]
     velocity = params["velocity"]
     stagger_delay_frames = params["stagger_delay_frames"]
+    seed = params.get("seed", 0)
 
     # Create new sprites for the entry pattern (same number as target formation)
     sprites = _clone_formation_sprites(target_formation)
@@ -796,18 +810,33 @@ def create_formation_entry_from_sprites(
 
     sprite_distances.sort(key=distance_from_center)
 
+    # Optionally seed the conflict repair with the minimum-total-distance assignment
+    initial_assignments = None
+    if params.get("assignment", "greedy") == "optimal":
+        initial_assignments = _optimal_sprite_assignment(
+            target_formation, spawn_positions, min(len(target_formation), len(spawn_positions))
+        )
+
     # Use min-conflicts algorithm for optimal sprite-to-spawn assignment
-    # Fast path for small formations: use shorter time limit and fewer iterations
+    # Fast path for small formations: use fewer iterations
     num_sprites = len(target_formation)
     if num_sprites <= 4:
         # Small formations: greedy assignment is usually good enough, minimal optimization
         optimal_assignments = _min_conflicts_sprite_assignment(
-            target_formation, spawn_positions, max_iterations=50, time_limit=0.01
+            target_formation,
+            spawn_positions,
+            max_iterations=50,
+            seed=seed,
+            initial_assignments=initial_assignments,
         )
     else:
-        # Larger formations: full optimization
+        # Larger formations: longer search, bounded by the default conflict-check budget
         optimal_assignments = _min_conflicts_sprite_assignment(
-            target_formation, spawn_positions, max_iterations=1000, time_limit=0.1
+            target_formation,
+            spawn_positions,
+            max_iterations=1000,
+            seed=seed,
+            initial_assignments=initial_assignments,
         )
 
     # Convert the assignment(s) into wave format.
@@ -985,6 +1014,9 @@ def _find_nearest(spawn_positions, target_positions) -> list[tuple[float, int, i
     return sprite_distances
 
 
+_INTERSECTION_TOLERANCE = 1e-10
+
+
 def _do_line_segments_intersect(
     line1: tuple[float, float, float, float], line2: tuple[float, float, float, float]
 ) -> bool:
@@ -1002,7 +1034,7 @@ def _do_line_segments_intersect(
     x3, y3, x4, y4 = line2
 
     # First check if any endpoints are the same (touching at endpoints)
-    tolerance = 1e-10
+    tolerance = _INTERSECTION_TOLERANCE
     if (
         (abs(x1 - x3) < tolerance and abs(y1 - y3) < tolerance)
         or (abs(x1 - x4) < tolerance and abs(y1 - y4) < tolerance)
@@ -1026,25 +1058,45 @@ def _do_line_segments_intersect(
     return -tolerance <= t <= 1 + tolerance and -tolerance <= u <= 1 + tolerance
 
 
+# Paths closer than this fraction of the larger sprite dimension count as a collision
+_SAFE_DISTANCE_FACTOR = 0.8
+
+
 def _min_conflicts_sprite_assignment(
     target_formation: arcade.SpriteList,
     spawn_positions: list[tuple[float, float]],
     max_iterations: int = 1000,
-    time_limit: float = 0.1,
+    time_limit: float | None = None,
+    seed: int | None = 0,
+    initial_assignments: dict[int, int] | None = None,
+    max_checks: int | None = None,
 ) -> dict[int, int]:
     """Assign sprites to spawn positions using min-conflicts algorithm.
 
     This function implements a min-conflicts approach:
     1. Start with a nearest-neighbor assignment of sprites to spawn positions
     2. Detect all path conflicts between sprites
-    3. Iteratively swap conflicting sprite assignments to reduce conflicts
-    4. Continue until no conflicts remain or time/iteration limits reached
+    3. Repeatedly pick a conflicted sprite and swap its spawn with the partner that
+       removes the most conflicts (accepting a small setback to escape local minima)
+    4. Continue until no conflicts remain, the search stops improving, or the
+       iteration or work limit is reached, and return the best assignment seen
+
+    Conflicts are tracked per sprite and updated incrementally: evaluating a swap only
+    re-checks the two swapped paths against nearby paths, found through a uniform grid
+    over the cells each path passes through.
 
     Args:
         target_formation: SpriteList with sprites positioned at target formation locations
         spawn_positions: List of (x, y) spawn positions
-        max_iterations: Maximum number of iterations to perform
-        time_limit: Maximum time in seconds to spend on optimization
+        max_iterations: Maximum number of swap iterations to perform
+        time_limit: Optional wall-clock cap in seconds. Leave as None for results that
+            depend only on the inputs and *seed*.
+        max_checks: Cap on path-pair conflict checks, including the initial scan. The
+            cost of an iteration grows with how many paths cross, so this bounds the
+            work deterministically. None uses a default sized for a wave-start call.
+        seed: Seed for the random choices. None uses an unseeded generator.
+        initial_assignments: Assignment to start the repair from instead of the
+            nearest-neighbor one (e.g. from :func:`_optimal_sprite_assignment`). Not modified.
 
     Returns:
         Dictionary mapping sprite_idx to spawn_idx with minimal conflicts
@@ -1053,47 +1105,247 @@ def _min_conflicts_sprite_assignment(
         return {}
 
     num_sprites = min(len(target_formation), len(spawn_positions))
-    start_time = time.time()
+    deadline = time.perf_counter() + time_limit if time_limit is not None else None
+    rng = random.Random(seed)
 
-    assignments = _initial_sprite_assignment(target_formation, spawn_positions, num_sprites)
-    current_conflicts = _count_conflicts(assignments, target_formation, spawn_positions)
-    iteration = 0
-
-    while current_conflicts > 0 and iteration < max_iterations:
-        if time.time() - start_time > time_limit:
+    if initial_assignments is not None:
+        assignments = dict(initial_assignments)
+    else:
+        assignments = _initial_sprite_assignment(target_formation, spawn_positions, num_sprites)
+    state = _ConflictState(target_formation, spawn_positions, assignments)
+    best_total = state.total
+    best_assignments = dict(assignments)
+    stalled = 0
+    if max_checks is None:
+        max_checks = _DEFAULT_MAX_CHECKS
+
+    for _ in range(max_iterations):
+        if state.total == 0 or stalled >= _MAX_STALLED_ITERATIONS or state.checks >= max_checks:
             break
-
-        conflicting_pairs = _get_conflicting_pairs(assignments, target_formation, spawn_positions)
-        if not conflicting_pairs:
+        if deadline is not None and time.perf_counter() > deadline:
             break
+        state.step(rng)
+        if state.total < best_total:
+            best_total = state.total
+            best_assignments = dict(assignments)
+            stalled = 0
+        else:
+            stalled += 1
 
-        improved, assignments, current_conflicts = _try_improving_swaps(
-            assignments,
-            conflicting_pairs,
-            current_conflicts,
-            target_formation,
-            spawn_positions,
-            start_time,
-            time_limit,
+    return best_assignments
+
+
+# Swap partners tried per step: some of the chosen sprite's conflict partners plus a few random sprites
+_PARTNER_SWAP_CANDIDATES = 4
+_RANDOM_SWAP_CANDIDATES = 2
+# Stop once this many iterations pass without beating the best assignment so far
+_MAX_STALLED_ITERATIONS = 100
+# Default cap on path-pair conflict checks per search (each costs a few microseconds)
+_DEFAULT_MAX_CHECKS = 10_000
+# Broad phase cell size in pixels, a fraction of a typical screen-crossing entry path
+_GRID_CELL_SIZE = 128.0
+# Chance of accepting a swap that adds one conflict, to walk out of local minima
+_UPHILL_SWAP_PROBABILITY = 0.3
+
+
+class _ConflictState:
+    """Incrementally maintained path conflicts for a sprite → spawn assignment.
+
+    ``assignments`` is updated in place as swaps are applied.
+    """
+
+    def __init__(
+        self,
+        target_formation: arcade.SpriteList,
+        spawn_positions: list[tuple[float, float]],
+        assignments: dict[int, int],
+    ):
+        self.assignments = assignments
+        self.spawn_positions = spawn_positions
+        # Path-pair conflict checks made so far; bounds the search's work
+        self.checks = 0
+        self.sprite_ids = list(assignments)
+        self.targets: dict[int, tuple[float, float]] = {}
+        self.sizes: dict[int, float] = {}
+        for sprite_idx in self.sprite_ids:
+            sprite = target_formation[sprite_idx]
+            self.targets[sprite_idx] = (sprite.center_x, sprite.center_y)
+            self.sizes[sprite_idx] = max(getattr(sprite, "width", 64), getattr(sprite, "height", 64))
+
+        # Two paths can only conflict where they pass within the largest safe distance
+        self._max_safe_distance = max(self.sizes.values(), default=0.0) * _SAFE_DISTANCE_FACTOR
+        self._grid = _PathGrid(self._max_safe_distance / 2, _GRID_CELL_SIZE)
+        self._boxes: dict[int, tuple[float, float, float, float]] = {}
+        for sprite_idx, spawn_idx in assignments.items():
+            self._place_path(sprite_idx, spawn_idx)
+
+        self.conflicts: dict[int, set[int]] = {sprite_idx: set() for sprite_idx in self.sprite_ids}
+        for sprite_idx, spawn_idx in assignments.items():
+            for other_idx in self._grid.query(spawn_positions[spawn_idx], self.targets[sprite_idx]):
+                if other_idx > sprite_idx and self._paths_conflict(
+                    sprite_idx, spawn_idx, other_idx, assignments[other_idx]
+                ):
+                    self.conflicts[sprite_idx].add(other_idx)
+                    self.conflicts[other_idx].add(sprite_idx)
+        self.total = sum(len(partners) for partners in self.conflicts.values()) // 2
+
+    def _path_box(self, sprite_idx: int, spawn_idx: int) -> tuple[float, float, float, float]:
+        sx, sy = self.spawn_positions[spawn_idx]
+        tx, ty = self.targets[sprite_idx]
+        return (min(sx, tx), min(sy, ty), max(sx, tx), max(sy, ty))
+
+    def _place_path(self, sprite_idx: int, spawn_idx: int) -> None:
+        self._boxes[sprite_idx] = self._path_box(sprite_idx, spawn_idx)
+        self._grid.insert(sprite_idx, self.spawn_positions[spawn_idx], self.targets[sprite_idx])
+
+    def _paths_conflict(self, sprite1_idx: int, spawn1_idx: int, sprite2_idx: int, spawn2_idx: int) -> bool:
+        self.checks += 1
+        min_safe_distance = max(self.sizes[sprite1_idx], self.sizes[sprite2_idx]) * _SAFE_DISTANCE_FACTOR
+        # Spawn points or formation slots that are too close conflict whichever sprites
+        # use them, so no swap can fix them; only the movement in between is searched
+        return _paths_would_collide(
+            self.spawn_positions[spawn1_idx],
+            self.targets[sprite1_idx],
+            self.spawn_positions[spawn2_idx],
+            self.targets[sprite2_idx],
+            min_safe_distance,
+            check_endpoints=False,
         )
 
-        if not improved:
-            improved, assignments, current_conflicts = _try_random_swaps(
-                assignments,
-                conflicting_pairs,
-                current_conflicts,
-                target_formation,
-                spawn_positions,
-                start_time,
-                time_limit,
-            )
+    def _conflicts_for(self, sprite_idx: int, spawn_idx: int, exclude: tuple[int, int]) -> set[int]:
+        """Sprites whose current path conflicts with *sprite_idx* travelling from *spawn_idx*."""
+        assignments = self.assignments
+        boxes = self._boxes
+        reach = self._max_safe_distance
+        left, bottom, right, top = self._path_box(sprite_idx, spawn_idx)
+        found = set()
+        for other_idx in self._grid.query(self.spawn_positions[spawn_idx], self.targets[sprite_idx]):
+            if other_idx in exclude:
+                continue
+            # Grid cells are coarse; paths whose boxes are a safe distance apart cannot conflict
+            other_left, other_bottom, other_right, other_top = boxes[other_idx]
+            if (
+                other_left - right >= reach
+                or left - other_right >= reach
+                or other_bottom - top >= reach
+                or bottom - other_top >= reach
+            ):
+                continue
+            if self._paths_conflict(sprite_idx, spawn_idx, other_idx, assignments[other_idx]):
+                found.add(other_idx)
+        return found
+
+    def evaluate_swap(self, sprite1_idx: int, sprite2_idx: int) -> tuple[int, set[int], set[int], bool]:
+        """Return (conflict delta, new partners of sprite1, new partners of sprite2, pair conflict)."""
+        spawn1 = self.assignments[sprite1_idx]
+        spawn2 = self.assignments[sprite2_idx]
+        pair = (sprite1_idx, sprite2_idx)
+        new1 = self._conflicts_for(sprite1_idx, spawn2, pair)
+        new2 = self._conflicts_for(sprite2_idx, spawn1, pair)
+        pair_conflict = self._paths_conflict(sprite1_idx, spawn2, sprite2_idx, spawn1)
+
+        old_partners1 = self.conflicts[sprite1_idx]
+        old = len(old_partners1) + len(self.conflicts[sprite2_idx]) - (1 if sprite2_idx in old_partners1 else 0)
+        new = len(new1) + len(new2) + (1 if pair_conflict else 0)
+        return new - old, new1, new2, pair_conflict
+
+    def apply_swap(
+        self, sprite1_idx: int, sprite2_idx: int, delta: int, new1: set[int], new2: set[int], pair_conflict: bool
+    ) -> None:
+        conflicts = self.conflicts
+        for sprite_idx in (sprite1_idx, sprite2_idx):
+            for other_idx in conflicts[sprite_idx]:
+                conflicts[other_idx].discard(sprite_idx)
+        for other_idx in new1:
+            conflicts[other_idx].add(sprite1_idx)
+        for other_idx in new2:
+            conflicts[other_idx].add(sprite2_idx)
+        if pair_conflict:
+            new1.add(sprite2_idx)
+            new2.add(sprite1_idx)
+        conflicts[sprite1_idx] = new1
+        conflicts[sprite2_idx] = new2
+
+        assignments = self.assignments
+        assignments[sprite1_idx], assignments[sprite2_idx] = assignments[sprite2_idx], assignments[sprite1_idx]
+        for sprite_idx in (sprite1_idx, sprite2_idx):
+            self._grid.remove(sprite_idx)
+            self._place_path(sprite_idx, assignments[sprite_idx])
+        self.total += delta
+
+    def step(self, rng: random.Random) -> bool:
+        """Try to swap one conflicted sprite with its best partner; return whether a swap was made."""
+        conflicted = [sprite_idx for sprite_idx in self.sprite_ids if self.conflicts[sprite_idx]]
+        sprite_idx = rng.choice(conflicted)
+        candidates = sorted(self.conflicts[sprite_idx])
+        if len(candidates) > _PARTNER_SWAP_CANDIDATES:
+            candidates = rng.sample(candidates, _PARTNER_SWAP_CANDIDATES)
+        others = len(self.sprite_ids) - 1
+        for _ in range(min(_RANDOM_SWAP_CANDIDATES, others)):
+            other_idx = rng.choice(self.sprite_ids)
+            if other_idx != sprite_idx:
+                candidates.append(other_idx)
+
+        best = None
+        for other_idx in candidates:
+            result = self.evaluate_swap(sprite_idx, other_idx)
+            if best is None or result[0] < best[1][0]:
+                best = (other_idx, result)
+                if result[0] < 0:
+                    break
+
+        if best is None:
+            return False
+        other_idx, (delta, new1, new2, pair_conflict) = best
+        # Sideways (and occasionally slightly worse) moves keep the search from stalling in a local minimum
+        if delta > 1 or (delta == 1 and rng.random() >= _UPHILL_SWAP_PROBABILITY):
+            return False
+        self.apply_swap(sprite_idx, other_idx, delta, new1, new2, pair_conflict)
+        return True
 
-        if not improved:
-            break
 
-        iteration += 1
+class _PathGrid:
+    """Uniform grid broad phase over straight paths.
 
-    return assignments
+    Each path is registered in the cells covered by its bounding box grown by
+    *margin*, so two paths that pass within ``2 * margin`` of each other always
+    share a cell.
+    """
+
+    def __init__(self, margin: float, cell_size: float):
+        self._margin = margin
+        self._cell_size = max(cell_size, 1.0)
+        self._cells: dict[tuple[int, int], set[int]] = {}
+        self._item_cells: dict[int, list[tuple[int, int]]] = {}
+
+    def _cells_for(self, start: tuple[float, float], end: tuple[float, float]) -> list[tuple[int, int]]:
+        size = self._cell_size
+        margin = self._margin
+        x0 = math.floor((min(start[0], end[0]) - margin) / size)
+        x1 = math.floor((max(start[0], end[0]) + margin) / size)
+        y0 = math.floor((min(start[1], end[1]) - margin) / size)
+        y1 = math.floor((max(start[1], end[1]) + margin) / size)
+        return [(cx, cy) for cx in range(x0, x1 + 1) for cy in range(y0, y1 + 1)]
+
+    def insert(self, item: int, start: tuple[float, float], end: tuple[float, float]) -> None:
+        cells = self._cells_for(start, end)
+        self._item_cells[item] = cells
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item: int) -> None:
+        for cell in self._item_cells.pop(item, ()):
+            self._cells[cell].discard(item)
+
+    def query(self, start: tuple[float, float], end: tuple[float, float]) -> set[int]:
+        """Items sharing a cell with the path start → end (a superset of the nearby ones)."""
+        found: set[int] = set()
+        cells = self._cells
+        for cell in self._cells_for(start, end):
+            bucket = cells.get(cell)
+            if bucket:
+                found.update(bucket)
+        return found
 
 
 def _initial_sprite_assignment(
@@ -1133,94 +1385,6 @@ def _initial_sprite_assignment(
     return assignments
 
 
-def _count_conflicts(
-    assignments: dict[int, int],
-    target_formation: arcade.SpriteList,
-    spawn_positions: list[tuple[float, float]],
-) -> int:
-    conflicts = 0
-    sprite_indices = list(assignments.keys())
-
-    for i in range(len(sprite_indices)):
-        for j in range(i + 1, len(sprite_indices)):
-            sprite1_idx = sprite_indices[i]
-            sprite2_idx = sprite_indices[j]
-            if _sprites_would_collide_during_movement_with_assignments(
-                sprite1_idx, sprite2_idx, target_formation, spawn_positions, assignments
-            ):
-                conflicts += 1
-
-    return conflicts
-
-
-def _get_conflicting_pairs(
-    assignments: dict[int, int],
-    target_formation: arcade.SpriteList,
-    spawn_positions: list[tuple[float, float]],
-) -> list[tuple[int, int]]:
-    conflicts: list[tuple[int, int]] = []
-    sprite_indices = list(assignments.keys())
-
-    for i in range(len(sprite_indices)):
-        for j in range(i + 1, len(sprite_indices)):
-            sprite1_idx = sprite_indices[i]
-            sprite2_idx = sprite_indices[j]
-            if _sprites_would_collide_during_movement_with_assignments(
-                sprite1_idx, sprite2_idx, target_formation, spawn_positions, assignments
-            ):
-                conflicts.append((sprite1_idx, sprite2_idx))
-
-    return conflicts
-
-
-def _try_improving_swaps(
-    assignments: dict[int, int],
-    conflicting_pairs: list[tuple[int, int]],
-    current_conflicts: int,
-    target_formation: arcade.SpriteList,
-    spawn_positions: list[tuple[float, float]],
-    start_time: float,
-    time_limit: float,
-) -> tuple[bool, dict[int, int], int]:
-    for sprite1_idx, sprite2_idx in conflicting_pairs:
-        if time.time() - start_time > time_limit:
-            break
-        temp_assignments = _swap_assignments(assignments, sprite1_idx, sprite2_idx)
-        new_conflicts = _count_conflicts(temp_assignments, target_formation, spawn_positions)
-        if new_conflicts < current_conflicts:
-            return True, temp_assignments, new_conflicts
-    return False, assignments, current_conflicts
-
-
-def _try_random_swaps(
-    assignments: dict[int, int],
-    conflicting_pairs: list[tuple[int, int]],
-    current_conflicts: int,
-    target_formation: arcade.SpriteList,
-    spawn_positions: list[tuple[float, float]],
-    start_time: float,
-    time_limit: float,
-) -> tuple[bool, dict[int, int], int]:
-    for _ in range(min(10, len(conflicting_pairs))):
-        if time.time() - start_time > time_limit:
-            break
-        sprite1_idx, sprite2_idx = random.choice(conflicting_pairs)
-        temp_assignments = _swap_assignments(assignments, sprite1_idx, sprite2_idx)
-        new_conflicts = _count_conflicts(temp_assignments, target_formation, spawn_positions)
-        if new_conflicts <= current_conflicts + 1:
-            return True, temp_assignments, new_conflicts
-    return False, assignments, current_conflicts
-
-
-def _swap_assignments(assignments: dict[int, int], sprite1_idx: int, sprite2_idx: int) -> dict[int, int]:
-    spawn1 = assignments[sprite1_idx]
-    spawn2 = assignments[sprite2_idx]
-    temp_assignments = assignments.copy()
-    temp_assignments[sprite1_idx] = spawn2
-    temp_assignments[sprite2_idx] = spawn1
-    return temp_assignments
-
-
 def _sprites_would_collide_during_movement_with_assignments(
     sprite1_idx: int,
     sprite2_idx: int,
@@ -1261,38 +1425,133 @@ def _sprites_would_collide_during_movement_with_assignments(
     # Calculate minimum safe distance - use a more reasonable value
     # For movement collision detection, we only care about actual sprite overlap
     # The final formation positions are handled separately
-    min_safe_distance = max(sprite1_width, sprite1_height, sprite2_width, sprite2_height) * 0.8
+    min_safe_distance = max(sprite1_width, sprite1_height, sprite2_width, sprite2_height) * _SAFE_DISTANCE_FACTOR
 
-    # Check start positions
-    start_distance = math.hypot(spawn1[0] - spawn2[0], spawn1[1] - spawn2[1])
-    if start_distance < min_safe_distance:
-        return True
+    return _paths_would_collide(spawn1, target1, spawn2, target2, min_safe_distance)
 
-    # Check end positions
-    end_distance = math.hypot(target1[0] - target2[0], target1[1] - target2[1])
-    if end_distance < min_safe_distance:
-        return True
 
-    # Check if movement paths intersect
-    path1 = (spawn1[0], spawn1[1], target1[0], target1[1])
-    path2 = (spawn2[0], spawn2[1], target2[0], target2[1])
+def _paths_would_collide(
+    spawn1: tuple[float, float],
+    target1: tuple[float, float],
+    spawn2: tuple[float, float],
+    target2: tuple[float, float],
+    min_safe_distance: float,
+    check_endpoints: bool = True,
+) -> bool:
+    """Check if two straight spawn → target paths come closer than *min_safe_distance*.
 
-    if _do_line_segments_intersect(path1, path2):
-        return True
+    Both sprites travel for the same time, so their separation at time t is the linear
+    vector ``offset + t * drift``; start, end and intermediate checks all sample it.
+    With ``check_endpoints=False`` the start and end separations are not checked.
+    """
+    offset_x = spawn2[0] - spawn1[0]
+    offset_y = spawn2[1] - spawn1[1]
+    drift_x = (target2[0] - spawn2[0]) - (target1[0] - spawn1[0])
+    drift_y = (target2[1] - spawn2[1]) - (target1[1] - spawn1[1])
+    min_safe_squared = min_safe_distance * min_safe_distance
+
+    # Check start and end positions
+    if check_endpoints:
+        if offset_x * offset_x + offset_y * offset_y < min_safe_squared:
+            return True
+        end_x = offset_x + drift_x
+        end_y = offset_y + drift_y
+        if end_x * end_x + end_y * end_y < min_safe_squared:
+            return True
 
     # Check multiple points along the movement paths
-    for t in [0.25, 0.5, 0.75]:
-        # Calculate position at time t for sprite 1
-        pos1_x = spawn1[0] + t * (target1[0] - spawn1[0])
-        pos1_y = spawn1[1] + t * (target1[1] - spawn1[1])
-
-        # Calculate position at time t for sprite 2
-        pos2_x = spawn2[0] + t * (target2[0] - spawn2[0])
-        pos2_y = spawn2[1] + t * (target2[1] - spawn2[1])
-
-        # Check distance at this point
-        distance = math.hypot(pos2_x - pos1_x, pos2_y - pos1_y)
-        if distance < min_safe_distance:
+    for t in (0.25, 0.5, 0.75):
+        gap_x = offset_x + t * drift_x
+        gap_y = offset_y + t * drift_y
+        if gap_x * gap_x + gap_y * gap_y < min_safe_squared:
             return True
 
-    return False
+    # Check if movement paths intersect (segments with disjoint bounding boxes cannot)
+    if (
+        max(spawn1[0], target1[0]) < min(spawn2[0], target2[0]) - _INTERSECTION_TOLERANCE
+        or max(spawn2[0], target2[0]) < min(spawn1[0], target1[0]) - _INTERSECTION_TOLERANCE
+        or max(spawn1[1], target1[1]) < min(spawn2[1], target2[1]) - _INTERSECTION_TOLERANCE
+        or max(spawn2[1], target2[1]) < min(spawn1[1], target1[1]) - _INTERSECTION_TOLERANCE
+    ):
+        return False
+    path1 = (spawn1[0], spawn1[1], target1[0], target1[1])
+    path2 = (spawn2[0], spawn2[1], target2[0], target2[1])
+    return _do_line_segments_intersect(path1, path2)
+
+
+def _load_numpy():
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - exercised only without numpy installed
+        raise ImportError(
+            "assignment='optimal' requires NumPy. Install it with 'pip install arcadeactions[batch]'."
+        ) from exc
+    return numpy
+
+
+def _optimal_sprite_assignment(
+    target_formation: arcade.SpriteList,
+    spawn_positions: list[tuple[float, float]],
+    num_sprites: int,
+) -> dict[int, int]:
+    """Assign sprites to spawn positions with the minimum total travel distance.
+
+    Solves the rectangular assignment problem over a NumPy distance matrix with the
+    O(n³) Hungarian method (shortest augmenting paths with row/column potentials),
+    vectorizing the scan over spawn positions. Minimal-length matchings rarely cross,
+    so this is a much better starting point for the conflict repair than the greedy
+    nearest-spawn pass on large formations.
+
+    Returns:
+        Dictionary mapping sprite_idx to spawn_idx for the first *num_sprites* sprites
+    """
+    np = _load_numpy()
+    if num_sprites <= 0 or not spawn_positions:
+        return {}
+
+    targets = np.array(
+        [(target_formation[idx].center_x, target_formation[idx].center_y) for idx in range(num_sprites)], dtype=float
+    )
+    spawns = np.array(spawn_positions, dtype=float)
+    cost = np.hypot(targets[:, None, 0] - spawns[None, :, 0], targets[:, None, 1] - spawns[None, :, 1])
+
+    # 1-based Hungarian: column 0 is the virtual start column of each augmenting path
+    num_spawns = len(spawn_positions)
+    row_potential = np.zeros(num_sprites + 1)
+    col_potential = np.zeros(num_spawns + 1)
+    owner = np.zeros(num_spawns + 1, dtype=np.int64)  # sprite row matched to each column, 0 = free
+    way = np.zeros(num_spawns + 1, dtype=np.int64)
+
+    for row in range(1, num_sprites + 1):
+        owner[0] = row
+        col = 0
+        min_slack = np.full(num_spawns + 1, np.inf)
+        used = np.zeros(num_spawns + 1, dtype=bool)
+        while True:
+            used[col] = True
+            current_row = owner[col]
+            free = ~used
+            slack = np.full(num_spawns + 1, np.inf)
+            slack[1:] = cost[current_row - 1] - row_potential[current_row] - col_potential[1:]
+            improved = free & (slack < min_slack)
+            min_slack[improved] = slack[improved]
+            way[improved] = col
+
+            candidates = np.where(free, min_slack, np.inf)
+            next_col = int(np.argmin(candidates))
+            delta = candidates[next_col]
+            row_potential[owner[used]] += delta
+            col_potential[used] -= delta
+            min_slack[free] -= delta
+
+            col = next_col
+            if owner[col] == 0:
+                break
+
+        # Flip the augmenting path back to the start column
+        while col:
+            prev_col = way[col]
+            owner[col] = owner[prev_col]
+            col = prev_col
+
+    return {int(owner[col]) - 1: col - 1 for col in range(1, num_spawns + 1) if owner[col]}
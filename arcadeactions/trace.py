@@ -0,0 +1,191 @@
+"""
+Structured event tracing for ArcadeActions internals.
+
+Tracing is off by default. Instrumented code checks ``_tracer.enabled`` before
+building an event, so a disabled tracer costs one attribute check and never
+touches the filesystem.
+
+When enabled, events are appended to a bounded in-memory ring buffer (the oldest
+events are dropped once it is full). Passing a ``path`` to :func:`enable_trace`
+also starts a background writer thread that periodically drains the buffer and
+appends the events to that file as NDJSON, one JSON object per line; the game
+loop itself never performs file I/O.
+
+Example:
+    from arcadeactions import enable_trace, disable_trace, get_trace_events
+
+    enable_trace()  # in-memory only
+    ...
+    for event in get_trace_events():
+        print(event["event"], event)
+
+    enable_trace(path="trace.ndjson", flush_interval=0.25)  # stream to disk
+    ...
+    disable_trace()  # stops the writer after a final flush
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import threading
+import time
+from collections import deque
+from typing import Any
+
+__all__ = [
+    "enable_trace",
+    "disable_trace",
+    "flush_trace",
+    "get_trace_events",
+    "clear_trace",
+    "is_trace_enabled",
+]
+
+DEFAULT_CAPACITY = 4096
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+class TraceRecorder:
+    """Bounded ring buffer of trace events with an optional NDJSON writer thread."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.enabled = False
+        self.dropped = 0
+        self.write_errors = 0
+        self._events: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._writer: _TraceWriter | None = None
+        self._write_lock = threading.Lock()
+
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen or 0
+
+    def configure(self, *, capacity: int, path: str | None, flush_interval: float) -> None:
+        """Resize the buffer and (re)start or stop the background writer."""
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._stop_writer()
+        if capacity != self.capacity:
+            self._events = deque(self._events, maxlen=capacity)
+        if path is not None:
+            self._writer = _TraceWriter(self, path, flush_interval)
+            self._writer.start()
+
+    def record(self, event: str, **fields: Any) -> None:
+        """Append an event. Callers should check ``enabled`` before building *fields*."""
+        events = self._events
+        if len(events) == events.maxlen:
+            self.dropped += 1
+        fields["event"] = event
+        fields["time"] = time.time()
+        events.append(fields)
+
+    def events(self) -> list[dict[str, Any]]:
+        """Return the buffered (not yet written) events, oldest first."""
+        return list(self._events)
+
+    def clear(self) -> None:
+        self._events.clear()
+        self.dropped = 0
+
+    def flush(self) -> None:
+        """Write buffered events to the writer's file now (no-op without a path)."""
+        writer = self._writer
+        if writer is not None:
+            self._write_pending(writer.path)
+
+    def shutdown(self) -> None:
+        """Disable tracing and stop the writer after a final flush."""
+        self.enabled = False
+        self._stop_writer()
+
+    def _stop_writer(self) -> None:
+        writer = self._writer
+        self._writer = None
+        if writer is not None:
+            writer.stop()
+            self._write_pending(writer.path)
+
+    def _write_pending(self, path: str) -> None:
+        events = self._events
+        # Drain only what is buffered now; the game thread may keep appending meanwhile
+        batch = [events.popleft() for _ in range(len(events))]
+        if not batch:
+            return
+        lines = "".join(json.dumps(event, default=repr) + "\n" for event in batch)
+        with self._write_lock:
+            try:
+                with open(path, "a", encoding="utf-8") as trace_file:
+                    trace_file.write(lines)
+            except OSError:
+                self.write_errors += 1
+
+
+class _TraceWriter(threading.Thread):
+    """Daemon thread that periodically flushes a recorder's buffer to an NDJSON file."""
+
+    def __init__(self, recorder: TraceRecorder, path: str, interval: float):
+        super().__init__(name="arcadeactions-trace-writer", daemon=True)
+        self.path = path
+        self._recorder = recorder
+        self._interval = max(0.01, float(interval))
+        self._stop_event = threading.Event()
+
+    def run(self) -> None:
+        while not self._stop_event.wait(self._interval):
+            self._recorder._write_pending(self.path)
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive() and self is not threading.current_thread():
+            self.join(timeout=max(1.0, self._interval * 2))
+
+
+_tracer = TraceRecorder()
+atexit.register(_tracer.shutdown)
+
+
+def enable_trace(
+    *,
+    path: str | None = None,
+    capacity: int = DEFAULT_CAPACITY,
+    flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+) -> None:
+    """Turn on event tracing.
+
+    Args:
+        path: Optional NDJSON file to append events to from a background thread.
+            Without a path, events stay in the in-memory buffer for :func:`get_trace_events`.
+        capacity: Maximum number of buffered events; the oldest are dropped when full.
+        flush_interval: Seconds between background writes when *path* is set.
+    """
+    _tracer.configure(capacity=capacity, path=path, flush_interval=flush_interval)
+    _tracer.enabled = True
+
+
+def disable_trace() -> None:
+    """Turn off event tracing, flushing any pending events to the trace file."""
+    _tracer.shutdown()
+
+
+def is_trace_enabled() -> bool:
+    return _tracer.enabled
+
+
+def flush_trace() -> None:
+    """Write pending events to the trace file immediately (if one is configured)."""
+    _tracer.flush()
+
+
+def get_trace_events() -> list[dict[str, Any]]:
+    """Return buffered trace events, oldest first.
+
+    When a trace file is configured, events already written to it are no longer buffered.
+    """
+    return _tracer.events()
+
+
+def clear_trace() -> None:
+    """Discard buffered trace events and reset the dropped-event count."""
+    _tracer.clear()
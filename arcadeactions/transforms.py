@@ -3,6 +3,9 @@ from __future__ import annotations
 from collections.abc import Callable
 from typing import Any
 
+from arcadeactions._clock_domains import TICK_EPSILON
+from arcadeactions._sprite_state import SpriteStateMap
+from arcadeactions._transform_staging import get_scale, set_property, set_scale
 from arcadeactions.base import Action as _Action
 from arcadeactions.frame_conditions import _clone_condition, infinite
 
@@ -29,7 +32,7 @@ class ScaleUntil(_Action):
         else:
             self.target_scale_velocity = scale_velocity
         self.current_scale_velocity = self.target_scale_velocity  # Current rate (can be scaled)
-        self._original_scales = {}
+        self._original_scales = SpriteStateMap()
 
     def set_factor(self, factor: float) -> None:
         """Scale the scale velocity by the given factor.
@@ -44,7 +47,7 @@ class ScaleUntil(_Action):
         """Start scaling - store original scales for velocity calculation."""
 
         def store_original_scale(sprite):
-            self._original_scales[id(sprite)] = (sprite.scale, sprite.scale)
+            self._original_scales.set_for(sprite, (sprite.scale, sprite.scale))
 
         self.for_each_sprite(store_original_scale)
 
@@ -56,7 +59,7 @@ class ScaleUntil(_Action):
 
         def apply_scale(sprite):
             # Get current scale (which is a tuple in arcade)
-            current_scale = sprite.scale
+            current_scale = get_scale(sprite)
             if isinstance(current_scale, tuple):
                 current_scale_x, current_scale_y = current_scale
             else:
@@ -66,7 +69,7 @@ class ScaleUntil(_Action):
             # Apply scale velocity (avoiding negative scales)
             new_scale_x = max(0.01, current_scale_x + scale_delta_x)
             new_scale_y = max(0.01, current_scale_y + scale_delta_y)
-            sprite.scale = (new_scale_x, new_scale_y)
+            set_scale(sprite, (new_scale_x, new_scale_y))
 
         self.for_each_sprite(apply_scale)
 
@@ -228,6 +231,8 @@ class TweenUntil(_Action):
         fade_out.apply(sprite, tag="disappear")
     """
 
+    _supports_reuse = True
+
     def __init__(
         self,
         start_value: float | Callable[[Any], float],
@@ -245,7 +250,7 @@ class TweenUntil(_Action):
         self._frame_duration = None
         self._frames_elapsed = 0
         self._completed_naturally = False  # Track if action completed vs was stopped
-        self._evaluated_start_values: dict[int, float] = {}  # sprite_id -> evaluated start value
+        self._evaluated_start_values = SpriteStateMap()  # sprite_id -> evaluated start value
 
     def update(self, delta_time: float) -> None:
         """
@@ -264,6 +269,8 @@ class TweenUntil(_Action):
 
         # Now check external condition
         if self.condition and not self._condition_met:
+            if self._clock_scale != 1.0 and self._condition_counts_frames() and not self._take_condition_ticks():
+                return
             condition_result = self.condition()
             if condition_result:
                 self._condition_met = True
@@ -307,15 +314,15 @@ class TweenUntil(_Action):
             # If start_value is callable, evaluate it for this sprite
             if callable(self.start_value):
                 evaluated_start = self.start_value(sprite)
-                self._evaluated_start_values[id(sprite)] = evaluated_start
-                setattr(sprite, self.property_name, evaluated_start)
+                self._evaluated_start_values.set_for(sprite, evaluated_start)
+                set_property(sprite, self.property_name, evaluated_start)
             else:
-                self._evaluated_start_values[id(sprite)] = self.start_value
-                setattr(sprite, self.property_name, self.start_value)
+                self._evaluated_start_values.set_for(sprite, self.start_value)
+                set_property(sprite, self.property_name, self.start_value)
 
         if self._frame_duration == 0:
             # If duration is zero, immediately set to the end value.
-            self.for_each_sprite(lambda sprite: setattr(sprite, self.property_name, self.end_value))
+            self.for_each_sprite(lambda sprite: set_property(sprite, self.property_name, self.end_value))
             self.done = True
             if self.on_stop:
                 self.on_stop(None)
@@ -330,7 +337,10 @@ class TweenUntil(_Action):
             return
 
         # Update elapsed frames with factor applied
-        self._frames_elapsed += self._factor
+        self._frames_elapsed += self._factor * self._clock_scale
+        # Fractional clock-domain steps can land a hair short of the last frame
+        if 0 < self._frame_duration - self._frames_elapsed < TICK_EPSILON:
+            self._frames_elapsed = self._frame_duration
 
         # Calculate progress (0 to 1)
         t = min(self._frames_elapsed / self._frame_duration, 1.0)
@@ -345,12 +355,12 @@ class TweenUntil(_Action):
             elif callable(self.start_value):
                 # Evaluate callable if not cached (e.g., sprite added after action started)
                 sprite_start = self.start_value(sprite)
-                self._evaluated_start_values[sprite_id] = sprite_start
+                self._evaluated_start_values.set_for(sprite, sprite_start)
             else:
                 sprite_start = self.start_value
             # Calculate current value for this sprite
             value = sprite_start + (self.end_value - sprite_start) * eased_t
-            setattr(sprite, self.property_name, value)
+            set_property(sprite, self.property_name, value)
 
         self.for_each_sprite(update_sprite)
 
@@ -358,7 +368,7 @@ class TweenUntil(_Action):
         if t >= 1.0:
             # Ensure we set the exact end value
 
-            self.for_each_sprite(lambda sprite: setattr(sprite, self.property_name, self.end_value))
+            self.for_each_sprite(lambda sprite: set_property(sprite, self.property_name, self.end_value))
             self._completed_naturally = True  # Mark as naturally completed
             self.done = True
             if self.on_stop:
@@ -383,16 +393,17 @@ class TweenUntil(_Action):
                 elif callable(self.start_value):
                     # Evaluate callable if not cached (e.g., sprite added after action started)
                     sprite_start = self.start_value(sprite)
-                    self._evaluated_start_values[sprite_id] = sprite_start
+                    self._evaluated_start_values.set_for(sprite, sprite_start)
                 else:
                     sprite_start = self.start_value
-                setattr(sprite, self.property_name, sprite_start)
+                set_property(sprite, self.property_name, sprite_start)
 
             self.for_each_sprite(reset_sprite)
         # If action completed naturally or reached full duration, leave property at end value
 
     def reset(self) -> None:
         """Reset the action to its initial state."""
+        super().reset()
         self._frames_elapsed = 0
         self._frame_duration = None
         self._completed_naturally = False
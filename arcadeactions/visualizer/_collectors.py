@@ -6,7 +6,7 @@ from collections.abc import Callable, Iterable
 from typing import Protocol
 
 from arcadeactions.base import Action
-from arcadeactions._action_targets import TargetAdapter, adapt_target
+from arcadeactions._action_targets import TargetAdapter, adapt_target, get_target_name
 
 SpritePositionsProvider = Callable[[], dict[int, tuple[float, float]]]
 TargetNamesProvider = Callable[[], dict[int, str]]
@@ -99,7 +99,8 @@ def _collect_target_names_from_view() -> dict[int, str]:
 
     Inspects the current view's attributes to find SpriteLists and Sprites,
     mapping their IDs to their attribute names (e.g., "self.enemy_list").
-    Also inspects active actions to map their targets.
+    Also inspects active actions to map their targets; names registered with
+    ``register_target_name()`` (or ``apply(..., name=...)``) take precedence.
     """
     import arcade  # Import at function level to avoid circular imports
 
@@ -121,6 +122,10 @@ def _collect_target_names_from_view() -> dict[int, str]:
         if target is None:
             continue
         target_id = id(target)
+        registered = get_target_name(target)
+        if registered is not None:
+            names[target_id] = registered
+            continue
         if target_id in names:
             continue
         if target_id in membership_names:
@@ -10,8 +10,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from arcadeactions._frame_stats import FrameStats
     from arcadeactions.visualizer.instrumentation import ActionSnapshot, DebugDataStore
 
+# Rows of per-class and per-tag totals shown under the frame stats summary
+_FRAME_STATS_TOP_N = 3
+
 
 class ActionCard:
     """
@@ -127,6 +131,7 @@ class InspectorOverlay:
         width: int = 400,
         visible: bool = True,
         filter_tag: str | None = None,
+        frame_stats: FrameStats | None = None,
     ):
         """
         Initialize the inspector overlay.
@@ -138,6 +143,8 @@ class InspectorOverlay:
             width: Width of overlay panel
             visible: Initial visibility state
             filter_tag: Optional tag to filter actions by
+            frame_stats: Frame stats collector to summarize (defaults to the one used by
+                ``Action.update_all``); nothing is shown while it is disabled
         """
         self.debug_store = debug_store
         self.x = x
@@ -149,6 +156,9 @@ class InspectorOverlay:
         self.highlighted_target_id: int | None = None
         self._highlight_index: int = -1
         self._target_ids: list[int] = []  # Cached list of unique target IDs
+        if frame_stats is None:
+            from arcadeactions._frame_stats import frame_stats
+        self.frame_stats = frame_stats
 
     def toggle(self) -> None:
         """Toggle overlay visibility (deprecated - use cycle_position instead)."""
@@ -208,6 +218,31 @@ class InspectorOverlay:
             snapshots = [s for s in snapshots if s.tag == self.filter_tag]
         return len(snapshots)
 
+    def get_frame_stats_lines(self, frames: int = 60) -> list[str]:
+        """
+        Summarize recent update_all timings for display.
+
+        Args:
+            frames: Number of most recent frames to average phase times over
+
+        Returns:
+            Lines of text, or an empty list while frame stats are disabled
+        """
+        stats = self.frame_stats
+        if not stats.enabled or stats.frames_recorded == 0:
+            return []
+
+        averages = stats.phase_averages(frames)
+        total = sum(averages.values())
+        lines = [f"update_all: {total:.0f} us/frame (avg of last {min(frames, stats.frames_recorded)})"]
+        busiest = sorted(averages.items(), key=lambda item: item[1], reverse=True)[:_FRAME_STATS_TOP_N]
+        lines.append("  " + ", ".join(f"{name} {us:.0f}" for name, us in busiest))
+        for name, (us, calls) in list(stats.by_class().items())[:_FRAME_STATS_TOP_N]:
+            lines.append(f"  {name}: {us / 1000:.1f} ms / {calls} updates")
+        for tag, (us, calls) in list(stats.by_tag().items())[:_FRAME_STATS_TOP_N]:
+            lines.append(f"  tag {tag or '-'}: {us / 1000:.1f} ms / {calls} updates")
+        return lines
+
     def get_target_ids(self) -> list[int]:
         """Get list of unique target IDs."""
         return list(self._target_ids)
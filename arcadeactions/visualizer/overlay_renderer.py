@@ -81,8 +81,25 @@ class OverlayRenderer:
             window_height,
         )
         self._text_specs.append(self._build_title_spec(title_text, x, y))
+        self._add_frame_stats_specs(x, y)
         _sync_text_objects(self.text_objects, self._text_specs, self._last_text_specs)
 
+    def _add_frame_stats_specs(self, x: float, title_y: float) -> None:
+        """Add frame stats lines next to the title: below it at the top of the window, above it at the bottom."""
+        try:
+            lines = self.overlay.get_frame_stats_lines()
+        except AttributeError:
+            return
+        if not lines:
+            return
+        if self.overlay.position in ("upper_left", "upper_right"):
+            current_y = title_y - self.line_height - 2
+        else:
+            current_y = title_y + self.line_height * len(lines) + 2
+        for line in lines:
+            self._text_specs.append(_TextSpec(line, x, current_y, arcade.color.LIGHT_GRAY, self.font_size))
+            current_y -= self.line_height
+
     def _render_group(self, group: TargetGroup, start_y: int) -> int:
         """
         Render a target group.
@@ -12,7 +12,7 @@ import random
 
 import arcade
 
-from arcadeactions import Action, arrange_grid, center_window, move_until
+from arcadeactions import Action, arrange_grid, center_window, collides_with, move_until, register_collision_list
 from arcadeactions.helpers import move_to
 
 SPRITE_SCALING_PLAYER = 0.75
@@ -148,6 +148,11 @@ class GameView(arcade.View):
             sprite_factory=lambda: arcade.Sprite(self.texture_enemy_right, scale=SPRITE_SCALING_ENEMY),
         )
 
+        # Bullet conditions query these through one spatial hash per list per frame
+        register_collision_list("enemies", self.enemy_list)
+        register_collision_list("shields", self.shield_list)
+        register_collision_list("player", self.player_list)
+
         self.start_enemy_movement()
         self.start_enemy_firing()
 
@@ -229,8 +234,8 @@ class GameView(arcade.View):
         self.player_bullet_list.append(bullet)
 
         def bullet_collision_check():
-            enemy_hits = arcade.check_for_collision_with_list(bullet, self.enemy_list)
-            shield_hits = arcade.check_for_collision_with_list(bullet, self.shield_list)
+            enemy_hits = collides_with(bullet, "enemies")
+            shield_hits = collides_with(bullet, "shields")
             off_screen = bullet.bottom > WINDOW_HEIGHT
 
             if enemy_hits or shield_hits or off_screen:
@@ -276,8 +281,8 @@ class GameView(arcade.View):
                 self.enemy_bullet_list.append(bullet)
 
                 def enemy_bullet_collision_check(bullet_ref=bullet):
-                    player_hits = arcade.check_for_collision_with_list(bullet_ref, self.player_list)
-                    shield_hits = arcade.check_for_collision_with_list(bullet_ref, self.shield_list)
+                    player_hits = collides_with(bullet_ref, "player")
+                    shield_hits = collides_with(bullet_ref, "shields")
                     off_screen = bullet_ref.top < 0
 
                     if player_hits or shield_hits or off_screen:
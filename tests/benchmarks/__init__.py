@@ -0,0 +1,9 @@
+"""Headless benchmark suite for ``Action.update_all``.
+
+Run every scenario and compare against the committed baseline::
+
+    uv run python -m tests.benchmarks
+
+See the Benchmarks section of ``tests/TEST_ORGANIZATION.md`` for options and for
+refreshing the baseline.
+"""
@@ -0,0 +1,78 @@
+"""Command-line entry point: ``python -m tests.benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from .harness import BASELINE_PATH, DEFAULT_TOLERANCE, compare, load_baseline, run_all, write_baseline
+from .scenarios import SCENARIOS, get_scenario
+
+
+def _ensure_window() -> None:
+    """Give scenarios (and the visualizer's window hooks) a window without opening one."""
+    import arcade
+
+    try:
+        arcade.get_window()
+    except Exception:
+        from tests.conftest import HeadlessWindow
+
+        arcade.set_window(HeadlessWindow())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks", description=__doc__)
+    parser.add_argument("-s", "--scenario", action="append", help="Run only this scenario (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List scenarios and exit")
+    parser.add_argument("--frames", type=int, default=120, help="Timed frames per scenario (default: 120)")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed frames before measuring (default: 10)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=float(os.environ.get("ARCADEACTIONS_BENCH_TOLERANCE", DEFAULT_TOLERANCE)),
+        help="Allowed fractional slowdown before a metric counts as a regression "
+        "(default: $ARCADEACTIONS_BENCH_TOLERANCE or %(default)s)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="Write results to the baseline file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for scenario in SCENARIOS:
+            print(f"{scenario.name:26} {scenario.description}")
+        return 0
+
+    scenarios = [get_scenario(name) for name in args.scenario] if args.scenario else list(SCENARIOS)
+    _ensure_window()
+    results = run_all(scenarios, frames=args.frames, warmup=args.warmup)
+
+    if args.json:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(f"{'scenario':26} {'us/frame':>10} {'p95 us':>10} {'KiB/frame':>10} {'blocks/fr':>10} {'peak KiB':>10}")
+        for r in results:
+            print(
+                f"{r.name:26} {r.us_per_frame:10.1f} {r.p95_us_per_frame:10.1f} {r.alloc_kib_per_frame:10.2f}"
+                f" {r.retained_blocks_per_frame:10.2f} {r.peak_kib:10.1f}"
+            )
+
+    if args.update_baseline:
+        write_baseline(results, args.baseline, frames=args.frames)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    regressions = compare(results, baseline, args.tolerance)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
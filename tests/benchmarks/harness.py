@@ -0,0 +1,182 @@
+"""Measure benchmark scenarios and compare them against a stored baseline.
+
+Every scenario is built twice. The timing pass runs untraced and reports the median
+and 95th-percentile frame time. The memory pass runs under :mod:`tracemalloc` and
+reports the bytes allocated per frame (the traced high-water mark above the frame's
+starting point), blocks still alive after the measured frames (leaks show up here),
+and the peak traced memory of the whole run, build included.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import arcade
+
+from arcadeactions import Action
+
+from .scenarios import SCENARIOS, Scenario
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_TOLERANCE = 0.25
+
+# tracemalloc slows frames several-fold, so the memory pass measures fewer of them
+_MEMORY_FRAMES = 20
+
+# Metrics compared against the baseline, with an absolute allowance so that near-zero
+# values (e.g. 0.2 KiB per frame) don't fail on noise
+COMPARED_METRICS = {
+    "us_per_frame": 5.0,
+    "alloc_kib_per_frame": 1.0,
+    "retained_blocks_per_frame": 1.0,
+    "peak_kib": 64.0,
+}
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    frames: int
+    setup_ms: float
+    us_per_frame: float
+    p95_us_per_frame: float
+    alloc_kib_per_frame: float
+    retained_blocks_per_frame: float
+    peak_kib: float
+
+
+def _frame_times(scenario: Scenario, scale: float, frames: int, warmup: int) -> tuple[float, list[int]]:
+    Action.stop_all()
+    gc.collect()
+    start = time.perf_counter()
+    run = scenario.build(scale)
+    setup_ms = (time.perf_counter() - start) * 1000
+    try:
+        for _ in range(warmup):
+            run.frame()
+        times = []
+        clock = time.perf_counter_ns
+        for _ in range(frames):
+            before = clock()
+            run.frame()
+            times.append(clock() - before)
+    finally:
+        if run.teardown is not None:
+            run.teardown()
+        Action.stop_all()
+    return setup_ms, times
+
+
+def _memory(scenario: Scenario, scale: float, frames: int, warmup: int) -> tuple[float, float, float]:
+    Action.stop_all()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run = scenario.build(scale)
+        try:
+            for _ in range(warmup):
+                run.frame()
+            gc.collect()
+            peak = tracemalloc.get_traced_memory()[1]
+            blocks_before = len(tracemalloc.take_snapshot().traces)
+            allocated = 0
+            for _ in range(frames):
+                tracemalloc.reset_peak()
+                current = tracemalloc.get_traced_memory()[0]
+                run.frame()
+                frame_peak = tracemalloc.get_traced_memory()[1]
+                allocated += frame_peak - current
+                peak = max(peak, frame_peak)
+            gc.collect()
+            retained = len(tracemalloc.take_snapshot().traces) - blocks_before
+        finally:
+            if run.teardown is not None:
+                run.teardown()
+    finally:
+        tracemalloc.stop()
+        Action.stop_all()
+    return allocated / frames / 1024, retained / frames, peak / 1024
+
+
+def measure(scenario: Scenario, *, scale: float = 1.0, frames: int = 120, warmup: int = 10) -> BenchmarkResult:
+    """Run *scenario* and return its timing and memory figures."""
+    setup_ms, times = _frame_times(scenario, scale, frames, warmup)
+    alloc_kib, retained_blocks, peak_kib = _memory(scenario, scale, max(1, min(frames, _MEMORY_FRAMES)), warmup)
+    times_us = sorted(t / 1000 for t in times)
+    return BenchmarkResult(
+        name=scenario.name,
+        frames=frames,
+        setup_ms=round(setup_ms, 2),
+        us_per_frame=round(statistics.median(times_us), 1),
+        p95_us_per_frame=round(times_us[int(0.95 * (len(times_us) - 1))], 1),
+        alloc_kib_per_frame=round(alloc_kib, 2),
+        retained_blocks_per_frame=round(retained_blocks, 2),
+        peak_kib=round(peak_kib, 1),
+    )
+
+
+def run_all(
+    scenarios: Iterable[Scenario] = SCENARIOS, *, scale: float = 1.0, frames: int = 120, warmup: int = 10
+) -> list[BenchmarkResult]:
+    return [measure(scenario, scale=scale, frames=frames, warmup=warmup) for scenario in scenarios]
+
+
+def compare(results: Iterable[BenchmarkResult], baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Return one message per metric that got worse than *baseline* by more than *tolerance*.
+
+    A scenario missing from the baseline is reported too, since nothing about it can
+    be compared; record it with ``--update-baseline``.
+    """
+    recorded = baseline.get("scenarios", {})
+    regressions = []
+    for result in results:
+        base = recorded.get(result.name)
+        if base is None:
+            regressions.append(f"{result.name}: no baseline recorded (run with --update-baseline)")
+            continue
+        for metric, allowance in COMPARED_METRICS.items():
+            if metric not in base:
+                continue
+            limit = base[metric] * (1 + tolerance) + allowance
+            value = getattr(result, metric)
+            if value > limit:
+                regressions.append(
+                    f"{result.name}: {metric} {value} exceeds baseline {base[metric]} (limit {limit:.2f})"
+                )
+    return regressions
+
+
+def environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "arcade": arcade.__version__,
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def write_baseline(results: Iterable[BenchmarkResult], path: Path = BASELINE_PATH, *, frames: int = 120) -> None:
+    """Record *results* as the new baseline, keeping scenarios that weren't re-run."""
+    baseline = load_baseline(path)
+    scenarios = baseline.get("scenarios", {})
+    for result in results:
+        entry = asdict(result)
+        del entry["name"]
+        scenarios[result.name] = entry
+    data = {"environment": environment(), "frames": frames, "scenarios": dict(sorted(scenarios.items()))}
+    path.write_text(json.dumps(data, indent=2) + "\n")
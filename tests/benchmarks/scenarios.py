@@ -0,0 +1,161 @@
+"""Fixed workloads measured by the benchmark harness.
+
+Each scenario builds its sprites and actions for a given *scale* (1.0 is the size the
+baseline was recorded at) and returns a :class:`ScenarioRun` whose ``frame`` callable
+advances the game by one frame. SpriteLists are created with ``lazy=True`` so no
+OpenGL resources are touched, as in the headless test fixtures.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import arcade
+
+from arcadeactions import (
+    Action,
+    FollowPathUntil,
+    MoveUntil,
+    after_frames,
+    infinite,
+    repeat,
+    sequence,
+)
+from arcadeactions.formation import arrange_grid
+from arcadeactions.pattern import create_formation_entry_from_sprites
+from arcadeactions.presets.entry_paths import corkscrew_entry, loop_the_loop, swoop_entry
+
+DELTA_TIME = 1 / 60
+
+
+@dataclass
+class ScenarioRun:
+    """A built scenario: call ``frame()`` once per frame, then ``teardown()``."""
+
+    frame: Callable[[], None]
+    teardown: Callable[[], None] | None = None
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    build: Callable[[float], ScenarioRun]
+
+
+def _sprite(x: float, y: float) -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+    sprite.position = (x, y)
+    return sprite
+
+
+def _sprite_list(count: int, rng: random.Random) -> arcade.SpriteList:
+    sprites = arcade.SpriteList(lazy=True)
+    for _ in range(count):
+        sprites.append(_sprite(rng.uniform(50, 750), rng.uniform(50, 550)))
+    return sprites
+
+
+def _update_frame(*sprite_lists: arcade.SpriteList) -> Callable[[], None]:
+    """One game frame: the action manager, then Arcade's velocity integration."""
+
+    def frame() -> None:
+        Action.update_all(DELTA_TIME)
+        for sprite_list in sprite_lists:
+            sprite_list.update()
+
+    return frame
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, round(count * scale))
+
+
+def build_move_until_bounce(scale: float) -> ScenarioRun:
+    rng = random.Random(1)
+    sprites = _sprite_list(_scaled(10_000, scale), rng)
+    for sprite in sprites:
+        velocity = (rng.uniform(-4, 4), rng.uniform(-4, 4))
+        MoveUntil(velocity, infinite, bounds=(0, 0, 800, 600), boundary_behavior="bounce").apply(sprite)
+    return ScenarioRun(_update_frame(sprites))
+
+
+def build_follow_path(scale: float) -> ScenarioRun:
+    rng = random.Random(2)
+    paths = [loop_the_loop(), corkscrew_entry(), swoop_entry()]
+    sprites = _sprite_list(_scaled(2_000, scale), rng)
+    for sprite in sprites:
+        path = paths[rng.randrange(len(paths))]
+        FollowPathUntil(path, velocity=rng.uniform(120, 240), condition=infinite, rotate_with_path=True).apply(sprite)
+    return ScenarioRun(_update_frame(sprites))
+
+
+def build_repeat_sequence(scale: float) -> ScenarioRun:
+    rng = random.Random(3)
+    sprites = _sprite_list(_scaled(500, scale), rng)
+    for sprite in sprites:
+        patrol = sequence(
+            MoveUntil((2, 0), after_frames(20)),
+            MoveUntil((0, 2), after_frames(10)),
+            MoveUntil((-2, 0), after_frames(20)),
+            MoveUntil((0, -2), after_frames(10)),
+        )
+        repeat(patrol).apply(sprite)
+    return ScenarioRun(_update_frame(sprites))
+
+
+def build_formation_entry(scale: float) -> ScenarioRun:
+    count = _scaled(80, scale)
+    cols = 10
+    rows = max(1, -(-count // cols))
+    target = arrange_grid(
+        sprites=[_sprite(0, 0) for _ in range(rows * cols)],
+        rows=rows,
+        cols=cols,
+        start_x=160,
+        start_y=500,
+        spacing_x=50,
+        spacing_y=40,
+    )
+    entry = create_formation_entry_from_sprites(
+        target, window_bounds=(0, 0, 800, 600), velocity=4.0, stagger_delay_frames=20
+    )
+    sprites = arcade.SpriteList(lazy=True)
+    for sprite, action, _ in entry:
+        sprites.append(sprite)
+        action.apply(sprite, tag="formation_entry")
+    return ScenarioRun(_update_frame(sprites))
+
+
+def build_visualizer_attached(scale: float) -> ScenarioRun:
+    from arcadeactions.visualizer.attach import attach_visualizer, detach_visualizer
+
+    rng = random.Random(5)
+    attach_visualizer(snapshot_directory=None)
+    sprites = _sprite_list(_scaled(500, scale), rng)
+    for sprite in sprites:
+        MoveUntil((rng.uniform(-2, 2), rng.uniform(-2, 2)), infinite).apply(sprite, tag="drift")
+    FollowPathUntil(loop_the_loop(), velocity=180, condition=infinite).apply(sprites[0], tag="path")
+    return ScenarioRun(_update_frame(sprites), teardown=detach_visualizer)
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("move_until_bounce_10k", "10k sprites, one bouncing MoveUntil each", build_move_until_bounce),
+    Scenario("follow_path_2k", "2k sprites, one FollowPathUntil each on shared presets", build_follow_path),
+    Scenario("repeat_sequence_500", "500 repeat(sequence(4 x MoveUntil)) trees", build_repeat_sequence),
+    Scenario(
+        "formation_entry_80",
+        "80-sprite formation entry from create_formation_entry_from_sprites",
+        build_formation_entry,
+    ),
+    Scenario("visualizer_attached_500", "500 drifting sprites with the visualizer attached", build_visualizer_attached),
+)
+
+
+def get_scenario(name: str) -> Scenario:
+    for scenario in SCENARIOS:
+        if scenario.name == name:
+            return scenario
+    raise KeyError(f"Unknown benchmark scenario {name!r}")
@@ -0,0 +1,111 @@
+"""Tests for the benchmark harness, plus the opt-in baseline comparison itself."""
+
+import os
+
+import pytest
+
+from arcadeactions import Action
+
+from .harness import (
+    BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    BenchmarkResult,
+    compare,
+    load_baseline,
+    measure,
+    run_all,
+    write_baseline,
+)
+from .scenarios import SCENARIOS, get_scenario
+
+
+def _result(name: str = "scenario", **overrides) -> BenchmarkResult:
+    values = {
+        "frames": 10,
+        "setup_ms": 1.0,
+        "us_per_frame": 100.0,
+        "p95_us_per_frame": 120.0,
+        "alloc_kib_per_frame": 2.0,
+        "retained_blocks_per_frame": 0.0,
+        "peak_kib": 500.0,
+    }
+    values.update(overrides)
+    return BenchmarkResult(name=name, **values)
+
+
+@pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda scenario: scenario.name)
+def test_scenarios_run_at_small_scale(scenario):
+    result = measure(scenario, scale=0.01, frames=3, warmup=1)
+
+    assert result.name == scenario.name
+    assert result.us_per_frame > 0
+    assert result.peak_kib > 0
+    assert len(Action._active_actions) == 0
+
+
+def test_visualizer_scenario_detaches():
+    from arcadeactions.visualizer import _session
+
+    measure(get_scenario("visualizer_attached_500"), scale=0.01, frames=2, warmup=0)
+
+    assert _session._VISUALIZER_SESSION is None
+
+
+def test_unknown_scenario_raises():
+    with pytest.raises(KeyError, match="nope"):
+        get_scenario("nope")
+
+
+class TestCompare:
+    def test_within_tolerance_passes(self):
+        baseline = {"scenarios": {"scenario": {"us_per_frame": 100.0, "peak_kib": 500.0}}}
+
+        assert compare([_result(us_per_frame=120.0, peak_kib=600.0)], baseline, tolerance=0.25) == []
+
+    def test_regressions_are_reported_per_metric(self):
+        baseline = {"scenarios": {"scenario": {"us_per_frame": 100.0, "alloc_kib_per_frame": 2.0}}}
+
+        regressions = compare([_result(us_per_frame=200.0, alloc_kib_per_frame=10.0)], baseline, tolerance=0.25)
+
+        assert len(regressions) == 2
+        assert regressions[0].startswith("scenario: us_per_frame 200.0 exceeds baseline 100.0")
+
+    def test_absolute_allowance_absorbs_noise_near_zero(self):
+        baseline = {"scenarios": {"scenario": {"alloc_kib_per_frame": 0.1}}}
+
+        assert compare([_result(alloc_kib_per_frame=0.9)], baseline, tolerance=0.0) == []
+
+    def test_scenarios_missing_from_baseline_are_reported(self):
+        baseline = {"scenarios": {"scenario": {"us_per_frame": 100.0}}}
+
+        regressions = compare([_result(), _result(name="new")], baseline)
+
+        assert regressions == ["new: no baseline recorded (run with --update-baseline)"]
+
+
+def test_baseline_round_trip_keeps_other_scenarios(tmp_path):
+    path = tmp_path / "baseline.json"
+    write_baseline([_result("a"), _result("b")], path)
+    write_baseline([_result("a", us_per_frame=50.0)], path)
+
+    baseline = load_baseline(path)
+
+    assert baseline["scenarios"]["a"]["us_per_frame"] == 50.0
+    assert baseline["scenarios"]["b"]["us_per_frame"] == 100.0
+    assert "python" in baseline["environment"]
+
+
+def test_committed_baseline_covers_every_scenario():
+    baseline = load_baseline()
+
+    assert set(baseline["scenarios"]) == {scenario.name for scenario in SCENARIOS}
+
+
+@pytest.mark.benchmark
+def test_no_regressions_against_baseline():
+    """Full-size run compared with the committed baseline (``pytest -m benchmark``)."""
+    tolerance = float(os.environ.get("ARCADEACTIONS_BENCH_TOLERANCE", DEFAULT_TOLERANCE))
+
+    regressions = compare(run_all(), load_baseline(BASELINE_PATH), tolerance)
+
+    assert not regressions, "\n".join(regressions)
@@ -130,6 +130,7 @@ def pytest_collection_modifyitems(config, items):
 
     To run integration tests locally, use: pytest -m integration
     To run slow tests locally, use: pytest -m slow
+    Benchmarks (marked with @pytest.mark.benchmark) only run with: pytest -m benchmark
     """
     # Check if we're in CI
     is_ci = os.environ.get("CI") == "true" or os.environ.get("GITHUB_ACTIONS") == "true"
@@ -151,6 +152,12 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "slow" in item.keywords:
                 item.add_marker(skip_slow)
+    # Benchmark timings depend on the machine, so they never run unless asked for, even in CI
+    if not (bool(marker_expr) and "benchmark" in marker_expr):
+        skip_benchmark = pytest.mark.skip(reason="Benchmarks run only on request (use -m benchmark)")
+        for item in items:
+            if "benchmark" in item.keywords:
+                item.add_marker(skip_benchmark)
 
 
 class HeadlessWindow:
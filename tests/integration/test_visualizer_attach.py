@@ -620,6 +620,33 @@ def test_collect_target_names_from_view_finds_sprite_lists(monkeypatch):
     assert names[id(sprite_list)] == "self.enemy_list"
 
 
+def test_collect_target_names_from_view_prefers_registered_names(monkeypatch):
+    """Names given with apply(..., name=...) win over view attribute names."""
+    from arcadeactions.frame_conditions import infinite
+    from arcadeactions.movement import MoveUntil
+    from arcadeactions.visualizer.attach import _collect_target_names_from_view
+
+    sprite_list = arcade.SpriteList()
+    sprite_list.append(arcade.Sprite(":resources:images/items/star.png"))
+
+    class StubView:
+        def __init__(self):
+            self.enemy_list = sprite_list
+
+    class StubWindow:
+        def __init__(self):
+            self.current_view = StubView()
+
+    monkeypatch.setattr(arcade, "get_window", lambda: StubWindow())
+    MoveUntil((1, 0), infinite).apply(sprite_list, tag="named", name="Wave 3 enemies")
+    try:
+        names = _collect_target_names_from_view()
+    finally:
+        Action.stop_all()
+
+    assert names[id(sprite_list)] == "Wave 3 enemies"
+
+
 def test_collect_target_names_from_view_finds_sprites(monkeypatch):
     """Test that _collect_target_names_from_view finds Sprite objects."""
     from arcadeactions.visualizer.attach import _collect_target_names_from_view
@@ -4,7 +4,9 @@ import arcade
 import pytest
 
 from arcadeactions import Action
+from arcadeactions.axis_move import MoveXUntil, MoveYUntil
 from arcadeactions.base import CompositeAction
+from arcadeactions.callbacks import CallbackUntil
 from arcadeactions.conditional import MoveUntil, infinite
 from arcadeactions.frame_timing import after_frames
 
@@ -261,6 +263,65 @@ class TestAction:
         # No actions with effects tag
         assert len(Action.get_actions_for_target(sprite, "effects")) == 0
 
+    def test_action_get_actions_by_tag(self):
+        """Test looking up actions by tag across targets."""
+        sprite1 = create_test_sprite()
+        sprite2 = create_test_sprite()
+        action1 = MockAction(condition=lambda: False)
+        action2 = MockAction(condition=lambda: False)
+        action3 = MockAction(condition=lambda: False)
+
+        action1.apply(sprite1, tag="wave")
+        action2.apply(sprite2, tag="wave")
+        action3.apply(sprite2, tag="effects")
+
+        assert Action.get_actions_by_tag("wave") == [action1, action2]
+        assert Action.get_actions_by_tag("effects") == [action3]
+        assert Action.get_actions_by_tag("missing") == []
+
+    def test_action_stop_actions_by_tag(self):
+        """Test stopping every action registered under a tag."""
+        sprite1 = create_test_sprite()
+        sprite2 = create_test_sprite()
+        action1 = MockAction(condition=lambda: False)
+        action2 = MockAction(condition=lambda: False)
+        action3 = MockAction(condition=lambda: False)
+
+        action1.apply(sprite1, tag="wave")
+        action2.apply(sprite2, tag="wave")
+        action3.apply(sprite2, tag="effects")
+
+        Action.stop_actions_by_tag("wave")
+
+        assert action1.done and action2.done
+        assert action3._is_active
+        assert Action.get_actions_by_tag("wave") == []
+        assert Action.get_actions_for_target(sprite2) == [action3]
+
+    def test_action_retag_updates_index(self):
+        """Test that changing an active action's tag keeps tag lookups consistent."""
+        sprite = create_test_sprite()
+        action = MockAction(condition=lambda: False)
+        action.apply(sprite, tag="old")
+
+        action.tag = "new"
+
+        assert Action.get_actions_by_tag("old") == []
+        assert Action.get_actions_by_tag("new") == [action]
+        assert Action.get_actions_for_target(sprite, "new") == [action]
+
+    def test_finished_actions_leave_target_index(self):
+        """Test that actions completing during update_all are dropped from the indexes."""
+        sprite = create_test_sprite()
+        action = MockAction(condition=after_frames(1))
+        action.apply(sprite, tag="short")
+
+        Action.update_all(0.016)
+
+        assert action.done
+        assert Action.get_actions_for_target(sprite) == []
+        assert Action.get_actions_by_tag("short") == []
+
     def test_action_clone(self):
         """Test action cloning."""
 
@@ -732,6 +793,65 @@ class TestAction:
 
         assert Action.is_paused() is False
 
+    def test_pause_state_tracks_individual_pause_resume_and_stop(self):
+        """Test the paused-action count stays in step with pause, resume and stop."""
+        sprite = create_test_sprite()
+        action1 = MockAction(condition=lambda: False)
+        action2 = MockAction(condition=lambda: False)
+        action1.apply(sprite)
+        action2.apply(sprite)
+
+        action1.pause()
+        assert Action._active_actions.paused_count == 1
+        assert Action.is_paused() is False
+
+        action2.pause()
+        assert Action.is_paused() is True
+
+        action1.resume()
+        assert Action._active_actions.paused_count == 1
+        assert Action.is_paused() is False
+
+        action1.stop()
+        assert Action.is_paused() is True
+
+        action2.stop()
+        assert Action._active_actions.paused_count == 0
+        assert Action.is_paused() is False
+
+    def test_frame_counter_holds_while_all_paused(self):
+        """Test the frame counter only advances when some action is running."""
+        sprite = create_test_sprite()
+        MockAction(condition=lambda: False).apply(sprite)
+
+        Action.update_all(0.016)
+        frame = Action.current_frame()
+
+        Action.pause_all()
+        Action.update_all(0.016)
+        assert Action.current_frame() == frame
+
+        Action.step_all(0.016)
+        assert Action.current_frame() == frame + 1
+        assert Action.is_paused() is True
+
+        Action.resume_all()
+        Action.update_all(0.016)
+        assert Action.current_frame() == frame + 2
+
+    def test_action_applied_while_paused_counts_as_paused(self):
+        """Test that an action starting under a global pause joins the paused count."""
+        sprite = create_test_sprite()
+        MockAction(condition=lambda: False).apply(sprite)
+        Action.pause_all()
+
+        late = MockAction(condition=lambda: False)
+        late.apply(sprite)
+
+        assert late._paused
+        assert Action._active_actions.paused_count == 2
+        assert Action.is_paused() is True
+
     def test_action_apply_with_iterable_target(self):
         """Test applying action to a plain iterable of sprites."""
         sprites = [create_test_sprite(), create_test_sprite()]
@@ -904,6 +1024,42 @@ class TestAction:
         with pytest.raises(RuntimeError, match="Corrupted sprite list"):
             Action._get_sprite_list_name(sprite_list)
 
+    def test_get_sprite_list_name_uses_registered_name(self):
+        """Registered names label SpriteLists without scanning the heap."""
+        import gc
+
+        import pytest
+
+        from arcadeactions import register_target_name
+
+        sprite_list = arcade.SpriteList()
+        register_target_name(sprite_list, "enemies")
+
+        with pytest.MonkeyPatch.context() as patch:
+            patch.setattr(gc, "get_objects", lambda *args: pytest.fail("heap scanned"))
+            assert Action._describe_target(sprite_list) == "enemies"
+            register_target_name(sprite_list, None)
+            assert Action._describe_target(sprite_list) == "SpriteList(len=0)"
+
+    def test_apply_name_registers_target_name(self):
+        """apply(..., name=...) names the target for debug output until the target is collected."""
+        import gc
+
+        from arcadeactions._action_targets import _target_names
+
+        sprite = create_test_sprite()
+        action = MockAction(name="named")
+        action.apply(sprite, tag="test", name="player")
+
+        assert Action._describe_target(sprite) == "player"
+
+        Action.stop_all()
+        sprite_id = id(sprite)
+        del action, sprite
+        gc.collect()
+
+        assert sprite_id not in _target_names
+
     def test_radd_operator(self):
         """Test right-hand addition operator."""
         sprite = create_test_sprite()
@@ -1129,3 +1285,83 @@ class TestInstrumentationConditionDocstring:
         Action.update_all(0.016)
 
         assert store.condition_str == "Docstring condition."
+
+
+class BatchedMockAction(MockAction):
+    """MockAction that opts into the batch_update hook."""
+
+    batch_calls: list[int] = []
+
+    @classmethod
+    def batch_update(cls, actions, delta_time):
+        cls.batch_calls.append(len(actions))
+        for action in actions:
+            action.update(delta_time)
+
+
+class TestBatchUpdateHook:
+    """update_all hands types with a batch_update hook all their instances at once."""
+
+    def teardown_method(self):
+        Action.stop_all()
+        BatchedMockAction.batch_calls.clear()
+
+    def test_hook_called_once_per_type_per_frame(self):
+        sprites = [create_test_sprite() for _ in range(4)]
+        batched = [BatchedMockAction(condition=lambda: False) for _ in sprites]
+        plain = MockAction(condition=lambda: False)
+        for action, sprite in zip(batched, sprites, strict=True):
+            action.apply(sprite)
+        plain.apply(sprites[0])
+
+        Action.update_all(0.016)
+        Action.update_all(0.016)
+
+        assert BatchedMockAction.batch_calls == [4, 4]
+        assert all(action.time_elapsed == pytest.approx(0.032) for action in batched)
+        assert plain.time_elapsed == pytest.approx(0.032)
+
+    def test_finished_instances_leave_the_batch_group(self):
+        sprite = create_test_sprite()
+        lasting = BatchedMockAction(condition=lambda: False).apply(sprite)
+        finishing = BatchedMockAction(condition=lambda: True).apply(sprite)
+
+        Action.update_all(0.016)
+        Action.update_all(0.016)
+
+        assert finishing.done
+        assert BatchedMockAction.batch_calls == [2, 1]
+        assert Action._active_actions.batch_groups[BatchedMockAction] == [lasting]
+
+    def test_unbatched_move_until_keeps_apply_order(self):
+        sprite = create_test_sprite()
+        order = []
+
+        def move_velocity():
+            order.append("move-second")
+            return (1, 0)
+
+        CallbackUntil(lambda: order.append("callback-first"), infinite).apply(sprite)
+        MoveUntil((1, 0), infinite, velocity_provider=move_velocity).apply(sprite)
+        order.clear()
+
+        Action.update_all(0.016)
+        Action.update_all(0.016)
+
+        assert order == ["callback-first", "move-second"] * 2
+
+    def test_plain_move_until_stays_in_the_plain_phase(self):
+        sprites = [create_test_sprite() for _ in range(3)]
+        first = MockAction(condition=lambda: False).apply(sprites[0])
+        moves = [
+            MoveUntil((2, 0), infinite, batched=False).apply(sprites[0]),
+            MoveXUntil((3, 0), infinite).apply(sprites[1]),
+            MoveYUntil((0, 4), infinite).apply(sprites[2]),
+        ]
+        last = MockAction(condition=lambda: False).apply(sprites[0])
+
+        Action.update_all(0.016)
+
+        assert not any(Action._active_actions.batch_groups.values())
+        assert Action._active_actions.phases[1] == [first, *moves, last]
+        assert [(sprite.change_x, sprite.change_y) for sprite in sprites] == [(2, 0), (3, 0), (0, 4)]
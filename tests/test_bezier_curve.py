@@ -0,0 +1,95 @@
+"""Tests for the precomputed Bezier curves used by FollowPathUntil."""
+
+from math import comb, hypot
+
+import arcade
+import pytest
+
+from arcadeactions import Action, FollowPathUntil
+from arcadeactions._bezier import BezierCurve, get_bezier_curve
+from arcadeactions.conditional import infinite
+from arcadeactions.presets.entry_paths import corkscrew_entry
+
+
+def bernstein_point(points, t):
+    n = len(points) - 1
+    x = y = 0.0
+    for i, (px, py) in enumerate(points):
+        coef = comb(n, i) * (1 - t) ** (n - i) * t**i
+        x += px * coef
+        y += py * coef
+    return x, y
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+
+
+class TestBezierCurve:
+    @pytest.mark.parametrize(
+        "points",
+        [
+            [(0, 0), (100, 50)],
+            [(0, 0), (100, 300), (300, -100), (400, 0)],
+            corkscrew_entry(),
+        ],
+    )
+    def test_matches_bernstein_form(self, points):
+        curve = BezierCurve(tuple(points))
+
+        for i in range(41):
+            t = i / 40
+            assert curve.point(t) == pytest.approx(bernstein_point(points, t), abs=1e-6)
+
+    def test_param_at_distance_is_clamped_and_monotonic(self):
+        curve = BezierCurve(((0, 0), (50, 200), (250, 200), (300, 0)))
+
+        assert curve.param_at_distance(-5) == 0.0
+        assert curve.param_at_distance(curve.length + 5) == 1.0
+        params = [curve.param_at_distance(curve.length * i / 50) for i in range(51)]
+        assert params == sorted(params)
+
+    def test_equal_distances_give_equal_chords(self):
+        # Control points bunched at the start make t-linear traversal very uneven
+        curve = BezierCurve(((0, 0), (1, 0), (2, 0), (300, 0)))
+        step = curve.length / 20
+        points = [curve.point_at_distance(step * i) for i in range(21)]
+        chords = [hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(points, points[1:], strict=False)]
+
+        assert chords == pytest.approx([step] * 20, rel=1e-2)
+
+    def test_curves_are_shared_by_value(self):
+        first = get_bezier_curve([(0, 0), (10, 20), (30, 0)])
+        second = get_bezier_curve([[0.0, 0.0], [10, 20], (30.0, 0)])
+
+        assert first is second
+
+    def test_requires_two_points(self):
+        with pytest.raises(ValueError):
+            BezierCurve(((0, 0),))
+
+
+class TestFollowPathConstantSpeed:
+    def test_follow_path_moves_at_constant_speed(self):
+        sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        action = FollowPathUntil([(0, 0), (1, 0), (2, 0), (300, 0)], velocity=600, condition=infinite)
+        action.apply(sprite)
+
+        xs = []
+        for _ in range(20):
+            Action.update_all(1 / 60)
+            xs.append(sprite.center_x)
+
+        steps = [b - a for a, b in zip(xs, xs[1:], strict=False)]
+        assert steps == pytest.approx([10.0] * len(steps), rel=1e-2)
+
+    def test_actions_on_the_same_path_share_one_curve(self):
+        path = [(0, 0), (100, 200), (200, 0)]
+        first = FollowPathUntil(list(path), velocity=100, condition=infinite)
+        second = FollowPathUntil(list(path), velocity=100, condition=infinite)
+        first.apply(arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE))
+        second.apply(arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE))
+
+        assert first._get_curve() is second._get_curve()
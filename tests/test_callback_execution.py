@@ -340,3 +340,84 @@ class TestCallbackExecution:
         assert len(received) == 1
         assert received[0]["args"] == ("arg1", "arg2")
         assert received[0]["kwargs"] == {}
+
+    # --- Arity Caching ---
+
+    def test_zero_arg_callback_called_once_without_retry(self):
+        """Callbacks are called once with the arguments their signature accepts."""
+        calls = []
+
+        def callback():
+            calls.append(True)
+
+        Action.debug_level = 0
+        Action._execute_callback_impl(callback, "unwanted_arg")
+
+        assert calls == [True]
+
+    def test_type_error_inside_callback_is_not_retried(self):
+        """A TypeError raised by the callback body must not be mistaken for a signature mismatch."""
+        calls = []
+
+        def callback(data):
+            calls.append(data)
+            raise TypeError("bug inside callback")
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            Action._execute_callback_impl(callback, "payload")
+
+        assert calls == ["payload"]
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+    def test_bound_method_arity_excludes_self(self):
+        """Bound methods receive arguments after self."""
+        received = []
+
+        class Listener:
+            def on_event(self, sprite, axis):
+                received.append((sprite, axis))
+
+        Action.debug_level = 0
+        Action._execute_callback_impl(Listener().on_event, "sprite", "x", "right")
+
+        assert received == [("sprite", "x")]
+
+    def test_arity_cache_does_not_keep_callbacks_alive(self):
+        """The arity cache holds callbacks weakly."""
+        import gc
+        import weakref
+
+        from arcadeactions._callback_arity import _arity_cache, callback_arity
+
+        def callback(data):
+            pass
+
+        assert callback_arity(callback) == (1, 1)
+        assert callback in _arity_cache
+        ref = weakref.ref(callback)
+        del callback
+        gc.collect()
+
+        assert ref() is None
+
+    def test_arity_resolution(self):
+        """Arity is (required, maximum) positional args, or None when it can't be known up front."""
+        from arcadeactions._callback_arity import VARIADIC, callback_arity
+
+        def defaults(a, b=1):
+            pass
+
+        def with_varargs(a, *rest):
+            pass
+
+        def only_varargs(*args):
+            pass
+
+        def keyword_only(a, *, b):
+            pass
+
+        assert callback_arity(defaults) == (1, 2)
+        assert callback_arity(with_varargs) == (1, VARIADIC)
+        assert callback_arity(only_varargs) is None
+        assert callback_arity(keyword_only) is None
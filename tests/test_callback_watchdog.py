@@ -0,0 +1,136 @@
+"""Tests for the opt-in slow-callback watchdog."""
+
+import inspect
+
+import arcade
+import pytest
+
+from arcadeactions import Action, get_callback_watchdog, sequence, set_callback_watchdog
+from arcadeactions.conditional import CallbackUntil, DelayFrames, MoveUntil
+from arcadeactions.frame_conditions import after_frames, infinite
+from arcadeactions.frame_timing import every_frames
+from arcadeactions.visualizer.instrumentation import DebugDataStore
+
+
+@pytest.fixture(autouse=True)
+def cleanup_watchdog():
+    get_callback_watchdog().clear()
+    yield
+    Action.stop_all()
+    Action.set_debug_store(None)
+    set_callback_watchdog(False)
+    get_callback_watchdog().clear()
+
+
+def _sprite() -> arcade.Sprite:
+    return arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+
+
+def spawn_wave():
+    pass
+
+
+def test_disabled_watchdog_reports_nothing():
+    set_callback_watchdog(False, threshold_ms=0)
+    action = CallbackUntil(spawn_wave, infinite).apply(_sprite(), tag="spawner")
+
+    Action.update_all(1 / 60)
+
+    assert action._apply_site is None
+    assert get_callback_watchdog().reports() == []
+
+
+def test_reports_callback_until_with_apply_site():
+    set_callback_watchdog(True, threshold_ms=0)
+    apply_line = inspect.currentframe().f_lineno + 1
+    CallbackUntil(every_frames(1, spawn_wave), infinite).apply(_sprite(), tag="spawner")
+
+    Action.update_all(1 / 60)
+
+    (report,) = [report for report in get_callback_watchdog().reports() if report.kind == "callback"]
+    assert report.callback.endswith("every_frames.<locals>.ticker")
+    assert report.kind == "callback"
+    assert report.action_type == "CallbackUntil"
+    assert report.tag == "spawner"
+    assert report.apply_site == f"{__file__}:{apply_line}"
+    assert report.frame == Action.current_frame()
+
+
+def test_reports_on_stop_and_conditions():
+    set_callback_watchdog(True, threshold_ms=0)
+    stopped = []
+    MoveUntil((1, 0), after_frames(1), on_stop=lambda: stopped.append(True)).apply(_sprite(), tag="enemy")
+
+    Action.update_all(1 / 60)
+
+    kinds = {(report.kind, report.tag) for report in get_callback_watchdog().reports()}
+    assert stopped == [True]
+    assert ("condition", "enemy") in kinds
+    assert ("callback", "enemy") in kinds
+
+
+def test_threshold_filters_fast_calls():
+    set_callback_watchdog(True, threshold_ms=1000)
+    CallbackUntil(spawn_wave, infinite).apply(_sprite())
+
+    Action.update_all(1 / 60)
+
+    assert get_callback_watchdog().reports() == []
+
+
+def test_summary_aggregates_per_offender():
+    set_callback_watchdog(True, threshold_ms=0)
+    CallbackUntil(spawn_wave, infinite).apply(_sprite(), tag="spawner")
+
+    for _ in range(3):
+        Action.update_all(1 / 60)
+
+    (entry,) = [item for item in get_callback_watchdog().summary() if item["kind"] == "callback"]
+    assert entry["callback"].endswith("spawn_wave")
+    assert entry["count"] == 3
+    assert entry["max_ms"] <= entry["total_ms"]
+
+
+def test_composite_children_report_composite_apply_site():
+    set_callback_watchdog(True, threshold_ms=0)
+    seq = sequence(DelayFrames(1), CallbackUntil(spawn_wave, infinite)).apply(_sprite(), tag="wave")
+
+    for _ in range(3):
+        Action.update_all(1 / 60)
+
+    callback_reports = [
+        report for report in get_callback_watchdog().reports() if report.callback.endswith("spawn_wave")
+    ]
+    assert callback_reports
+    assert all(report.apply_site == seq._apply_site for report in callback_reports)
+    assert seq._apply_site.startswith(__file__)
+
+
+def test_reports_go_to_debug_store():
+    store = DebugDataStore()
+    Action.set_debug_store(store)
+    set_callback_watchdog(True, threshold_ms=0)
+    CallbackUntil(spawn_wave, infinite).apply(_sprite(), tag="spawner")
+
+    Action.update_all(1 / 60)
+
+    events = [event for event in store.events if event.event_type == "slow_callback"]
+    assert events
+    assert events[0].tag == "spawner"
+    assert events[0].details["callback"].endswith("spawn_wave")
+
+
+def test_capacity_and_threshold_validation():
+    set_callback_watchdog(True, threshold_ms=0, capacity=2)
+    CallbackUntil(spawn_wave, infinite).apply(_sprite())
+
+    for _ in range(5):
+        Action.update_all(1 / 60)
+
+    watchdog = get_callback_watchdog()
+    # One callback and one condition report per frame
+    assert len(watchdog.reports()) == 2
+    assert watchdog.dropped == 8
+    with pytest.raises(ValueError):
+        set_callback_watchdog(True, threshold_ms=-1)
+    set_callback_watchdog(False, threshold_ms=2.0, capacity=256)
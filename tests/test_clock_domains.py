@@ -0,0 +1,144 @@
+"""Tests for named clock domains that scale or pause groups of actions."""
+
+import arcade
+import pytest
+
+from arcadeactions import Action, get_clock_domain, reset_clock_domains, set_clock_paused, set_clock_scale
+from arcadeactions.composite import sequence
+from arcadeactions.conditional import FollowPathUntil, MoveUntil, RotateUntil, TweenUntil
+from arcadeactions.frame_conditions import after_frames, infinite
+
+
+@pytest.fixture(autouse=True)
+def cleanup_clock_domains():
+    reset_clock_domains()
+    yield
+    Action.stop_all()
+    reset_clock_domains()
+
+
+def _sprite() -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+    sprite.position = (100, 100)
+    return sprite
+
+
+def _frames_until_done(action: Action, limit: int = 100) -> int:
+    for frame in range(1, limit + 1):
+        Action.update_all(1 / 60)
+        if action.done:
+            return frame
+    raise AssertionError("action did not finish")
+
+
+def test_half_speed_domain_counts_frames_in_ticks():
+    set_clock_scale("enemies", 0.5)
+    sprite = _sprite()
+    action = MoveUntil((4, 0), after_frames(4)).apply(sprite, clock="enemies")
+
+    assert sprite.change_x == pytest.approx(2)
+    assert _frames_until_done(action) == 8
+
+
+def test_double_speed_domain_counts_two_ticks_per_frame():
+    set_clock_scale("enemies", 2.0)
+    action = MoveUntil((4, 0), after_frames(4)).apply(_sprite(), clock="enemies")
+
+    assert _frames_until_done(action) == 2
+    assert get_clock_domain("enemies").ticks == 4
+
+
+def test_slow_domain_moves_paths_every_frame():
+    set_clock_scale("enemies", 0.3)
+    sprite = _sprite()
+    FollowPathUntil([(0, 0), (1, 0), (2, 0), (300, 0)], velocity=600, condition=infinite).apply(sprite, clock="enemies")
+
+    xs = []
+    for _ in range(20):
+        Action.update_all(1 / 60)
+        xs.append(sprite.center_x)
+
+    steps = [b - a for a, b in zip(xs, xs[1:], strict=False)]
+    assert steps == pytest.approx([3.0] * len(steps), rel=1e-2)
+
+
+def test_slow_domain_tweens_every_frame():
+    set_clock_scale("effects", 0.3)
+    sprite = _sprite()
+    action = TweenUntil(0.0, 60.0, "center_x", after_frames(60)).apply(sprite, clock="effects")
+
+    xs = []
+    for _ in range(10):
+        Action.update_all(1 / 60)
+        xs.append(sprite.center_x)
+
+    steps = [b - a for a, b in zip(xs, xs[1:], strict=False)]
+    assert steps == pytest.approx([0.3] * len(steps))
+    assert _frames_until_done(action, limit=300) + 10 == 200
+    assert sprite.center_x == pytest.approx(60.0)
+
+
+def test_unbound_actions_keep_frame_clock():
+    set_clock_scale("enemies", 0.5)
+    MoveUntil((4, 0), infinite).apply(_sprite(), clock="enemies")
+    sprite = _sprite()
+    action = MoveUntil((4, 0), after_frames(4)).apply(sprite)
+
+    assert _frames_until_done(action) == 4
+
+
+def test_scale_change_is_applied_in_next_update():
+    sprite = _sprite()
+    MoveUntil((4, 0), infinite).apply(sprite, clock="enemies")
+
+    set_clock_scale("enemies", 0.25)
+    # The call itself only flags the domain
+    assert sprite.change_x == pytest.approx(4)
+
+    Action.update_all(1 / 60)
+    assert sprite.change_x == pytest.approx(1)
+
+    set_clock_scale("enemies", 1.0)
+    Action.update_all(1 / 60)
+    assert sprite.change_x == pytest.approx(4)
+
+
+def test_paused_domain_freezes_velocity_and_frame_counts():
+    sprite = _sprite()
+    action = MoveUntil((4, 0), after_frames(3)).apply(sprite, clock="enemies")
+
+    set_clock_paused("enemies", True)
+    for _ in range(10):
+        Action.update_all(1 / 60)
+    assert sprite.change_x == 0
+    assert not action.done
+
+    set_clock_paused("enemies", False)
+    assert _frames_until_done(action) == 3
+
+
+def test_rotation_is_scaled():
+    sprite = _sprite()
+    RotateUntil(10, infinite).apply(sprite, clock="effects")
+
+    set_clock_scale("effects", 0.5)
+    Action.update_all(1 / 60)
+
+    assert sprite.change_angle == pytest.approx(5)
+
+
+def test_composite_children_start_at_domain_scale():
+    set_clock_scale("enemies", 0.5)
+    sprite = _sprite()
+    sequence(MoveUntil((4, 0), after_frames(2)), MoveUntil((0, 6), infinite)).apply(sprite, clock="enemies")
+
+    assert sprite.change_x == pytest.approx(2)
+    for _ in range(6):
+        Action.update_all(1 / 60)
+
+    assert sprite.change_y == pytest.approx(3)
+
+
+def test_negative_scale_rejected():
+    with pytest.raises(ValueError):
+        set_clock_scale("enemies", -1)
@@ -0,0 +1,139 @@
+"""Tests for the per-frame collision broker."""
+
+import random
+
+import arcade
+import pytest
+
+from arcadeactions import Action, collides_with, first_hit, register_collision_list, unregister_collision_list
+from arcadeactions.collisions import CollisionBroker
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+
+
+def _sprite(x: float, y: float, size: int = 16) -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(size, size, color=arcade.color.WHITE)
+    sprite.center_x = x
+    sprite.center_y = y
+    return sprite
+
+
+class _Frames:
+    def __init__(self):
+        self.frame = 0
+
+    def __call__(self) -> int:
+        return self.frame
+
+
+class TestCollisionBroker:
+    def test_matches_arcade_collision_checks_while_sprites_move(self):
+        rng = random.Random(11)
+        frames = _Frames()
+        broker = CollisionBroker(frame_source=frames)
+        targets = arcade.SpriteList()
+        for _ in range(40):
+            targets.append(_sprite(rng.uniform(0, 400), rng.uniform(0, 400), size=rng.choice((8, 16, 40))))
+        bullets = [_sprite(rng.uniform(0, 400), rng.uniform(0, 400), size=6) for _ in range(60)]
+        broker.register("targets", targets)
+
+        for _ in range(10):
+            frames.frame += 1
+            for sprite in targets:
+                sprite.center_x += rng.uniform(-15, 15)
+                sprite.center_y += rng.uniform(-15, 15)
+            for bullet in bullets:
+                expected = arcade.check_for_collision_with_list(bullet, targets)
+                assert {id(s) for s in broker.collides_with(bullet, "targets")} == {id(s) for s in expected}
+
+    def test_answers_are_memoized_within_a_frame(self, monkeypatch):
+        frames = _Frames()
+        broker = CollisionBroker(frame_source=frames)
+        enemies = arcade.SpriteList()
+        enemies.append(_sprite(100, 100))
+        bullet = _sprite(100, 100, size=4)
+        broker.register("enemies", enemies)
+
+        calls = []
+        original = arcade.check_for_collision
+        monkeypatch.setattr(arcade, "check_for_collision", lambda a, b: calls.append(1) or original(a, b))
+
+        first = broker.collides_with(bullet, "enemies")
+        assert broker.collides_with(bullet, "enemies") is first
+        assert len(calls) == 1
+
+        frames.frame += 1
+        broker.collides_with(bullet, "enemies")
+        assert len(calls) == 2
+
+    def test_sprites_removed_mid_frame_are_not_reported(self):
+        frames = _Frames()
+        broker = CollisionBroker(frame_source=frames)
+        enemies = arcade.SpriteList()
+        enemy = _sprite(100, 100)
+        enemies.append(enemy)
+        bullet_a = _sprite(100, 100, size=4)
+        bullet_b = _sprite(102, 100, size=4)
+        broker.register("enemies", enemies)
+
+        assert broker.first_hit(bullet_a, "enemies") is enemy
+        enemy.remove_from_sprite_lists()
+
+        assert broker.collides_with(bullet_a, "enemies") == []
+        assert broker.first_hit(bullet_b, "enemies") is None
+
+    def test_sprites_added_mid_frame_appear_next_frame(self):
+        frames = _Frames()
+        broker = CollisionBroker(frame_source=frames)
+        enemies = arcade.SpriteList()
+        bullet = _sprite(100, 100, size=4)
+        broker.register("enemies", enemies)
+        assert broker.collides_with(bullet, "enemies") == []
+
+        enemy = _sprite(100, 100)
+        enemies.append(enemy)
+        assert broker.collides_with(bullet, "enemies") == []
+
+        frames.frame += 1
+        assert broker.collides_with(bullet, "enemies") == [enemy]
+
+    def test_query_sprite_is_not_its_own_hit(self):
+        broker = CollisionBroker(frame_source=_Frames())
+        enemies = arcade.SpriteList()
+        enemy = _sprite(100, 100)
+        neighbour = _sprite(110, 100)
+        enemies.extend([enemy, neighbour])
+        broker.register("enemies", enemies)
+
+        assert broker.collides_with(enemy, "enemies") == [neighbour]
+
+    def test_unknown_list_name_raises(self):
+        broker = CollisionBroker(frame_source=_Frames())
+        with pytest.raises(KeyError, match="ghosts"):
+            broker.collides_with(_sprite(0, 0), "ghosts")
+
+    def test_invalid_cell_size_raises(self):
+        broker = CollisionBroker(frame_source=_Frames())
+        with pytest.raises(ValueError, match="cell_size must be positive"):
+            broker.register("enemies", arcade.SpriteList(), cell_size=0)
+
+
+def test_module_helpers_follow_action_frames():
+    enemies = arcade.SpriteList()
+    enemy = _sprite(100, 100)
+    enemies.append(enemy)
+    bullet = _sprite(300, 100, size=4)
+    register_collision_list("test_enemies", enemies)
+    try:
+        assert collides_with(bullet, "test_enemies") == []
+        bullet.center_x = 100
+        assert collides_with(bullet, "test_enemies") == []
+
+        Action.update_all(1 / 60)
+        assert first_hit(bullet, "test_enemies") is enemy
+    finally:
+        unregister_collision_list("test_enemies")
@@ -586,6 +586,77 @@ class TestRepeatFunction:
         # Should still have velocity from repeat cycles
         assert sprite.change_x == 100
 
+    def test_repeat_reuse_rewinds_same_instance(self):
+        """reuse=True should restart the same child instead of cloning a new one."""
+        sprite = create_test_sprite()
+        rep = repeat(sequence(MoveUntil((5, 0), after_frames(2)), DelayFrames(1)), reuse=True)
+        rep.apply(sprite, tag="test_repeat")
+
+        advance_frames(1)
+        first = rep.current_action
+        advance_frames(3 * 3)
+
+        assert rep.current_action is first
+        assert sprite.change_x == 5
+
+    def test_repeat_reuse_matches_clone(self):
+        """Reused iterations should move sprites exactly like cloned iterations."""
+
+        def make_cycle():
+            return sequence(
+                MoveUntil((4, 0), after_frames(3)),
+                parallel(MoveUntil((0, -2), after_frames(2)), DelayFrames(3)),
+            )
+
+        cloned_sprite = create_test_sprite()
+        reused_sprite = create_test_sprite()
+        repeat(make_cycle()).apply(cloned_sprite)
+        repeat(make_cycle(), reuse=True).apply(reused_sprite)
+
+        for _ in range(40):
+            Action.update_all(0.016)
+            cloned_sprite.update()
+            reused_sprite.update()
+            assert reused_sprite.position == cloned_sprite.position
+        assert reused_sprite.center_x > 100
+
+    def test_repeat_reuse_falls_back_to_clone(self):
+        """Children without reuse support are still cloned each iteration."""
+        from arcadeactions.conditional import RotateUntil
+
+        sprite = create_test_sprite()
+        rep = repeat(RotateUntil(3, after_frames(2)), reuse=True)
+        rep.apply(sprite, tag="test_repeat")
+
+        advance_frames(1)
+        first = rep.current_action
+        advance_frames(2)
+
+        assert rep.current_action is not first
+        assert sprite.change_angle == 3
+
+    def test_repeat_reuse_keeps_boundary_callbacks(self):
+        """Boundary callbacks detached when an iteration ends come back on reuse."""
+        sprite = create_test_sprite()
+        sprite.center_x = 195
+        hits = []
+        move = MoveUntil(
+            (5, 0),
+            after_frames(2),
+            bounds=(0, 0, 200, 400),
+            boundary_behavior="limit",
+            on_boundary_enter=lambda s, axis, side: hits.append(side),
+        )
+        rep = repeat(sequence(move, DelayFrames(1)), reuse=True)
+        rep.apply(sprite, tag="test_repeat")
+
+        for _ in range(1 + 3 * 2):
+            Action.update_all(0.016)
+            sprite.update()
+
+        assert rep.current_action.actions[0].on_boundary_enter is not None
+        assert "right" in hits
+
 
 class TestRepeatIntegration:
     """Integration tests for repeat with other composite actions."""
@@ -3151,6 +3151,21 @@ class TestCallbackUntilCoverage(ActionTestBase):
         assert recorder.with_target >= 1
         assert recorder.with_target == recorder.without_target
 
+    def test_callback_type_error_propagates_instead_of_retrying(self, test_sprite):
+        """A TypeError from inside a target-taking callback is not retried as callback()."""
+        calls = []
+
+        def callback(target):
+            calls.append(target)
+            raise TypeError("bug inside callback")
+
+        action = CallbackUntil(callback=callback, condition=infinite)
+        action.apply(test_sprite, tag="callback_type_error")
+
+        with pytest.raises(TypeError, match="bug inside callback"):
+            action.update(1 / 60)
+        assert calls == [test_sprite]
+
     def test_after_frames_condition_simulated_timing_coverage(self, test_sprite):
         """Frame-based CallbackUntil conditions should complete deterministically."""
         action = CallbackUntil(
@@ -1,5 +1,6 @@
 """Tests for configurable debug logging system."""
 
+import arcade
 import pytest
 
 from arcadeactions import (
@@ -400,6 +401,50 @@ class TestDebugLogConditional:
         captured = capsys.readouterr()
         assert "[AA L3 CallbackUntil] verbose test message" in captured.out
 
+    def test_debug_gate_follows_configuration(self):
+        """The precomputed gate tracks set_debug_options, observe_actions and direct assignment."""
+        from arcadeactions._shared_logging import _debug_gate
+
+        assert not _debug_gate.lifecycle and not _debug_gate.verbose
+
+        set_debug_options(level=3, include_all=True)
+        assert _debug_gate.lifecycle and _debug_gate.verbose
+
+        # Level alone is not enough: nothing is observed
+        set_debug_options(level=3)
+        assert not _debug_gate.verbose
+
+        observe_actions("MoveUntil")
+        assert _debug_gate.verbose
+        assert _debug_gate.allows(3, "MoveUntil")
+        assert not _debug_gate.allows(3, "CallbackUntil")
+
+        Action.debug_level = 2
+        assert _debug_gate.lifecycle and not _debug_gate.verbose
+
+        Action.debug_level = 0
+        assert not _debug_gate.lifecycle
+
+    def test_disabled_logging_does_not_format_messages(self):
+        """With debugging off, per-frame log messages are never formatted."""
+        formatted = []
+
+        class Probe:
+            def __format__(self, spec):
+                formatted.append(spec)
+                return "probe"
+
+            __str__ = __repr__ = lambda self: format(self, "")
+
+        sprite = arcade.SpriteSolidColor(10, 10, color=arcade.color.WHITE)
+        MoveUntil((1, 0), infinite, bounds=(0, 0, 100, 100), boundary_behavior="bounce").apply(sprite, tag=Probe())
+        CallbackUntil(lambda: None, infinite).apply(sprite, tag=Probe())
+        for _ in range(3):
+            Action.update_all(1 / 60)
+        Action.stop_all()
+
+        assert formatted == []
+
 
 class TestNormalizeNames:
     """Test the _normalize_names helper function."""
@@ -41,3 +41,16 @@ def test_ease_rejects_invalid_frame_counts():
         pass
     else:
         raise AssertionError("Expected ValueError for non-positive frames")
+
+
+def test_ease_apply_takes_replace_positionally_like_action_apply():
+    from arcadeactions import Action, MoveUntil, infinite
+
+    sprite = arcade.Sprite()
+    first = Ease(MoveUntil((5, 0), infinite), frames=4).apply(sprite, "ease_smoke")
+    second = Ease(MoveUntil((1, 0), infinite), frames=4).apply(sprite, "ease_smoke", True)
+
+    active = list(Action._active_actions)
+    assert first not in active and first.wrapped_action not in active
+    assert second in active and second.wrapped_action in active
+    Action.stop_all()
@@ -0,0 +1,98 @@
+"""Tests for the fixed-timestep update_fixed driver and render interpolation."""
+
+import arcade
+import pytest
+
+from arcadeactions import Action, interpolated_position, interpolated_positions
+from arcadeactions.conditional import CallbackUntil, MoveUntil, TweenUntil
+from arcadeactions.frame_conditions import after_frames, infinite
+
+
+@pytest.fixture(autouse=True)
+def cleanup_fixed_step():
+    Action._fixed_step.reset()
+    yield
+    Action.stop_all()
+    Action._fixed_step.reset()
+
+
+def _sprite(x: float = 0, y: float = 0) -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+    sprite.position = (x, y)
+    return sprite
+
+
+def test_runs_whole_steps_and_carries_remainder():
+    deltas = []
+    CallbackUntil(lambda: None, infinite).apply(_sprite())
+
+    assert Action.update_fixed(1 / 120, on_step=deltas.append) == 0
+    assert Action.interpolation_alpha() == pytest.approx(0.5)
+    assert Action.update_fixed(1 / 120, on_step=deltas.append) == 1
+    assert Action.update_fixed(1 / 30, on_step=deltas.append) == 2
+
+    assert deltas == [pytest.approx(1 / 60)] * 3
+    assert Action.interpolation_alpha() == pytest.approx(0.0, abs=1e-6)
+
+
+def test_frame_conditions_count_simulated_steps():
+    sprite = _sprite()
+    action = MoveUntil((1, 0), after_frames(3)).apply(sprite)
+
+    # A dropped-frame hitch covering three steps finishes the action in one call
+    Action.update_fixed(3 / 60)
+
+    assert action.done
+
+
+def test_max_steps_caps_catch_up():
+    start = Action.current_frame()
+
+    steps = Action.update_fixed(1.0, max_steps=4)
+
+    assert steps == 4
+    assert Action._fixed_step.dropped_steps == 56
+    assert Action.current_frame() - start == 4
+    assert Action._fixed_step.accumulator < 1 / 60
+
+
+def test_interval_callbacks_see_fixed_delta():
+    calls = []
+    CallbackUntil(lambda: calls.append(True), infinite, seconds_between_calls=1 / 30).apply(_sprite())
+
+    # One long frame: six 1/60 s steps, firing at 1/30, 2/30 and 3/30 s
+    Action.update_fixed(0.1, max_steps=10)
+
+    assert len(calls) == 3
+
+
+def test_interpolated_position_between_last_two_steps():
+    sprites = arcade.SpriteList()
+    sprite = _sprite(0, 0)
+    sprites.append(sprite)
+    TweenUntil(0, 60, "center_x", after_frames(60)).apply(sprite)
+
+    Action.update_fixed(1 / 60 * 1.5)
+
+    assert sprite.center_x == pytest.approx(1.0)
+    assert Action.interpolation_alpha() == pytest.approx(0.5)
+    assert interpolated_position(sprite) == (pytest.approx(0.5), pytest.approx(0.0))
+
+    with interpolated_positions(sprites):
+        assert sprite.center_x == pytest.approx(0.5)
+    assert sprite.center_x == pytest.approx(1.0)
+
+
+def test_untracked_sprites_draw_at_current_position():
+    sprite = _sprite(10, 20)
+
+    Action.update_fixed(1 / 60 * 1.5)
+
+    assert interpolated_position(sprite) == (10, 20)
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        Action.update_fixed(1 / 60, step=0)
+    with pytest.raises(ValueError):
+        Action.update_fixed(1 / 60, max_steps=0)
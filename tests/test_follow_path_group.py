@@ -0,0 +1,152 @@
+"""Tests for FollowPathGroupUntil - one path action shared by a group of sprites."""
+
+import arcade
+import pytest
+
+from arcadeactions import Action, FollowPathGroupUntil, FollowPathUntil
+from arcadeactions.conditional import infinite
+from arcadeactions.formation import arrange_line
+from arcadeactions.group import AttackGroup
+
+PATH = [(0, 0), (100, 200), (300, 200), (400, 0)]
+
+
+def make_sprites(count: int) -> arcade.SpriteList:
+    sprites = arcade.SpriteList()
+    for index in range(count):
+        sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        sprite.position = (1000 + index, 1000)
+        sprites.append(sprite)
+    return sprites
+
+
+def run_frames(frames: int) -> None:
+    for _ in range(frames):
+        Action.update_all(1 / 60)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+
+
+class TestFollowPathGroupUntil:
+    def test_leader_matches_follow_path_until(self):
+        sprites = make_sprites(3)
+        single = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        FollowPathGroupUntil(PATH, velocity=240, condition=infinite, spacing_frames=5, rotate_with_path=True).apply(
+            sprites
+        )
+        FollowPathUntil(PATH, velocity=240, condition=infinite, rotate_with_path=True).apply(single)
+
+        for _ in range(30):
+            run_frames(1)
+            assert sprites[0].position == pytest.approx(single.position)
+            assert sprites[0].angle == pytest.approx(single.angle)
+
+    def test_spacing_frames_delays_followers(self):
+        sprites = make_sprites(3)
+        FollowPathGroupUntil(PATH, velocity=240, condition=infinite, spacing_frames=5).apply(sprites)
+
+        run_frames(4)
+        assert sprites[0].position != (0, 0)
+        assert sprites[1].position == (1001, 1000)
+        assert sprites[2].position == (1002, 1000)
+
+        run_frames(6)
+        # Follower 1 has travelled five frames fewer than the leader
+        assert sprites[1].position != (1001, 1000)
+        assert sprites[2].position == (1002, 1000)
+
+    def test_arc_length_spacing(self):
+        sprites = make_sprites(2)
+        action = FollowPathGroupUntil(PATH, velocity=600, condition=infinite, spacing=50)
+        action.apply(sprites)
+
+        run_frames(3)  # leader at 30px, follower still 20px short of the start
+        assert sprites[1].position == (1001, 1000)
+
+        run_frames(10)
+        leader = action._riders[sprites[0]]
+        follower = action._riders[sprites[1]]
+        assert leader.distance - follower.distance == pytest.approx(50)
+
+    def test_per_sprite_completion(self):
+        sprites = make_sprites(3)
+        finished = []
+        stopped = []
+        action = FollowPathGroupUntil(
+            [(0, 0), (100, 0)],
+            velocity=600,
+            condition=infinite,
+            on_stop=lambda: stopped.append(True),
+            spacing_frames=2,
+            on_sprite_complete=finished.append,
+        )
+        action.apply(sprites)
+
+        run_frames(10)
+        assert finished == [sprites[0]]
+        assert not action.done
+        assert sprites[0].position == (100, 0)
+
+        run_frames(4)
+        assert finished == list(sprites)
+        assert action.done
+        assert stopped == [True]
+
+    def test_explicit_delays(self):
+        sprites = make_sprites(2)
+        FollowPathGroupUntil(PATH, velocity=240, condition=infinite, delays=[3, 0]).apply(sprites)
+
+        run_frames(2)
+        assert sprites[0].position == (1000, 1000)
+        assert sprites[1].position != (1001, 1000)
+
+    def test_removed_sprites_do_not_block_completion(self):
+        sprites = make_sprites(2)
+        action = FollowPathGroupUntil([(0, 0), (100, 0)], velocity=600, condition=infinite, spacing_frames=30)
+        action.apply(sprites)
+
+        run_frames(12)
+        sprites[1].remove_from_sprite_lists()
+        run_frames(1)
+
+        assert action.done
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            FollowPathGroupUntil([(0, 0)], velocity=100, condition=infinite)
+        with pytest.raises(ValueError):
+            FollowPathGroupUntil(PATH, velocity=100, condition=infinite, spacing=-1)
+
+    def test_batched_matches_unbatched(self):
+        pytest.importorskip("numpy")
+        plain = make_sprites(6)
+        batched = make_sprites(6)
+        options = {"spacing_frames": 3, "spacing": 10, "rotate_with_path": True}
+        FollowPathGroupUntil(PATH, velocity=300, condition=infinite, **options).apply(plain)
+        FollowPathGroupUntil(PATH, velocity=300, condition=infinite, batched=True, **options).apply(batched)
+
+        for _ in range(90):
+            run_frames(1)
+            for expected, actual in zip(plain, batched, strict=True):
+                assert actual.position == pytest.approx(expected.position)
+                assert actual.angle == pytest.approx(expected.angle)
+
+
+class TestEntryPathUsesGroupAction:
+    def test_entry_path_applies_one_path_action(self):
+        sprites = make_sprites(5)
+        group = AttackGroup(sprites, group_id="convoy")
+        group.place(arrange_line, start_x=100, start_y=400, spacing=50)
+
+        group.entry_path([(400, -100), (400, 200), (100, 400)], velocity=600, spacing_frames=2)
+
+        path_actions = [action for action in Action._active_actions if isinstance(action, FollowPathGroupUntil)]
+        assert len(path_actions) == 1
+
+        run_frames(200)
+        for sprite in sprites:
+            assert sprite.position == pytest.approx(group.get_home_slot(sprite), abs=0.5)
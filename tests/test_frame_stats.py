@@ -0,0 +1,103 @@
+"""Tests for the opt-in frame stats collector in Action.update_all."""
+
+import arcade
+import pytest
+
+from arcadeactions import Action, get_frame_stats, set_frame_stats
+from arcadeactions._frame_stats import PHASES, FrameStats
+from arcadeactions.conditional import MoveUntil
+from arcadeactions.easing import Ease
+from arcadeactions.frame_conditions import infinite
+
+
+@pytest.fixture(autouse=True)
+def cleanup_stats():
+    get_frame_stats().reset()
+    yield
+    Action.stop_all()
+    set_frame_stats(False)
+    get_frame_stats().reset()
+
+
+def _sprite() -> arcade.Sprite:
+    return arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+
+
+def test_disabled_collector_records_nothing():
+    MoveUntil((1, 0), infinite).apply(_sprite())
+
+    Action.update_all(1 / 60)
+
+    stats = get_frame_stats()
+    assert stats.frames_recorded == 0
+    assert stats.last_frame() == {}
+    assert stats.by_class() == {}
+
+
+def test_records_every_phase_per_frame():
+    set_frame_stats(True)
+    MoveUntil((1, 0), infinite).apply(_sprite())
+
+    for _ in range(3):
+        Action.update_all(1 / 60)
+
+    stats = get_frame_stats()
+    assert stats.frames_recorded == 3
+    assert set(stats.last_frame()) == set(PHASES)
+    assert stats.frame_numbers() == [Action.current_frame() - 2, Action.current_frame() - 1, Action.current_frame()]
+    assert len(stats.phase_history("action_updates")) == 3
+    assert all(total >= 0 for total in stats.frame_totals())
+
+
+def test_per_class_and_per_tag_totals():
+    set_frame_stats(True)
+    sprite = _sprite()
+    MoveUntil((1, 0), infinite).apply(sprite, tag="enemies")
+    Ease(MoveUntil((0, 1), infinite), frames=60).apply(_sprite(), tag="player")
+
+    for _ in range(4):
+        Action.update_all(1 / 60)
+
+    stats = get_frame_stats()
+    by_class = stats.by_class()
+    assert by_class["Ease"][1] == 4
+    assert by_class["MoveUntil"][1] >= 4
+    by_tag = stats.by_tag()
+    assert by_tag["enemies"][1] == 4
+    assert by_tag["player"][1] == 4
+
+
+def test_ring_buffer_keeps_only_capacity_frames():
+    set_frame_stats(True, capacity=4)
+
+    for _ in range(10):
+        Action.update_all(1 / 60)
+
+    stats = get_frame_stats()
+    assert stats.capacity == 4
+    assert stats.frames_recorded == 10
+    assert len(stats.frame_numbers()) == 4
+    assert stats.frame_numbers() == sorted(stats.frame_numbers())
+    assert len(stats.phase_history("rebuild", frames=2)) == 2
+    set_frame_stats(False, capacity=240)
+
+
+def test_disabling_keeps_recorded_data():
+    set_frame_stats(True)
+    Action.update_all(1 / 60)
+    set_frame_stats(False)
+    Action.update_all(1 / 60)
+
+    assert get_frame_stats().frames_recorded == 1
+
+
+def test_phase_averages_and_capacity_validation():
+    stats = FrameStats(capacity=2)
+    assert stats.phase_averages() == {}
+
+    start = stats.begin_frame()
+    stats.mark(0, start - 0.001)
+
+    assert stats.phase_averages()["frame_counter"] >= 1000
+    with pytest.raises(ValueError):
+        FrameStats(capacity=0)
@@ -0,0 +1,101 @@
+"""Tests for the off-screen LOD policy that parks opted-in actions."""
+
+import arcade
+import pytest
+
+from arcadeactions import Action, clear_lod_policy, set_lod_policy, set_lod_viewport
+from arcadeactions.conditional import MoveUntil
+from arcadeactions.frame_conditions import after_frames, infinite
+
+VIEWPORT = (0, 0, 800, 600)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_lod():
+    clear_lod_policy()
+    yield
+    Action.stop_all()
+    clear_lod_policy()
+
+
+def _sprite(x: float, y: float) -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+    sprite.position = (x, y)
+    return sprite
+
+
+def _frames_until_done(action: Action, limit: int = 100) -> int:
+    for frame in range(1, limit + 1):
+        Action.update_all(1 / 60)
+        if action.done:
+            return frame
+    raise AssertionError("action did not finish")
+
+
+def test_offscreen_action_is_parked_for_interval():
+    set_lod_policy(VIEWPORT, interval=4, tags=["scenery"])
+    action = MoveUntil((1, 0), infinite).apply(_sprite(-500, 300), tag="scenery")
+
+    Action.update_all(1 / 60)
+
+    assert action._wake_frame == Action.current_frame() + 4
+
+
+def test_offscreen_after_frames_still_stops_on_exact_frame():
+    set_lod_policy(VIEWPORT, interval=4, classes=[MoveUntil])
+    action = MoveUntil((1, 0), after_frames(10)).apply(_sprite(2000, 300))
+
+    assert _frames_until_done(action) == 10
+
+
+def test_onscreen_action_keeps_full_rate():
+    set_lod_policy(VIEWPORT, interval=4, tags=["scenery"])
+    action = MoveUntil((1, 0), infinite).apply(_sprite(400, 300), tag="scenery")
+
+    Action.update_all(1 / 60)
+
+    assert action._wake_frame is None
+
+
+def test_margin_counts_as_onscreen():
+    set_lod_policy(VIEWPORT, margin=64, interval=4, tags=["scenery"])
+    action = MoveUntil((1, 0), infinite).apply(_sprite(-40, 300), tag="scenery")
+
+    Action.update_all(1 / 60)
+
+    assert action._wake_frame is None
+
+
+def test_actions_not_opted_in_keep_full_rate():
+    set_lod_policy(VIEWPORT, interval=4, tags=["scenery"])
+    action = MoveUntil((1, 0), infinite).apply(_sprite(-500, 300), tag="enemy")
+
+    Action.update_all(1 / 60)
+
+    assert action._wake_frame is None
+
+
+def test_bounded_movement_keeps_full_rate():
+    set_lod_policy(VIEWPORT, interval=4, tags=["scenery"])
+    action = MoveUntil((1, 0), infinite, bounds=(-1000, 0, 1000, 600), boundary_behavior="wrap").apply(
+        _sprite(-500, 300), tag="scenery"
+    )
+
+    Action.update_all(1 / 60)
+
+    assert action._wake_frame is None
+
+
+def test_moving_the_viewport_changes_what_is_offscreen():
+    set_lod_policy(VIEWPORT, interval=4, tags=["scenery"])
+    action = MoveUntil((1, 0), infinite).apply(_sprite(1200, 300), tag="scenery")
+    set_lod_viewport((1000, 0, 1800, 600))
+
+    Action.update_all(1 / 60)
+
+    assert action._wake_frame is None
+
+
+def test_invalid_interval_rejected():
+    with pytest.raises(ValueError):
+        set_lod_policy(VIEWPORT, interval=0)
@@ -0,0 +1,157 @@
+"""Tests for the NumPy-batched MoveUntil path (``MoveUntil(batched=True)``)."""
+
+import random
+
+import arcade
+import pytest
+
+from arcadeactions._movement_batch import MoveUntilBatchEngine
+from arcadeactions.base import Action
+from arcadeactions.conditional import MoveUntil, infinite
+from arcadeactions.frame_timing import after_frames
+
+pytest.importorskip("numpy")
+
+BOUNDS = (0, 0, 400, 300)
+
+
+def _make_sprites(seed: int, count: int = 40) -> arcade.SpriteList:
+    rng = random.Random(seed)
+    sprites = arcade.SpriteList()
+    for _ in range(count):
+        sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        sprite.center_x = rng.uniform(10, 390)
+        sprite.center_y = rng.uniform(10, 290)
+        sprites.append(sprite)
+    return sprites
+
+
+def _run(batched: bool, behavior: str | None, velocity: tuple[float, float], frames: int = 120):
+    """Run a MoveUntil over a seeded sprite list; return final state and callback log."""
+    sprites = _make_sprites(seed=7)
+    index = {id(sprite): i for i, sprite in enumerate(sprites)}
+    events = []
+
+    def on_enter(sprite, axis, side):
+        events.append(("enter", index[id(sprite)], axis, side))
+
+    def on_exit(sprite, axis, side):
+        events.append(("exit", index[id(sprite)], axis, side))
+
+    action = MoveUntil(
+        velocity,
+        infinite,
+        bounds=BOUNDS if behavior else None,
+        boundary_behavior=behavior,
+        on_boundary_enter=on_enter,
+        on_boundary_exit=on_exit,
+        batched=batched,
+    )
+    action.apply(sprites)
+
+    if velocity == (0, 0):
+        # Boundary-only action: sprites carry their own velocities
+        rng = random.Random(11)
+        for sprite in sprites:
+            sprite.change_x = rng.uniform(-6, 6)
+            sprite.change_y = rng.uniform(-6, 6)
+
+    for _ in range(frames):
+        Action.update_all(1 / 60)
+        sprites.update()
+
+    state = [(s.center_x, s.center_y, s.change_x, s.change_y) for s in sprites]
+    Action.stop_all()
+    return state, events
+
+
+class TestMoveUntilBatched:
+    """The batched path must be observably identical to the per-sprite path."""
+
+    def teardown_method(self):
+        Action.stop_all()
+
+    @pytest.mark.parametrize("behavior", ["bounce", "wrap", "limit", None])
+    @pytest.mark.parametrize("velocity", [(5, -3), (0, 0)])
+    def test_batched_matches_unbatched(self, behavior, velocity):
+        expected_state, expected_events = _run(False, behavior, velocity)
+        actual_state, actual_events = _run(True, behavior, velocity)
+
+        assert actual_state == pytest.approx(expected_state)
+        assert actual_events == expected_events
+
+    def test_batched_bounce_fires_callbacks(self):
+        _, events = _run(True, "bounce", (5, -3))
+        assert any(kind == "enter" for kind, *_ in events)
+        assert any(kind == "exit" for kind, *_ in events)
+
+    def test_batched_single_sprite(self):
+        sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        sprite.center_x = 395
+        sprite.center_y = 150
+        action = MoveUntil((5, 0), infinite, bounds=BOUNDS, boundary_behavior="bounce", batched=True)
+        action.apply(sprite)
+
+        Action.update_all(1 / 60)
+        sprite.update()
+        Action.update_all(1 / 60)
+
+        assert sprite.change_x < 0
+
+    def test_clone_preserves_batched(self):
+        action = MoveUntil((1, 0), infinite, batched=True)
+        clone = action.clone()
+        assert clone.batched is True
+        assert clone._batch_engine is action._batch_engine
+
+    def test_velocity_provider_uses_scalar_path(self):
+        sprites = _make_sprites(seed=3, count=5)
+        action = MoveUntil((0, 0), infinite, velocity_provider=lambda: (2, 1), batched=True)
+        action.apply(sprites)
+
+        Action.update_all(1 / 60)
+
+        assert all(sprite.change_x == 2 and sprite.change_y == 1 for sprite in sprites)
+
+    def test_instances_share_one_engine_step_per_frame(self, mocker):
+        """Many batched actions with the same bounds are stepped together by batch_update."""
+
+        def run(batched: bool):
+            sprites = _make_sprites(seed=5, count=30)
+            hits = []
+            for sprite in sprites:
+                MoveUntil(
+                    (4, -2),
+                    infinite,
+                    bounds=BOUNDS,
+                    boundary_behavior="bounce",
+                    on_boundary_enter=lambda s, axis, side: hits.append((axis, side)),
+                    batched=batched,
+                ).apply(sprite)
+            for _ in range(90):
+                Action.update_all(1 / 60)
+                sprites.update()
+            state = [(s.center_x, s.center_y, s.change_x, s.change_y) for s in sprites]
+            Action.stop_all()
+            return state, sorted(hits)
+
+        expected = run(False)
+        step_spy = mocker.spy(MoveUntilBatchEngine, "step")
+
+        assert run(True) == expected
+        assert step_spy.call_count == 90
+
+    def test_batch_update_checks_conditions(self):
+        sprites = _make_sprites(seed=9, count=4)
+        stopped = []
+        actions = [
+            MoveUntil((1, 0), after_frames(3), on_stop=lambda: stopped.append(1), batched=True).apply(sprite)
+            for sprite in sprites
+        ]
+
+        for _ in range(3):
+            Action.update_all(1 / 60)
+
+        assert all(action.done for action in actions)
+        assert len(stopped) == len(sprites)
+        assert len(Action._active_actions) == 0
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import itertools
 import math
+import random
 from types import SimpleNamespace
 
 import arcade
@@ -12,11 +14,15 @@ from arcadeactions import Action
 from arcadeactions.pattern import (
     _calculate_velocity_to_target,
     _clone_formation_sprites,
+    _ConflictState,
     _create_precision_condition_and_callback,
     _determine_min_spacing,
     _find_nearest,
     _generate_arc_spawn_positions,
     _min_conflicts_sprite_assignment,
+    _optimal_sprite_assignment,
+    _paths_would_collide,
+    _sprites_would_collide_during_movement_with_assignments,
     _validate_entry_kwargs,
     create_bounce_pattern,
     create_figure_eight_pattern,
@@ -262,6 +268,150 @@ def test_min_conflicts_assignment_returns_mapping(monkeypatch):
     assert set(assignments.keys()) <= {0, 1}
 
 
+def _crowded_entry(rows: int, cols: int):
+    target = arcade.SpriteList()
+    for row in range(rows):
+        for col in range(cols):
+            spr = arcade.SpriteSolidColor(16, 16, color=arcade.color.WHITE)
+            spr.center_x = 120 + col * 50
+            spr.center_y = 350 + row * 40
+            target.append(spr)
+    spawns = _generate_arc_spawn_positions(target, (0, 0, 800, 600), _determine_min_spacing(target))
+    return target, spawns
+
+
+def _count_movement_conflicts(target, spawns, assignments) -> int:
+    sprite_ids = list(assignments)
+    return sum(
+        _sprites_would_collide_during_movement_with_assignments(a, b, target, spawns, assignments)
+        for i, a in enumerate(sprite_ids)
+        for b in sprite_ids[i + 1 :]
+    )
+
+
+def test_min_conflicts_assignment_is_deterministic_for_seed():
+    target, spawns = _crowded_entry(4, 6)
+
+    first = _min_conflicts_sprite_assignment(target, spawns, seed=3)
+    second = _min_conflicts_sprite_assignment(target, spawns, seed=3)
+
+    assert first == second
+    assert sorted(first.values()) == sorted(set(first.values()))
+
+
+def test_min_conflicts_assignment_reduces_greedy_conflicts():
+    target, spawns = _crowded_entry(6, 10)
+    greedy = {sprite_idx: sprite_idx for sprite_idx in range(len(target))}
+
+    assignments = _min_conflicts_sprite_assignment(target, spawns)
+
+    assert _count_movement_conflicts(target, spawns, assignments) < _count_movement_conflicts(target, spawns, greedy)
+
+
+def test_min_conflicts_assignment_stops_at_check_budget(monkeypatch):
+    target, spawns = _crowded_entry(10, 10)
+    checks = 0
+    original = _ConflictState._paths_conflict
+
+    def counting(self, *args):
+        nonlocal checks
+        checks += 1
+        return original(self, *args)
+
+    monkeypatch.setattr(_ConflictState, "_paths_conflict", counting)
+
+    _min_conflicts_sprite_assignment(target, spawns, max_checks=2000)
+
+    # The budget is checked between iterations; one iteration evaluates a handful of swaps
+    assert checks < 2000 + 12 * len(target)
+
+
+def test_min_conflicts_assignment_zero_iterations_keeps_initial_assignment():
+    target, spawns = _crowded_entry(2, 3)
+
+    assignments = _min_conflicts_sprite_assignment(target, spawns, max_iterations=0)
+
+    assert len(assignments) == len(target)
+
+
+def test_conflict_state_tracks_total_through_swaps():
+    target, spawns = _crowded_entry(4, 5)
+    state = _ConflictState(target, spawns, {sprite_idx: sprite_idx for sprite_idx in range(len(target))})
+    rng = random.Random(7)
+
+    def brute_force_total() -> int:
+        total = 0
+        ids = state.sprite_ids
+        for i, a in enumerate(ids):
+            for b in ids[i + 1 :]:
+                size = max(state.sizes[a], state.sizes[b]) * 0.8
+                total += _paths_would_collide(
+                    spawns[state.assignments[a]],
+                    state.targets[a],
+                    spawns[state.assignments[b]],
+                    state.targets[b],
+                    size,
+                    check_endpoints=False,
+                )
+        return total
+
+    assert state.total == brute_force_total()
+    for _ in range(30):
+        sprite1, sprite2 = rng.sample(state.sprite_ids, 2)
+        state.apply_swap(sprite1, sprite2, *state.evaluate_swap(sprite1, sprite2))
+        assert state.total == brute_force_total()
+
+
+def test_optimal_assignment_minimises_total_distance():
+    pytest.importorskip("numpy")
+    rng = random.Random(5)
+    target = arcade.SpriteList()
+    for _ in range(5):
+        spr = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        spr.center_x = rng.uniform(0, 800)
+        spr.center_y = rng.uniform(0, 600)
+        target.append(spr)
+    spawns = [(rng.uniform(0, 800), rng.uniform(0, 600)) for _ in range(6)]
+
+    def distance(sprite_idx: int, spawn_idx: int) -> float:
+        sprite = target[sprite_idx]
+        return math.hypot(sprite.center_x - spawns[spawn_idx][0], sprite.center_y - spawns[spawn_idx][1])
+
+    assignments = _optimal_sprite_assignment(target, spawns, len(target))
+    best = min(
+        sum(distance(sprite_idx, spawn_idx) for sprite_idx, spawn_idx in enumerate(choice))
+        for choice in itertools.permutations(range(len(spawns)), len(target))
+    )
+
+    assert sorted(assignments) == list(range(len(target)))
+    assert len(set(assignments.values())) == len(target)
+    assert sum(distance(sprite_idx, spawn_idx) for sprite_idx, spawn_idx in assignments.items()) == pytest.approx(best)
+
+
+def test_min_conflicts_assignment_starts_from_initial_assignments():
+    target, spawns = _crowded_entry(2, 3)
+    initial = {sprite_idx: len(target) - 1 - sprite_idx for sprite_idx in range(len(target))}
+
+    assignments = _min_conflicts_sprite_assignment(target, spawns, max_iterations=0, initial_assignments=initial)
+
+    assert assignments == initial
+    assert assignments is not initial
+
+
+def test_create_formation_entry_from_sprites_optimal_assignment():
+    pytest.importorskip("numpy")
+    target, _ = _crowded_entry(3, 4)
+
+    entries = create_formation_entry_from_sprites(target, window_bounds=(0, 0, 800, 600), assignment="optimal")
+
+    assert sorted(idx for _, _, idx in entries) == list(range(len(target)))
+
+
+def test_validate_entry_kwargs_rejects_unknown_assignment():
+    with pytest.raises(ValueError, match="assignment"):
+        _validate_entry_kwargs({"window_bounds": (0, 0, 800, 600), "assignment": "fastest"})
+
+
 def test_create_formation_entry_from_sprites_uses_helper_monkeypatched(monkeypatch):
     import arcadeactions.pattern as pattern_module
 
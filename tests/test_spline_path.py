@@ -0,0 +1,116 @@
+"""Tests for piecewise cubic spline paths."""
+
+from math import cos, hypot, pi, sin
+
+import arcade
+import pytest
+
+from arcadeactions import Action, FollowPathGroupUntil, FollowPathUntil, SplinePath
+from arcadeactions.conditional import infinite
+from arcadeactions.presets.entry_paths import circle_arc_waypoints
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+
+
+def ring(count: int, radius: float) -> list[tuple[float, float]]:
+    return [(radius * cos(2 * pi * i / count), radius * sin(2 * pi * i / count)) for i in range(count)]
+
+
+class TestSplinePath:
+    def test_catmull_rom_passes_through_waypoints(self):
+        waypoints = [(0, 0), (100, 80), (180, -40), (300, 20), (420, 0)]
+        path = SplinePath(waypoints)
+
+        assert path.segment_count == 4
+        for i, waypoint in enumerate(waypoints):
+            assert path.point(i / 4) == pytest.approx(waypoint)
+
+    def test_bezier_chain_reproduces_circle(self):
+        path = SplinePath(circle_arc_waypoints(0, 0, 100), kind="bezier")
+
+        assert path.length == pytest.approx(2 * pi * 100, rel=1e-3)
+        for i in range(60):
+            x, y = path.point_at_distance(path.length * i / 60)
+            assert hypot(x, y) == pytest.approx(100, abs=0.1)
+
+    def test_closed_loop_is_smooth_at_the_seam(self):
+        path = SplinePath(ring(40, 200), closed=True)
+
+        assert path.point(0.0) == pytest.approx(path.point(1.0))
+        assert path.angle_at_distance(0.0) == pytest.approx(90.0, abs=0.5)
+        assert path.angle_at_distance(path.length - 1e-6) == pytest.approx(90.0, abs=0.5)
+
+    def test_equal_distances_give_equal_chords(self):
+        path = SplinePath([(0, 0), (5, 0), (10, 0), (400, 0), (410, 50)])
+        step = path.length / 40
+        points = [path.point_at_distance(step * i) for i in range(41)]
+        chords = [hypot(b[0] - a[0], b[1] - a[1]) for a, b in zip(points, points[1:], strict=False)]
+
+        assert chords == pytest.approx([step] * 40, rel=2e-2)
+
+    def test_points_at_distances_matches_scalar_lookup(self):
+        np = pytest.importorskip("numpy")
+        path = SplinePath(ring(12, 150))
+        distances = np.linspace(-10, path.length + 10, 37)
+
+        xs, ys = path.points_at_distances(np, distances)
+
+        for distance, x, y in zip(distances.tolist(), xs.tolist(), ys.tolist(), strict=True):
+            assert (x, y) == pytest.approx(path.point_at_distance(distance), abs=1e-6)
+
+    def test_behaves_as_a_point_sequence(self):
+        waypoints = [(0, 0), (10, 10), (20, 0)]
+        path = SplinePath(waypoints)
+
+        assert len(path) == 3
+        assert list(path) == waypoints
+        assert path[-1] == (20, 0)
+
+    @pytest.mark.parametrize(
+        ("points", "kwargs", "message"),
+        [
+            ([(0, 0)], {}, "at least 2"),
+            ([(0, 0), (1, 1), (2, 2)], {"kind": "bezier"}, "3k \\+ 1"),
+            ([(0, 0), (1, 1), (2, 2), (3, 3)], {"kind": "bezier", "closed": True}, "closed"),
+            ([(0, 0), (1, 1)], {"kind": "hermite"}, "kind must be"),
+        ],
+    )
+    def test_rejects_invalid_input(self, points, kwargs, message):
+        with pytest.raises(ValueError, match=message):
+            SplinePath(points, **kwargs)
+
+
+class TestFollowSplinePath:
+    def test_follow_path_uses_analytic_heading(self):
+        sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+        path = SplinePath(ring(40, 200), closed=True)
+        action = FollowPathUntil(path, velocity=600, condition=infinite, rotate_with_path=True)
+        action.apply(sprite)
+
+        for _ in range(30):
+            Action.update_all(1 / 60)
+            x, y = sprite.position
+            assert hypot(x, y) == pytest.approx(200, abs=0.5)
+            # Tangent of a counter-clockwise circle points 90 degrees ahead of the radius
+            assert sprite.angle == pytest.approx(path.angle_at_distance(action._distance_travelled))
+
+    def test_group_follows_spline_path(self):
+        sprites = arcade.SpriteList()
+        sprites.extend(arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE) for _ in range(3))
+        path = SplinePath([(0, 0), (100, 0), (200, 100), (300, 100)])
+        finished = []
+        action = FollowPathGroupUntil(
+            path, velocity=1200, condition=infinite, spacing_frames=2, on_sprite_complete=finished.append
+        )
+        action.apply(sprites)
+
+        for _ in range(40):
+            Action.update_all(1 / 60)
+
+        assert len(finished) == 3
+        for sprite in sprites:
+            assert sprite.position == pytest.approx((300, 100))
@@ -0,0 +1,110 @@
+"""Tests for the weakly-keyed per-sprite state used by actions."""
+
+import gc
+
+import arcade
+import pytest
+
+from arcadeactions import Action
+from arcadeactions._sprite_state import SpriteStateMap
+from arcadeactions.conditional import MoveUntil, ParametricMotionUntil
+from arcadeactions.frame_conditions import infinite
+from arcadeactions.frame_timing import after_frames
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+
+
+def _sprite(x: float = 100.0, y: float = 100.0) -> arcade.Sprite:
+    sprite = arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+    sprite.center_x = x
+    sprite.center_y = y
+    return sprite
+
+
+class _Unreferenceable:
+    __slots__ = ()
+
+
+class TestSpriteStateMap:
+    def test_reads_by_sprite_id(self):
+        state = SpriteStateMap()
+        sprite = _sprite()
+        state.set_for(sprite, "a")
+
+        assert state[id(sprite)] == "a"
+        assert state.get_for(sprite) == "a"
+        assert state.setdefault_for(sprite, "b") == "a"
+        assert state == {id(sprite): "a"}
+
+    def test_entry_dropped_when_sprite_collected(self):
+        state = SpriteStateMap()
+        sprite = _sprite()
+        state.setdefault_for(sprite, {"x": "right", "y": None})
+        del sprite
+        gc.collect()
+
+        assert state == {}
+        assert not state._refs
+
+    def test_removed_entries_stop_tracking_sprite(self):
+        state = SpriteStateMap()
+        kept = _sprite()
+        dropped = _sprite()
+        state.set_for(kept, 1)
+        state.set_for(dropped, 2)
+
+        state.pop(id(dropped))
+        del state[id(kept)]
+
+        assert not state._refs
+        state.set_for(kept, 3)
+        state.clear()
+        assert not state._refs
+
+    def test_unreferenceable_objects_are_pinned_until_removed(self):
+        state = SpriteStateMap()
+        obj = _Unreferenceable()
+        state.set_for(obj, "pinned")
+        key = id(obj)
+        del obj
+
+        assert state[key] == "pinned"
+        state.clear()
+        assert not state._refs
+
+
+class TestActionSpriteState:
+    def test_bounce_state_does_not_outlive_sprites(self):
+        """Sprites churning through a bouncing MoveUntil don't accumulate boundary state."""
+        sprites = arcade.SpriteList()
+        action = MoveUntil((5, 0), infinite, bounds=(0, 0, 200, 200), boundary_behavior="bounce")
+        action.apply(sprites, tag="churn")
+
+        for _ in range(20):
+            sprite = _sprite(x=195)
+            sprites.append(sprite)
+            Action.update_all(1 / 60)
+            sprite.update()
+            Action.update_all(1 / 60)
+            sprites.remove(sprite)
+            del sprite
+        gc.collect()
+
+        assert len(action._boundary_state) == 0
+
+    def test_parametric_origins_released_with_sprites(self):
+        sprites = arcade.SpriteList()
+        sprites.extend([_sprite(), _sprite(x=150)])
+        action = ParametricMotionUntil(lambda t: (10 * t, 0), after_frames(30))
+        action.apply(sprites, tag="origins")
+        Action.update_all(1 / 60)
+        assert len(action._origins) == 2
+
+        sprites.pop()
+        gc.collect()
+
+        assert len(action._origins) == 1
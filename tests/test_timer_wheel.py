@@ -0,0 +1,184 @@
+"""Tests for the timer wheel that parks waiting actions between frames."""
+
+import random
+
+import arcade
+import pytest
+
+from arcadeactions import Action, DelayFrames, parallel, repeat, sequence
+from arcadeactions._timer_wheel import TimerWheel
+from arcadeactions.conditional import CallbackUntil, MoveUntil
+from arcadeactions.frame_timing import after_frames
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+
+
+def _sprite() -> arcade.Sprite:
+    return arcade.SpriteSolidColor(8, 8, color=arcade.color.WHITE)
+
+
+class TestTimerWheel:
+    def test_matches_brute_force_schedule(self):
+        rng = random.Random(3)
+        wheel = TimerWheel(now=4090)
+        expected: dict[int, int] = {}
+        for _ in range(600):
+            roll = rng.random()
+            if roll < 0.4:
+                item = rng.randrange(40)
+                frame = wheel.now + rng.choice([1, 63, 64, 65, rng.randrange(1, 5000), rng.randrange(1, 300_000)])
+                wheel.schedule(item, frame)
+                expected[item] = frame
+            elif roll < 0.5:
+                item = rng.randrange(40)
+                assert wheel.cancel(item) == (item in expected)
+                expected.pop(item, None)
+            else:
+                target = wheel.now + rng.choice([1, 5, 64, rng.randrange(1, 3000)])
+                fired = []
+                wheel.advance(target, lambda item, fired=fired: fired.append((wheel.now, item)))
+                due = sorted((frame, item) for item, frame in expected.items() if frame <= target)
+                assert sorted(fired) == due
+                for _, item in due:
+                    del expected[item]
+            assert len(wheel) == len(expected)
+
+    def test_schedule_in_past_fires_next_frame(self):
+        wheel = TimerWheel(now=10)
+        wheel.schedule("a", 3)
+        fired = []
+        wheel.advance(11, fired.append)
+        assert fired == ["a"]
+
+    def test_moving_backwards_fires_everything(self):
+        wheel = TimerWheel(now=100)
+        wheel.schedule("a", 500)
+        fired = []
+        wheel.advance(0, fired.append)
+        assert fired == ["a"]
+        assert wheel.now == 0
+        assert len(wheel) == 0
+
+
+class TestParkedActions:
+    def test_delay_frames_is_parked_and_fires_on_time(self):
+        stopped = []
+        action = DelayFrames(30, on_stop=lambda *_: stopped.append(Action.current_frame()))
+        action.apply(_sprite())
+        start = Action.current_frame()
+
+        Action.update_all(1 / 60)
+
+        assert action in Action._timer_wheel
+        assert action in Action._active_actions
+        assert action not in Action._active_actions.phases[1]
+
+        for _ in range(29):
+            Action.update_all(1 / 60)
+
+        assert stopped == [start + 30]
+        assert action not in Action._active_actions
+        assert len(Action._timer_wheel) == 0
+
+    def test_staggered_sequences_start_moving_on_the_same_frames(self):
+        sprites = [_sprite() for _ in range(5)]
+        started = {}
+        for index, sprite in enumerate(sprites):
+            sequence(
+                DelayFrames(10 * index, on_stop=lambda *_, i=index: started.setdefault(i, Action.current_frame())),
+                MoveUntil((1, 0), after_frames(3)),
+            ).apply(sprite)
+        start = Action.current_frame()
+
+        for _ in range(50):
+            Action.update_all(1 / 60)
+
+        assert started == {0: start + 1, **{index: start + 10 * index for index in range(1, 5)}}
+
+    def test_pause_credits_parked_frames(self):
+        sprite = _sprite()
+        action = DelayFrames(20)
+        action.apply(sprite)
+        other = CallbackUntil(lambda: None, after_frames(1000)).apply(sprite)
+
+        for _ in range(5):
+            Action.update_all(1 / 60)
+        action.pause()
+        for _ in range(10):
+            Action.update_all(1 / 60)
+        action.resume()
+        for _ in range(14):
+            Action.update_all(1 / 60)
+
+        assert not action.done
+        Action.update_all(1 / 60)
+        assert action.done
+        assert not other.done
+
+    def test_retagging_parked_action_keeps_its_schedule(self):
+        stopped = []
+        action = DelayFrames(30, on_stop=lambda *_: stopped.append(Action.current_frame()))
+        action.apply(_sprite(), tag="t")
+        start = Action.current_frame()
+
+        for _ in range(6):
+            Action.update_all(1 / 60)
+        action.tag = "other"
+
+        assert action in Action._timer_wheel
+        assert action not in Action._active_actions.phases[1]
+        assert Action.get_actions_by_tag("other") == [action]
+        assert Action.get_actions_by_tag("t") == []
+
+        for _ in range(24):
+            Action.update_all(1 / 60)
+
+        assert stopped == [start + 30]
+
+    def test_step_all_advances_parked_actions_one_frame_at_a_time(self):
+        action = DelayFrames(10).apply(_sprite())
+        Action.update_all(1 / 60)
+        Action.pause_all()
+
+        for _ in range(8):
+            Action.step_all(1 / 60)
+        assert not action.done
+        Action.step_all(1 / 60)
+        assert action.done
+
+    def test_stop_cancels_parked_action(self):
+        action = sequence(DelayFrames(40), MoveUntil((1, 0), after_frames(2))).apply(_sprite())
+        Action.update_all(1 / 60)
+        assert action in Action._timer_wheel
+
+        action.stop()
+
+        assert action not in Action._timer_wheel
+        assert action not in Action._active_actions
+
+    def test_parallel_and_repeat_wake_for_earliest_child(self):
+        calls = []
+        parallel(DelayFrames(5), DelayFrames(12, on_stop=lambda *_: calls.append("long"))).apply(_sprite())
+        repeat(
+            sequence(DelayFrames(4), CallbackUntil(lambda: calls.append("tick"), after_frames(1))), reuse=True
+        ).apply(_sprite())
+
+        for _ in range(12):
+            Action.update_all(1 / 60)
+
+        assert calls.count("tick") == 2
+        assert calls[-1] == "long"
+
+    def test_user_condition_keeps_delay_polled(self):
+        polls = []
+        action = DelayFrames(30, condition=lambda: polls.append(1) and False).apply(_sprite())
+
+        for _ in range(5):
+            Action.update_all(1 / 60)
+
+        assert len(polls) == 5
+        assert action not in Action._timer_wheel
@@ -0,0 +1,105 @@
+"""Tests for the structured trace subsystem."""
+
+import json
+
+import arcade
+import pytest
+
+from arcadeactions import (
+    Action,
+    clear_trace,
+    disable_trace,
+    enable_trace,
+    flush_trace,
+    get_trace_events,
+    is_trace_enabled,
+    repeat,
+)
+from arcadeactions.conditional import DelayFrames, ParametricMotionUntil
+from arcadeactions.frame_timing import after_frames
+from arcadeactions.trace import _tracer
+
+
+@pytest.fixture(autouse=True)
+def reset_trace():
+    disable_trace()
+    clear_trace()
+    yield
+    disable_trace()
+    clear_trace()
+
+
+def _run_repeat(frames: int) -> None:
+    sprite = arcade.SpriteSolidColor(10, 10, color=arcade.color.WHITE)
+    repeat(DelayFrames(2)).apply(sprite)
+    for _ in range(frames):
+        Action.update_all(1 / 60)
+    Action.stop_all()
+
+
+class TestTrace:
+    def test_disabled_by_default_records_nothing(self, mocker):
+        open_spy = mocker.patch("builtins.open")
+
+        _run_repeat(10)
+
+        assert not is_trace_enabled()
+        assert get_trace_events() == []
+        open_spy.assert_not_called()
+
+    def test_repeat_iterations_are_traced_in_memory(self):
+        enable_trace()
+
+        _run_repeat(10)
+
+        names = [event["event"] for event in get_trace_events()]
+        assert names.count("repeat_clone_start") >= 3
+        assert "repeat_clone_done" in names
+        assert all("time" in event for event in get_trace_events())
+
+    def test_parametric_motion_events(self):
+        enable_trace()
+        sprite = arcade.SpriteSolidColor(10, 10, color=arcade.color.WHITE)
+        ParametricMotionUntil(lambda t: (t * 10, 0), after_frames(3)).apply(sprite)
+        for _ in range(5):
+            Action.update_all(1 / 60)
+
+        names = [event["event"] for event in get_trace_events()]
+        assert names == ["param_motion_apply", "param_motion_update", "param_motion_removed"]
+
+    def test_ring_buffer_drops_oldest(self):
+        enable_trace(capacity=3)
+        for index in range(5):
+            _tracer.record("tick", index=index)
+
+        assert [event["index"] for event in get_trace_events()] == [2, 3, 4]
+        assert _tracer.dropped == 2
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError):
+            enable_trace(capacity=0)
+
+    def test_writer_flushes_ndjson(self, tmp_path):
+        path = tmp_path / "trace.ndjson"
+        enable_trace(path=str(path), flush_interval=60)
+
+        _tracer.record("first", value=1)
+        flush_trace()
+        _tracer.record("second", value=object())
+        disable_trace()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        events = [json.loads(line) for line in lines]
+        assert [event["event"] for event in events] == ["first", "second"]
+        assert events[0]["value"] == 1
+        # Non-JSON values are written via repr
+        assert events[1]["value"].startswith("<object object")
+        assert get_trace_events() == []
+
+    def test_unwritable_path_counts_errors(self, tmp_path):
+        enable_trace(path=str(tmp_path / "missing" / "trace.ndjson"), flush_interval=60)
+        _tracer.record("lost")
+        flush_trace()
+
+        assert _tracer.write_errors >= 1
+        _tracer.write_errors = 0
@@ -0,0 +1,147 @@
+"""Tests for opt-in transform staging committed once per update_all."""
+
+import arcade
+import pytest
+
+from arcadeactions import Action, MoveBy, MoveTo, get_transform_staging, set_transform_staging
+from arcadeactions._transform_staging import transform_stage
+from arcadeactions.conditional import CallbackUntil, ParametricMotionUntil, TweenUntil
+from arcadeactions.frame_conditions import after_frames, infinite
+
+
+class _CountingSprite(arcade.SpriteSolidColor):
+    """Sprite that counts writes to its transform setters."""
+
+    def __init__(self):
+        super().__init__(8, 8, color=arcade.color.WHITE)
+        self.writes: list[str] = []
+
+    @property
+    def position(self):
+        return arcade.SpriteSolidColor.position.fget(self)
+
+    @position.setter
+    def position(self, value):
+        self.writes.append("position")
+        arcade.SpriteSolidColor.position.fset(self, value)
+
+    @property
+    def center_x(self):
+        return arcade.SpriteSolidColor.center_x.fget(self)
+
+    @center_x.setter
+    def center_x(self, value):
+        self.writes.append("center_x")
+        arcade.SpriteSolidColor.center_x.fset(self, value)
+
+    @property
+    def center_y(self):
+        return arcade.SpriteSolidColor.center_y.fget(self)
+
+    @center_y.setter
+    def center_y(self, value):
+        self.writes.append("center_y")
+        arcade.SpriteSolidColor.center_y.fset(self, value)
+
+    @property
+    def angle(self):
+        return arcade.SpriteSolidColor.angle.fget(self)
+
+    @angle.setter
+    def angle(self, value):
+        self.writes.append("angle")
+        arcade.SpriteSolidColor.angle.fset(self, value)
+
+
+@pytest.fixture(autouse=True)
+def cleanup_actions():
+    yield
+    Action.stop_all()
+    set_transform_staging(False)
+
+
+@pytest.fixture
+def staging():
+    set_transform_staging(True)
+    yield
+    set_transform_staging(False)
+
+
+def _drive(sprite):
+    """A parametric path plus x and angle tweens, all writing the same sprite."""
+    ParametricMotionUntil(lambda t: (100 * t, 50 * t), after_frames(10), rotate_with_path=True).apply(sprite)
+    TweenUntil(0, 90, "angle", after_frames(20)).apply(sprite)
+    TweenUntil(0, 40, "center_x", after_frames(20)).apply(sprite)
+
+
+def test_staging_is_off_by_default():
+    assert get_transform_staging() is False
+
+
+def test_each_transform_is_written_once_per_frame(staging):
+    sprite = _CountingSprite()
+    sprite.position = (100, 100)
+    _drive(sprite)
+    Action.update_all(1 / 60)
+
+    sprite.writes.clear()
+    Action.update_all(1 / 60)
+
+    assert sorted(sprite.writes) == ["angle", "position"]
+    assert not transform_stage.active
+    assert len(transform_stage) == 0
+
+
+def test_staged_frame_matches_direct_writes():
+    results = []
+    for enabled in (False, True):
+        set_transform_staging(enabled)
+        sprite = _CountingSprite()
+        sprite.position = (100, 100)
+        _drive(sprite)
+        for _ in range(5):
+            Action.update_all(1 / 60)
+        results.append((sprite.position, sprite.angle))
+        Action.stop_all()
+
+    assert results[0] == results[1]
+
+
+def test_writes_outside_update_all_are_not_staged(staging):
+    sprite = _CountingSprite()
+    MoveTo(30, 40).apply(sprite)
+
+    assert sprite.position == (30, 40)
+    assert len(transform_stage) == 0
+
+
+def test_sequential_instant_moves_compose_within_a_frame(staging):
+    sprite = _CountingSprite()
+    sprite.position = (0, 0)
+
+    def chain():
+        MoveTo(10, 10).apply(sprite)
+        MoveBy(5, -5).apply(sprite)
+
+    CallbackUntil(chain, after_frames(1)).apply(sprite)
+    sprite.writes.clear()
+    Action.update_all(1 / 60)
+
+    assert sprite.position == (15, 5)
+    assert sprite.writes == ["position"]
+
+
+def test_pending_transforms_commit_when_an_update_raises(staging):
+    sprite = _CountingSprite()
+    sprite.position = (0, 0)
+    ParametricMotionUntil(lambda t: (100 * t, 0), after_frames(10)).apply(sprite)
+
+    def explode(target):
+        raise RuntimeError("boom")
+
+    CallbackUntil(explode, infinite).apply(sprite)
+    with pytest.raises(RuntimeError):
+        Action.update_all(1 / 60)
+
+    assert sprite.center_x == pytest.approx(10)
+    assert not transform_stage.active
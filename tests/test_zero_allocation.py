@@ -647,3 +647,89 @@ class TestZeroAllocationIntegration:
         result = arrange_circle(existing_sprites, center_x=400, center_y=500, radius=100)
         assert result is existing_sprites
         assert len(result) == 4
+
+
+class TestRepeatReuseAllocation:
+    """Test that repeat(..., reuse=True) rewinds its child instead of cloning it."""
+
+    def test_reused_repeat_allocates_no_actions_per_cycle(self, mocker):
+        """Once running, a reusable repeat should not construct any new actions."""
+        from arcadeactions import Action, TweenUntil, parallel, repeat, sequence
+        from arcadeactions.conditional import DelayFrames, MoveUntil
+        from arcadeactions.frame_timing import after_frames
+
+        sprite = create_test_sprite()
+        cycle = sequence(
+            MoveUntil((2, 0), after_frames(3)),
+            DelayFrames(2),
+            parallel(MoveUntil((0, 1), after_frames(2)), TweenUntil(0, 90, "angle", after_frames(2))),
+        )
+        repeat(cycle, reuse=True).apply(sprite)
+
+        # Warm up past the first cycle (the initial clone happens at start)
+        for _ in range(8):
+            Action.update_all(1 / 60)
+
+        init_spy = mocker.spy(Action, "__init__")
+        for _ in range(5 * 7):
+            Action.update_all(1 / 60)
+
+        assert init_spy.call_count == 0
+
+
+class TestUpdateAllAllocation:
+    """Test that a steady-state Action.update_all frame does not build per-frame lists."""
+
+    def test_steady_state_frame_allocates_less_than_one_action_list(self):
+        """Transient allocations per frame must stay below a single copy of the active actions."""
+        import tracemalloc
+
+        from arcadeactions import Action, infinite
+        from arcadeactions.conditional import MoveUntil
+
+        sprites = create_test_sprite_list(500)
+        for sprite in sprites:
+            MoveUntil((1, 0), infinite).apply(sprite)
+        for _ in range(3):
+            Action.update_all(1 / 60)
+
+        tracemalloc.start()
+        try:
+            Action.update_all(1 / 60)
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            for _ in range(5):
+                Action.update_all(1 / 60)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # A list of 500 references alone is ~4 KB
+        assert peak - baseline < 8 * len(sprites)
+        assert current - baseline <= 0
+
+    def test_phase_lists_compact_finished_and_stopped_actions(self):
+        """Finished actions are swap-removed and actions stopped mid-frame are not skipped or revisited."""
+        from arcadeactions import Action, infinite
+        from arcadeactions.conditional import CallbackUntil, DelayFrames, MoveUntil
+
+        sprite = create_test_sprite()
+        short = DelayFrames(1).apply(sprite)
+        long_running = MoveUntil((1, 0), infinite).apply(sprite)
+        victim = MoveUntil((0, 1), infinite).apply(sprite)
+        calls = []
+        stopper = CallbackUntil(lambda: (calls.append(1), victim.stop()), infinite).apply(sprite)
+        tail = MoveUntil((0, 0), infinite).apply(sprite)
+
+        Action.update_all(1 / 60)
+        Action.update_all(1 / 60)
+
+        registry = Action._active_actions
+        wrappers, others = registry.phases
+        entries = others + [action for group in registry.batch_groups.values() for action in group]
+        assert wrappers == []
+        assert sorted(map(id, entries)) == sorted(map(id, [long_running, stopper, tail]))
+        assert short not in Action._active_actions
+        assert victim not in Action._active_actions
+        assert len(calls) == 2
+        assert Action.num_active_actions == 3
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from arcadeactions._frame_stats import FrameStats
 from arcadeactions.visualizer.instrumentation import DebugDataStore
 from arcadeactions.visualizer.overlay import ActionCard, InspectorOverlay, TargetGroup
 
@@ -441,3 +442,28 @@ class TestInspectorOverlay:
         debug_store.record_event("removed", 1, "MoveUntil", 100, "Sprite")
         overlay.update()
         assert overlay.highlighted_target_id is None
+
+
+class TestFrameStatsLines:
+    def test_empty_while_disabled(self, debug_store):
+        overlay = InspectorOverlay(debug_store, frame_stats=FrameStats())
+
+        assert overlay.get_frame_stats_lines() == []
+
+    def test_summarizes_recorded_frames(self, debug_store):
+        stats = FrameStats()
+        stats.enabled = True
+        start = stats.begin_frame()
+        stats.mark(0, start)
+
+        class Action:
+            tag = "enemies"
+
+        stats.add_action(Action(), 0.002)
+        overlay = InspectorOverlay(debug_store, frame_stats=stats)
+
+        lines = overlay.get_frame_stats_lines()
+
+        assert lines[0].startswith("update_all:")
+        assert any("Action: 2.0 ms / 1 updates" in line for line in lines)
+        assert any("tag enemies" in line for line in lines)